@@ -20,7 +20,11 @@ Example::
 Warnings:
   - Discoveries are slow (~30m per window at pop=100 gen=20 on 1h).
     run-all on a 3-train × 3-OOS config is multi-hour compute.
-  - Runs sequentially. Use shell & + multiple configs for parallelism.
+  - --max-parallel runs independent windows concurrently; --total-workers
+    caps worker processes across them (each discovery has its own pool).
+  - The matrix is rewritten to <log-dir>/matrix_<campaign-id>.txt after
+    every finished OOS validation, so partial results are readable
+    while the campaign runs.
 """
 
 from __future__ import annotations
@@ -35,6 +39,7 @@ from vibe_quant.discovery.campaign import (
     RUN_MODE_DISCOVERY,
     RUN_MODE_OOS,
     CampaignPlan,
+    MatrixReport,
     RegimeCrossConfig,
     build_matrix_report,
     plan_campaign,
@@ -133,6 +138,25 @@ def _load_plan_from_db(campaign_id: str, state: StateManager) -> CampaignPlan |
     return plan
 
 
+def _run(plan: CampaignPlan, state: StateManager, args: argparse.Namespace, force: bool) -> None:
+    """Run a plan with the scheduler options, keeping the matrix file current."""
+    matrix_path = Path(args.log_dir) / f"matrix_{plan.campaign_id}.txt"
+
+    def write_matrix(report: MatrixReport) -> None:
+        matrix_path.parent.mkdir(parents=True, exist_ok=True)
+        matrix_path.write_text(report.as_text() + "\n", encoding="utf-8")
+
+    run_campaign(
+        plan,
+        state,
+        log_dir=args.log_dir,
+        skip_existing=not force,
+        max_parallel=args.max_parallel,
+        total_workers=args.total_workers,
+        on_progress=write_matrix,
+    )
+
+
 def cmd_plan(args: argparse.Namespace) -> int:
     state = StateManager()
     try:
@@ -158,7 +182,7 @@ def cmd_run(args: argparse.Namespace) -> int:
         if plan is None:
             print(f"error: campaign {args.campaign_id} not found", file=sys.stderr)
             return 2
-        run_campaign(plan, state, log_dir=args.log_dir, skip_existing=not args.force)
+        _run(plan, state, args, force=args.force)
     finally:
         state.close()
     return 0
@@ -180,7 +204,7 @@ def cmd_run_all(args: argparse.Namespace) -> int:
         config = RegimeCrossConfig.from_yaml(args.config)
         plan = plan_campaign(config, state)
         logger.info("campaign %s planned: %d discoveries", plan.campaign_id, len(plan.discovery_runs))
-        run_campaign(plan, state, log_dir=args.log_dir, skip_existing=True)
+        _run(plan, state, args, force=False)
         report = build_matrix_report(plan.campaign_id, state)
     finally:
         state.close()
@@ -188,6 +212,18 @@ def cmd_run_all(args: argparse.Namespace) -> int:
     return 0
 
 
+def _add_scheduler_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--max-parallel", type=int, default=1, help="Subprocesses running at once (default 1)"
+    )
+    parser.add_argument(
+        "--total-workers",
+        type=int,
+        default=None,
+        help="Worker processes shared by running discoveries (default: each uses all CPUs)",
+    )
+
+
 def main() -> int:
     logging.basicConfig(
         level=logging.INFO,
@@ -204,6 +240,7 @@ def main() -> int:
     p_run.add_argument("campaign_id")
     p_run.add_argument("--log-dir", type=Path, default=Path("logs/regime_cross"))
     p_run.add_argument("--force", action="store_true", help="Re-run completed runs")
+    _add_scheduler_args(p_run)
     p_run.set_defaults(func=cmd_run)
 
     p_rep = sub.add_parser("report", help="Print cross-regime matrix")
@@ -213,6 +250,7 @@ def main() -> int:
     p_all = sub.add_parser("run-all", help="Plan + run + report in one shot")
     p_all.add_argument("config", type=Path)
     p_all.add_argument("--log-dir", type=Path, default=Path("logs/regime_cross"))
+    _add_scheduler_args(p_all)
     p_all.set_defaults(func=cmd_run_all)
 
     args = parser.parse_args()
@@ -0,0 +1,85 @@
+"""Benchmark: vectorized non-dominated sort vs the previous Python loop.
+
+Run with: python3.13 tests/benchmarks/bench_pareto_sort.py
+"""
+
+from __future__ import annotations
+
+import time
+
+import numpy as np
+
+from vibe_quant.discovery.nsga import non_dominated_sort, pareto_front
+
+
+def pareto_rank_python(objectives: list[tuple[float, float, float]]) -> list[int]:
+    """Former fitness.pareto_rank: inlined 3-objective front peeling in Python."""
+    n = len(objectives)
+    ranks = [-1] * n
+    remaining = set(range(n))
+    current_rank = 0
+    sharpes = [o[0] for o in objectives]
+    inv_dds = [o[1] for o in objectives]
+    pfs = [o[2] for o in objectives]
+    while remaining:
+        front: list[int] = []
+        remaining_list = list(remaining)
+        for i in remaining_list:
+            dominated = False
+            s_i, d_i, p_i = sharpes[i], inv_dds[i], pfs[i]
+            for j in remaining_list:
+                if i == j:
+                    continue
+                s_j, d_j, p_j = sharpes[j], inv_dds[j], pfs[j]
+                if (
+                    s_j >= s_i
+                    and d_j >= d_i
+                    and p_j >= p_i
+                    and (s_j > s_i or d_j > d_i or p_j > p_i)
+                ):
+                    dominated = True
+                    break
+            if not dominated:
+                front.append(i)
+        for i in front:
+            ranks[i] = current_rank
+            remaining.discard(i)
+        current_rank += 1
+    return ranks
+
+
+def _best_of(func, *args, repeat: int = 3) -> float:
+    """Best wall time in milliseconds over ``repeat`` runs."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best * 1e3
+
+
+def main() -> None:
+    rng = np.random.default_rng(42)
+    print("=" * 70)
+    print("NON-DOMINATED SORT: NumPy dominance matrix vs Python loop")
+    print("=" * 70)
+    for n in (1000, 2000, 5000):
+        obj = rng.normal(size=(n, 3))
+        rows = [tuple(r) for r in obj.tolist()]
+        t_vec = _best_of(non_dominated_sort, obj)
+        t_front = _best_of(pareto_front, obj)
+        t_py = _best_of(pareto_rank_python, rows, repeat=1)
+        assert non_dominated_sort(obj).tolist() == pareto_rank_python(rows)
+        print(
+            f"  n={n:5d}: python={t_py:9.1f}ms  numpy={t_vec:7.1f}ms "
+            f"({t_py / t_vec:5.1f}x)  front0-only={t_front:6.1f}ms"
+        )
+    # Discovery's 4 objectives (no Python baseline: the old code was 3-objective only)
+    for n in (1000, 5000):
+        obj = rng.normal(size=(n, 4))
+        print(f"  n={n:5d} m=4: numpy={_best_of(non_dominated_sort, obj):7.1f}ms")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,8 +4,8 @@ from __future__ import annotations
 
 from vibe_quant.api.app import create_app
 
-EXPECTED_PATH_COUNT = 74
-EXPECTED_SCHEMA_COUNT = 67
+EXPECTED_PATH_COUNT = 76
+EXPECTED_SCHEMA_COUNT = 70
 
 REQUIRED_PATHS = [
     "/health",
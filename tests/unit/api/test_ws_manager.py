@@ -0,0 +1,133 @@
+"""Tests for the WebSocket ConnectionManager fan-out and backpressure."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+
+from vibe_quant.api.ws.manager import ConnectionManager
+
+
+class FakeWebSocket:
+    """Minimal stand-in for ``fastapi.WebSocket`` with a configurable send delay."""
+
+    def __init__(self, delay: float = 0.0, fail: bool = False) -> None:
+        self.delay = delay
+        self.fail = fail
+        self.sent: list[dict[str, object]] = []
+        self.closed_code: int | None = None
+        self.accepted = False
+
+    async def accept(self) -> None:
+        self.accepted = True
+
+    async def send_text(self, payload: str) -> None:
+        if self.fail:
+            raise RuntimeError("socket gone")
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.sent.append(json.loads(payload))
+
+    async def close(self, code: int = 1000) -> None:
+        self.closed_code = code
+
+
+async def test_broadcast_does_not_wait_for_slow_client() -> None:
+    mgr = ConnectionManager()
+    fast = FakeWebSocket()
+    slow = FakeWebSocket(delay=5.0)
+    await mgr.connect(fast, "jobs")
+    await mgr.connect(slow, "jobs")
+
+    start = time.monotonic()
+    for i in range(10):
+        await mgr.broadcast("jobs", {"type": "job_started", "run_id": i})
+    elapsed = time.monotonic() - start
+
+    await asyncio.sleep(0.05)
+    assert elapsed < 0.1
+    assert [m["run_id"] for m in fast.sent] == list(range(10))
+    assert slow.sent == []
+    await mgr.stop()
+
+
+async def test_full_queue_coalesces_progress_latest_wins() -> None:
+    mgr = ConnectionManager(queue_maxsize=3)
+    slow = FakeWebSocket(delay=10.0)
+    await mgr.connect(slow, "jobs")
+    await asyncio.sleep(0)
+
+    await mgr.broadcast("jobs", {"type": "heartbeat", "run_id": 7, "seq": 0})
+    await asyncio.sleep(0)  # writer picks up seq 0 and blocks in send
+    for seq in range(1, 50):
+        await mgr.broadcast("jobs", {"type": "heartbeat", "run_id": 7, "seq": seq})
+
+    assert mgr.client_count("jobs") == 1
+    assert mgr.evicted_count == 0
+    sub = mgr._channels["jobs"][slow]  # noqa: SLF001
+    queued = [json.loads(p)["seq"] for _, p in sub.queue]
+    assert len(queued) <= 3
+    assert queued[-1] == 49
+    await mgr.stop()
+
+
+async def test_client_that_stays_behind_is_evicted() -> None:
+    mgr = ConnectionManager(queue_maxsize=4)
+    fast = FakeWebSocket()
+    stuck = FakeWebSocket(delay=10.0)
+    await mgr.connect(fast, "jobs")
+    await mgr.connect(stuck, "jobs")
+    await asyncio.sleep(0)
+
+    for i in range(10):
+        await mgr.broadcast("jobs", {"type": "job_started", "run_id": i})
+        await asyncio.sleep(0.005)  # broadcasts arrive from separate requests
+    await asyncio.sleep(0.05)
+
+    assert mgr.client_count("jobs") == 1
+    assert mgr.evicted_count == 1
+    assert stuck.closed_code == 1013
+    assert len(fast.sent) == 10
+    await mgr.stop()
+
+
+async def test_send_timeout_evicts_half_dead_client() -> None:
+    mgr = ConnectionManager(send_timeout=0.05)
+    hung = FakeWebSocket(delay=10.0)
+    await mgr.connect(hung, "trading")
+
+    await mgr.broadcast("trading", {"type": "paper_halted", "run_id": 1})
+    await asyncio.sleep(0.2)
+
+    assert mgr.client_count("trading") == 0
+    assert mgr.evicted_count == 1
+    await mgr.stop()
+
+
+async def test_failed_send_removes_dead_connection() -> None:
+    mgr = ConnectionManager()
+    dead = FakeWebSocket(fail=True)
+    await mgr.connect(dead, "jobs")
+
+    await mgr.broadcast("jobs", {"type": "job_killed", "run_id": 3})
+    await asyncio.sleep(0.02)
+
+    assert mgr.client_count("jobs") == 0
+    assert mgr.evicted_count == 0
+    await mgr.stop()
+
+
+async def test_send_personal_ordered_with_broadcast() -> None:
+    mgr = ConnectionManager()
+    ws = FakeWebSocket()
+    await mgr.connect(ws, "discovery")
+
+    await mgr.broadcast("discovery", {"type": "job_started", "run_id": 1})
+    await mgr.send_personal(ws, {"type": "ack", "data": {}})
+    await asyncio.sleep(0.02)
+
+    assert [m["type"] for m in ws.sent] == ["job_started", "ack"]
+    mgr.disconnect(ws, "discovery")
+    assert mgr.client_count("discovery") == 0
+    await mgr.stop()
@@ -269,6 +269,26 @@ class TestBacktestJobManager:
         # Cleanup
         manager.kill_job(run_id)
 
+    def test_job_writes_share_state_write_queue(
+        self, tmp_path: Path, state_manager: StateManager, run_id: int
+    ) -> None:
+        """Registration, heartbeats and status changes use the given StateManager's queue."""
+        manager = BacktestJobManager(tmp_path / "jobs.db", state=state_manager)
+        before = state_manager.write_stats()["writes"]
+        manager.start_job(
+            run_id=run_id,
+            job_type="screening",
+            command=[sys.executable, "-c", "pass"],
+        )
+        manager.update_heartbeat(run_id)
+        manager.mark_completed(run_id)
+
+        assert state_manager.write_stats()["writes"] == before + 3
+        assert manager.get_status(run_id) == JobStatus.COMPLETED
+        manager.close()
+        # The injected StateManager stays open for its owner
+        assert state_manager.get_backtest_run(run_id) is not None
+
     def test_mark_completed_success(
         self,
         manager: BacktestJobManager,
@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 import numpy as np
+import pytest
 
 from vibe_quant.overfitting.bootstrap_sharpe import (
     BootstrapResult,
+    _block_indices,
     _sharpe_from_returns,
     bootstrap_sharpe_ci,
 )
@@ -116,3 +118,66 @@ class TestBootstrapSharpeCi:
 
         assert len(result.bootstrap_sharpes) == 500
         assert result.bootstrap_sharpes.dtype == np.float64
+
+
+class TestChunkedAndBlockBootstrap:
+    def test_chunking_does_not_change_iid_results(self):
+        """Chunks draw the same random stream as one full-size draw."""
+        rng = np.random.default_rng(7)
+        returns = rng.normal(0.3, 1.0, 200)
+        full = bootstrap_sharpe_ci(returns, n_bootstrap=300, seed=5)
+        chunked = bootstrap_sharpe_ci(returns, n_bootstrap=300, seed=5, max_chunk_elements=1000)
+
+        np.testing.assert_array_equal(full.bootstrap_sharpes, chunked.bootstrap_sharpes)
+        assert full.ci_lower == chunked.ci_lower
+
+    def test_chunked_matches_unchunked_reference(self):
+        """IID results equal a direct (n_bootstrap, n) resample."""
+        rng = np.random.default_rng(11)
+        returns = rng.normal(0.2, 1.0, 80)
+        result = bootstrap_sharpe_ci(returns, n_bootstrap=400, seed=3, max_chunk_elements=500)
+
+        ref_rng = np.random.default_rng(3)
+        samples = returns[ref_rng.integers(0, 80, size=(400, 80))]
+        expected = samples.mean(axis=1) / samples.std(axis=1, ddof=1) * np.sqrt(80)
+        np.testing.assert_allclose(result.bootstrap_sharpes, expected)
+
+    @pytest.mark.parametrize("method", ["stationary", "block"])
+    def test_block_methods_reproducible(self, method):
+        rng = np.random.default_rng(1)
+        returns = rng.normal(0.3, 1.0, 120)
+        r1 = bootstrap_sharpe_ci(returns, n_bootstrap=200, seed=9, method=method)
+        r2 = bootstrap_sharpe_ci(
+            returns, n_bootstrap=200, seed=9, method=method, max_chunk_elements=500
+        )
+        assert len(r1.bootstrap_sharpes) == 200
+        np.testing.assert_array_equal(r1.bootstrap_sharpes, r2.bootstrap_sharpes)
+
+    def test_block_indices_are_contiguous_runs(self):
+        rng = np.random.default_rng(0)
+        idx = _block_indices(rng, rows=3, n=20, method="block", block_length=5)
+        assert idx.shape == (3, 20)
+        # Within each fixed block, indices advance by one (mod n)
+        steps = (np.diff(idx, axis=1) % 20).reshape(3, 19)
+        in_block = np.arange(1, 20) % 5 != 0
+        assert (steps[:, in_block] == 1).all()
+
+    def test_block_bootstrap_widens_ci_for_autocorrelated_returns(self):
+        """Positively autocorrelated returns get a wider CI than IID assumes."""
+        rng = np.random.default_rng(21)
+        noise = rng.normal(0, 1.0, 600)
+        returns = np.empty(600)
+        returns[0] = noise[0]
+        for t in range(1, 600):
+            returns[t] = 0.8 * returns[t - 1] + noise[t]
+        returns += 0.2
+
+        iid = bootstrap_sharpe_ci(returns, n_bootstrap=2000, seed=4)
+        stationary = bootstrap_sharpe_ci(
+            returns, n_bootstrap=2000, seed=4, method="stationary", block_length=20
+        )
+        assert (stationary.ci_upper - stationary.ci_lower) > (iid.ci_upper - iid.ci_lower)
+
+    def test_invalid_method_raises(self):
+        with pytest.raises(ValueError, match="method"):
+            bootstrap_sharpe_ci([0.1] * 10, method="wild")  # type: ignore[arg-type]
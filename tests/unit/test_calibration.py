@@ -0,0 +1,300 @@
+"""Tests for execution model calibration from recorded fills."""
+
+from __future__ import annotations
+
+import json
+from datetime import UTC, datetime, timedelta
+from pathlib import Path  # noqa: TCH003
+
+import numpy as np
+import pytest
+
+from vibe_quant.db.state_manager import StateManager
+from vibe_quant.validation.calibration import (
+    CalibratedExecutionModel,
+    FillObservation,
+    calibrate,
+    fit_latency,
+    fit_slippage,
+    load_fill_observations,
+)
+from vibe_quant.validation.fill_model import SlippageEstimator
+from vibe_quant.validation.venue import create_venue_config_for_validation
+
+_T0 = datetime(2025, 1, 1, tzinfo=UTC)
+
+
+def _event(event: str, ts: datetime, **data: object) -> dict[str, object]:
+    return {"ts": ts.isoformat(), "event": event, "run_id": "r", "strategy": "s", "data": data}
+
+
+def _write_log(path: Path, events: list[dict[str, object]]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8") as fp:
+        for e in events:
+            fp.write(json.dumps(e) + "\n")
+
+
+def _obs(
+    slippage: float,
+    quantity: float = 1.0,
+    avg_volume: float | None = 100.0,
+    volatility: float | None = 0.01,
+    latency_ms: float = 50.0,
+    side: str = "BUY",
+) -> FillObservation:
+    sign = 1.0 if side == "BUY" else -1.0
+    return FillObservation(
+        order_id="o",
+        symbol="BTCUSDT",
+        side=side,
+        quantity=quantity,
+        reference_price=100.0,
+        fill_price=100.0 * (1.0 + sign * slippage),
+        submitted_at=_T0,
+        filled_at=_T0 + timedelta(milliseconds=latency_ms),
+        avg_volume=avg_volume,
+        volatility=volatility,
+    )
+
+
+class TestLoadFillObservations:
+    """Tests for pairing ORDER and FILL events."""
+
+    def test_pairs_orders_with_fills(self, tmp_path: Path) -> None:
+        _write_log(
+            tmp_path / "paper_1.jsonl",
+            [
+                _event(
+                    "ORDER",
+                    _T0,
+                    order_id="a",
+                    side="BUY",
+                    quantity=2.0,
+                    reference_price=100.0,
+                    symbol="BTCUSDT",
+                    avg_volume=50.0,
+                    volatility=0.02,
+                    spread=0.0002,
+                ),
+                _event(
+                    "FILL",
+                    _T0 + timedelta(milliseconds=120),
+                    order_id="a",
+                    fill_price=100.1,
+                    quantity=1.0,
+                ),
+                _event(
+                    "FILL",
+                    _T0 + timedelta(milliseconds=300),
+                    order_id="a",
+                    fill_price=100.3,
+                    quantity=1.0,
+                ),
+                # Limit order without an arrival price: the limit price is the reference
+                _event(
+                    "ORDER",
+                    _T0 + timedelta(seconds=1),
+                    order_id="b",
+                    side="SELL",
+                    quantity=1.0,
+                    price=200.0,
+                    order_type="LIMIT",
+                ),
+                _event(
+                    "FILL",
+                    _T0 + timedelta(seconds=1, milliseconds=40),
+                    order_id="b",
+                    fill_price=199.8,
+                    quantity=1.0,
+                ),
+                # Limit order with an arrival price: slippage is from arrival
+                _event(
+                    "ORDER",
+                    _T0 + timedelta(seconds=2),
+                    order_id="e",
+                    side="BUY",
+                    quantity=1.0,
+                    price=99.0,
+                    reference_price=100.0,
+                    order_type="LIMIT",
+                ),
+                _event(
+                    "FILL",
+                    _T0 + timedelta(seconds=2, milliseconds=10),
+                    order_id="e",
+                    fill_price=99.0,
+                    quantity=1.0,
+                ),
+                # No reference price, and an order that never filled
+                _event("ORDER", _T0, order_id="c", side="BUY", quantity=1.0),
+                _event("FILL", _T0, order_id="c", fill_price=1.0, quantity=1.0),
+                _event("ORDER", _T0, order_id="d", side="BUY", quantity=1.0, price=5.0),
+            ],
+        )
+
+        a, b, e = load_fill_observations("paper_1", base_path=tmp_path)
+
+        assert a.order_id == "a"
+        assert a.quantity == 2.0
+        assert a.fill_price == pytest.approx(100.2)
+        assert a.slippage == pytest.approx(0.002)
+        assert a.latency_ms == pytest.approx(120.0)
+        assert (a.avg_volume, a.volatility, a.spread) == (50.0, 0.02, 0.0002)
+        assert a.has_market_context
+        assert b.slippage == pytest.approx(0.001)
+        assert not b.has_market_context
+        assert e.reference_price == 100.0
+        assert e.slippage == pytest.approx(-0.01)
+
+    def test_missing_log_raises(self, tmp_path: Path) -> None:
+        with pytest.raises(FileNotFoundError, match="Event log not found"):
+            load_fill_observations("nope", base_path=tmp_path)
+
+
+class TestFitSlippage:
+    """Tests for the slippage curve fit."""
+
+    def test_recovers_known_curve(self) -> None:
+        rng = np.random.default_rng(7)
+        observations = []
+        for _ in range(200):
+            qty = float(rng.uniform(0.5, 20.0))
+            vol = float(rng.uniform(0.005, 0.03))
+            slip = 0.0002 + 0.3 * vol * np.sqrt(qty / 100.0)
+            side = "BUY" if rng.random() < 0.5 else "SELL"
+            observations.append(_obs(slip, quantity=qty, volatility=vol, side=side))
+
+        fit = fit_slippage(observations)
+
+        assert fit.impact_exponent == pytest.approx(0.5)
+        assert fit.impact_coefficient == pytest.approx(0.3, rel=1e-6)
+        assert fit.base_slippage == pytest.approx(0.0002, abs=1e-9)
+        assert fit.r_squared == pytest.approx(1.0)
+        assert fit.n_observations == 200
+
+    def test_coefficients_stay_non_negative(self) -> None:
+        # Slippage falls with size: the unconstrained slope is negative
+        observations = [_obs(0.001 / q, quantity=q) for q in (1.0, 2.0, 4.0, 8.0)]
+        fit = fit_slippage(observations)
+        assert fit.impact_coefficient == 0.0
+        assert fit.base_slippage == pytest.approx(np.mean([0.001, 0.0005, 0.00025, 0.000125]))
+
+    def test_without_market_context_fits_constant(self) -> None:
+        observations = [_obs(s, avg_volume=None) for s in (0.001, 0.003)]
+        fit = fit_slippage(observations)
+        assert fit.impact_coefficient == 0.0
+        assert fit.base_slippage == pytest.approx(0.002)
+        assert fit.rmse == pytest.approx(0.001)
+
+    def test_empty_raises(self) -> None:
+        with pytest.raises(ValueError, match="without fill observations"):
+            fit_slippage([])
+
+
+class TestFitLatency:
+    """Tests for the latency distribution summary."""
+
+    def test_quantiles(self) -> None:
+        observations = [_obs(0.0, latency_ms=float(ms)) for ms in range(1, 101)]
+        observations.append(_obs(0.0, latency_ms=-5.0))  # clock skew, dropped
+
+        fit = fit_latency(observations, quantile=0.9)
+
+        assert fit.n_observations == 100
+        assert fit.p50_ms == pytest.approx(50.5)
+        assert fit.base_ms == fit.p90_ms
+        assert fit.to_latency_values().base_ms == fit.base_ms
+
+    def test_invalid_quantile(self) -> None:
+        with pytest.raises(ValueError, match="quantile"):
+            fit_latency([_obs(0.0)], quantile=1.5)
+
+
+class TestCalibratedExecutionModel:
+    """Tests for fitting, storing and applying a named model."""
+
+    @pytest.fixture
+    def model(self, tmp_path: Path) -> CalibratedExecutionModel:
+        events = []
+        for i in range(10):
+            ts = _T0 + timedelta(minutes=i)
+            events.append(
+                _event(
+                    "ORDER",
+                    ts,
+                    order_id=str(i),
+                    side="BUY",
+                    quantity=1.0 + i,
+                    reference_price=100.0,
+                    avg_volume=100.0,
+                    volatility=0.01,
+                )
+            )
+            slip = 0.0001 + 0.2 * 0.01 * np.sqrt((1.0 + i) / 100.0)
+            events.append(
+                _event(
+                    "FILL",
+                    ts + timedelta(milliseconds=80 + i),
+                    order_id=str(i),
+                    fill_price=100.0 * (1 + slip),
+                    quantity=1.0 + i,
+                )
+            )
+        _write_log(tmp_path / "PAPER-001.jsonl", events)
+        return calibrate(["PAPER-001"], name="paper_fit", base_path=tmp_path)
+
+    def test_calibrate_and_round_trip(self, model: CalibratedExecutionModel) -> None:
+        assert model.slippage.impact_coefficient == pytest.approx(0.2, rel=1e-6)
+        assert model.latency.p50_ms == pytest.approx(84.5)
+        assert model.source_runs == ("PAPER-001",)
+        assert CalibratedExecutionModel.from_dict(model.to_dict()) == model
+        assert "paper_fit" in model.summary()
+
+    def test_calibrate_without_fills_raises(self, tmp_path: Path) -> None:
+        _write_log(tmp_path / "empty.jsonl", [])
+        with pytest.raises(ValueError, match="No fills"):
+            calibrate(["empty"], name="x", base_path=tmp_path)
+
+    def test_state_manager_upserts_by_name(
+        self, tmp_path: Path, model: CalibratedExecutionModel
+    ) -> None:
+        state = StateManager(tmp_path / "state.db")
+        state.save_execution_model(model.name, model.to_dict())
+        state.save_execution_model(model.name, {**model.to_dict(), "source_runs": ["x"]})
+
+        rows = state.list_execution_models()
+        stored = state.get_execution_model("paper_fit")
+        state.close()
+
+        assert len(rows) == 1
+        assert stored is not None
+        assert stored["model"]["source_runs"] == ["x"]
+
+    def test_venue_uses_fitted_slippage_and_latency(self, model: CalibratedExecutionModel) -> None:
+        venue = create_venue_config_for_validation(latency_preset="retail", execution_model=model)
+
+        assert venue.execution_model == "paper_fit"
+        assert venue.latency_config is not None
+        assert venue.latency_config.base_latency_nanos == int(model.latency.base_ms * 1_000_000)
+        assert venue.fill_config.impact_coefficient == model.slippage.impact_coefficient
+        assert venue.fill_config.base_slippage == model.slippage.base_slippage
+
+        # Latency stays off where the venue disables it (sub-bar without detail)
+        assert (
+            create_venue_config_for_validation(
+                latency_preset=None, execution_model=model
+            ).latency_config
+            is None
+        )
+
+
+def test_slippage_estimator_exponent_and_base() -> None:
+    default = SlippageEstimator(impact_coefficient=0.1)
+    calibrated = SlippageEstimator(impact_coefficient=0.1, impact_exponent=1.0, base_slippage=0.001)
+
+    assert default.calculate(4.0, 100.0, volatility=0.02) == pytest.approx(0.1 * 0.02 * 0.2)
+    assert calibrated.calculate(4.0, 100.0, volatility=0.02) == pytest.approx(
+        0.001 + 0.1 * 0.02 * 0.04
+    )
+    assert calibrated.calculate(4.0, 0.0, spread=0.0002) == pytest.approx(0.0011)
@@ -0,0 +1,159 @@
+"""Unit tests for Combinatorial Purged Cross-Validation and PBO."""
+
+from __future__ import annotations
+
+import itertools
+import math
+
+import numpy as np
+import pytest
+
+from vibe_quant.overfitting.cpcv import (
+    CombinatorialPurgedCV,
+    CPCVConfig,
+    GroupResult,
+)
+
+
+def _sharpe(returns: np.ndarray, periods_per_year: float = 365.0) -> float:
+    return float(returns.mean() / returns.std(ddof=1) * math.sqrt(periods_per_year))
+
+
+def _moments(g: int, returns: np.ndarray) -> GroupResult:
+    return GroupResult(g, returns.size, float(returns.mean()), float(returns.std(ddof=1)))
+
+
+class RecordingRunner:
+    """Group runner returning moments of a fixed return series."""
+
+    def __init__(self, returns: np.ndarray) -> None:
+        self.returns = returns
+        self.calls: list[list[int]] = []
+
+    def run_group(self, indices: list[int]) -> GroupResult:
+        self.calls.append(indices)
+        return _moments(-1, self.returns[indices])
+
+
+class TestCPCVConfig:
+    """Tests for CPCVConfig validation and derived counts."""
+
+    def test_counts(self) -> None:
+        config = CPCVConfig(n_groups=6, n_test_groups=2)
+        assert config.n_combinations == 15
+        assert config.n_paths == 5
+
+    @pytest.mark.parametrize(
+        ("kwargs", "match"),
+        [
+            ({"n_groups": 1}, "n_groups"),
+            ({"n_groups": 4, "n_test_groups": 4}, "n_test_groups"),
+            ({"n_test_groups": 0}, "n_test_groups"),
+            ({"embargo_pct": 1.0}, "embargo_pct"),
+            ({"periods_per_year": 0}, "periods_per_year"),
+        ],
+    )
+    def test_invalid(self, kwargs: dict[str, float], match: str) -> None:
+        with pytest.raises(ValueError, match=match):
+            CPCVConfig(**kwargs)  # type: ignore[arg-type]
+
+
+class TestGroups:
+    """Tests for group construction."""
+
+    def test_contiguous_with_embargoed_heads(self) -> None:
+        cpcv = CombinatorialPurgedCV(CPCVConfig(n_groups=4, embargo_pct=0.01))
+        groups = cpcv.groups(1000)
+        assert groups == [range(0, 250), range(260, 500), range(510, 750), range(760, 1000)]
+
+    def test_too_few_samples_raises(self) -> None:
+        cpcv = CombinatorialPurgedCV(CPCVConfig(n_groups=6))
+        with pytest.raises(ValueError, match="Not enough samples"):
+            cpcv.groups(50)
+
+
+class TestEvaluate:
+    """Tests for recombining group moments into OOS Sharpe ratios."""
+
+    def test_pooled_sharpe_matches_concatenated_returns(self) -> None:
+        rng = np.random.default_rng(11)
+        config = CPCVConfig(n_groups=5, n_test_groups=2, min_oos_sharpe=-10.0)
+        chunks = [rng.normal(0.001 * g, 0.02, 40 + 7 * g) for g in range(5)]
+        result = CombinatorialPurgedCV(config).evaluate(
+            [_moments(g, r) for g, r in enumerate(chunks)]
+        )
+
+        expected = [
+            _sharpe(np.concatenate([chunks[g] for g in combo]))
+            for combo in itertools.combinations(range(5), 2)
+        ]
+        assert result.oos_sharpes == pytest.approx(expected)
+        assert result.mean_oos_sharpe == pytest.approx(np.mean(expected))
+        assert result.positive_frac == pytest.approx(np.mean(np.array(expected) > 0))
+
+    def test_run_backtests_each_group_once(self) -> None:
+        rng = np.random.default_rng(3)
+        runner = RecordingRunner(rng.normal(0.002, 0.01, 600))
+        cpcv = CombinatorialPurgedCV(CPCVConfig(n_groups=6, n_test_groups=2, embargo_pct=0.0))
+
+        result = cpcv.run(600, runner)
+
+        assert len(runner.calls) == 6
+        assert len(result.oos_sharpes) == 15
+        assert [g.group_index for g in result.group_results] == list(range(6))
+
+    def test_wrong_group_count_raises(self) -> None:
+        cpcv = CombinatorialPurgedCV(CPCVConfig(n_groups=4))
+        with pytest.raises(ValueError, match="Expected 4 group results"):
+            cpcv.evaluate([GroupResult(0, 10, 0.0, 1.0)])
+
+    def test_from_metrics_round_trips_sharpe(self) -> None:
+        g = GroupResult.from_metrics(
+            0, sharpe=1.5, total_return=0.2, n_obs=100, periods_per_year=365
+        )
+        assert g.mean_return / g.std_return * math.sqrt(365) == pytest.approx(1.5)
+        assert GroupResult.from_metrics(0, 0.0, 0.1, 10, 365).std_return == 0.0
+
+
+class TestPBO:
+    """Tests for the Probability of Backtest Overfitting."""
+
+    def test_dominant_candidate_has_zero_pbo(self) -> None:
+        rng = np.random.default_rng(5)
+        cpcv = CombinatorialPurgedCV(CPCVConfig(n_groups=6, n_test_groups=3))
+        base = [rng.normal(0, 0.01, 50) for _ in range(6)]
+        rows = [[_moments(g, r + 0.001 * k) for g, r in enumerate(base)] for k in range(4)]
+
+        pbo = cpcv.probability_of_backtest_overfitting(rows)
+
+        assert pbo.pbo == 0.0
+        assert pbo.n_candidates == 4
+        assert len(pbo.logits) == 20
+        # The best candidate wins every combination, so every path is its
+        # full-sample Sharpe.
+        assert len(pbo.path_sharpes) == cpcv.config.n_paths
+        full = _sharpe(np.concatenate(base) + 0.003)
+        assert pbo.path_sharpes == pytest.approx([full] * cpcv.config.n_paths)
+
+    def test_mean_reverting_ranks_overfit(self) -> None:
+        # Candidate k is good on groups of parity k and bad elsewhere, so the
+        # in-sample winner tends to lose out of sample.
+        rng = np.random.default_rng(9)
+        cpcv = CombinatorialPurgedCV(CPCVConfig(n_groups=6, n_test_groups=3))
+        rows = []
+        for k in range(2):
+            rows.append(
+                [
+                    _moments(g, rng.normal(0.004 if g % 2 == k else -0.004, 0.01, 50))
+                    for g in range(6)
+                ]
+            )
+
+        pbo = cpcv.probability_of_backtest_overfitting(rows)
+
+        assert pbo.pbo > 0.5
+
+    def test_single_candidate_raises(self) -> None:
+        cpcv = CombinatorialPurgedCV(CPCVConfig(n_groups=2, n_test_groups=1))
+        with pytest.raises(ValueError, match="at least 2 candidates"):
+            cpcv.probability_of_backtest_overfitting([[GroupResult(0, 10, 0.0, 1.0)] * 2])
@@ -6,6 +6,7 @@ from pathlib import Path
 import pytest
 
 from vibe_quant.db import StateManager, get_connection
+from vibe_quant.db.state_manager import _PendingWrite
 
 
 class TestConnection:
@@ -456,3 +457,166 @@ class TestStateManager:
 
         results = state_manager.list_backtest_results(limit=3)
         assert len(results) == 3
+
+
+class TestStateManagerWritePath:
+    """Tests for the group-commit write queue and per-thread reads."""
+
+    @pytest.fixture
+    def state_manager(self, tmp_path: Path) -> StateManager:
+        manager = StateManager(tmp_path / "test.db")
+        yield manager
+        manager.close()
+
+    @staticmethod
+    def _run(state_manager: StateManager) -> int:
+        return state_manager.create_backtest_run(
+            strategy_id=None,
+            run_mode="screening",
+            symbols=["BTCUSDT-PERP"],
+            timeframe="5m",
+            start_date="2024-01-01",
+            end_date="2024-06-30",
+            parameters={},
+        )
+
+    def test_32_worker_stress_has_no_lock_errors(self, tmp_path: Path) -> None:
+        """32 workers on two managers (two write connections) lose no writes."""
+        import threading
+
+        managers = [StateManager(tmp_path / "stress.db"), StateManager(tmp_path / "stress.db")]
+        run_id = self._run(managers[0])
+        errors: list[BaseException] = []
+        per_worker = 40
+
+        def worker(i: int) -> None:
+            mgr = managers[i % 2]
+            try:
+                for j in range(per_worker):
+                    mgr.save_sweep_result(
+                        run_id, {"parameters": {"w": i, "j": j}, "sharpe_ratio": 0.1}
+                    )
+                    mgr.update_heartbeat(run_id)
+                    mgr.get_backtest_run(run_id)
+            except BaseException as exc:  # noqa: BLE001
+                errors.append(exc)
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(32)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert errors == []
+        assert len(managers[0].get_sweep_results(run_id)) == 32 * per_worker
+        stats = [m.write_stats() for m in managers]
+        assert sum(s["failed_writes"] for s in stats) == 0
+        assert sum(s["writes"] for s in stats) == 32 * per_worker * 2 + 1
+        # Concurrent writers were folded into shared transactions
+        assert sum(s["transactions"] for s in stats) < sum(s["writes"] for s in stats)
+        for m in managers:
+            m.close()
+
+    def test_failing_write_does_not_roll_back_batch(self, state_manager: StateManager) -> None:
+        """A bad op in a group commit fails alone; its neighbours commit."""
+        import threading
+
+        run_id = self._run(state_manager)
+        outcomes: dict[int, object] = {}
+
+        def good(i: int) -> None:
+            outcomes[i] = state_manager.save_sweep_result(run_id, {"parameters": {"i": i}})
+
+        def bad() -> None:
+            try:
+                state_manager._execute_write("INSERT INTO no_such_table VALUES (1)")  # noqa: SLF001
+            except sqlite3.OperationalError as exc:
+                outcomes[-1] = exc
+
+        # Hold the write lock so all ops queue up and land in one batch
+        with state_manager._write_lock:  # noqa: SLF001
+            threads = [threading.Thread(target=good, args=(i,)) for i in range(4)]
+            threads.append(threading.Thread(target=bad))
+            for t in threads:
+                t.start()
+            while len(state_manager._pending) < 5:  # noqa: SLF001
+                pass
+        for t in threads:
+            t.join()
+
+        assert isinstance(outcomes[-1], sqlite3.OperationalError)
+        assert sorted(outcomes[i] for i in range(4)) == [1, 2, 3, 4]  # type: ignore[type-var]
+        assert len(state_manager.get_sweep_results(run_id)) == 4
+        stats = state_manager.write_stats()
+        assert stats["max_batch"] == 5
+        assert stats["failed_writes"] == 1
+
+    def test_interrupted_op_rolls_back_batch(self, state_manager: StateManager) -> None:
+        """A BaseException in an op rolls the batch back and fails its neighbours."""
+        import threading
+
+        run_id = self._run(state_manager)
+        outcomes: dict[str, BaseException | None] = {}
+
+        def good() -> None:
+            try:
+                state_manager.save_sweep_result(run_id, {"parameters": {}})
+            except sqlite3.Error as exc:
+                outcomes["good"] = exc
+            else:
+                outcomes["good"] = None
+
+        def interrupt(conn: sqlite3.Connection) -> None:
+            conn.execute("UPDATE backtest_runs SET status = 'x'")
+            raise KeyboardInterrupt
+
+        # Queue the good write first so the interrupted batch carries it
+        with state_manager._write_lock:  # noqa: SLF001
+            thread = threading.Thread(target=good)
+            thread.start()
+            while not state_manager._pending:  # noqa: SLF001
+                pass
+            state_manager._pending.append(_PendingWrite(interrupt))  # noqa: SLF001
+            with pytest.raises(KeyboardInterrupt):
+                state_manager._commit_batch()  # noqa: SLF001
+        thread.join()
+
+        assert isinstance(outcomes["good"], sqlite3.OperationalError)
+        assert not state_manager._writer().in_transaction  # noqa: SLF001
+        assert state_manager.get_sweep_results(run_id) == []
+        run = state_manager.get_backtest_run(run_id)
+        assert run is not None
+        assert run["status"] != "x"
+        # The writer is usable again
+        state_manager.update_heartbeat(run_id)
+
+    def test_reads_use_one_connection_per_thread(self, state_manager: StateManager) -> None:
+        """Each thread gets its own read connection; close() releases them."""
+        import threading
+
+        run_id = self._run(state_manager)
+        seen: list[sqlite3.Connection] = []
+        all_read = threading.Barrier(3)
+
+        def read() -> None:
+            assert state_manager.get_backtest_run(run_id) is not None
+            seen.append(state_manager._reader)  # noqa: SLF001
+            all_read.wait()
+
+        threads = [threading.Thread(target=read) for _ in range(3)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len({id(c) for c in seen}) == 3
+        assert state_manager.write_stats()["read_connections"] == 3
+        # The next new reader closes those of threads that have exited
+        assert state_manager.get_backtest_run(run_id) is not None
+        assert state_manager.write_stats()["read_connections"] == 1
+        with pytest.raises(sqlite3.ProgrammingError):
+            seen[0].execute("SELECT 1")
+        state_manager.close()
+        assert state_manager.write_stats()["read_connections"] == 0
+        # Usable again after close
+        assert state_manager.get_backtest_run(run_id) is not None
@@ -0,0 +1,187 @@
+"""Tests for on-demand detail bars used for sub-bar fill simulation."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from nautilus_trader.model.data import Bar
+from nautilus_trader.model.objects import Price, Quantity
+
+from vibe_quant.data.catalog import CatalogManager, get_bar_type
+from vibe_quant.validation.detail_store import (
+    OPEN_END,
+    DetailBarStore,
+    bar_duration_ns,
+    merge_windows,
+)
+from vibe_quant.validation.runner import ValidationRunner
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from vibe_quant.validation.detail_store import Window
+
+_SEC = 1_000_000_000
+_T0 = 1_735_689_600 * _SEC  # 2025-01-01 00:00 UTC
+
+
+def _detail_bars(n: int) -> list[Bar]:
+    bar_type = get_bar_type("BTCUSDT", "5s")
+    bars = []
+    for i in range(n):
+        price = Price.from_str(f"{100 + i}.00")
+        bars.append(
+            Bar(
+                bar_type=bar_type,
+                open=price,
+                high=price,
+                low=price,
+                close=price,
+                volume=Quantity.from_str("1.000"),
+                ts_event=_T0 + i * 5 * _SEC,
+                ts_init=_T0 + (i + 1) * 5 * _SEC - 1_000_000,
+            )
+        )
+    return bars
+
+
+class TestWindows:
+    """Tests for window helpers."""
+
+    def test_bar_duration(self) -> None:
+        assert bar_duration_ns("5s") == 5 * _SEC
+        assert bar_duration_ns("4h") == 4 * 3600 * _SEC
+        with pytest.raises(ValueError, match="Unknown timeframe"):
+            bar_duration_ns("7m")
+
+    def test_merge_pads_and_merges(self) -> None:
+        windows = merge_windows([(50, 60), (10, 20), (25, 30)], pad_ns=3)
+        assert windows == [(7, 33), (47, 63)]
+
+    def test_merge_caps_open_end(self) -> None:
+        assert merge_windows([(10, OPEN_END), (12, 15)], pad_ns=5) == [(5, OPEN_END)]
+
+
+class TestDetailBarStore:
+    """Tests for DetailBarStore against a real parquet catalog."""
+
+    @pytest.fixture
+    def bar_dir(self, tmp_path: Path) -> Path:
+        manager = CatalogManager(tmp_path)
+        bars = _detail_bars(120)
+        # Two files so the store has to concatenate them
+        manager.write_bars(bars[60:])
+        manager.write_bars(bars[:60])
+        return tmp_path / "data" / "bar" / str(get_bar_type("BTCUSDT", "5s"))
+
+    def test_bounds_and_windows(self, bar_dir: Path) -> None:
+        store = DetailBarStore(bar_dir, start_ns=_T0 + 100 * _SEC, end_ns=_T0 + 500 * _SEC)
+        # ts_init in [100s, 500s] -> bars 20..99
+        assert len(store) == 80
+
+        bars = store.bars([(_T0, _T0 + 150 * _SEC), (_T0 + 400 * _SEC, OPEN_END)])
+
+        closes = [float(b.close) for b in bars]
+        assert closes == [120.0 + i for i in range(10)] + [180.0 + i for i in range(20)]
+        assert all(b.bar_type == get_bar_type("BTCUSDT", "5s") for b in bars)
+        ts = [b.ts_init for b in bars]
+        assert ts == sorted(ts)
+
+    def test_count(self, bar_dir: Path) -> None:
+        store = DetailBarStore(bar_dir)
+        assert store.count([(_T0, _T0 + 50 * _SEC), (_T0 + 500 * _SEC, OPEN_END)]) == 10 + 20
+        assert store.count([]) == 0
+
+    def test_empty_windows(self, bar_dir: Path) -> None:
+        store = DetailBarStore(bar_dir)
+        assert len(store) == 120
+        assert store.bars([]) == []
+        assert store.bars([(0, _T0)]) == []
+
+    def test_missing_directory_raises(self, tmp_path: Path) -> None:
+        with pytest.raises(ValueError, match="No parquet files"):
+            DetailBarStore(tmp_path / "nope")
+
+
+class FakeStore:
+    """Detail store returning its windows instead of bars."""
+
+    def __init__(self) -> None:
+        self.requests: list[list[Window]] = []
+
+    def __len__(self) -> int:
+        return 1000
+
+    def count(self, windows: list[Window]) -> int:
+        # Bars at ts 0..999, one per ns
+        return sum(max(0, min(end + 1, 1000) - max(start, 0)) for start, end in windows)
+
+    def bars(self, windows: list[Window]) -> list[tuple[int, int]]:
+        self.requests.append(windows)
+        return list(windows)
+
+
+class TestOnDemandPasses:
+    """Tests for the fixed-point loop over detail windows."""
+
+    def test_stops_when_orders_stay_inside_windows(self) -> None:
+        # Pass 1 finds one order; with detail bars a second order appears,
+        # after which the order set is stable.
+        interval_sets = [[(100, 200)], [(100, 180), (400, 450)], [(100, 180), (400, 450)]]
+        calls: list[object] = []
+
+        def execute(detail: object) -> tuple[str, list[Window]]:
+            calls.append(detail)
+            return f"pass{len(calls)}", interval_sets[len(calls) - 1]
+
+        store = FakeStore()
+        result = ValidationRunner._run_with_on_demand_detail(
+            execute,  # type: ignore[arg-type]
+            [store],  # type: ignore[list-item]
+            pad_ns=10,
+            run_id=1,
+        )
+
+        assert result == "pass3"
+        assert calls[0] is None
+        assert store.requests == [[(90, 210)], [(90, 210), (390, 460)]]
+
+    def test_falls_back_to_full_detail(self) -> None:
+        n = 0
+
+        def execute(detail: object) -> tuple[int, list[Window]]:
+            nonlocal n
+            n += 1
+            # Every pass finds an order outside the previous windows
+            return n, [(n * 1000, n * 1000 + 5)]
+
+        store = FakeStore()
+        result = ValidationRunner._run_with_on_demand_detail(
+            execute,  # type: ignore[arg-type]
+            [store],  # type: ignore[list-item]
+            pad_ns=0,
+            run_id=1,
+        )
+
+        assert result == ValidationRunner._MAX_DETAIL_PASSES
+        assert store.requests[-1] == [(0, OPEN_END)]
+
+    def test_high_coverage_goes_straight_to_full_detail(self) -> None:
+        calls: list[object] = []
+
+        def execute(detail: object) -> tuple[int, list[Window]]:
+            calls.append(detail)
+            # Orders work over most of the run
+            return len(calls), [(0, 600), (700, 900)]
+
+        store = FakeStore()
+        result = ValidationRunner._run_with_on_demand_detail(
+            execute,  # type: ignore[arg-type]
+            [store],  # type: ignore[list-item]
+            pad_ns=0,
+            run_id=1,
+        )
+
+        assert result == 2
+        assert store.requests == [[(0, OPEN_END)]]
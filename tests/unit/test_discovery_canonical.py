@@ -0,0 +1,144 @@
+"""Tests for vibe_quant.discovery.canonical and population deduplication."""
+
+from __future__ import annotations
+
+import random
+from typing import Any
+
+from vibe_quant.discovery.canonical import canonicalize, genome_key
+from vibe_quant.discovery.diversity import replace_duplicates
+from vibe_quant.discovery.operators import (
+    ConditionType,
+    Direction,
+    PriceVsMAConditionGene,
+    StrategyChromosome,
+    StrategyGene,
+    is_valid_chromosome,
+)
+from vibe_quant.discovery.pipeline import DiscoveryConfig, DiscoveryPipeline
+
+
+def _gene(
+    ind: str = "RSI",
+    threshold: float = 30.0,
+    condition: ConditionType = ConditionType.GT,
+    **params: float,
+) -> StrategyGene:
+    return StrategyGene(
+        indicator_type=ind,
+        parameters=params or {"period": 14.0},
+        condition=condition,
+        threshold=threshold,
+    )
+
+
+def _chrom(entry: list[StrategyGene], **overrides: Any) -> StrategyChromosome:
+    fields: dict[str, Any] = {
+        "entry_genes": entry,
+        "exit_genes": [_gene("ADX", 25.0, ConditionType.LT, period=14.0)],
+        "stop_loss_pct": 2.0,
+        "take_profit_pct": 4.0,
+        "direction": Direction.LONG,
+    }
+    fields.update(overrides)
+    return StrategyChromosome(**fields)
+
+
+class TestGenomeKey:
+    """Tests for semantic equivalence of chromosomes."""
+
+    def test_gene_order_does_not_matter(self) -> None:
+        a, b = _gene("RSI", 30.0), _gene("CCI", -100.0, period=20.0)
+        assert genome_key(_chrom([a, b])) == genome_key(_chrom([b.clone(), a.clone()]))
+
+    def test_repeated_and_dominated_conditions_are_redundant(self) -> None:
+        base = genome_key(_chrom([_gene("RSI", 50.0)]))
+        assert genome_key(_chrom([_gene("RSI", 50.0), _gene("RSI", 50.0)])) == base
+        assert genome_key(_chrom([_gene("RSI", 30.0), _gene("RSI", 50.0)])) == base
+        # A different period is a different indicator output: both bind
+        assert genome_key(_chrom([_gene("RSI", 30.0, period=7.0), _gene("RSI", 50.0)])) != base
+
+    def test_lower_bounds_keep_the_smallest(self) -> None:
+        lt = ConditionType.LT
+        assert genome_key(_chrom([_gene("RSI", 70.0, lt), _gene("RSI", 40.0, lt)])) == genome_key(
+            _chrom([_gene("RSI", 40.0, lt)])
+        )
+
+    def test_params_compared_as_the_dsl_sees_them(self) -> None:
+        assert genome_key(_chrom([_gene(period=14.2)])) == genome_key(_chrom([_gene(period=14.8)]))
+        assert genome_key(_chrom([_gene(period=14.0)])) != genome_key(_chrom([_gene(period=15.0)]))
+        ma_a = PriceVsMAConditionGene("KAMA", {"period": 20.3}, ConditionType.GT)
+        ma_b = PriceVsMAConditionGene("KAMA", {"period": 20.9}, ConditionType.GT)
+        assert genome_key(_chrom([_gene()], ma_entry_genes=[ma_a])) == genome_key(
+            _chrom([_gene()], ma_entry_genes=[ma_b])
+        )
+
+    def test_direction_overrides_only_matter_for_both(self) -> None:
+        plain = _chrom([_gene()])
+        overridden = _chrom([_gene()], stop_loss_long_pct=5.0)
+        assert genome_key(plain) == genome_key(overridden)
+        plain.direction = overridden.direction = Direction.BOTH
+        assert genome_key(plain) != genome_key(overridden)
+
+
+def test_canonicalize_is_idempotent_and_keeps_validity() -> None:
+    chrom = _chrom(
+        [_gene("RSI", 30.0), _gene("CCI", -100.0, period=20.0), _gene("RSI", 50.0)],
+        stop_loss_short_pct=3.0,
+    )
+    key = genome_key(chrom)
+    canonicalize(chrom)
+
+    assert genome_key(chrom) == key
+    assert [g.indicator_type for g in chrom.entry_genes] == ["CCI", "RSI"]
+    assert chrom.entry_genes[1].threshold == 50.0
+    assert chrom.stop_loss_short_pct is None
+    assert is_valid_chromosome(chrom)
+    genes = [g.clone() for g in chrom.entry_genes]
+    canonicalize(chrom)
+    assert chrom.entry_genes == genes
+
+
+def test_replace_duplicates_keeps_first_and_swaps_the_rest() -> None:
+    random.seed(0)
+    a, b = _gene("RSI", 30.0), _gene("CCI", -100.0, period=20.0)
+    first = _chrom([a, b])
+    population = [first, _chrom([b.clone(), a.clone()]), first.clone(), _chrom([_gene()])]
+
+    deduped, replaced = replace_duplicates(population, direction_constraint=Direction.SHORT)
+
+    assert replaced == 2
+    assert deduped[0] is first and deduped[3] is population[3]
+    assert len({genome_key(c) for c in deduped}) == 4
+    assert deduped[1].direction == Direction.SHORT
+    assert is_valid_chromosome(deduped[1])
+
+
+def test_pipeline_backtests_only_distinct_strategies() -> None:
+    random.seed(2)
+    keys: list[object] = []
+
+    def backtest(chrom: StrategyChromosome) -> dict[str, Any]:
+        keys.append(genome_key(chrom))
+        return {
+            "sharpe_ratio": 1.0,
+            "max_drawdown": 0.1,
+            "profit_factor": 1.5,
+            "total_trades": 100,
+            "total_return": 0.1,
+        }
+
+    seed = _chrom([_gene("RSI", 30.0), _gene("CCI", -100.0, period=20.0)])
+    config = DiscoveryConfig(
+        population_size=6,
+        max_generations=1,
+        top_k=2,
+        max_workers=None,
+        symbols=["BTCUSDT"],
+        timeframe="1h",
+        eval_windows=1,
+    )
+    DiscoveryPipeline(config, backtest, seed_chromosomes=[seed.clone() for _ in range(6)]).run()
+
+    assert len(keys) == 6
+    assert len(set(keys)) == 6
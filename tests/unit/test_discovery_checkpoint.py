@@ -0,0 +1,181 @@
+"""Tests for vibe_quant.discovery.checkpoint and pipeline resume."""
+
+from __future__ import annotations
+
+import random
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from vibe_quant.discovery.checkpoint import DiscoveryCheckpoint, load_checkpoint, save_checkpoint
+from vibe_quant.discovery.fitness import FitnessResult
+from vibe_quant.discovery.genome import chromosome_to_serializable
+from vibe_quant.discovery.operators import initialize_population
+from vibe_quant.discovery.pipeline import DiscoveryConfig, DiscoveryPipeline, GenerationResult
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from vibe_quant.discovery.operators import StrategyChromosome
+    from vibe_quant.discovery.pipeline import DiscoveryResult
+
+
+class _Crash(BaseException):
+    """Simulated job kill; not caught by per-candidate error handling."""
+
+
+def _mock_backtest(chrom: StrategyChromosome) -> dict[str, Any]:
+    n_genes = len(chrom.entry_genes) + len(chrom.exit_genes)
+    total_trades = 150
+    mean_ret = (0.5 + n_genes * 0.05) / total_trades
+    r = random.Random(n_genes)
+    return {
+        "sharpe_ratio": 1.0 + chrom.take_profit_pct / 10 + n_genes * 0.1,
+        "max_drawdown": min(0.9, chrom.stop_loss_pct / 20),
+        "profit_factor": 2.0,
+        "total_trades": total_trades,
+        "total_return": 0.5 + n_genes * 0.05,
+        "trade_returns": tuple(r.gauss(mean_ret, mean_ret * 0.3) for _ in range(total_trades)),
+    }
+
+
+def _config(**overrides: Any) -> DiscoveryConfig:
+    params: dict[str, Any] = {
+        "population_size": 8,
+        "max_generations": 5,
+        "elite_count": 1,
+        "convergence_generations": 10,
+        "top_k": 3,
+        "max_workers": None,
+        "symbols": ["BTCUSDT"],
+        "timeframe": "1h",
+    }
+    params.update(overrides)
+    return DiscoveryConfig(**params)
+
+
+def _fingerprint(result: DiscoveryResult) -> tuple[object, ...]:
+    return (
+        [(g.best_fitness, g.mean_fitness) for g in result.generations],
+        result.total_candidates_evaluated,
+        [(chromosome_to_serializable(c), fr.adjusted_score) for c, fr in result.top_strategies],
+    )
+
+
+def test_round_trip_preserves_state(tmp_path: Path) -> None:
+    random.seed(3)
+    population = initialize_population(3)
+    fr = FitnessResult(
+        sharpe_ratio=1.5,
+        max_drawdown=0.1,
+        profit_factor=2.0,
+        total_trades=3,
+        total_return=0.2,
+        complexity_penalty=0.0,
+        overtrade_penalty=0.0,
+        sl_tp_penalty=0.0,
+        raw_score=0.7,
+        adjusted_score=0.7,
+        passed_filters=True,
+        filter_results={"dsr": True},
+        trade_returns=(0.01, -0.02, 0.03),
+    )
+    gen = GenerationResult(
+        generation=0,
+        best_fitness=0.7,
+        mean_fitness=0.5,
+        worst_fitness=0.1,
+        best_chromosome=population[0],
+        population_size=3,
+        num_passed_filters=1,
+    )
+    rng_state = random.getstate()
+    checkpoint = DiscoveryCheckpoint(
+        generation=0,
+        population=population,
+        fitness_results=[fr] * 3,
+        generation_results=[gen],
+        all_scored=[(population[1], fr)],
+        total_evaluated=3,
+        elapsed=12.5,
+        rng_state=rng_state,
+        config={"population_size": 3},
+        promotion=(0.4, None),
+    )
+    path = tmp_path / "ckpt.json"
+    save_checkpoint(checkpoint, path)
+    loaded = load_checkpoint(path)
+
+    assert loaded is not None
+    assert [c.uid for c in loaded.population] == [c.uid for c in population]
+    assert [chromosome_to_serializable(c) for c in loaded.population] == [
+        chromosome_to_serializable(c) for c in population
+    ]
+    assert loaded.fitness_results[0] == fr
+    assert loaded.generation_results[0].best_chromosome.uid == population[0].uid
+    assert loaded.rng_state == rng_state
+    assert loaded.promotion == (0.4, None)
+    assert loaded.surrogate is None
+    assert not (tmp_path / "ckpt.tmp").exists()
+    assert load_checkpoint(tmp_path / "missing.json") is None
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        {},
+        {"surrogate_eval_fraction": 0.5, "surrogate_min_archive": 8, "multi_objective": True},
+    ],
+)
+def test_resume_continues_bit_identically(tmp_path: Path, overrides: dict[str, Any]) -> None:
+    config = _config(**overrides)
+    random.seed(21)
+    expected = DiscoveryPipeline(config, _mock_backtest).run()
+
+    checkpoint = tmp_path / "ckpt.json"
+    calls = 0
+
+    def crashing_backtest(chrom: StrategyChromosome) -> dict[str, Any]:
+        nonlocal calls
+        calls += 1
+        if calls > 17:  # dies mid-run, after some generations were checkpointed
+            raise _Crash
+        return _mock_backtest(chrom)
+
+    random.seed(21)
+    with pytest.raises(_Crash):
+        DiscoveryPipeline(config, crashing_backtest, checkpoint_file=checkpoint).run()
+    loaded = load_checkpoint(checkpoint)
+    assert loaded is not None and 1 <= loaded.generation < config.max_generations - 1
+
+    random.seed(999)  # resume must not depend on the fresh process's RNG
+    resumed = DiscoveryPipeline(
+        config, _mock_backtest, checkpoint_file=checkpoint, resume=True
+    ).run()
+
+    assert _fingerprint(resumed) == _fingerprint(expected)
+    assert not checkpoint.exists()  # finished runs cannot be resumed again
+
+
+def test_resume_rejects_changed_config(tmp_path: Path) -> None:
+    checkpoint = tmp_path / "ckpt.json"
+    random.seed(1)
+    DiscoveryPipeline(
+        _config(max_generations=2), _mock_backtest, checkpoint_file=checkpoint
+    )._save_checkpoint(
+        generation=0,
+        population=initialize_population(8),
+        fitness_results=[],
+        generation_results=[],
+        all_scored=[],
+        total_evaluated=0,
+        elapsed=0.0,
+    )
+    pipeline = DiscoveryPipeline(
+        _config(max_generations=2, mutation_rate=0.3),
+        _mock_backtest,
+        checkpoint_file=checkpoint,
+        resume=True,
+    )
+    with pytest.raises(ValueError, match="mutation_rate"):
+        pipeline.run()
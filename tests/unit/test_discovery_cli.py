@@ -146,6 +146,55 @@ def test_multi_seed_runs(tmp_path: Path, monkeypatch) -> None:
     assert notes.get("num_seeds") == 3
 
 
+def test_island_model_runs(tmp_path: Path, monkeypatch) -> None:
+    """--islands should evolve the seeds as islands and record the topology."""
+    db_path = tmp_path / "state.db"
+    run_id = _create_discovery_run(db_path)
+    monkeypatch.chdir(tmp_path)
+
+    monkeypatch.setattr(
+        "sys.argv",
+        [
+            "prog",
+            "--run-id",
+            str(run_id),
+            "--population-size",
+            "6",
+            "--max-generations",
+            "3",
+            "--elite-count",
+            "1",
+            "--timeframe",
+            "1h",
+            "--num-seeds",
+            "3",
+            "--islands",
+            "--migration-interval",
+            "1",
+            "--migration-topology",
+            "fully_connected",
+            "--db",
+            str(db_path),
+            "--mock",
+        ],
+    )
+
+    assert main() == 0
+
+    state = StateManager(db_path)
+    result = state.get_backtest_result(run_id)
+    state.close()
+
+    import json
+
+    assert result is not None
+    notes = json.loads(result["notes"])
+    assert notes["num_seeds"] == 3
+    assert notes["islands"]["topology"] == "fully_connected"
+    progress = json.loads((tmp_path / f"logs/discovery_{run_id}_progress.json").read_text())
+    assert progress["num_islands"] == 3
+
+
 def test_cross_window_metadata_persisted_to_notes(tmp_path: Path, monkeypatch) -> None:
     """Discovery notes should retain direction and cross-window config."""
     db_path = tmp_path / "state.db"
@@ -1,13 +1,23 @@
 """Tests for chromosome Gower distance metric."""
 
+import random
+
+import numpy as np
 import pytest
 
-from vibe_quant.discovery.distance import gene_distance, chromosome_distance
+from vibe_quant.discovery.distance import (
+    chromosome_distance,
+    distance_matrix,
+    encode_chromosomes,
+    gene_distance,
+)
 from vibe_quant.discovery.operators import (
     ConditionType,
     Direction,
     StrategyChromosome,
     StrategyGene,
+    initialize_population,
+    mutate,
 )
 
 
@@ -136,3 +146,44 @@ class TestChromosomeDistance:
         )
         d = chromosome_distance(a, b)
         assert 0.0 <= d <= 1.0
+
+
+def _reference_matrix(rows: list[StrategyChromosome], cols: list[StrategyChromosome]) -> np.ndarray:
+    return np.array([[chromosome_distance(a, b) for b in cols] for a in rows])
+
+
+class TestDistanceMatrix:
+    """Tests for the vectorized distance matrix."""
+
+    def test_matches_scalar_distance(self) -> None:
+        random.seed(5)
+        pop = initialize_population(40)
+        pop += [mutate(c, 0.3) for c in pop[:10]]
+        pop.append(_chrom([_gene("UNKNOWN_IND")], [_gene("RSI")], direction=Direction.BOTH))
+
+        matrix = distance_matrix(encode_chromosomes(pop))
+
+        np.testing.assert_allclose(matrix, _reference_matrix(pop, pop), atol=1e-12)
+        # Unknown indicators keep a 0.5 param distance even to themselves
+        assert np.diag(matrix)[:-1].max() == 0.0
+
+    def test_rectangular_and_wider_than_default_slots(self) -> None:
+        random.seed(6)
+        pop = initialize_population(5)
+        wide = _chrom([_gene("RSI", p) for p in range(10, 17)], [_gene("CCI")])
+
+        matrix = distance_matrix(encode_chromosomes(pop), encode_chromosomes([wide]))
+
+        assert matrix.shape == (5, 1)
+        np.testing.assert_allclose(matrix, _reference_matrix(pop, [wide]), atol=1e-12)
+
+    def test_concat_and_take_preserve_rows(self) -> None:
+        random.seed(7)
+        pop = initialize_population(6)
+        joined = encode_chromosomes(pop[:3]).concat(encode_chromosomes(pop[3:]))
+        np.testing.assert_allclose(
+            distance_matrix(joined.take([4, 0])),
+            _reference_matrix([pop[4], pop[0]], [pop[4], pop[0]]),
+            atol=1e-12,
+        )
+
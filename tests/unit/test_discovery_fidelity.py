@@ -0,0 +1,189 @@
+"""Tests for vibe_quant.discovery.fidelity and multi-fidelity discovery."""
+
+from __future__ import annotations
+
+import random
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from vibe_quant.discovery.fidelity import PromotionSchedule, random_sub_window
+from vibe_quant.discovery.fitness import (
+    FULL_FIDELITY,
+    SCREEN_FIDELITY,
+    FitnessResult,
+    fidelity_ranked_scores,
+)
+from vibe_quant.discovery.nsga import nsga2_rank
+from vibe_quant.discovery.pipeline import DiscoveryConfig, DiscoveryPipeline
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from vibe_quant.discovery.operators import StrategyChromosome
+
+
+def _fitness(score: float, fidelity: int = FULL_FIDELITY) -> FitnessResult:
+    return FitnessResult(
+        sharpe_ratio=score,
+        max_drawdown=0.1,
+        profit_factor=2.0,
+        total_trades=100,
+        total_return=0.2,
+        complexity_penalty=0.0,
+        overtrade_penalty=0.0,
+        sl_tp_penalty=0.0,
+        raw_score=score,
+        adjusted_score=score,
+        passed_filters=True,
+        filter_results={},
+        fidelity=fidelity,
+    )
+
+
+def _mock_backtest(chrom: StrategyChromosome, trades: int = 150) -> dict[str, Any]:
+    n_genes = len(chrom.entry_genes) + len(chrom.exit_genes)
+    mean_ret = (0.5 + n_genes * 0.05) / trades
+    r = random.Random(n_genes)
+    return {
+        "sharpe_ratio": 2.0 + n_genes * 0.1 + chrom.take_profit_pct / 100,
+        "max_drawdown": 0.08,
+        "profit_factor": 2.0,
+        "total_trades": trades,
+        "total_return": 0.5 + n_genes * 0.05,
+        "trade_returns": tuple(r.gauss(mean_ret, mean_ret * 0.3) for _ in range(trades)),
+    }
+
+
+class TestRandomSubWindow:
+    """Tests for sub-window sampling."""
+
+    def test_window_inside_range_with_requested_length(self) -> None:
+        rng = random.Random(0)
+        for _ in range(50):
+            start, end = random_sub_window("2024-01-01", "2024-12-31", 0.25, rng)
+            assert "2024-01-01" <= start < end <= "2024-12-31"
+
+    def test_full_fraction_is_whole_range(self) -> None:
+        assert random_sub_window("2024-01-01", "2024-03-01", 1.0) == ("2024-01-01", "2024-03-01")
+
+    def test_rejects_bad_fraction(self) -> None:
+        with pytest.raises(ValueError, match="fraction"):
+            random_sub_window("2024-01-01", "2024-03-01", 0.0)
+
+
+class TestPromotionSchedule:
+    """Tests for promotion and rate adaptation."""
+
+    def test_promotes_top_fraction_in_index_order(self) -> None:
+        schedule = PromotionSchedule(rate=0.4)
+        assert schedule.promote([0.1, 0.9, 0.5, 0.7, 0.2]) == [1, 3]
+
+    def test_always_promotes_one(self) -> None:
+        assert PromotionSchedule(rate=0.2, min_rate=0.2).promote([0.3, 0.1]) == [0]
+
+    def test_rate_falls_when_screen_predicts_full(self) -> None:
+        schedule = PromotionSchedule(rate=0.5, min_rate=0.2, smoothing=0.0)
+        schedule.update([0.1, 0.2, 0.3, 0.4], [1.0, 2.0, 3.0, 4.0])
+        assert schedule.last_correlation == pytest.approx(1.0)
+        assert schedule.rate == pytest.approx(0.2)
+
+    def test_rate_rises_when_screen_is_uninformative(self) -> None:
+        schedule = PromotionSchedule(rate=0.5, min_rate=0.2, smoothing=0.5)
+        schedule.update([0.1, 0.2, 0.3, 0.4], [4.0, 3.0, 2.0, 1.0])
+        assert schedule.rate == pytest.approx(0.75)
+
+    def test_constant_scores_leave_rate_unchanged(self) -> None:
+        schedule = PromotionSchedule(rate=0.5)
+        assert schedule.update([0.0, 0.0, 0.0], [1.0, 2.0, 3.0]) == 0.5
+        assert schedule.last_correlation is None
+
+
+def test_fidelity_ranked_scores_never_mix_levels() -> None:
+    results = [
+        _fitness(0.3),
+        _fitness(0.9, SCREEN_FIDELITY),
+        _fitness(0.1),
+        _fitness(0.2, SCREEN_FIDELITY),
+    ]
+    scores = fidelity_ranked_scores(results)
+    order = sorted(range(4), key=lambda i: scores[i], reverse=True)
+    assert order == [0, 2, 1, 3]
+    assert fidelity_ranked_scores(results[::2]) == [0.3, 0.1]
+
+
+def test_nsga2_rank_puts_screened_after_full() -> None:
+    results = [_fitness(5.0, SCREEN_FIDELITY), _fitness(1.0), _fitness(0.0)]
+    ranks, _ = nsga2_rank(results)
+    assert ranks.tolist() == [2, 0, 1]
+
+
+def test_config_rejects_bad_promotion_rates() -> None:
+    with pytest.raises(ValueError, match="promotion_rate"):
+        DiscoveryConfig(promotion_rate=0.1, min_promotion_rate=0.2)
+    with pytest.raises(ValueError, match="fidelity_window_fraction"):
+        DiscoveryConfig(fidelity_window_fraction=1.5)
+
+
+def _counting_factory(
+    windows: list[tuple[str, str]],
+) -> Callable[[str, str], Callable[[StrategyChromosome], dict[str, Any]]]:
+    def factory(start: str, end: str) -> Callable[[StrategyChromosome], dict[str, Any]]:
+        windows.append((start, end))
+        return lambda chrom: _mock_backtest(chrom, trades=40)
+
+    return factory
+
+
+def test_pipeline_promotes_subset_to_full_fidelity() -> None:
+    random.seed(4)
+    config = DiscoveryConfig(
+        population_size=10,
+        max_generations=4,
+        elite_count=1,
+        convergence_generations=10,
+        top_k=3,
+        min_trades=50,
+        max_workers=None,
+        symbols=["BTCUSDT"],
+        timeframe="1h",
+        start_date="2024-01-01",
+        end_date="2024-12-31",
+        fidelity_window_fraction=0.25,
+        promotion_rate=0.4,
+        min_promotion_rate=0.2,
+    )
+    full_calls = 0
+
+    def backtest(chrom: StrategyChromosome) -> dict[str, Any]:
+        nonlocal full_calls
+        full_calls += 1
+        return _mock_backtest(chrom)
+
+    windows: list[tuple[str, str]] = []
+    pipeline = DiscoveryPipeline(config, backtest, backtest_fn_factory=_counting_factory(windows))
+    result = pipeline.run()
+
+    n_gens = len(result.generations)
+    assert len(windows) == n_gens  # one screening window per generation
+    assert full_calls == result.total_candidates_evaluated
+    assert result.total_candidates_evaluated < 10 * n_gens
+    # Only full-fidelity results can reach the top-K
+    assert result.top_strategies
+    assert all(fr.fidelity == FULL_FIDELITY for _, fr in result.top_strategies)
+
+
+def test_pipeline_without_factory_runs_full_fidelity() -> None:
+    random.seed(4)
+    config = DiscoveryConfig(
+        population_size=6,
+        max_generations=2,
+        elite_count=1,
+        top_k=2,
+        max_workers=None,
+        symbols=["BTCUSDT"],
+        timeframe="1h",
+        fidelity_window_fraction=0.25,
+    )
+    result = DiscoveryPipeline(config, _mock_backtest).run()
+    assert result.total_candidates_evaluated == 6 * len(result.generations)
@@ -0,0 +1,151 @@
+"""Tests for vibe_quant.discovery.islands."""
+
+from __future__ import annotations
+
+import json
+import random
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from vibe_quant.discovery.fitness import FitnessResult
+from vibe_quant.discovery.islands import (
+    IslandConfig,
+    IslandModel,
+    migrate,
+    migration_targets,
+)
+from vibe_quant.discovery.operators import initialize_population
+from vibe_quant.discovery.pipeline import DiscoveryConfig
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from vibe_quant.discovery.operators import StrategyChromosome
+
+
+def _fitness(score: float) -> FitnessResult:
+    return FitnessResult(
+        sharpe_ratio=score,
+        max_drawdown=0.1,
+        profit_factor=2.0,
+        total_trades=100,
+        total_return=0.2,
+        complexity_penalty=0.0,
+        overtrade_penalty=0.0,
+        sl_tp_penalty=0.0,
+        raw_score=score,
+        adjusted_score=score,
+        passed_filters=True,
+        filter_results={},
+    )
+
+
+def _mock_backtest(chrom: StrategyChromosome) -> dict[str, Any]:
+    n_genes = len(chrom.entry_genes) + len(chrom.exit_genes)
+    total_trades = 150
+    mean_ret = (0.5 + n_genes * 0.05) / total_trades
+    r = random.Random(n_genes)
+    return {
+        "sharpe_ratio": 2.0 + n_genes * 0.1,
+        "max_drawdown": 0.08,
+        "profit_factor": 2.0,
+        "total_trades": total_trades,
+        "total_return": 0.5 + n_genes * 0.05,
+        "trade_returns": tuple(r.gauss(mean_ret, mean_ret * 0.3) for _ in range(total_trades)),
+    }
+
+
+class TestMigrationTargets:
+    """Tests for topology construction."""
+
+    def test_ring(self) -> None:
+        assert migration_targets("ring", 3) == {0: [1], 1: [2], 2: [0]}
+
+    def test_fully_connected(self) -> None:
+        assert migration_targets("fully_connected", 3) == {0: [1, 2], 1: [0, 2], 2: [0, 1]}
+
+    def test_random_never_targets_self(self) -> None:
+        targets = migration_targets("random", 4, random.Random(1))
+        assert all(len(t) == 1 and t[0] != i for i, t in targets.items())
+
+    def test_single_island_has_no_targets(self) -> None:
+        assert migration_targets("ring", 1) == {0: []}
+
+
+class TestMigrate:
+    """Tests for moving individuals between islands."""
+
+    def test_best_replace_worst_from_snapshot(self) -> None:
+        random.seed(0)
+        pops = [initialize_population(4) for _ in range(2)]
+        fitness = [
+            [_fitness(s) for s in (0.1, 0.9, 0.5, 0.3)],
+            [_fitness(s) for s in (0.8, 0.2, 0.7, 0.4)],
+        ]
+        best_a, best_b = pops[0][1], pops[1][0]
+
+        moved = migrate(pops, fitness, migration_targets("ring", 2), migration_size=1)
+
+        assert moved == 2
+        # Island 1's worst (0.2) got island 0's best, and vice versa (0.1 slot)
+        assert pops[1][1].uid == best_a.uid
+        assert fitness[1][1].adjusted_score == 0.9
+        assert pops[0][0].uid == best_b.uid
+        assert fitness[0][0].adjusted_score == 0.8
+        # Migrants are copies
+        assert pops[1][1] is not best_a
+
+    def test_keeps_at_least_one_resident(self) -> None:
+        random.seed(0)
+        pops = [initialize_population(2) for _ in range(3)]
+        fitness = [[_fitness(0.5), _fitness(0.4)] for _ in range(3)]
+
+        moved = migrate(pops, fitness, migration_targets("fully_connected", 3), 2)
+
+        assert moved == 3  # 4 candidates per island, capped at 1 slot each
+
+    def test_zero_size_is_noop(self) -> None:
+        pops = [initialize_population(2) for _ in range(2)]
+        fitness = [[_fitness(0.5)] * 2 for _ in range(2)]
+        assert migrate(pops, fitness, migration_targets("ring", 2), 0) == 0
+
+
+def test_island_config_validation() -> None:
+    with pytest.raises(ValueError, match="migration_interval"):
+        IslandConfig(migration_interval=0)
+    with pytest.raises(ValueError, match="topology"):
+        IslandConfig(topology="star")  # type: ignore[arg-type]
+
+
+def test_island_model_runs_and_writes_merged_progress(tmp_path: Path) -> None:
+    progress = tmp_path / "progress.json"
+    config = DiscoveryConfig(
+        population_size=6,
+        max_generations=4,
+        elite_count=1,
+        convergence_generations=2,
+        top_k=3,
+        max_workers=None,
+        symbols=["BTCUSDT"],
+        timeframe="1h",
+    )
+    model = IslandModel(
+        config,
+        IslandConfig(num_islands=3, migration_interval=1, migration_size=1),
+        _mock_backtest,
+        progress_file=progress,
+    )
+
+    result = model.run()
+
+    assert result.generations
+    # Every generation evaluates all islands together
+    assert all(gr.population_size == 18 for gr in result.generations)
+    assert result.total_candidates_evaluated == 18 * len(result.generations)
+    assert 0 < len(result.top_strategies) <= 3
+
+    data = json.loads(progress.read_text())
+    assert data["num_islands"] == 3
+    assert [i["island"] for i in data["islands"]] == [0, 1, 2]
+    assert data["migrated"] > 0 or len(result.generations) == 1
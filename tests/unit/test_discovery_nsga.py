@@ -0,0 +1,173 @@
+"""Tests for vibe_quant.discovery.nsga."""
+
+from __future__ import annotations
+
+import random
+from typing import Any
+
+import numpy as np
+import pytest
+
+from vibe_quant.discovery.fitness import FitnessResult
+from vibe_quant.discovery.nsga import (
+    ParetoArchive,
+    crowded_scores,
+    crowding_distance,
+    non_dominated_sort,
+    nsga2_rank,
+    pareto_front,
+)
+from vibe_quant.discovery.operators import StrategyChromosome, initialize_population
+from vibe_quant.discovery.pipeline import DiscoveryConfig, DiscoveryPipeline
+
+
+def _fitness(
+    sharpe: float, dd: float = 0.1, trades: int = 100, score: float = 1.0
+) -> FitnessResult:
+    return FitnessResult(
+        sharpe_ratio=sharpe,
+        max_drawdown=dd,
+        profit_factor=2.0,
+        total_trades=trades,
+        total_return=0.2,
+        complexity_penalty=0.0,
+        overtrade_penalty=0.0,
+        sl_tp_penalty=0.0,
+        raw_score=score,
+        adjusted_score=score,
+        passed_filters=True,
+        filter_results={},
+    )
+
+
+def _reference_ranks(obj: np.ndarray) -> list[int]:
+    """Naive front peeling for cross-checking."""
+    n = len(obj)
+    ranks = [-1] * n
+    remaining = set(range(n))
+    rank = 0
+    while remaining:
+        front = [
+            i
+            for i in remaining
+            if not any(
+                np.all(obj[j] >= obj[i]) and np.any(obj[j] > obj[i]) for j in remaining if j != i
+            )
+        ]
+        for i in front:
+            ranks[i] = rank
+        remaining -= set(front)
+        rank += 1
+    return ranks
+
+
+class TestNonDominatedSort:
+    """Tests for front ranking."""
+
+    def test_matches_reference_with_ties(self) -> None:
+        rng = np.random.default_rng(7)
+        obj = rng.integers(0, 5, size=(120, 3)).astype(float)  # many exact ties
+        assert non_dominated_sort(obj).tolist() == _reference_ranks(obj)
+
+    def test_front_zero_matches_pareto_front(self) -> None:
+        obj = np.random.default_rng(1).normal(size=(300, 4))
+        ranks = non_dominated_sort(obj)
+        assert np.flatnonzero(ranks == 0).tolist() == pareto_front(obj).tolist()
+
+    def test_nan_is_worst(self) -> None:
+        ranks = non_dominated_sort([[1.0, 1.0], [float("nan"), 2.0], [0.0, 0.0]])
+        assert ranks.tolist() == [0, 0, 1]
+
+    def test_empty_and_shape_check(self) -> None:
+        assert non_dominated_sort(np.empty((0, 3))).size == 0
+        with pytest.raises(ValueError, match="2-D"):
+            non_dominated_sort([1.0, 2.0])
+
+
+def test_crowding_distance_boundaries_infinite() -> None:
+    obj = np.array([[0.0, 4.0], [1.0, 3.0], [2.0, 1.0], [4.0, 0.0]])
+    dist = crowding_distance(obj, np.zeros(4, dtype=np.int64))
+    assert np.isinf(dist[0]) and np.isinf(dist[3])
+    # Interior: (2-0)/4 + (4-1)/4 for point 1, (4-1)/4 + (3-0)/4 for point 2
+    assert dist[1] == pytest.approx(1.25)
+    assert dist[2] == pytest.approx(1.5)
+
+
+def test_crowded_scores_rank_dominates_crowding() -> None:
+    scores = crowded_scores([0, 0, 1], [0.0, np.inf, np.inf])
+    assert scores[1] > scores[0] > scores[2]
+
+
+def test_nsga2_rank_puts_infeasible_last() -> None:
+    results = [_fitness(5.0, score=0.0), _fitness(1.0), _fitness(0.5)]
+    ranks, _ = nsga2_rank(results)
+    assert ranks.tolist() == [2, 0, 1]
+
+
+class TestParetoArchive:
+    """Tests for the cross-generation archive."""
+
+    def test_keeps_only_non_dominated_feasible(self) -> None:
+        random.seed(0)
+        chroms = initialize_population(4)
+        archive = ParetoArchive(max_size=10)
+        archive.update(
+            [
+                (chroms[0], _fitness(2.0, dd=0.2)),
+                (chroms[1], _fitness(1.0, dd=0.1)),
+                (chroms[2], _fitness(0.5, dd=0.3)),  # dominated by both
+                (chroms[3], _fitness(9.0, score=0.0)),  # infeasible
+            ]
+        )
+        assert {c.uid for c, _ in archive.members} == {chroms[0].uid, chroms[1].uid}
+
+        archive.update([(chroms[2], _fitness(3.0, dd=0.05))])
+        assert [c.uid for c, _ in archive.members] == [chroms[2].uid]
+
+    def test_truncates_by_crowding(self) -> None:
+        random.seed(0)
+        chroms = initialize_population(6)
+        archive = ParetoArchive(max_size=3)
+        archive.update((c, _fitness(float(i), dd=0.05 * i)) for i, c in enumerate(chroms))
+        assert len(archive) == 3
+        sharpes = {fr.sharpe_ratio for _, fr in archive.members}
+        assert {0.0, 5.0} <= sharpes  # extremes survive
+
+
+def _mock_backtest(chrom: StrategyChromosome) -> dict[str, Any]:
+    n_genes = len(chrom.entry_genes) + len(chrom.exit_genes)
+    total_trades = 80 + 20 * n_genes
+    mean_ret = 0.5 / total_trades
+    r = random.Random(n_genes)
+    return {
+        "sharpe_ratio": 1.0 + chrom.take_profit_pct / 10,
+        "max_drawdown": min(0.9, chrom.stop_loss_pct / 20),
+        "profit_factor": 2.0,
+        "total_trades": total_trades,
+        "total_return": 0.5,
+        "trade_returns": tuple(r.gauss(mean_ret, mean_ret * 0.3) for _ in range(total_trades)),
+    }
+
+
+def test_pipeline_multi_objective_returns_pareto_front() -> None:
+    random.seed(11)
+    config = DiscoveryConfig(
+        population_size=12,
+        max_generations=4,
+        elite_count=2,
+        convergence_generations=2,
+        top_k=3,
+        max_workers=None,
+        symbols=["BTCUSDT"],
+        timeframe="1h",
+        multi_objective=True,
+        pareto_archive_size=20,
+    )
+
+    result = DiscoveryPipeline(config, _mock_backtest).run()
+
+    assert result.top_strategies
+    assert 0 < len(result.pareto_front) <= 20
+    front = [fr for _, fr in result.pareto_front]
+    ranks, _ = nsga2_rank(front, "1h")
+    assert (ranks == 0).all()
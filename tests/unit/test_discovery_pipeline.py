@@ -55,6 +55,15 @@ def _mock_backtest_few_trades(chrom: StrategyChromosome) -> dict[str, Any]:
     }
 
 
+_DRIVER_CALLS: list[str] = []
+
+
+def _raising_backtest(chrom: StrategyChromosome) -> dict[str, Any]:
+    _DRIVER_CALLS.append(chrom.uid)  # a worker process appends to its own copy
+    msg = "engine exploded"
+    raise RuntimeError(msg)
+
+
 def _mock_filter(chrom: StrategyChromosome, bt: dict[str, Any]) -> dict[str, bool]:
     """Mock filter: pass if sharpe > 1."""
     return {"sharpe_check": bt["sharpe_ratio"] > 1.0}
@@ -790,3 +799,84 @@ class TestElitePreservation:
         new_slp = [c.stop_loss_pct for c in new_pop[:2]]
         # Elites are cloned into first positions
         assert new_slp == elite_slp
+
+
+class TestConcurrentValidation:
+    """Holdout, cross-window and WFA backtests share the worker pool."""
+
+    @staticmethod
+    def _top(pipe: DiscoveryPipeline, n: int = 2) -> list[tuple[StrategyChromosome, Any]]:
+        pop = initialize_population(n)
+        fitness, _ = pipe._evaluate(pop, None)
+        return list(zip(pop, fitness, strict=True))
+
+    def test_stages_run_concurrently_on_pool(self) -> None:
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+
+        # Passes only if all 2 holdout + 2 WFA backtests are in flight together
+        barrier = threading.Barrier(4, timeout=5)
+
+        def blocking_backtest(chrom: StrategyChromosome) -> dict[str, Any]:
+            barrier.wait()
+            return {
+                "sharpe_ratio": 1.2,
+                "max_drawdown": 0.1,
+                "profit_factor": 1.5,
+                "total_trades": 80,
+                "total_return": 0.1,
+            }
+
+        cfg = _make_config(
+            train_test_split=0.5,
+            holdout_start_date="2024-06-01", holdout_end_date="2024-07-05",
+            wfa_oos_step_days=30,
+        )
+        pipe = DiscoveryPipeline(
+            cfg, _mock_backtest,
+            holdout_backtest_fn=blocking_backtest,
+            backtest_fn_factory=lambda s, e: blocking_backtest,
+        )
+        top = self._top(pipe)
+        windows = pipe._wfa_window_dates("2024-06-01", "2024-07-05")
+        assert len(windows) == 1
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            holdout_pending = pipe._submit_holdout(top, pool)  # type: ignore[arg-type]
+            wfa_pending = pipe._submit_wfa(top, windows, pool)  # type: ignore[arg-type]
+            holdout = pipe._evaluate_holdout(top, holdout_pending)
+            wfa, _ = pipe._evaluate_wfa_rolling(top, *windows[0], wfa_pending)
+
+        assert [hr.total_trades for hr in holdout] == [80, 80]
+        assert all(w.oos_windows[0].total_trades == 80 for w in wfa)
+
+    def test_worker_failure_retried_in_driver(self) -> None:
+        from concurrent.futures import ProcessPoolExecutor
+
+        from vibe_quant.discovery.pipeline import _submit_validation
+
+        def closure_backtest(chrom: StrategyChromosome) -> dict[str, Any]:
+            return {"sharpe_ratio": float("nan"), "total_trades": 60, "total_return": 0.2}
+
+        chrom = initialize_population(1)[0]
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            # Local closures cannot be pickled for the worker
+            hr = _submit_validation(pool, closure_backtest, chrom)()
+
+        assert hr.total_trades == 60
+        assert hr.sharpe_ratio == 0.0  # NaN replaced
+        assert hr.max_drawdown == 1.0
+
+    def test_backtest_error_not_retried_in_driver(self) -> None:
+        from concurrent.futures import ProcessPoolExecutor
+
+        from vibe_quant.discovery.pipeline import _submit_validation
+
+        _DRIVER_CALLS.clear()
+        chrom = initialize_population(1)[0]
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            join = _submit_validation(pool, _raising_backtest, chrom)
+            with pytest.raises(RuntimeError, match="engine exploded"):
+                join()
+
+        assert _DRIVER_CALLS == []
@@ -0,0 +1,159 @@
+"""Tests for vibe_quant.discovery.steady_state."""
+
+from __future__ import annotations
+
+import json
+import random
+from typing import TYPE_CHECKING, Any
+
+from vibe_quant.discovery.fitness import FitnessResult
+from vibe_quant.discovery.operators import initialize_population
+from vibe_quant.discovery.pipeline import DiscoveryConfig
+from vibe_quant.discovery.steady_state import SteadyStateGA
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from vibe_quant.discovery.operators import StrategyChromosome
+
+
+def _fitness(score: float) -> FitnessResult:
+    return FitnessResult(
+        sharpe_ratio=score,
+        max_drawdown=0.1,
+        profit_factor=2.0,
+        total_trades=100,
+        total_return=0.2,
+        complexity_penalty=0.0,
+        overtrade_penalty=0.0,
+        sl_tp_penalty=0.0,
+        raw_score=score,
+        adjusted_score=score,
+        passed_filters=True,
+        filter_results={},
+    )
+
+
+def _mock_backtest(chrom: StrategyChromosome) -> dict[str, Any]:
+    n_genes = len(chrom.entry_genes) + len(chrom.exit_genes)
+    total_trades = 150
+    mean_ret = (0.5 + n_genes * 0.05) / total_trades
+    r = random.Random(n_genes)
+    return {
+        "sharpe_ratio": 2.0 + n_genes * 0.1,
+        "max_drawdown": 0.08,
+        "profit_factor": 2.0,
+        "total_trades": total_trades,
+        "total_return": 0.5 + n_genes * 0.05,
+        "trade_returns": tuple(r.gauss(mean_ret, mean_ret * 0.3) for _ in range(total_trades)),
+    }
+
+
+def _config(**overrides: Any) -> DiscoveryConfig:
+    params: dict[str, Any] = {
+        "population_size": 6,
+        "max_generations": 4,
+        "elite_count": 1,
+        "convergence_generations": 10,
+        "top_k": 3,
+        "max_workers": None,
+        "symbols": ["BTCUSDT"],
+        "timeframe": "1h",
+    }
+    params.update(overrides)
+    return DiscoveryConfig(**params)
+
+
+def _seeded(ga: SteadyStateGA, scores: list[float]) -> list[StrategyChromosome]:
+    ga._population = initialize_population(len(scores))
+    ga._fitness = [_fitness(s) for s in scores]
+    return list(ga._population)
+
+
+class TestReplace:
+    """Tests for merging a finished child into the population."""
+
+    def test_tournament_replaces_worst_only_if_not_worse(self) -> None:
+        random.seed(0)
+        ga = SteadyStateGA(_config(use_crowding=False), _mock_backtest)
+        before = _seeded(ga, [0.5, 0.1, 0.9, 0.3])
+        child = initialize_population(1)[0]
+
+        ga._replace(child, _fitness(0.05), (before[0], before[2]))
+        assert ga._population == before
+
+        ga._replace(child, _fitness(0.4), (before[0], before[2]))
+        assert ga._population[1] is child
+        assert ga.replacements == 1
+
+    def test_crowding_competes_with_closer_parent(self) -> None:
+        random.seed(0)
+        ga = SteadyStateGA(_config(use_crowding=True), _mock_backtest)
+        before = _seeded(ga, [0.5, 0.1, 0.2, 0.3])
+        child = ga._population[2].clone()  # identical to parent 2
+
+        ga._replace(child, _fitness(0.25), (before[0], before[2]))
+
+        assert ga._population[2] is child
+        assert ga._fitness[0] is not None and ga._fitness[0].adjusted_score == 0.5
+
+    def test_crowding_skips_parent_replaced_in_flight(self) -> None:
+        random.seed(0)
+        ga = SteadyStateGA(_config(use_crowding=True), _mock_backtest)
+        before = _seeded(ga, [0.5, 0.1, 0.2, 0.3])
+        child = before[2].clone()
+        # Another child took parent 2's slot while this one was evaluated
+        newcomer = initialize_population(1)[0]
+        ga._replace(newcomer, _fitness(0.2), (before[2], before[2]))
+        assert ga._population[2] is newcomer
+
+        # The remaining parent is fitter, so the child is discarded
+        ga._replace(child, _fitness(0.25), (before[0], before[2]))
+
+        assert ga._population[2] is newcomer
+        assert ga._population[0] is before[0]
+
+    def test_crowding_without_parents_competes_with_most_similar(self) -> None:
+        random.seed(0)
+        ga = SteadyStateGA(_config(use_crowding=True), _mock_backtest)
+        _seeded(ga, [0.5, 0.1, 0.2, 0.3])
+        gone = initialize_population(2)
+        child = ga._population[3].clone()
+
+        ga._replace(child, _fitness(0.35), (gone[0], gone[1]))
+
+        assert ga._population[3] is child
+
+    def test_multi_objective_drops_most_dominated(self) -> None:
+        random.seed(0)
+        ga = SteadyStateGA(_config(multi_objective=True), _mock_backtest)
+        _seeded(ga, [0.5, 0.1, 0.9, 0.3])
+        child = initialize_population(1)[0]
+
+        ga._replace(child, _fitness(2.0), (child, child))
+
+        assert ga._population[1] is child
+
+
+def test_run_spends_evaluation_budget_and_reports_counts(tmp_path: Path) -> None:
+    random.seed(5)
+    progress = tmp_path / "progress.json"
+    calls = 0
+
+    def backtest(chrom: StrategyChromosome) -> dict[str, Any]:
+        nonlocal calls
+        calls += 1
+        return _mock_backtest(chrom)
+
+    result = SteadyStateGA(_config(), backtest, progress_file=progress).run()
+
+    assert result.total_candidates_evaluated == 6 * 4
+    # One generation-equivalent per population_size evaluations
+    assert len(result.generations) == 4
+    assert calls >= 24
+    assert 0 < len(result.top_strategies) <= 3
+
+    data = json.loads(progress.read_text())
+    assert data["mode"] == "steady_state"
+    assert data["total_evaluated"] == 24
+    assert data["evaluation_budget"] == 24
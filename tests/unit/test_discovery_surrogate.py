@@ -0,0 +1,163 @@
+"""Tests for vibe_quant.discovery.surrogate."""
+
+from __future__ import annotations
+
+import random
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from vibe_quant.discovery.fitness import FitnessResult
+from vibe_quant.discovery.operators import initialize_population
+from vibe_quant.discovery.pipeline import DiscoveryConfig, DiscoveryPipeline
+from vibe_quant.discovery.surrogate import KNNSurrogate, predicted_fitness
+
+if TYPE_CHECKING:
+    from vibe_quant.discovery.operators import StrategyChromosome
+
+
+def _fitness(score: float) -> FitnessResult:
+    return FitnessResult(
+        sharpe_ratio=score,
+        max_drawdown=0.1,
+        profit_factor=2.0,
+        total_trades=100,
+        total_return=0.2,
+        complexity_penalty=0.0,
+        overtrade_penalty=0.0,
+        sl_tp_penalty=0.0,
+        raw_score=score,
+        adjusted_score=score,
+        passed_filters=True,
+        filter_results={},
+    )
+
+
+def _mock_backtest(chrom: StrategyChromosome) -> dict[str, Any]:
+    n_genes = len(chrom.entry_genes) + len(chrom.exit_genes)
+    total_trades = 150
+    mean_ret = (0.5 + n_genes * 0.05) / total_trades
+    r = random.Random(n_genes)
+    return {
+        "sharpe_ratio": 2.0 + n_genes * 0.1,
+        "max_drawdown": 0.08,
+        "profit_factor": 2.0,
+        "total_trades": total_trades,
+        "total_return": 0.5 + n_genes * 0.05,
+        "trade_returns": tuple(r.gauss(mean_ret, mean_ret * 0.3) for _ in range(total_trades)),
+    }
+
+
+class TestKNNSurrogate:
+    """Tests for prediction and screening."""
+
+    def test_exact_match_predicts_its_score(self) -> None:
+        random.seed(0)
+        pop = initialize_population(8)
+        surrogate = KNNSurrogate(k=3)
+        for i, chrom in enumerate(pop):
+            surrogate.add(chrom, _fitness(i / 10))
+
+        pred = surrogate.predict(pop[5])
+
+        assert pred.nearest_distance == 0.0
+        assert pred.score == pytest.approx(0.5, abs=1e-3)
+        assert pred.upper_bound >= pred.score
+
+    def test_bounded_archive_matches_fresh_one(self) -> None:
+        random.seed(4)
+        pop = initialize_population(30)
+        probes = initialize_population(5)
+        rolling = KNNSurrogate(k=3, max_archive=8)
+        for i, chrom in enumerate(pop):
+            rolling.add(chrom, _fitness(i / 10))
+            if i % 7 == 0:  # predict mid-stream so evictions hit encoded rows
+                rolling.predict_many(probes)
+
+        fresh = KNNSurrogate(k=3, max_archive=8)
+        fresh.restore(rolling.entries)
+
+        assert len(rolling) == 8
+        assert [c.uid for c, _ in rolling.entries] == [c.uid for c in pop[-8:]]
+        assert rolling.predict_many(probes) == fresh.predict_many(probes)
+
+    def test_empty_archive_raises(self) -> None:
+        random.seed(0)
+        with pytest.raises(ValueError, match="empty"):
+            KNNSurrogate().predict(initialize_population(1)[0])
+
+    def test_screen_budget_and_exploration(self) -> None:
+        random.seed(0)
+        surrogate = KNNSurrogate()
+        for chrom in initialize_population(10):
+            surrogate.add(chrom, _fitness(random.random()))
+        pop = initialize_population(20)
+
+        chosen, skipped = surrogate.screen(
+            pop, eval_fraction=0.25, exploration=0.4, rng=random.Random(1)
+        )
+
+        assert len(chosen) == 5
+        assert chosen == sorted(chosen)
+        assert set(chosen).isdisjoint(skipped)
+        assert len(chosen) + len(skipped) == 20
+        # The 3 surrogate picks have the highest upper bounds among non-random ones
+        best_skipped = max(p.upper_bound for p in skipped.values())
+        picked = sorted((surrogate.predict(pop[i]).upper_bound for i in chosen), reverse=True)
+        assert picked[2] >= best_skipped
+
+    def test_screen_evaluates_everything_when_untrained(self) -> None:
+        random.seed(0)
+        pop = initialize_population(6)
+        chosen, skipped = KNNSurrogate().screen(pop, eval_fraction=0.5, exploration=0.0)
+        assert chosen == list(range(6))
+        assert skipped == {}
+
+    def test_predicted_fitness_never_passes(self) -> None:
+        random.seed(0)
+        surrogate = KNNSurrogate()
+        chrom = initialize_population(1)[0]
+        surrogate.add(chrom, _fitness(0.7))
+
+        fr = predicted_fitness(surrogate.predict(chrom))
+
+        assert not fr.passed_filters
+        assert fr.total_trades == 0
+        assert fr.adjusted_score == pytest.approx(0.7)
+
+
+def test_config_rejects_bad_surrogate_fraction() -> None:
+    with pytest.raises(ValueError, match="surrogate_eval_fraction"):
+        DiscoveryConfig(surrogate_eval_fraction=0.0)
+
+
+def test_pipeline_backtests_fewer_candidates() -> None:
+    random.seed(3)
+    config = DiscoveryConfig(
+        population_size=10,
+        max_generations=6,
+        elite_count=1,
+        convergence_generations=10,
+        top_k=3,
+        max_workers=None,
+        symbols=["BTCUSDT"],
+        timeframe="1h",
+        surrogate_eval_fraction=0.5,
+        surrogate_min_archive=10,
+    )
+    calls = 0
+
+    def backtest(chrom: StrategyChromosome) -> dict[str, Any]:
+        nonlocal calls
+        calls += 1
+        return _mock_backtest(chrom)
+
+    result = DiscoveryPipeline(config, backtest).run()
+
+    n_gens = len(result.generations)
+    assert n_gens > 1
+    # First generation is fully backtested, later ones only half
+    assert result.total_candidates_evaluated == 10 + 5 * (n_gens - 1)
+    assert calls >= result.total_candidates_evaluated
+    assert result.top_strategies
+    assert all(fr.total_trades > 0 for _, fr in result.top_strategies)
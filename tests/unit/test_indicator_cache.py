@@ -0,0 +1,251 @@
+"""Tests for cached, array-based chart indicator computation."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import pandas as pd
+import pytest
+from fastapi.testclient import TestClient
+
+from vibe_quant.api.app import create_app
+from vibe_quant.data.archive import RawDataArchive
+from vibe_quant.data.indicator_compute import (
+    IndicatorCache,
+    compute_indicator_arrays,
+    compute_indicators,
+    indicator_cache,
+    to_columnar,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+_T0 = 1_735_689_600_000  # 2025-01-01 UTC
+
+
+def _frame(n: int = 120) -> pd.DataFrame:
+    rng = np.random.default_rng(7)
+    close = 100 + np.cumsum(rng.normal(0, 1, n))
+    return pd.DataFrame(
+        {
+            "open_time": _T0 + np.arange(n, dtype=np.int64) * 60_000,
+            "open": close,
+            "high": close + 1,
+            "low": close - 1,
+            "close": close,
+            "volume": np.ones(n),
+        }
+    )
+
+
+def test_compute_indicators_points_match_arrays() -> None:
+    df = _frame()
+    series = compute_indicators(df, [{"type": "ema", "period": 10}])
+    arrays = compute_indicator_arrays(df, [{"type": "ema", "period": 10}])
+
+    assert len(series) == 1
+    assert series[0].name == "ema_10"
+    assert series[0].display_label == "EMA(10)"
+    values = arrays[0].outputs[0][1]
+    assert series[0].data[0].value is None  # warmup NaN -> None
+    assert series[0].data[-1].value == pytest.approx(values[-1])
+    assert [p.time for p in series[0].data] == df["open_time"].tolist()
+
+
+def test_cache_serves_viewport_slice_of_wider_entry() -> None:
+    df = _frame()
+    cache = IndicatorCache()
+    cfg = {"type": "SMA", "period": 5}
+    key = cache.make_key("BTCUSDT", "1m", cfg)
+    assert key is not None
+    full = compute_indicator_arrays(df, [cfg])[0]
+    cache.put(key, 1, None, None, full)
+
+    lo, hi = _T0 + 30 * 60_000, _T0 + 60 * 60_000
+    hit = cache.get(key, 1, lo, hi)
+
+    assert hit is not None
+    assert hit.times[0] == lo
+    assert len(hit.times) == 30
+    np.testing.assert_array_equal(hit.outputs[0][1], full.outputs[0][1][30:60])
+    assert cache.hits == 1
+
+
+def test_cache_misses_on_new_fingerprint_or_uncovered_range() -> None:
+    df = _frame()
+    cache = IndicatorCache()
+    cfg = {"type": "RSI", "period": 14}
+    key = cache.make_key("BTCUSDT", "1m", cfg)
+    assert key is not None
+    arrays = compute_indicator_arrays(df, [cfg])[0]
+    cache.put(key, 1, _T0, _T0 + 60 * 60_000, arrays)
+
+    assert cache.get(key, 2, _T0, _T0 + 10 * 60_000) is None
+    assert cache.get(key, 1, None, None) is None
+    assert cache.get(key, 1, _T0, _T0 + 90 * 60_000) is None
+
+    cache.put(key, 2, _T0, _T0 + 60 * 60_000, arrays)
+    assert len(cache) == 1  # stale fingerprint entry dropped
+
+
+def test_fill_range_pads_and_merges_overlapping_entries() -> None:
+    df = _frame()
+    cache = IndicatorCache()
+    cfg = {"type": "SMA", "period": 5}
+    key = cache.make_key("BTCUSDT", "1m", cfg)
+    assert key is not None
+    minute = 60_000
+    lo, hi = _T0 + 40 * minute, _T0 + 60 * minute
+
+    # Padded by the viewport width on each side
+    assert cache.fill_range(key, 1, lo, hi) == (_T0 + 20 * minute, _T0 + 80 * minute)
+    assert cache.fill_range(key, 1, None, hi) == (None, hi)
+
+    arrays = compute_indicator_arrays(df, [cfg])[0]
+    cache.put(key, 1, _T0, _T0 + 30 * minute, arrays.slice(_T0, _T0 + 30 * minute))
+    # Overlapping same-fingerprint entries are absorbed; stale ones are not
+    assert cache.fill_range(key, 1, lo, hi) == (_T0, _T0 + 80 * minute)
+    assert cache.fill_range(key, 2, lo, hi) == (_T0 + 20 * minute, _T0 + 80 * minute)
+
+    # The merged entry replaces the one it covers and serves pans within it
+    cache.put(key, 1, _T0, _T0 + 80 * minute, arrays.slice(_T0, _T0 + 80 * minute))
+    assert len(cache) == 1
+    assert cache.get(key, 1, _T0 + 55 * minute, _T0 + 75 * minute) is not None
+
+
+def test_cache_key_ignores_param_order_and_case() -> None:
+    a = IndicatorCache.make_key("BTCUSDT", "1h", {"type": "bbands", "period": 20, "std_dev": 2})
+    b = IndicatorCache.make_key("BTCUSDT", "1h", {"std_dev": 2, "period": 20, "type": "BBANDS"})
+    assert a == b
+
+
+def test_cache_evicts_least_recently_used_by_bytes() -> None:
+    df = _frame()
+    arrays = compute_indicator_arrays(df, [{"type": "SMA", "period": 5}])[0]
+    cache = IndicatorCache(max_bytes=arrays.nbytes * 2)
+    keys = [cache.make_key("BTCUSDT", "1m", {"type": "SMA", "period": p}) for p in (5, 6, 7)]
+    for key in keys:
+        assert key is not None
+        cache.put(key, 1, None, None, arrays)
+
+    assert len(cache) == 2
+    assert cache.get(keys[0], 1, None, None) is None  # type: ignore[arg-type]
+
+
+def test_columnar_aligns_outputs_to_shared_time_axis() -> None:
+    df = _frame()
+    arrays = compute_indicator_arrays(
+        df, [{"type": "EMA", "period": 3}, {"type": "BBANDS", "period": 20}]
+    )
+    times = arrays[0].times
+    shorter = arrays[1].slice(_T0 + 50 * 60_000, None)
+
+    columns = to_columnar([arrays[0], shorter], times)
+
+    assert [c["output_name"] for c in columns] == ["value", "lower", "middle", "upper"]
+    assert all(len(c["values"]) == len(times) for c in columns)
+    assert columns[1]["values"][49] is None
+    assert columns[1]["values"][50] == pytest.approx(float(shorter.outputs[0][1][0]))
+
+
+@pytest.fixture
+def archive_client(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> TestClient:
+    db_path = tmp_path / "archive.db"
+    arc = RawDataArchive(db_path)
+    df = _frame(300)
+    arc.insert_klines(
+        "BTCUSDT",
+        "1m",
+        [
+            (int(r.open_time), r.open, r.high, r.low, r.close, r.volume, int(r.open_time) + 59_999)
+            for r in df.itertuples()
+        ],
+        "test",
+    )
+    arc.close()
+    monkeypatch.setattr(
+        "vibe_quant.api.routers.data._get_archive", lambda: RawDataArchive(db_path)
+    )
+    indicator_cache.clear()
+    yield TestClient(create_app())
+    indicator_cache.clear()
+
+
+def test_indicator_endpoints_share_cache(archive_client: TestClient) -> None:
+    params = {"interval": "1m", "indicators": '[{"type": "EMA", "period": 10}]'}
+
+    first = archive_client.get("/api/data/indicators/BTCUSDT", params=params)
+    second = archive_client.get("/api/data/indicators/BTCUSDT/columnar", params=params)
+
+    assert first.status_code == 200
+    assert second.status_code == 200
+    assert indicator_cache.hits == 1
+    points = first.json()["series"][0]["data"]
+    body = second.json()
+    assert body["time"] == [p["time"] for p in points]
+    assert body["series"][0]["values"] == [p["value"] for p in points]
+    assert body["series"][0]["display_label"] == "EMA(10)"
+
+
+def test_indicator_request_hits_after_panning(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    db_path = tmp_path / "week.db"
+    arc = RawDataArchive(db_path)
+    minutes = np.arange(7 * 1440, dtype=np.int64)
+    arc.insert_klines(
+        "BTCUSDT",
+        "1m",
+        [(int(_T0 + m * 60_000), 1.0, 2.0, 0.5, 1.0 + m % 7, 1.0, 0) for m in minutes],
+        "test",
+    )
+    arc.close()
+    monkeypatch.setattr("vibe_quant.api.routers.data._get_archive", lambda: RawDataArchive(db_path))
+    indicator_cache.clear()
+    client = TestClient(create_app())
+
+    def request(start: str, end: str) -> dict[str, Any]:
+        params = {
+            "interval": "1h",
+            "indicators": '[{"type": "EMA", "period": 10}]',
+            "start": start,
+            "end": end,
+        }
+        response = client.get("/api/data/indicators/BTCUSDT/columnar", params=params)
+        assert response.status_code == 200
+        return response.json()  # type: ignore[no-any-return]
+
+    first = request("2025-01-03", "2025-01-05")
+    panned = request("2025-01-04", "2025-01-06")
+
+    assert indicator_cache.hits == 1
+    assert len(first["time"]) == 48
+    assert panned["time"][0] == _T0 + 3 * 86_400_000
+    assert len(panned["time"]) == 48
+    indicator_cache.clear()
+
+
+def test_data_version_is_per_symbol_and_interval(tmp_path: Path) -> None:
+    arc = RawDataArchive(tmp_path / "archive.db")
+
+    def insert(symbol: str, interval: str, minutes: range) -> None:
+        rows = [
+            (_T0 + m * 60_000, 1.0, 1.0, 1.0, 1.0, 1.0, _T0 + m * 60_000 + 59_999) for m in minutes
+        ]
+        arc.insert_klines(symbol, interval, rows, "test")
+
+    assert arc.data_version("BTCUSDT", "1m") == 0
+    insert("BTCUSDT", "1m", range(10))
+    btc = arc.data_version("BTCUSDT", "1m")
+    assert btc > 0
+
+    insert("ETHUSDT", "1m", range(10))
+    insert("BTCUSDT", "5m", range(10))
+    insert("BTCUSDT", "1m", range(10))  # all duplicates
+    assert arc.data_version("BTCUSDT", "1m") == btc
+
+    insert("BTCUSDT", "1m", range(10, 12))
+    assert arc.data_version("BTCUSDT", "1m") > btc
+    arc.close()
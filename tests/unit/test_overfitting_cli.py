@@ -68,7 +68,8 @@ def db_path(tmp_path: Path) -> Path:
             is_pareto_optimal BOOLEAN DEFAULT 0,
             passed_deflated_sharpe BOOLEAN,
             passed_walk_forward BOOLEAN,
-            passed_purged_kfold BOOLEAN
+            passed_purged_kfold BOOLEAN,
+            passed_cpcv BOOLEAN
         )
     """)
 
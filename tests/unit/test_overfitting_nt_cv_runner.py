@@ -195,3 +195,104 @@ def test_runs_through_purgedkfoldcv(
     assert len(result.fold_results) == 3
     assert result.mean_oos_sharpe == 1.5
     assert result.is_robust is True
+
+
+def test_timestamps_are_cached_int64_array(stub_env: tuple[Path, Path]) -> None:
+    """Candidates of the same run share one read-only timestamp array."""
+    from vibe_quant.overfitting import nt_cv_runner
+
+    nt_cv_runner.clear_bar_timestamp_cache()
+    db, catalog = stub_env
+    first = nt_cv_runner.NTPurgedKFoldRunner(run_id=42, db_path=db, catalog_path=catalog)
+    second = nt_cv_runner.NTPurgedKFoldRunner(run_id=42, db_path=db, catalog_path=catalog)
+
+    ts = first._bar_ts_ns  # noqa: SLF001
+    assert ts.dtype.name == "int64"
+    assert not ts.flags.writeable
+    assert second._bar_ts_ns is ts  # noqa: SLF001
+
+
+def test_date_range_limits_bars(stub_env: tuple[Path, Path]) -> None:
+    from datetime import date
+
+    from vibe_quant.overfitting.nt_cv_runner import NTPurgedKFoldRunner
+
+    db, catalog = stub_env
+    runner = NTPurgedKFoldRunner(
+        run_id=42,
+        db_path=db,
+        catalog_path=catalog,
+        start_date=date(2024, 1, 3),
+        end_date=date(2024, 1, 4),
+    )
+    # 4h bars: six per day over two inclusive days
+    assert runner.n_samples == 12
+    assert runner._index_range_to_dates([0, 11]) == ("2024-01-03", "2024-01-04")  # noqa: SLF001
+
+
+def test_multiple_files_merged_in_time_order(tmp_path: Path) -> None:
+    """Files are ordered by ts_event statistics, not by file name."""
+    import pandas as pd
+
+    from vibe_quant.overfitting.nt_cv_runner import load_bar_timestamps
+
+    bar_dir = tmp_path / "bars"
+    bar_dir.mkdir()
+    hour_ns = 3600 * 10**9
+    late = [10 * hour_ns + i * hour_ns for i in range(5)]
+    early = [i * hour_ns for i in range(5)]
+    pd.DataFrame({"ts_event": late}).to_parquet(bar_dir / "a.parquet", index=False)
+    pd.DataFrame({"ts_event": early}).to_parquet(bar_dir / "b.parquet", index=False)
+
+    ts = load_bar_timestamps(bar_dir)
+    assert ts.tolist() == early + late
+
+    pruned = load_bar_timestamps(bar_dir, start_ns=10 * hour_ns)
+    assert pruned.tolist() == late
+
+
+def test_pickled_runner_reloads_timestamps(stub_env: tuple[Path, Path]) -> None:
+    """Pool workers get the runner without the array and reload it from cache."""
+    import pickle
+
+    from vibe_quant.overfitting.nt_cv_runner import NTPurgedKFoldRunner
+
+    db, catalog = stub_env
+    runner = NTPurgedKFoldRunner(run_id=42, db_path=db, catalog_path=catalog)
+    assert runner.__getstate__()["_bar_ts_ns"] is None
+
+    clone = pickle.loads(pickle.dumps(runner))
+    assert clone.n_samples == runner.n_samples
+    assert clone._index_range_to_dates([0, 99]) == ("2024-01-01", "2024-01-17")  # noqa: SLF001
+
+
+def test_with_params_backtests_the_candidate(
+    stub_env: tuple[Path, Path], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Each candidate's parameters reach the screening runner."""
+    from types import SimpleNamespace
+
+    from vibe_quant.overfitting.nt_cv_runner import NTPurgedKFoldRunner
+    from vibe_quant.screening import nt_runner
+
+    seen: list[dict[str, float | int]] = []
+
+    class FakeScreeningRunner:
+        def __init__(self, **_kwargs: object) -> None:
+            pass
+
+        def __call__(self, params: dict[str, float | int]) -> SimpleNamespace:
+            seen.append(params)
+            return SimpleNamespace(sharpe_ratio=params.get("rsi.period", 0) / 10, total_return=0.1)
+
+    monkeypatch.setattr(nt_runner, "NTScreeningRunner", FakeScreeningRunner)
+
+    db, catalog = stub_env
+    base = NTPurgedKFoldRunner(run_id=42, db_path=db, catalog_path=catalog)
+    tuned = base.with_params({"rsi.period": 21})
+
+    assert tuned.n_samples == base.n_samples
+    assert base.run_group(list(range(10))).mean_return != tuned.run_group(
+        list(range(10))
+    ).mean_return
+    assert seen == [{}, {"rsi.period": 21}]
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import sqlite3
 from datetime import date
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import pytest
 
@@ -454,18 +454,16 @@ class TestOverfittingPipeline:
         assert result.config.enable_purged_kfold is True
         pipeline.close()
 
-    def test_update_candidate(self, db_path: Path) -> None:
-        """Updates candidate with filter results."""
+    def test_update_stage(self, db_path: Path) -> None:
+        """Persists one stage flag without touching the others."""
         pipeline = OverfittingPipeline(db_path)
 
-        # Get first candidate ID
         candidates = pipeline._load_candidates(1)
         candidate_id = candidates[0]["id"]
 
-        # Update with filter results
-        pipeline._update_candidate(candidate_id, True, False, None)
+        pipeline._update_stage(candidate_id, "dsr", True)
+        pipeline._update_stage(candidate_id, "wfa", False)
 
-        # Verify update
         row = pipeline.conn.execute(
             "SELECT passed_deflated_sharpe, passed_walk_forward, passed_purged_kfold "
             "FROM sweep_results WHERE id = ?",
@@ -490,9 +488,9 @@ class TestOverfittingPipeline:
 
         pipeline.close()
 
-    def test_get_filtered_candidates_require_all(self, db_path: Path) -> None:
+    def test_get_filtered_candidates_require_all(self, cpcv_db_path: Path) -> None:
         """get_filtered_candidates with require_all=True."""
-        pipeline = OverfittingPipeline(db_path)
+        pipeline = OverfittingPipeline(cpcv_db_path)
 
         # Run pipeline to set flags
         pipeline.run(run_id=1, config=FilterConfig.dsr_only())
@@ -692,3 +690,201 @@ class TestIntegration:
         assert result2.passed_dsr == 0  # Disabled
 
         pipeline.close()
+
+
+class TestStageScheduling:
+    """Tests for executor-scheduled stages, fail-fast and resume."""
+
+    def _flags(self, pipeline: OverfittingPipeline) -> list[tuple[object, ...]]:
+        return pipeline.conn.execute(
+            "SELECT passed_deflated_sharpe, passed_walk_forward, passed_purged_kfold "
+            "FROM sweep_results ORDER BY id"
+        ).fetchall()
+
+    def test_process_pool_matches_inline(self, db_path: Path) -> None:
+        """Stages on a process pool produce the same results as inline."""
+        pipeline = OverfittingPipeline(db_path)
+        inline = pipeline.run(run_id=1, config=FilterConfig.default(), allow_mock=True)
+        inline_flags = self._flags(pipeline)
+        pooled = pipeline.run(run_id=1, config=FilterConfig(max_workers=2), allow_mock=True)
+
+        assert self._flags(pipeline) == inline_flags
+        assert [
+            (c.sweep_result_id, c.passed_dsr, c.passed_wfa, c.passed_cv) for c in pooled.candidates
+        ] == [
+            (c.sweep_result_id, c.passed_dsr, c.passed_wfa, c.passed_cv) for c in inline.candidates
+        ]
+        assert pooled.passed_all == inline.passed_all
+        pipeline.close()
+
+    def test_fail_fast_skips_later_stages(self, db_path: Path) -> None:
+        """A DSR rejection leaves WFA/CV unrun when fail_fast is set."""
+        pipeline = OverfittingPipeline(db_path)
+        pipeline.conn.execute(
+            "INSERT INTO sweep_results (run_id, parameters, sharpe_ratio, total_return) "
+            "VALUES (1, '{\"rsi_period\": 3}', -1.0, -20.0)"
+        )
+        pipeline.conn.commit()
+        result = pipeline.run(run_id=1, config=FilterConfig(fail_fast=True), allow_mock=True)
+
+        rejected = [c for c in result.candidates if not c.passed_dsr]
+        assert rejected
+        for c in rejected:
+            assert c.passed_wfa is None
+            assert c.passed_cv is None
+            assert c.wfa_result is None
+            row = pipeline.conn.execute(
+                "SELECT passed_walk_forward, passed_purged_kfold FROM sweep_results WHERE id = ?",
+                (c.sweep_result_id,),
+            ).fetchone()
+            assert tuple(row) == (None, None)
+        pipeline.close()
+
+    def test_resume_keeps_stored_stage_flags(self, db_path: Path) -> None:
+        """Resume reuses persisted WFA/CV flags instead of re-running stages."""
+        pipeline = OverfittingPipeline(db_path)
+        pipeline.conn.execute(
+            "UPDATE sweep_results SET passed_walk_forward = 1, passed_purged_kfold = 0"
+        )
+        pipeline.conn.commit()
+
+        result = pipeline.run(run_id=1, config=FilterConfig.default(), allow_mock=True, resume=True)
+
+        for c in result.candidates:
+            assert c.passed_wfa is True
+            assert c.passed_cv is False
+            assert c.wfa_result is None
+            assert c.cv_result is None
+        assert all(tuple(row)[1:] == (1, 0) for row in self._flags(pipeline))
+
+        # Without resume the stored flags are cleared and stages re-run
+        rerun = pipeline.run(run_id=1, config=FilterConfig.default(), allow_mock=True)
+        assert all(c.wfa_result is not None for c in rerun.candidates)
+        pipeline.close()
+
+
+@pytest.fixture
+def cpcv_db_path(db_path: Path) -> Path:
+    """Test database with the passed_cpcv column migration applied."""
+    conn = sqlite3.connect(str(db_path))
+    conn.execute("ALTER TABLE sweep_results ADD COLUMN passed_cpcv BOOLEAN")
+    conn.commit()
+    conn.close()
+    return db_path
+
+
+class TestCPCVStage:
+    """Tests for the opt-in CPCV filter stage."""
+
+    def test_cpcv_flags_and_pbo(self, cpcv_db_path: Path) -> None:
+        """CPCV runs per candidate, persists its flag and reports PBO."""
+        pipeline = OverfittingPipeline(cpcv_db_path)
+        result = pipeline.run(run_id=1, config=FilterConfig.cpcv_only(), allow_mock=True)
+
+        assert result.pbo is not None
+        assert result.pbo.n_candidates == 3
+        assert 0.0 <= result.pbo.pbo <= 1.0
+        for c in result.candidates:
+            assert c.cpcv_result is not None
+            assert len(c.cpcv_result.oos_sharpes) == 15
+            assert c.passed_cpcv == c.cpcv_result.is_robust
+            assert c.passed_all == c.passed_cpcv
+        assert result.passed_cpcv == sum(1 for c in result.candidates if c.passed_cpcv)
+        rows = pipeline.conn.execute(
+            "SELECT id, passed_cpcv FROM sweep_results ORDER BY id"
+        ).fetchall()
+        flags = {c.sweep_result_id: c.passed_cpcv for c in result.candidates}
+        assert all(bool(row[1]) == flags[row[0]] for row in rows)
+        assert "PBO" in pipeline.generate_report(result)
+        pipeline.close()
+
+    def test_get_filtered_candidates_checks_cpcv(self, cpcv_db_path: Path) -> None:
+        """Candidates that failed CPCV are not returned as survivors."""
+        pipeline = OverfittingPipeline(cpcv_db_path)
+        pipeline.conn.execute(
+            "UPDATE sweep_results SET passed_deflated_sharpe = 1, passed_cpcv = (id = 1)"
+        )
+        pipeline.conn.commit()
+
+        assert [r["id"] for r in pipeline.get_filtered_candidates(1)] == [1]
+        pipeline.conn.execute("UPDATE sweep_results SET passed_deflated_sharpe = 0")
+        pipeline.conn.commit()
+        assert [r["id"] for r in pipeline.get_filtered_candidates(1, require_all=False)] == [1]
+        pipeline.close()
+
+    def test_cpcv_requires_group_runner(self, cpcv_db_path: Path) -> None:
+        """An injected CV runner without run_group() can't drive CPCV."""
+
+        class FoldOnlyRunner:
+            def run(self, train_indices: list[int], test_indices: list[int]) -> None:
+                raise AssertionError
+
+        pipeline = OverfittingPipeline(cpcv_db_path, cv_runner=FoldOnlyRunner())
+        with pytest.raises(ValueError, match="run_group"):
+            pipeline.run(run_id=1, config=FilterConfig.cpcv_only())
+        pipeline.close()
+
+    def test_group_runner_gets_candidate_params(self, cpcv_db_path: Path) -> None:
+        """Each candidate's CPCV groups are backtested with its own parameters."""
+        from vibe_quant.overfitting.cpcv import GroupResult
+
+        seen: list[dict[str, Any]] = []
+
+        class ParamRunner:
+            def __init__(self, params: dict[str, Any] | None = None) -> None:
+                self.params = params or {}
+
+            def with_params(self, params: dict[str, Any]) -> ParamRunner:
+                seen.append(params)
+                return ParamRunner(params)
+
+            def run(self, train_indices: list[int], test_indices: list[int]) -> None:
+                raise AssertionError
+
+            def run_group(self, indices: list[int]) -> GroupResult:
+                period = self.params["rsi_period"]
+                shift = (indices[0] // 5 + period) % 5
+                return GroupResult(0, len(indices), 0.001 * shift, 0.01)
+
+        pipeline = OverfittingPipeline(cpcv_db_path, cv_runner=ParamRunner())
+        result = pipeline.run(run_id=1, config=FilterConfig.cpcv_only())
+
+        assert sorted(p["rsi_period"] for p in seen) == [7, 14, 21]
+        assert result.pbo is not None
+        assert result.pbo_survivors_only is False
+        pipeline.close()
+
+    def test_identical_candidates_skip_pbo(
+        self, cpcv_db_path: Path, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Candidates a runner cannot tell apart yield no PBO, not a degenerate one."""
+        pipeline = OverfittingPipeline(
+            cpcv_db_path, cv_runner=MockBacktestRunner(oos_sharpe=1.0, oos_return=0.1)
+        )
+        with caplog.at_level("WARNING"):
+            result = pipeline.run(run_id=1, config=FilterConfig.cpcv_only())
+
+        assert all(c.cpcv_result is not None for c in result.candidates)
+        assert result.pbo is None
+        assert "identical group results" in caplog.text
+        pipeline.close()
+
+    def test_fail_fast_pbo_flagged_as_survivors_only(self, cpcv_db_path: Path) -> None:
+        """PBO over fail-fast survivors is reported as such."""
+        pipeline = OverfittingPipeline(cpcv_db_path)
+        pipeline.conn.execute(
+            "INSERT INTO sweep_results (run_id, parameters, sharpe_ratio, total_return) "
+            "VALUES (1, '{\"rsi_period\": 3}', -1.0, -20.0)"
+        )
+        pipeline.conn.commit()
+        config = FilterConfig(
+            enable_wfa=False, enable_purged_kfold=False, enable_cpcv=True, fail_fast=True
+        )
+        result = pipeline.run(run_id=1, config=config, num_observations=1000, allow_mock=True)
+
+        assert any(c.cpcv_result is None for c in result.candidates)
+        assert result.pbo is not None
+        assert result.pbo.n_candidates < result.total_candidates
+        assert result.pbo_survivors_only is True
+        assert "survivors only" in pipeline.generate_report(result)
+        pipeline.close()
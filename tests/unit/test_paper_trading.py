@@ -965,6 +965,151 @@ class TestPaperTradingNode:
         _json.dumps(checkpoint.balance)
 
 
+class TestOrderEventLogging:
+    """Paper node ORDER/FILL events feed execution model calibration."""
+
+    def test_paper_fills_calibrate_to_saved_model(self, db_path: Path, tmp_path: Path) -> None:
+        """Order events from the node's bus handler calibrate and persist a model."""
+        from nautilus_trader.cache.cache import Cache
+        from nautilus_trader.model.data import Bar, BarType, QuoteTick
+        from nautilus_trader.model.enums import OrderSide
+        from nautilus_trader.model.identifiers import ClientOrderId
+        from nautilus_trader.test_kit.providers import TestInstrumentProvider
+        from nautilus_trader.test_kit.stubs.events import TestEventStubs
+        from nautilus_trader.test_kit.stubs.execution import TestExecStubs
+
+        from vibe_quant.db.state_manager import StateManager
+        from vibe_quant.logging.writer import EventWriter
+        from vibe_quant.validation.calibration import CalibratedExecutionModel, calibrate
+
+        logs_path = tmp_path / "events"
+        config = PaperTradingConfig(
+            trader_id="PAPER-001",
+            binance=BinanceTestnetConfig("key", "secret"),
+            symbols=["BTCUSDT"],
+            strategy_id=1,
+            db_path=db_path,
+            logs_path=logs_path,
+        )
+        node = PaperTradingNode(config)
+        node._event_writer = EventWriter(run_id=config.trader_id, base_path=logs_path)
+
+        instrument = TestInstrumentProvider.btcusdt_perp_binance()
+        cache = Cache()
+        cache.add_instrument(instrument)
+        bar_type = BarType.from_str(f"{instrument.id}-1-HOUR-LAST-EXTERNAL")
+        for i in range(20):
+            close = instrument.make_price(10_000.0 + 10.0 * (i % 3))
+            cache.add_bar(
+                Bar(bar_type, close, close, close, close, instrument.make_qty(10.0), i, i)
+            )
+        cache.add_quote_tick(
+            QuoteTick(
+                instrument.id,
+                instrument.make_price(9_999.0),
+                instrument.make_price(10_001.0),
+                instrument.make_qty(1.0),
+                instrument.make_qty(1.0),
+                0,
+                0,
+            )
+        )
+
+        class _Runtime:
+            def __init__(self, cache: Cache) -> None:
+                self.cache = cache
+
+        node._trading_node = _Runtime(cache)  # type: ignore[assignment]
+
+        sec = 1_000_000_000
+        for i, qty in enumerate([0.5, 1.0, 2.0, 4.0, 0.5, 1.0, 2.0, 4.0]):
+            side = OrderSide.BUY if i % 2 == 0 else OrderSide.SELL
+            order = TestExecStubs.market_order(
+                instrument=instrument,
+                order_side=side,
+                quantity=instrument.make_qty(qty),
+                client_order_id=ClientOrderId(f"O-{i}"),
+            )
+            cache.add_order(order)
+            # The execution engine updates the cached order before publishing.
+            submitted = TestEventStubs.order_submitted(order, ts_event=(i + 1) * 60 * sec)
+            order.apply(submitted)
+            node._on_order_event(submitted)
+
+            # Adverse move grows with size: 1 bp plus 2 bp per unit.
+            move = 10_000.0 * (0.0001 + 0.0002 * qty)
+            fill_px = 10_000.0 + move if side == OrderSide.BUY else 10_000.0 - move
+            filled = TestEventStubs.order_filled(
+                order,
+                instrument,
+                last_px=instrument.make_price(fill_px),
+                ts_event=(i + 1) * 60 * sec + 100_000_000,
+            )
+            order.apply(filled)
+            cache.update_order(order)
+            node._on_order_event(filled)
+
+        assert node._order_references == {}
+        node._event_writer.close()
+        records = [
+            json.loads(line) for line in (logs_path / "PAPER-001.jsonl").read_text().splitlines()
+        ]
+        orders = [r["data"] for r in records if r["event"] == "ORDER"]
+        fills = [r["data"] for r in records if r["event"] == "FILL"]
+        assert len(orders) == len(fills) == 8
+        assert orders[0]["reference_price"] == pytest.approx(10_000.0)
+        assert orders[0]["spread"] == pytest.approx(0.0002)
+        assert orders[0]["avg_volume"] == pytest.approx(10.0)
+        assert orders[0]["volatility"] > 0
+        assert fills[0]["slippage"] == pytest.approx(0.0002, abs=1e-6)
+        assert fills[1]["slippage"] == pytest.approx(0.0003, abs=1e-6)
+
+        model = calibrate([config.trader_id], name="paper_fit", base_path=logs_path)
+        assert model.slippage.n_observations == 8
+        assert model.latency.p50_ms == pytest.approx(100.0, abs=1.0)
+        assert model.slippage.impact_coefficient > 0
+
+        StateManager(db_path).save_execution_model(model.name, model.to_dict())
+        stored = StateManager(db_path).get_execution_model("paper_fit")
+        assert stored is not None
+        assert CalibratedExecutionModel.from_dict(stored["model"]) == model
+
+    def test_market_context_matches_validation_stats(self) -> None:
+        """Paper records the volume/volatility validation applies the fitted k with."""
+        from types import SimpleNamespace
+
+        from nautilus_trader.cache.cache import Cache
+        from nautilus_trader.model.data import Bar, BarType
+        from nautilus_trader.test_kit.providers import TestInstrumentProvider
+
+        from vibe_quant.paper.execution_events import market_context
+        from vibe_quant.validation.extraction import estimate_market_stats
+
+        instrument = TestInstrumentProvider.btcusdt_perp_binance()
+        cache = Cache()
+        cache.add_instrument(instrument)
+        hourly = BarType.from_str(f"{instrument.id}-1-HOUR-LAST-EXTERNAL")
+        minute = BarType.from_str(f"{instrument.id}-1-MINUTE-LAST-EXTERNAL")
+        bars = []
+        # More minute bars than hourly ones: the strategy timeframe must win
+        for bar_type, count, step in ((hourly, 80, 25.0), (minute, 200, 1.0)):
+            for i in range(count):
+                close = instrument.make_price(10_000.0 + step * (i % 7))
+                volume = instrument.make_qty(float(1 + i % 5) * step)
+                bar = Bar(bar_type, close, close, close, close, volume, i, i)
+                cache.add_bar(bar)
+                bars.append(bar)
+
+        context = market_context(cache, instrument.id, "1h")
+        engine = SimpleNamespace(kernel=SimpleNamespace(cache=SimpleNamespace(bars=lambda: bars)))
+        avg_volume, volatility = estimate_market_stats(engine, "1h")  # type: ignore[arg-type]
+
+        assert context["avg_volume"] == pytest.approx(avg_volume, rel=1e-12)
+        assert context["volatility"] == pytest.approx(volatility, rel=1e-12)
+        # Trailing window only: the hourly series' average volume is 75
+        assert avg_volume == pytest.approx(75.0)
+
+
 class TestNodeStateEnum:
     """Tests for NodeState enum."""
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import numpy as np
 import pytest
 
 from vibe_quant.overfitting.purged_kfold import (
@@ -232,6 +233,23 @@ class TestPurgedKFoldNoLeakage:
                     f"Fold {fold_idx}: insufficient embargo gap"
                 )
 
+    def test_fold_layout_matches_docstring_example(self) -> None:
+        """Purge and embargo cut exactly the neighbouring folds' edges."""
+        kfold = PurgedKFold(
+            n_splits=5, purge_pct=0.01, embargo_pct=0.02, indicator_lookback_bars=20
+        )
+        train_idx, test_idx = list(kfold.split(1000))[1]
+        assert test_idx.dtype == np.int64
+        assert test_idx.tolist() == list(range(200, 400))
+        assert train_idx.tolist() == list(range(180)) + list(range(420, 1000))
+
+    def test_gaps_stop_at_neighbouring_fold(self) -> None:
+        """A purge longer than a fold only empties the preceding fold."""
+        kfold = PurgedKFold(n_splits=5, purge_pct=0.0, embargo_pct=0.0, indicator_lookback_bars=100)
+        train_idx, test_idx = list(kfold.split(450))[2]
+        assert test_idx.tolist() == list(range(180, 270))
+        assert train_idx.tolist() == list(range(90)) + list(range(270, 450))
+
 
 # --- CVConfig Tests ---
 
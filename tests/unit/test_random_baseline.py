@@ -1,4 +1,4 @@
-"""Tests for random short entry baseline."""
+"""Tests for random entry baseline."""
 
 from __future__ import annotations
 
@@ -7,9 +7,13 @@ import pytest
 
 from vibe_quant.validation.random_baseline import (
     BaselineConfig,
+    OHLCArrays,
     OHLCBar,
     _compute_metrics,
+    _first_passage_exits,
+    _random_entries,
     _simulate_single_run,
+    run_random_baseline,
     run_random_short_baseline,
 )
 
@@ -30,6 +34,17 @@ def _make_bars(prices: list[float], spread: float = 0.5) -> list[OHLCBar]:
     return bars
 
 
+def _random_walk_bars(n: int, seed: int, drift: float = 0.0) -> list[OHLCBar]:
+    rng = np.random.default_rng(seed)
+    close = 100.0 * np.exp(np.cumsum(rng.normal(drift, 0.004, n)))
+    high = close * (1 + np.abs(rng.normal(0, 0.002, n)))
+    low = close * (1 - np.abs(rng.normal(0, 0.002, n)))
+    return [
+        OHLCBar(ts=i * 60000, open=c, high=h, low=lo, close=c)
+        for i, (c, h, lo) in enumerate(zip(close, high, low, strict=True))
+    ]
+
+
 class TestSimulateSingleRun:
     def test_tp_hit(self):
         """SHORT trade hits TP when price drops enough."""
@@ -77,6 +92,101 @@ class TestSimulateSingleRun:
 
         assert trades_fee[0].pnl_pct < trades_nofee[0].pnl_pct
 
+    def test_long_tp_hit(self):
+        """LONG trade hits TP when price rises enough."""
+        prices = [100.0, 101.0, 103.0, 106.0]
+        bars = _make_bars(prices, spread=0.5)
+        trades = _simulate_single_run(
+            bars, np.array([0]), sl_pct=10.0, tp_pct=5.0, taker_fee=0.0, direction="long"
+        )
+        assert trades[0].hit_tp is True
+        assert trades[0].exit_price == pytest.approx(105.0)
+        assert trades[0].pnl_pct == pytest.approx(5.0)
+
+
+class TestVectorizedSimulation:
+    @pytest.mark.parametrize("direction", ["short", "long"])
+    @pytest.mark.parametrize(("sl_pct", "tp_pct"), [(0.5, 3.0), (3.0, 0.5), (1.0, 1.0)])
+    def test_exit_table_matches_reference(self, direction, sl_pct, tp_pct):
+        """Every entry bar's exit matches the bar-by-bar walk exactly."""
+        bars = _random_walk_bars(400, seed=1)
+        table = _first_passage_exits(
+            OHLCArrays.from_bars(bars), sl_pct, tp_pct, taker_fee=0.0005, direction=direction
+        )
+        for entry in range(len(bars) - 1):
+            (trade,) = _simulate_single_run(
+                bars, np.array([entry]), sl_pct, tp_pct, 0.0005, direction
+            )
+            assert table.exit_idx[entry] == trade.exit_idx
+            assert table.exit_price[entry] == trade.exit_price
+            assert table.pnl_pct[entry] == trade.pnl_pct
+            assert table.hit_sl[entry] == trade.hit_sl
+            assert table.hit_tp[entry] == trade.hit_tp
+
+    def test_sl_wins_same_bar_tie(self):
+        prices = [100.0, 100.0]
+        bars = _make_bars(prices, spread=10.0)
+        table = _first_passage_exits(OHLCArrays.from_bars(bars), 1.0, 1.0, 0.0, "short")
+        assert table.hit_sl[0] and not table.hit_tp[0]
+
+    def test_random_entries_do_not_overlap(self):
+        bars = OHLCArrays.from_bars(_random_walk_bars(2000, seed=2))
+        table = _first_passage_exits(bars, 1.0, 2.0, 0.0)
+        entries = _random_entries(table.exit_idx, 0.05, 50, np.random.default_rng(0))
+        for row in entries:
+            row = row[row >= 0]
+            assert np.all(row < len(bars) - 1)
+            assert np.all(row[1:] > table.exit_idx[row[:-1]])
+
+    @pytest.mark.parametrize("direction", ["short", "long"])
+    def test_statistically_matches_reference_loop(self, direction):
+        """Vectorized runs match per-bar Bernoulli entries + bar-by-bar walk."""
+        bars = _random_walk_bars(3000, seed=3, drift=-0.0002)
+        config = BaselineConfig(sl_pct=1.0, tp_pct=2.0, target_trades=30, direction=direction)
+        result = run_random_baseline(bars, config, n_simulations=400, seed=5)
+
+        rng = np.random.default_rng(6)
+        entry_prob = config.target_trades * 1.5 / len(bars)
+        ref = [
+            _compute_metrics(
+                _simulate_single_run(
+                    bars,
+                    np.where(rng.random(len(bars)) < entry_prob)[0],
+                    config.sl_pct,
+                    config.tp_pct,
+                    config.taker_fee,
+                    direction,
+                ),
+                config.taker_fee,
+            )
+            for _ in range(400)
+        ]
+        ref_trades = np.array([m.total_trades for m in ref])
+        ref_returns = np.array([m.total_return for m in ref])
+        assert result.trades_mean == pytest.approx(ref_trades.mean(), abs=4 * ref_trades.std() / 20)
+        assert result.return_mean == pytest.approx(
+            ref_returns.mean(), abs=4 * ref_returns.std() / 20
+        )
+
+    def test_arrays_and_bar_list_agree(self):
+        bars = _random_walk_bars(500, seed=4)
+        config = BaselineConfig(sl_pct=1.0, tp_pct=2.0, target_trades=20)
+        from_list = run_random_baseline(bars, config, n_simulations=20, seed=1)
+        from_arrays = run_random_baseline(
+            OHLCArrays.from_bars(bars), config, n_simulations=20, seed=1
+        )
+        assert from_list.metrics == from_arrays.metrics
+
+    def test_short_wrapper_forces_short(self):
+        bars = _random_walk_bars(500, seed=4)
+        long_cfg = BaselineConfig(sl_pct=1.0, tp_pct=2.0, target_trades=20, direction="long")
+        result = run_random_short_baseline(bars, long_cfg, n_simulations=10, seed=1)
+        assert result.config.direction == "short"
+
+    def test_invalid_direction_raises(self):
+        with pytest.raises(ValueError, match="direction"):
+            BaselineConfig(sl_pct=1.0, tp_pct=1.0, direction="sideways")  # type: ignore[arg-type]
+
 
 class TestComputeMetrics:
     def test_empty_trades(self):
@@ -147,3 +257,14 @@ class TestRunRandomShortBaseline:
         summary = result.summary()
         assert len(summary) > 100
         assert "VERDICT" in summary
+
+    def test_percentile_of_strategy(self):
+        bars = _random_walk_bars(1000, seed=7)
+        config = BaselineConfig(sl_pct=1.0, tp_pct=2.0, target_trades=20)
+        result = run_random_baseline(bars, config, n_simulations=200, seed=3)
+        sharpes = np.array([m.sharpe for m in result.metrics])
+
+        assert result.percentile_of(sharpes.max() + 1.0) == 100.0
+        assert result.percentile_of(sharpes.min() - 1.0) == 0.0
+        assert result.percentile_of(float(np.median(sharpes))) == pytest.approx(50.0, abs=1.0)
+        assert "percentile" in result.summary(strategy_sharpe=2.0)
@@ -312,6 +312,87 @@ def test_run_campaign_runs_discoveries_when_not_completed(
         assert m_run.call_count == 4
 
 
+def _completing_run(state: StateManager, on_discovery=None):
+    """Fake ``subprocess.run`` that completes runs and seeds champions."""
+    from unittest.mock import MagicMock
+
+    def _fake_run(cmd, **_kwargs):
+        run_id = int(cmd[cmd.index("--run-id") + 1])
+        if "vibe_quant.discovery" in cmd:
+            if on_discovery is not None:
+                on_discovery(cmd)
+            _seed_discovery_result(
+                state, run_id, [{"dsl": _valid_dsl(f"s_{run_id}"), "score": 0.9}]
+            )
+        state.update_backtest_run_status(run_id, "completed")
+        res = MagicMock()
+        res.returncode = 0
+        return res
+
+    return _fake_run
+
+
+def test_run_campaign_runs_cells_concurrently_within_worker_budget(
+    state: StateManager, minimal_config: RegimeCrossConfig
+) -> None:
+    import threading
+
+    plan = plan_campaign(minimal_config, state)
+    barrier = threading.Barrier(2, timeout=10)
+    worker_args: list[str] = []
+
+    def _on_discovery(cmd: list[str]) -> None:
+        worker_args.append(cmd[cmd.index("--max-workers") + 1])
+        barrier.wait()  # both discoveries must be running at once
+
+    with patch(
+        "vibe_quant.discovery.campaign.subprocess.run",
+        side_effect=_completing_run(state, _on_discovery),
+    ) as m_run:
+        run_campaign(plan, state, max_parallel=3, total_workers=5)
+
+    assert worker_args == ["2", "2"]  # 5 workers split across 2 cells
+    assert m_run.call_count == 4
+    assert len(plan.oos_runs) == 2
+
+
+def test_run_campaign_validates_cells_as_they_finish(
+    state: StateManager, minimal_config: RegimeCrossConfig
+) -> None:
+    import threading
+
+    plan = plan_campaign(minimal_config, state)
+    bear_oos_done = threading.Event()
+    reports: list[int] = []
+
+    def _on_discovery(cmd: list[str]) -> None:
+        # bull_b only finishes once bear_a's OOS validation has reported
+        if cmd[cmd.index("--direction") + 1] == "long":
+            assert bear_oos_done.wait(timeout=10)
+
+    def _on_progress(report) -> None:
+        reports.append(len(report.cells))
+        bear_oos_done.set()
+
+    with patch(
+        "vibe_quant.discovery.campaign.subprocess.run",
+        side_effect=_completing_run(state, _on_discovery),
+    ):
+        run_campaign(plan, state, max_parallel=2, on_progress=_on_progress)
+
+    assert reports == [1, 2]
+
+
+def test_run_campaign_rejects_bad_parallelism(
+    state: StateManager, minimal_config: RegimeCrossConfig
+) -> None:
+    plan = plan_campaign(minimal_config, state)
+    with pytest.raises(ValueError, match="max_parallel"):
+        run_campaign(plan, state, max_parallel=0)
+    with pytest.raises(ValueError, match="total_workers"):
+        run_campaign(plan, state, total_workers=0)
+
+
 # ---------------------------------------------------------------------------
 # build_matrix_report
 # ---------------------------------------------------------------------------
@@ -59,7 +59,12 @@ def test_cmd_validation_run_closes_runner_on_success(monkeypatch: Any, capsys: A
         def __init__(self, **kwargs: Any) -> None:
             pass
 
-        def run(self, run_id: int, latency_preset: str | None = None) -> Any:
+        def run(
+            self,
+            run_id: int,
+            latency_preset: str | None = None,
+            execution_model: str | None = None,
+        ) -> Any:
             assert run_id == 123
             assert latency_preset is None
             return SimpleNamespace(
@@ -112,7 +117,12 @@ def test_cmd_validation_run_closes_runner_on_validation_error(
         def __init__(self, **kwargs: Any) -> None:
             pass
 
-        def run(self, run_id: int, latency_preset: str | None = None) -> Any:
+        def run(
+            self,
+            run_id: int,
+            latency_preset: str | None = None,
+            execution_model: str | None = None,
+        ) -> Any:
             assert run_id == 999
             assert latency_preset == "retail"
             raise FakeValidationRunnerError("boom")
@@ -142,7 +152,12 @@ def test_cmd_validation_list_formats_fraction_as_percent(
         pass
 
     class FakeValidationRunner:
-        def run(self, run_id: int, latency_preset: str | None = None) -> Any:
+        def run(
+            self,
+            run_id: int,
+            latency_preset: str | None = None,
+            execution_model: str | None = None,
+        ) -> Any:
             raise NotImplementedError
 
         def close(self) -> None:
@@ -201,6 +216,8 @@ def test_cmd_validation_batch_formats_markdown_results(
         latency_preset: str | None,
         ensure_data: bool,
         verbose: bool,
+        max_workers: int | None,
+        execution_model: str | None,
     ) -> list[FakeBatchResult]:
         assert strategy_ids == [212, 220]
         assert symbol == "BTCUSDT"
@@ -210,6 +227,8 @@ def test_cmd_validation_batch_formats_markdown_results(
         assert latency_preset == "retail"
         assert ensure_data is True
         assert verbose is True
+        assert max_workers == 4
+        assert execution_model == "binance_paper"
         return [
             FakeBatchResult(
                 strategy_id=212,
@@ -221,6 +240,7 @@ def test_cmd_validation_batch_formats_markdown_results(
                 total_trades=50,
                 win_rate=0.55,
                 profit_factor=1.7,
+                error=None,
             )
         ]
 
@@ -242,6 +262,8 @@ def test_cmd_validation_batch_formats_markdown_results(
         latency="retail",
         ensure_data=True,
         db=None,
+        workers=4,
+        execution_model="binance_paper",
     )
     assert root_cli.cmd_validation_batch(args) == 0
     output = capsys.readouterr().out
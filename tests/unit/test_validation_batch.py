@@ -73,7 +73,7 @@ def test_ensure_data_window_ingests_missing_coverage(monkeypatch: Any) -> None:
 
 
 def test_run_validation_batch_creates_runs_and_closes_resources(monkeypatch: Any) -> None:
-    """Batch runner should create one validation run per strategy and close resources."""
+    """Batch runner should create one run per strategy, validate them together and close resources."""
     calls: dict[str, object] = {"created_runs": [], "runner_closed": 0, "state_closed": 0}
 
     def fake_ensure_data_window(
@@ -135,18 +135,33 @@ def test_run_validation_batch_creates_runs_and_closes_resources(monkeypatch: Any
         def __init__(self, db_path: Any) -> None:
             assert db_path is None
 
-        def run(self, run_id: int, latency_preset: str | None = None) -> Any:
-            strategy_id = run_id - 900
+        def run_batch(
+            self,
+            run_ids: list[int],
+            *,
+            latency_preset: str | None = None,
+            max_workers: int | None = None,
+            execution_model: str | None = None,
+        ) -> list[Any]:
             assert latency_preset == "retail"
-            return SimpleNamespace(
-                strategy_name=f"strategy_{strategy_id}",
-                total_return=0.10 + strategy_id / 1000,
-                sharpe_ratio=1.0 + strategy_id / 1000,
-                max_drawdown=0.05,
-                total_trades=20 + strategy_id,
-                win_rate=0.60,
-                profit_factor=1.40,
-            )
+            assert max_workers == 2
+            assert execution_model is None
+            calls["batched_run_ids"] = list(run_ids)
+            results = []
+            for run_id in run_ids:
+                strategy_id = run_id - 900
+                results.append(
+                    SimpleNamespace(
+                        strategy_name=f"strategy_{strategy_id}",
+                        total_return=0.10 + strategy_id / 1000,
+                        sharpe_ratio=1.0 + strategy_id / 1000,
+                        max_drawdown=0.05,
+                        total_trades=20 + strategy_id,
+                        win_rate=0.60,
+                        profit_factor=1.40,
+                    )
+                )
+            return results
 
         def close(self) -> None:
             calls["runner_closed"] = int(calls["runner_closed"]) + 1
@@ -164,9 +179,11 @@ def test_run_validation_batch_creates_runs_and_closes_resources(monkeypatch: Any
         latency_preset="retail",
         ensure_data=False,
         verbose=False,
+        max_workers=2,
     )
 
     assert [result.strategy_id for result in results] == [212, 220]
+    assert calls["batched_run_ids"] == [1112, 1120]
     assert [result.run_id for result in results] == [1112, 1120]
     assert calls["created_runs"] == [
         {
@@ -194,6 +211,68 @@ def test_run_validation_batch_creates_runs_and_closes_resources(monkeypatch: Any
     assert calls["state_closed"] == 1
 
 
+def test_run_validation_batch_keeps_successes_when_runs_fail(monkeypatch: Any) -> None:
+    """A failed run is reported alongside the completed ones, not raised."""
+    from vibe_quant.validation.runner import ValidationBatchError
+
+    class FakeStateManager:
+        def __init__(self, db_path: Any) -> None:
+            self._next = 900
+
+        def get_strategy(self, strategy_id: int) -> dict[str, object]:
+            return {"id": strategy_id, "name": f"strategy_{strategy_id}"}
+
+        def create_backtest_run(self, **_kwargs: object) -> int:
+            self._next += 1
+            return self._next
+
+        def close(self) -> None:
+            pass
+
+    class FakeValidationRunner:
+        def __init__(self, db_path: Any) -> None:
+            pass
+
+        def run_batch(self, run_ids: list[int], **_kwargs: object) -> list[Any]:
+            ok = SimpleNamespace(
+                strategy_name="strategy_1",
+                total_return=0.1,
+                sharpe_ratio=1.5,
+                max_drawdown=0.05,
+                total_trades=30,
+                win_rate=0.6,
+                profit_factor=1.4,
+            )
+            msg = "1 of 2 validation runs failed"
+            raise ValidationBatchError(
+                msg, results={901: ok}, errors={902: "BrokenProcessPool: worker died"}
+            )
+
+        def close(self) -> None:
+            pass
+
+    monkeypatch.setattr(batch, "ensure_data_window", lambda *_a, **_k: None)
+    monkeypatch.setattr(batch, "StateManager", FakeStateManager)
+    monkeypatch.setattr(batch, "ValidationRunner", FakeValidationRunner)
+
+    results = batch.run_validation_batch(
+        [1, 2],
+        symbol="BTCUSDT",
+        timeframe="1m",
+        start_date="2024-10-01",
+        end_date="2024-12-31",
+        verbose=False,
+    )
+
+    assert [(r.run_id, r.error) for r in results] == [
+        (901, None),
+        (902, "BrokenProcessPool: worker died"),
+    ]
+    assert results[0].sharpe_ratio == 1.5
+    assert results[1].strategy_name == "strategy_2"
+    assert "FAILED: BrokenProcessPool" in batch.format_batch_results_markdown(results)
+
+
 def test_format_batch_results_markdown_formats_fraction_metrics() -> None:
     """Markdown formatter should display returns and win rates as percentages."""
     markdown = batch.format_batch_results_markdown(
@@ -5,11 +5,16 @@ from __future__ import annotations
 from decimal import Decimal
 from types import SimpleNamespace
 
+import numpy as np
+import pytest
+
 from vibe_quant.validation.extraction import (
     _compute_max_drawdown_from_trades,
     compute_extended_metrics,
+    extract_results,
     extract_trades,
 )
+from vibe_quant.validation.fill_model import SlippageEstimator, trailing_market_stats
 from vibe_quant.validation.results import TradeRecord, ValidationResult
 
 
@@ -225,3 +230,225 @@ class TestSlippageModelSelection:
         assert len(result.trades) == 1
         assert result.trades[0].slippage_cost > 0.0
         assert result.total_slippage > 0.0
+
+
+_HOUR_NS = 3_600_000_000_000
+_T0_NS = 1_735_689_600_000_000_000  # 2025-01-01 00:00 UTC
+
+
+class TestExtendedMetrics:
+    """Tests for drawdown duration, exposure and per-hour PnL."""
+
+    def test_drawdown_duration_exposure_and_hourly_pnl(self) -> None:
+        trades = [
+            # Two overlapping trades, then a gap, then a recovery
+            _make_trade("2025-01-01T00:00:00+00:00", "2025-01-01T10:00:00+00:00", 50.0),
+            _make_trade("2025-01-01T05:00:00+00:00", "2025-01-02T00:00:00+00:00", -100.0),
+            _make_trade("2025-01-03T00:00:00+00:00", "2025-01-03T12:00:00+00:00", -20.0),
+            _make_trade("2025-01-04T00:00:00+00:00", "2025-01-05T00:00:00+00:00", 200.0),
+        ]
+        result = ValidationResult(starting_balance=1000.0, trades=trades)
+
+        compute_extended_metrics(result)
+
+        # Peak after trade 1 (Jan 1 10:00), recovered at trade 4's exit (Jan 5)
+        assert result.max_drawdown_duration_days == pytest.approx(3 + 14 / 24)
+        # Held 24h + 12h + 24h of the 96h span
+        assert result.time_in_market == pytest.approx(60 / 96)
+        assert len(result.pnl_by_hour) == 24
+        assert result.pnl_by_hour[0] == pytest.approx(100.0)
+        assert result.pnl_by_hour[10] == pytest.approx(50.0)
+        assert result.pnl_by_hour[12] == pytest.approx(-20.0)
+        assert result.max_consecutive_losses == 2
+
+    def test_sortino_left_to_nt_stats(self) -> None:
+        # Sortino is NT's daily-returns ratio; a trade-level value would not
+        # be comparable, so extraction never fills it in
+        trades = [
+            _make_trade("2025-01-01T00:00:00+00:00", "2025-01-02T00:00:00+00:00", pnl)
+            for pnl in (40.0, -20.0, 30.0)
+        ]
+        result = ValidationResult(trades=list(trades))
+        compute_extended_metrics(result)
+        assert result.sortino_ratio == 0.0
+
+        from_stats = ValidationResult(sortino_ratio=1.5, trades=list(trades))
+        compute_extended_metrics(from_stats)
+        assert from_stats.sortino_ratio == 1.5
+
+
+class TestExcursions:
+    """Tests for MAE/MFE from cached bars."""
+
+    @staticmethod
+    def _engine(positions: list[object], bars: list[object]) -> object:
+        cache = SimpleNamespace(
+            positions=lambda: positions,
+            position_snapshots=list,
+            bars=lambda: bars,
+        )
+        return SimpleNamespace(kernel=SimpleNamespace(cache=cache))
+
+    @staticmethod
+    def _position(entry: str, opened_h: int, closed_h: int, instrument: str) -> object:
+        return SimpleNamespace(
+            is_closed=True,
+            realized_pnl=1.0,
+            avg_px_open=100.0,
+            avg_px_close=101.0,
+            peak_qty=1.0,
+            ts_opened=_T0_NS + opened_h * _HOUR_NS,
+            ts_closed=_T0_NS + closed_h * _HOUR_NS,
+            entry=entry,
+            instrument_id=instrument,
+            commissions=lambda: [0.1],
+        )
+
+    @staticmethod
+    def _bar(
+        instrument: str, hour: float, high: float, low: float, spec: str = "1-HOUR-LAST"
+    ) -> object:
+        return SimpleNamespace(
+            bar_type=SimpleNamespace(instrument_id=instrument, spec=spec),
+            volume=10.0,
+            close=(high + low) / 2,
+            high=high,
+            low=low,
+            ts_init=_T0_NS + round(hour * _HOUR_NS),
+        )
+
+    def test_mae_mfe_per_direction_and_instrument(self) -> None:
+        positions = [
+            self._position("SELL", 2, 3, "ETH"),
+            self._position("BUY", 1, 2, "BTC"),
+        ]
+        # Unordered cache, with bars outside every position window. The bar
+        # closing at the entry instant (BTC hour 1, ETH hour 2) is pre-entry.
+        bars = [
+            self._bar("BTC", 2, 104.0, 99.0),
+            self._bar("ETH", 2, 103.0, 98.0),
+            self._bar("BTC", 0, 150.0, 50.0),
+            self._bar("BTC", 1, 101.0, 90.0),
+            self._bar("ETH", 3, 101.0, 96.0),
+            self._bar("ETH", 5, 150.0, 50.0),
+        ]
+        result = ValidationResult(starting_balance=1000.0)
+        venue_config = SimpleNamespace(
+            default_leverage=Decimal("10"),
+            fill_config=SimpleNamespace(impact_coefficient=0.1, prob_slippage=0.0),
+        )
+
+        extract_trades(result, self._engine(positions, bars), venue_config)
+
+        # Trades come out in entry order
+        assert [t.symbol for t in result.trades] == ["BTC", "ETH"]
+        # Long BTC: low 99 / high 104; short ETH: high 101 / low 96
+        assert result.avg_mae == pytest.approx((0.01 + 0.01) / 2)
+        assert result.avg_mfe == pytest.approx((0.04 + 0.04) / 2)
+
+    @pytest.mark.parametrize(
+        ("timeframe", "expected_mae"),
+        [("1h", 0.01), ("5m", 0.005), (None, 0.005)],
+    )
+    def test_excursions_use_one_bar_type(self, timeframe: str | None, expected_mae: float) -> None:
+        positions = [self._position("BUY", 1, 2, "BTC")]
+        # A 4h bar closing inside the position started three hours before it
+        bars = [
+            self._bar("BTC", 2, 102.0, 99.0),
+            self._bar("BTC", 2, 102.0, 80.0, spec="4-HOUR-LAST"),
+            *(self._bar("BTC", 1 + k / 12, 101.0, 99.5, "5-MINUTE-LAST") for k in range(1, 13)),
+        ]
+        venue_config = SimpleNamespace(
+            default_leverage=Decimal("10"), fill_config=None, starting_balance_usdt=1000.0
+        )
+        result = extract_results(
+            1,
+            "s",
+            SimpleNamespace(elapsed_time=0.0, total_positions=1, stats_pnls={}, stats_returns={}),
+            self._engine(positions, bars),
+            venue_config,
+            timeframe=timeframe,
+        )
+
+        assert result.avg_mae == pytest.approx(expected_mae)
+
+    def test_slippage_uses_market_stats_at_entry(self) -> None:
+        positions = [self._position("BUY", 10, 11, "BTC"), self._position("BUY", 90, 91, "BTC")]
+        # Calm first half, volatile second half
+        bars = [
+            self._bar("BTC", h, 100.5 + (h % 2) * (0.1 if h < 50 else 2.0), 99.5)
+            for h in range(100)
+        ]
+        result = ValidationResult(starting_balance=1000.0)
+        venue_config = SimpleNamespace(
+            default_leverage=Decimal("10"),
+            fill_config=SimpleNamespace(impact_coefficient=0.1, prob_slippage=0.0),
+        )
+
+        extract_trades(result, self._engine(positions, bars), venue_config, timeframe="1h")
+
+        close = np.array([bar.close for bar in bars])
+        # Bars closing at or before the entry instant are known at entry
+        avg_volume, volatility = trailing_market_stats(np.full(100, 10.0), close, [11, 91])
+        estimator = SlippageEstimator(impact_coefficient=0.1)
+        expected = [
+            estimator.estimate_cost(100.0, 1.0, avg_volume=v, volatility=s, spread=0.0001)
+            for v, s in zip(avg_volume, volatility, strict=True)
+        ]
+        assert [t.slippage_cost for t in result.trades] == pytest.approx(expected)
+        assert expected[1] > expected[0]
+
+    def test_no_bars_leaves_excursions_unset(self) -> None:
+        result = ValidationResult(starting_balance=1000.0)
+        venue_config = SimpleNamespace(default_leverage=Decimal("10"), fill_config=None)
+
+        extract_trades(result, self._engine([self._position("BUY", 0, 1, "BTC")], []), venue_config)
+
+        assert result.total_trades == 1
+        assert (result.avg_mae, result.avg_mfe) == (0.0, 0.0)
+
+
+def test_estimate_costs_matches_scalar() -> None:
+    estimator = SlippageEstimator(impact_coefficient=0.2, impact_exponent=0.7, base_slippage=1e-4)
+    prices = np.array([100.0, 250.0, 40_000.0])
+    sizes = np.array([1.0, -3.0, 0.01])
+
+    costs = estimator.estimate_costs(prices, sizes, avg_volume=50.0, volatility=0.02, spread=1e-4)
+
+    expected = [
+        estimator.estimate_cost(p, q, avg_volume=50.0, volatility=0.02, spread=1e-4)
+        for p, q in zip(prices, sizes, strict=True)
+    ]
+    assert costs == pytest.approx(expected)
+
+
+def test_estimate_costs_per_trade_market_stats() -> None:
+    estimator = SlippageEstimator(impact_coefficient=0.1)
+    volumes = np.array([50.0, 0.0, 200.0])
+    sigmas = np.array([0.02, 0.03, 0.0])
+
+    costs = estimator.estimate_costs(np.full(3, 100.0), np.ones(3), volumes, sigmas, spread=1e-4)
+
+    expected = [
+        estimator.estimate_cost(100.0, 1.0, avg_volume=v, volatility=s, spread=1e-4)
+        for v, s in zip(volumes, sigmas, strict=True)
+    ]
+    assert costs == pytest.approx(expected)
+
+
+def test_trailing_market_stats_matches_direct_computation() -> None:
+    rng = np.random.default_rng(7)
+    close = 100.0 * np.exp(np.cumsum(rng.normal(0.0, 0.01, 300)))
+    volume = rng.uniform(0.0, 5.0, 300)
+    volume[::17] = 0.0
+
+    avg_volume, volatility = trailing_market_stats(volume, close, [0, 2, 120, 300], window=50)
+
+    for i, end in enumerate([120, 300]):
+        window_volume = volume[end - 50 : end]
+        returns = np.diff(np.log(close[end - 50 : end]))
+        assert avg_volume[i + 2] == pytest.approx(window_volume[window_volume > 0].mean())
+        assert volatility[i + 2] == pytest.approx(np.std(returns, ddof=1))
+    # No bars, and too few returns for a sample deviation
+    assert np.isnan(avg_volume[0]) and np.isnan(volatility[0])
+    assert avg_volume[1] > 0 and np.isnan(volatility[1])
@@ -13,9 +13,11 @@ from vibe_quant.db.state_manager import StateManager
 from vibe_quant.validation.latency import LatencyPreset
 from vibe_quant.validation.runner import (
     TradeRecord,
+    ValidationBatchError,
     ValidationResult,
     ValidationRunner,
     ValidationRunnerError,
+    _shard_groups,
     list_validation_runs,
 )
 
@@ -72,6 +74,19 @@ def _make_mock_result(run_id: int = 1, strategy_name: str = "test_strategy") ->
     )
 
 
+def _window_backtest(self: ValidationRunner, **kwargs: object) -> ValidationResult:
+    """Deterministic window result keyed on the window's test start day."""
+    import time
+
+    run_cfg = kwargs["run_config"]
+    assert isinstance(run_cfg, dict)
+    day = date.fromisoformat(str(run_cfg["start_date"])).day
+    time.sleep(0.02 * (30 - day) / 30)  # earlier windows finish last
+    result = _make_mock_result(run_id=int(kwargs["run_id"]))  # type: ignore[call-overload]
+    result.total_return = day / 100
+    return result
+
+
 @pytest.fixture
 def temp_db() -> Path:
     """Create temporary database file."""
@@ -519,6 +534,37 @@ class TestValidationRunner:
         assert stored_result["total_trades"] == 45
         assert len(trades) == 6
 
+    def test_run_walk_forward_parallel_matches_sequential(
+        self,
+        temp_db: Path,
+        temp_logs: Path,
+        state_with_strategy: StateManager,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Pooled windows return in window order with identical aggregates."""
+        state_with_strategy.close()
+        # Class-level patches so forked pool workers inherit them
+        monkeypatch.setattr(ValidationRunner, "_run_backtest", _window_backtest)
+        monkeypatch.setattr(ValidationRunner, "_ensure_instruments", staticmethod(lambda _s: None))
+
+        runner = ValidationRunner(db_path=temp_db, logs_path=temp_logs)
+        sequential = runner.run_walk_forward(run_id=1, train_days=7, test_days=7)
+        state = StateManager(temp_db)
+        seq_stored = state.get_backtest_result(1)
+        state.close()
+        parallel = runner.run_walk_forward(
+            run_id=1, train_days=7, test_days=7, max_workers=3
+        )
+        runner.close()
+
+        assert [r.total_return for r in parallel] == [r.total_return for r in sequential]
+        assert [r.total_return for r in parallel] == pytest.approx([0.08, 0.15, 0.22])
+        state = StateManager(temp_db)
+        stored = state.get_backtest_result(1)
+        state.close()
+        assert seq_stored is not None and stored is not None
+        assert stored["total_return"] == pytest.approx(seq_stored["total_return"])
+
     def test_run_walk_forward_no_windows_raises(
         self,
         temp_db: Path,
@@ -820,6 +866,121 @@ class TestDetailTimeframe:
         runner.close()
 
 
+class TestRunBatch:
+    """Tests for grouped batch validation."""
+
+    @staticmethod
+    def _create_runs(
+        temp_db: Path, dsl_config: dict[str, object], end_dates: list[str]
+    ) -> list[int]:
+        state = StateManager(temp_db)
+        run_ids = []
+        for i, end_date in enumerate(end_dates):
+            strategy_id = state.create_strategy(
+                name=f"test_strategy_{i}", dsl_config={**dsl_config, "name": f"test_strategy_{i}"}
+            )
+            run_ids.append(
+                state.create_backtest_run(
+                    strategy_id=strategy_id,
+                    run_mode="validation",
+                    symbols=["BTCUSDT-PERP"],
+                    timeframe="5m",
+                    start_date="2025-01-01",
+                    end_date=end_date,
+                    parameters={},
+                    latency_preset="retail",
+                )
+            )
+        state.close()
+        return run_ids
+
+    def test_shard_groups_splits_large_groups(self) -> None:
+        """Workers are shared out in proportion to group size."""
+        shards = _shard_groups([[1, 2, 3, 4, 5], [6]], 4)  # type: ignore[list-item]
+        assert shards == [[1, 2], [3, 4], [5], [6]]
+        assert _shard_groups([[1], [2], [3]], 2) == [[1], [2], [3]]  # type: ignore[list-item]
+        assert _shard_groups([[1, 2]], 8) == [[1], [2]]  # type: ignore[list-item]
+
+    def test_runs_sharing_data_share_a_group(
+        self, temp_db: Path, temp_logs: Path, sample_dsl_config: dict[str, object]
+    ) -> None:
+        """Runs are grouped by data window and stored in run order."""
+        run_ids = self._create_runs(
+            temp_db, sample_dsl_config, ["2025-01-31", "2025-02-28", "2025-01-31"]
+        )
+        runner = ValidationRunner(db_path=temp_db, logs_path=temp_logs)
+        groups: list[list[int]] = []
+
+        def fake_group(jobs: list[object], detail_mode: str) -> list[tuple[int, object]]:
+            groups.append([job.run_id for job in jobs])  # type: ignore[attr-defined]
+            return [
+                (job.run_id, _make_mock_result(job.run_id, job.strategy_name))  # type: ignore[attr-defined]
+                for job in jobs
+            ]
+
+        runner._run_group = fake_group  # type: ignore[assignment,method-assign]
+        results = runner.run_batch(run_ids)
+
+        assert groups == [[run_ids[0], run_ids[2]], [run_ids[1]]]
+        assert [r.run_id for r in results] == run_ids
+        for run_id in run_ids:
+            run = runner._state.get_backtest_run(run_id)
+            assert run is not None
+            assert run["status"] == "completed"
+            assert runner._state.get_backtest_result(run_id) is not None
+            assert len(runner._state.get_trades(run_id)) == 2
+        runner.close()
+
+    def test_failed_run_does_not_stop_others(
+        self, temp_db: Path, temp_logs: Path, sample_dsl_config: dict[str, object]
+    ) -> None:
+        """A failing run is marked failed; the rest still complete."""
+        run_ids = self._create_runs(temp_db, sample_dsl_config, ["2025-01-31", "2025-01-31"])
+        runner = ValidationRunner(db_path=temp_db, logs_path=temp_logs)
+
+        def fake_group(jobs: list[object], detail_mode: str) -> list[tuple[int, object]]:
+            return [
+                (run_ids[0], "RuntimeError: boom"),
+                (run_ids[1], _make_mock_result(run_ids[1])),
+            ]
+
+        runner._run_group = fake_group  # type: ignore[assignment,method-assign]
+        with pytest.raises(ValidationBatchError, match="1 of 2 validation runs failed") as exc:
+            runner.run_batch(run_ids)
+
+        assert list(exc.value.results) == [run_ids[1]]
+        assert exc.value.errors == {run_ids[0]: "RuntimeError: boom"}
+        failed = runner._state.get_backtest_run(run_ids[0])
+        completed = runner._state.get_backtest_run(run_ids[1])
+        assert failed is not None and failed["status"] == "failed"
+        assert completed is not None and completed["status"] == "completed"
+        runner.close()
+
+    def test_crashed_group_marks_its_runs_failed(
+        self, temp_db: Path, temp_logs: Path, sample_dsl_config: dict[str, object]
+    ) -> None:
+        """Runs of a group that dies are failed, not left running."""
+        run_ids = self._create_runs(
+            temp_db, sample_dsl_config, ["2025-01-31", "2025-02-28", "2025-01-31"]
+        )
+        runner = ValidationRunner(db_path=temp_db, logs_path=temp_logs)
+
+        def fake_group(jobs: list[object], detail_mode: str) -> list[tuple[int, object]]:
+            if jobs[0].run_id == run_ids[0]:  # type: ignore[attr-defined]
+                msg = "worker died"
+                raise RuntimeError(msg)
+            return [(job.run_id, _make_mock_result(job.run_id)) for job in jobs]  # type: ignore[attr-defined]
+
+        runner._run_group = fake_group  # type: ignore[assignment,method-assign]
+        with pytest.raises(ValidationBatchError, match="2 of 3") as exc:
+            runner.run_batch(run_ids)
+
+        assert list(exc.value.results) == [run_ids[1]]
+        statuses = [runner._state.get_backtest_run(rid)["status"] for rid in run_ids]  # type: ignore[index]
+        assert statuses == ["failed", "completed", "failed"]
+        runner.close()
+
+
 class TestListValidationRuns:
     """Tests for list_validation_runs function."""
 
@@ -679,6 +679,71 @@ class TestRobustnessCheck:
 # -- Edge Cases --
 
 
+class DateRunner:
+    """Picklable runner whose metrics depend only on the window dates.
+
+    Early windows sleep longest so pool completion order is scrambled.
+    """
+
+    def optimize(
+        self,
+        strategy_id: str,
+        start_date: date,
+        end_date: date,
+        param_grid: dict[str, list[object]],
+    ) -> tuple[dict[str, object], float, float]:
+        import time
+
+        time.sleep(max(0.0, 0.05 - start_date.toordinal() % 365 * 0.0002))
+        return {"start": start_date.isoformat()}, 1.0 + start_date.month / 10, 10.0
+
+    def backtest(
+        self,
+        strategy_id: str,
+        start_date: date,
+        end_date: date,
+        params: dict[str, object],
+    ) -> tuple[float, float]:
+        return start_date.month / 10, float(start_date.day - 15)
+
+
+class TestParallelWindows:
+    """Tests for process-pool window execution."""
+
+    _CFG = WFAConfig(in_sample_days=60, out_of_sample_days=30, step_days=30, min_windows=3)
+
+    def test_parallel_matches_sequential_in_window_order(self) -> None:
+        start, end = date(2023, 1, 1), date(2023, 12, 31)
+        sequential = WalkForwardAnalysis(config=self._CFG, runner=DateRunner())
+        parallel = WalkForwardAnalysis(config=self._CFG, runner=DateRunner(), max_workers=4)
+
+        expected = sequential.run("s", start, end, {})
+        result = parallel.run("s", start, end, {})
+
+        assert result == expected
+        assert [w.window_index for w in result.windows] == list(range(result.num_windows))
+
+    def test_shared_executor_is_used(self) -> None:
+        from concurrent.futures import ThreadPoolExecutor
+
+        wfa = WalkForwardAnalysis(config=self._CFG, runner=DateRunner())
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            result = wfa.run("s", date(2023, 1, 1), date(2023, 12, 31), {}, executor=pool)
+
+        starts = [w.best_params["start"] for w in result.windows]
+        assert starts == sorted(starts)
+
+    def test_unpicklable_runner_falls_back_to_sequential(self) -> None:
+        runner = MockRunner()
+        runner.hook = lambda: None  # type: ignore[attr-defined]
+        wfa = WalkForwardAnalysis(config=self._CFG, runner=runner, max_workers=4)
+
+        result = wfa.run("s", date(2023, 1, 1), date(2023, 12, 31), {})
+
+        # Sequential runs call the in-process runner directly
+        assert len(runner.optimize_calls) == result.num_windows
+
+
 class TestEdgeCases:
     """Tests for edge cases."""
 
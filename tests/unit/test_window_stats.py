@@ -0,0 +1,104 @@
+"""Tests for archive window statistics and daily rollups."""
+
+from __future__ import annotations
+
+import math
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+
+from vibe_quant.data.archive import RawDataArchive
+from vibe_quant.data.window_stats import classify_regime, date_to_ms, get_window_stats
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+_START = "2025-01-01"
+BARS_PER_DAY = 1440
+
+
+def _klines(start_ms: int, closes: list[float]) -> list[tuple[float, ...]]:
+    """1m klines with open = previous close."""
+    rows: list[tuple[float, ...]] = []
+    prev = closes[0]
+    for i, close in enumerate(closes):
+        ot = start_ms + i * 60_000
+        rows.append((ot, prev, max(prev, close) + 1, min(prev, close) - 1, close, 1.0, ot + 59_999))
+        prev = close
+    return rows
+
+
+@pytest.fixture
+def archive(tmp_path: Path) -> RawDataArchive:
+    arc = RawDataArchive(tmp_path / "archive.db")
+    yield arc
+    arc.close()
+
+
+def _daily_closes_series(days: int, daily_closes: list[float]) -> list[float]:
+    """Expand per-day closes to flat 1m closes (each day ends at its close)."""
+    out: list[float] = []
+    prev = daily_closes[0]
+    for d in range(days):
+        target = daily_closes[d]
+        out.extend([prev] * (BARS_PER_DAY - 1) + [target])
+        prev = target
+    return out
+
+
+def test_classify_regime_thresholds() -> None:
+    assert classify_regime(0.10) == 1
+    assert classify_regime(-0.10) == -1
+    assert classify_regime(0.01) == 0
+    assert classify_regime(0.03, threshold=0.02) == 1
+
+
+def test_window_stats_endpoints_and_regime(archive: RawDataArchive) -> None:
+    start_ms = date_to_ms(_START)
+    closes = _daily_closes_series(3, [100.0, 105.0, 120.0])
+    archive.insert_klines("BTCUSDT", "1m", _klines(start_ms, closes), "test")
+
+    stats = get_window_stats(archive, "BTCUSDT", _START, "2025-01-04", with_volatility=False)
+
+    assert stats is not None
+    assert stats.start_price == pytest.approx(100.0)
+    assert stats.end_price == pytest.approx(120.0)
+    assert stats.total_return == pytest.approx(0.2)
+    assert stats.regime == 1
+    assert stats.realized_vol is None
+
+
+def test_window_stats_missing_data_returns_none(archive: RawDataArchive) -> None:
+    assert get_window_stats(archive, "BTCUSDT", _START, "2025-01-04") is None
+
+
+def test_realized_vol_matches_daily_log_returns(archive: RawDataArchive) -> None:
+    start_ms = date_to_ms(_START)
+    daily = [100.0, 102.0, 99.0, 104.0, 101.0]
+    archive.insert_klines("BTCUSDT", "1m", _klines(start_ms, _daily_closes_series(5, daily)), "t")
+
+    stats = get_window_stats(archive, "BTCUSDT", _START, "2025-01-06")
+
+    rets = [math.log(b / a) for a, b in zip(daily, daily[1:], strict=False)]
+    mean = sum(rets) / len(rets)
+    expected = math.sqrt(sum((r - mean) ** 2 for r in rets) / (len(rets) - 1)) * math.sqrt(365)
+    assert stats is not None
+    assert stats.n_days == 5
+    assert stats.realized_vol == pytest.approx(expected)
+
+
+def test_month_window_stats_finish_quickly(archive: RawDataArchive) -> None:
+    # A month of 1m bars; a planner-dependent self-join used to make the
+    # daily aggregation quadratic in bars on newer SQLite releases.
+    start_ms = date_to_ms(_START)
+    daily = [100.0 + (d % 5) for d in range(30)]
+    archive.insert_klines("BTCUSDT", "1m", _klines(start_ms, _daily_closes_series(30, daily)), "t")
+
+    started = time.perf_counter()
+    stats = get_window_stats(archive, "BTCUSDT", _START, "2025-01-31")
+    elapsed = time.perf_counter() - started
+
+    assert stats is not None
+    assert stats.n_days == 30
+    assert elapsed < 5.0
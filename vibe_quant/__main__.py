@@ -37,17 +37,20 @@ def cmd_validation_run(args: argparse.Namespace) -> int:
 
     run_id = args.run_id
     latency = args.latency
+    execution_model = getattr(args, "execution_model", None)
     db_path = Path(args.db) if getattr(args, "db", None) else DEFAULT_DB_PATH
 
     print(f"Running validation backtest for run_id={run_id}")
     if latency:
         print(f"  Latency preset: {latency}")
+    if execution_model:
+        print(f"  Execution model: {execution_model}")
 
     job_manager, stop_heartbeat = run_with_heartbeat(run_id, db_path)
     runner: ValidationRunner | None = None
     try:
         runner = ValidationRunner(db_path=db_path)
-        result = runner.run(run_id=run_id, latency_preset=latency)
+        result = runner.run(run_id=run_id, latency_preset=latency, execution_model=execution_model)
 
         job_manager.mark_completed(run_id)
 
@@ -154,10 +157,53 @@ def cmd_validation_batch(args: argparse.Namespace) -> int:
         latency_preset=args.latency,
         ensure_data=args.ensure_data,
         verbose=True,
+        max_workers=getattr(args, "workers", None),
+        execution_model=getattr(args, "execution_model", None),
     )
 
     print()
     print(format_batch_results_markdown(results))
+    return 1 if any(result.error is not None for result in results) else 0
+
+
+def cmd_validation_calibrate(args: argparse.Namespace) -> int:
+    """Fit a named slippage/latency model from recorded paper/live fills.
+
+    Args:
+        args: Parsed CLI arguments.
+
+    Returns:
+        Exit code (0 for success).
+    """
+    from pathlib import Path
+
+    from vibe_quant.db.connection import DEFAULT_DB_PATH
+    from vibe_quant.db.state_manager import StateManager
+    from vibe_quant.validation.calibration import calibrate
+
+    db_path = Path(args.db) if getattr(args, "db", None) else DEFAULT_DB_PATH
+    run_ids = [r.strip() for r in args.runs.split(",") if r.strip()]
+    try:
+        model = calibrate(
+            run_ids,
+            name=args.name,
+            base_path=getattr(args, "logs", None),
+            latency_quantile=args.latency_quantile,
+        )
+    except (FileNotFoundError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    print(model.summary())
+    if args.dry_run:
+        return 0
+
+    state = StateManager(db_path)
+    try:
+        state.save_execution_model(model.name, model.to_dict())
+    finally:
+        state.close()
+    print(f"Saved execution model {model.name!r}; select it with --execution-model {model.name}")
     return 0
 
 
@@ -302,6 +348,12 @@ def build_parser() -> argparse.ArgumentParser:
         default=None,
         help="Override latency preset (default: from database or retail)",
     )
+    val_run_parser.add_argument(
+        "--execution-model",
+        type=str,
+        default=None,
+        help="Calibrated slippage/latency model (see 'validation calibrate')",
+    )
     val_run_parser.set_defaults(func=cmd_validation_run)
 
     # validation list
@@ -364,6 +416,17 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Download missing raw 1m data before running the batch",
     )
+    val_batch_parser.add_argument(
+        "--workers",
+        type=int,
+        help="Run data groups on N worker processes (0 = cpu_count; default: sequential)",
+    )
+    val_batch_parser.add_argument(
+        "--execution-model",
+        type=str,
+        default=None,
+        help="Calibrated slippage/latency model (see 'validation calibrate')",
+    )
     val_batch_parser.add_argument(
         "--db",
         type=str,
@@ -372,6 +435,48 @@ def build_parser() -> argparse.ArgumentParser:
     )
     val_batch_parser.set_defaults(func=cmd_validation_batch)
 
+    # validation calibrate
+    val_cal_parser = validation_subparsers.add_parser(
+        "calibrate",
+        help="Fit slippage and latency from recorded paper/live fills",
+    )
+    val_cal_parser.add_argument(
+        "--runs",
+        type=str,
+        required=True,
+        help="Comma-separated event log run IDs to read fills from (e.g. PAPER-001)",
+    )
+    val_cal_parser.add_argument(
+        "--name",
+        type=str,
+        required=True,
+        help="Name to store the model under",
+    )
+    val_cal_parser.add_argument(
+        "--latency-quantile",
+        type=float,
+        default=0.5,
+        help="Latency quantile used as the simulated delay (default: 0.5)",
+    )
+    val_cal_parser.add_argument(
+        "--logs",
+        type=str,
+        default=None,
+        help="Event log directory (default: logs/events; paper runs log to logs/paper)",
+    )
+    val_cal_parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Print the fit report without saving the model",
+    )
+    val_cal_parser.add_argument(
+        "--db",
+        type=str,
+        default=None,
+        help="Database path",
+    )
+    val_cal_parser.set_defaults(func=cmd_validation_calibrate)
+
     return parser
 
 
@@ -38,7 +38,7 @@ __all__ = ["create_app"]
 @asynccontextmanager
 async def _lifespan(app: FastAPI) -> AsyncIterator[None]:
     state_mgr = StateManager()
-    job_mgr = BacktestJobManager()
+    job_mgr = BacktestJobManager(state=state_mgr)
     catalog_mgr = CatalogManager()
 
     ws_mgr = ConnectionManager()
@@ -8,10 +8,15 @@ import os
 import sys
 import time
 from datetime import UTC, datetime
-from typing import TYPE_CHECKING, Annotated
+from typing import TYPE_CHECKING, Annotated, Any
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    import pandas as pd
+
     from vibe_quant.data.archive import RawDataArchive
+    from vibe_quant.data.indicator_compute import IndicatorArrays
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 
@@ -22,10 +27,13 @@ from vibe_quant.api.schemas.data import (
     DataCoverageResponse,
     DataQualityResponse,
     DataStatusResponse,
+    IndicatorColumn,
+    IndicatorsColumnarResponse,
     IndicatorsResponse,
     IngestPreviewResponse,
     IngestRequest,
     OhlcError,
+    WindowStatsResponse,
 )
 from vibe_quant.data.catalog import CatalogManager
 from vibe_quant.jobs.manager import BacktestJobManager
@@ -35,6 +43,8 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/data", tags=["data"])
 
 _INTERVAL_MINUTES = {"1m": 1, "5m": 5, "15m": 15, "30m": 30, "1h": 60, "4h": 240, "1d": 1440}
+# Browse additionally serves Monday-aligned weekly bars from the rollup pyramid.
+_BROWSE_INTERVAL_MINUTES = {**_INTERVAL_MINUTES, "1w": 10080}
 
 
 def _next_data_run_id() -> int:
@@ -261,41 +271,141 @@ async def rebuild_catalog(jobs: JobMgr) -> dict[str, object]:
 # --- Browse OHLCV data ---
 
 
+def _parse_date_ms(value: str | None, label: str) -> int | None:
+    if not value:
+        return None
+    try:
+        return int(datetime.strptime(value, "%Y-%m-%d").replace(tzinfo=UTC).timestamp() * 1000)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=f"Invalid {label} date: {exc}") from exc
+
+
+def _browse_source_level(interval_minutes: int) -> str | None:
+    """Coarsest rollup pyramid level that evenly divides the interval (None = raw 1m)."""
+    for resolution, minutes in (("1w", 10080), ("1d", 1440), ("1h", 60)):
+        if interval_minutes % minutes == 0:
+            return resolution
+    return None
+
+
+def _choose_browse_interval(
+    interval: str, start_ts: int, end_ts: int, max_points: int | None
+) -> str:
+    """Finest interval at least as coarse as ``interval`` that fits ``max_points`` bars."""
+    if max_points is None:
+        return interval
+    span_ms = max(end_ts - start_ts, 0)
+    requested = _BROWSE_INTERVAL_MINUTES[interval]
+    candidates = [
+        (name, minutes)
+        for name, minutes in sorted(_BROWSE_INTERVAL_MINUTES.items(), key=lambda kv: kv[1])
+        if minutes >= requested
+    ]
+    for name, minutes in candidates:
+        if -(-span_ms // (minutes * 60_000)) <= max_points:
+            return name
+    return candidates[-1][0]
+
+
+def _resample_rows(rows: Iterable[Sequence[Any]], bucket_ms: int) -> list[dict[str, object]]:
+    """Aggregate time-ordered ``(open_time, o, h, l, c, v, close_time)`` rows into buckets."""
+    data: list[dict[str, object]] = []
+    bucket: dict[str, object] | None = None
+    for r in rows:
+        ot = r[0]
+        bucket_start = (ot // bucket_ms) * bucket_ms
+        if bucket is None or bucket["open_time"] != bucket_start:
+            if bucket is not None:
+                data.append(bucket)
+            bucket = {
+                "open_time": bucket_start,
+                "open": r[1],
+                "high": r[2],
+                "low": r[3],
+                "close": r[4],
+                "volume": r[5],
+                "close_time": bucket_start + bucket_ms - 1,
+            }
+        else:
+            if r[2] > bucket["high"]:  # type: ignore[operator]
+                bucket["high"] = r[2]
+            if r[3] < bucket["low"]:  # type: ignore[operator]
+                bucket["low"] = r[3]
+            bucket["close"] = r[4]
+            bucket["volume"] = bucket["volume"] + r[5]  # type: ignore[operator]
+            bucket["close_time"] = r[6]
+    if bucket is not None:
+        data.append(bucket)
+    return data
+
+
 @router.get("/browse/{symbol}", response_model=BrowseDataResponse)
 async def browse_data(
     symbol: str,
     interval: str = Query(default="1m"),
     start: str | None = Query(default=None),
     end: str | None = Query(default=None),
+    max_points: int | None = Query(default=None, ge=10, le=100_000),
 ) -> BrowseDataResponse:
-    archive = _get_archive()
-    try:
-        start_ts: int | None = None
-        end_ts: int | None = None
+    """OHLCV bars for the chart.
 
-        if start:
-            try:
-                start_ts = int(
-                    datetime.strptime(start, "%Y-%m-%d").replace(tzinfo=UTC).timestamp() * 1000
-                )
-            except ValueError as exc:
-                raise HTTPException(status_code=400, detail=f"Invalid start date: {exc}") from exc
-        if end:
-            try:
-                end_ts = int(
-                    datetime.strptime(end, "%Y-%m-%d").replace(tzinfo=UTC).timestamp() * 1000
-                )
-            except ValueError as exc:
-                raise HTTPException(status_code=400, detail=f"Invalid end date: {exc}") from exc
+    Intervals of 1h and coarser are served from the pre-aggregated rollup
+    pyramid (1h/1d/1w) instead of resampling 1m rows. With ``max_points``
+    (e.g. the viewport width in pixels) the interval is coarsened until
+    the range fits, and the response's ``interval`` reports the one used.
+    """
+    from vibe_quant.data.rollups import LEVELS, read_rollups, refresh_rollups
 
-        if interval not in _INTERVAL_MINUTES:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Invalid interval '{interval}'. Must be one of: {', '.join(_INTERVAL_MINUTES)}",
-            )
-        interval_minutes = _INTERVAL_MINUTES[interval]
+    if interval not in _BROWSE_INTERVAL_MINUTES:
+        raise HTTPException(
+            status_code=400,
+            detail=(
+                f"Invalid interval '{interval}'. "
+                f"Must be one of: {', '.join(_BROWSE_INTERVAL_MINUTES)}"
+            ),
+        )
+    start_ts = _parse_date_ms(start, "start")
+    end_ts = _parse_date_ms(end, "end")
+
+    archive = _get_archive()
+    try:
+        source: str | None = None
+        if max_points is not None or _browse_source_level(_BROWSE_INTERVAL_MINUTES[interval]):
+            # Resolve open-ended ranges against the data actually archived.
+            date_range = archive.get_date_range(symbol, "1m")
+            if date_range is None:
+                return BrowseDataResponse(symbol=symbol, interval=interval, data=[])
+            range_start = start_ts if start_ts is not None else date_range[0]
+            range_end = end_ts if end_ts is not None else date_range[1] + 60_000
+            interval = _choose_browse_interval(interval, range_start, range_end, max_points)
+            source = _browse_source_level(_BROWSE_INTERVAL_MINUTES[interval])
+
+        interval_minutes = _BROWSE_INTERVAL_MINUTES[interval]
         bucket_ms = interval_minutes * 60 * 1000
 
+        if source is not None:
+            level = LEVELS[source]
+            refresh_rollups(archive.conn, symbol, source, range_start, range_end)
+            rollup_rows = read_rollups(archive.conn, symbol, source, start_ts, end_ts)
+            rows = ((*r, r[0] + level.bucket_ms - 1) for r in rollup_rows)
+            data: list[dict[str, object]]
+            if level.bucket_ms == bucket_ms:
+                data = [
+                    {
+                        "open_time": r[0],
+                        "open": r[1],
+                        "high": r[2],
+                        "low": r[3],
+                        "close": r[4],
+                        "volume": r[5],
+                        "close_time": r[6],
+                    }
+                    for r in rows
+                ]
+            else:
+                data = _resample_rows(rows, bucket_ms)
+            return BrowseDataResponse(symbol=symbol, interval=interval, data=data)
+
         # Build WHERE clause
         conditions = ["symbol = ?", "interval = '1m'"]
         params: list[object] = [symbol]
@@ -314,50 +424,25 @@ async def browse_data(
             WHERE {where}
             ORDER BY open_time
         """
-        data: list[dict[str, object]] = []
-
+        cursor = archive.conn.execute(sql, tuple(params))
+        raw_data: list[dict[str, object]]
         if interval_minutes <= 1:
-            for r in archive.conn.execute(sql, tuple(params)):
-                data.append(
-                    {
-                        "open_time": r[0],
-                        "open": r[1],
-                        "high": r[2],
-                        "low": r[3],
-                        "close": r[4],
-                        "volume": r[5],
-                        "close_time": r[6],
-                    }
-                )
+            raw_data = [
+                {
+                    "open_time": r[0],
+                    "open": r[1],
+                    "high": r[2],
+                    "low": r[3],
+                    "close": r[4],
+                    "volume": r[5],
+                    "close_time": r[6],
+                }
+                for r in cursor
+            ]
         else:
-            bucket: dict[str, object] | None = None
-            for r in archive.conn.execute(sql, tuple(params)):
-                ot = r[0]
-                bucket_start = (ot // bucket_ms) * bucket_ms
-                if bucket is None or bucket["open_time"] != bucket_start:
-                    if bucket is not None:
-                        data.append(bucket)
-                    bucket = {
-                        "open_time": bucket_start,
-                        "open": r[1],
-                        "high": r[2],
-                        "low": r[3],
-                        "close": r[4],
-                        "volume": r[5],
-                        "close_time": bucket_start + bucket_ms - 1,
-                    }
-                else:
-                    if r[2] > bucket["high"]:  # type: ignore[operator]
-                        bucket["high"] = r[2]
-                    if r[3] < bucket["low"]:  # type: ignore[operator]
-                        bucket["low"] = r[3]
-                    bucket["close"] = r[4]
-                    bucket["volume"] = bucket["volume"] + r[5]  # type: ignore[operator]
-                    bucket["close_time"] = r[6]
-            if bucket is not None:
-                data.append(bucket)
+            raw_data = _resample_rows(cursor, bucket_ms)
 
-        return BrowseDataResponse(symbol=symbol, interval=interval, data=data)
+        return BrowseDataResponse(symbol=symbol, interval=interval, data=raw_data)
     finally:
         archive.close()
 
@@ -365,28 +450,72 @@ async def browse_data(
 # --- Indicator computation ---
 
 
-@router.get("/indicators/{symbol}", response_model=IndicatorsResponse)
-async def compute_indicators_endpoint(
+def _load_indicator_frame(
+    archive: RawDataArchive,
     symbol: str,
-    interval: str = Query(default="1h"),
-    start: str | None = Query(default=None),
-    end: str | None = Query(default=None),
-    indicators: str = Query(default="[]"),
-) -> IndicatorsResponse:
-    import json
-
+    interval_minutes: int,
+    start_ts: int | None,
+    end_ts: int | None,
+) -> pd.DataFrame | None:
+    """Load 1m candles for the range and aggregate to ``interval_minutes``."""
     import pandas as pd
 
-    from vibe_quant.data.indicator_compute import compute_indicators
+    bucket_ms = interval_minutes * 60 * 1000
+
+    conditions = ["symbol = ?", "interval = '1m'"]
+    params: list[object] = [symbol]
+    if start_ts is not None:
+        conditions.append("open_time >= ?")
+        params.append(start_ts)
+    if end_ts is not None:
+        conditions.append("open_time < ?")
+        params.append(end_ts)
+    where = " AND ".join(conditions)
+
+    sql = f"""
+        SELECT open_time, open, high, low, close, volume
+        FROM raw_klines
+        WHERE {where}
+        ORDER BY open_time
+    """
+    rows = archive.conn.execute(sql, tuple(params)).fetchall()
+    if not rows:
+        return None
+
+    raw_df = pd.DataFrame(rows, columns=["open_time", "open", "high", "low", "close", "volume"])
+    if interval_minutes <= 1:
+        return raw_df
+
+    raw_df["bucket"] = (raw_df["open_time"] // bucket_ms) * bucket_ms
+    return raw_df.groupby("bucket").agg(
+        open_time=("bucket", "first"),
+        open=("open", "first"),
+        high=("high", "max"),
+        low=("low", "min"),
+        close=("close", "last"),
+        volume=("volume", "sum"),
+    ).reset_index(drop=True)
+
+
+def _indicator_arrays_for_request(
+    symbol: str,
+    interval: str,
+    start: str | None,
+    end: str | None,
+    indicators: str,
+) -> list[IndicatorArrays]:
+    """Resolve indicator configs to arrays, serving cached viewport slices when possible."""
+    import json
+
+    from vibe_quant.data.indicator_compute import compute_indicator_arrays, indicator_cache
 
-    # Parse indicators JSON
     try:
         indicator_configs: list[dict[str, object]] = json.loads(indicators)
     except json.JSONDecodeError as exc:
         raise HTTPException(status_code=400, detail=f"Invalid indicators JSON: {exc}") from exc
 
     if not indicator_configs:
-        return IndicatorsResponse(symbol=symbol, interval=interval, series=[])
+        return []
 
     if interval not in _INTERVAL_MINUTES:
         raise HTTPException(
@@ -394,69 +523,115 @@ async def compute_indicators_endpoint(
             detail=f"Invalid interval '{interval}'. Must be one of: {', '.join(_INTERVAL_MINUTES)}",
         )
 
+    start_ts = _parse_date_ms(start, "start")
+    end_ts = _parse_date_ms(end, "end")
+
     archive = _get_archive()
     try:
-        start_ts: int | None = None
-        end_ts: int | None = None
-        if start:
-            try:
-                start_ts = int(
-                    datetime.strptime(start, "%Y-%m-%d").replace(tzinfo=UTC).timestamp() * 1000
-                )
-            except ValueError as exc:
-                raise HTTPException(status_code=400, detail=f"Invalid start date: {exc}") from exc
-        if end:
-            try:
-                end_ts = int(
-                    datetime.strptime(end, "%Y-%m-%d").replace(tzinfo=UTC).timestamp() * 1000
-                )
-            except ValueError as exc:
-                raise HTTPException(status_code=400, detail=f"Invalid end date: {exc}") from exc
+        # Indicators are computed from 1m klines whatever the chart interval
+        fingerprint = archive.data_version(symbol, "1m")
+        keys = [indicator_cache.make_key(symbol, interval, cfg) for cfg in indicator_configs]
+        resolved: list[IndicatorArrays | None] = [
+            None if key is None else indicator_cache.get(key, fingerprint, start_ts, end_ts)
+            for key in keys
+        ]
+        missing = [
+            (i, key) for i, key in enumerate(keys) if key is not None and resolved[i] is None
+        ]
+        if missing:
+            # One load over the union of the misses' widened ranges
+            ranges = [
+                indicator_cache.fill_range(key, fingerprint, start_ts, end_ts) for _, key in missing
+            ]
+            starts = [lo for lo, _ in ranges if lo is not None]
+            ends = [hi for _, hi in ranges if hi is not None]
+            fill_start = min(starts) if len(starts) == len(ranges) else None
+            fill_end = max(ends) if len(ends) == len(ranges) else None
+            df = _load_indicator_frame(
+                archive, symbol, _INTERVAL_MINUTES[interval], fill_start, fill_end
+            )
+            if df is None:
+                return []
+            for i, key in missing:
+                computed = compute_indicator_arrays(df, [indicator_configs[i]])
+                if not computed:
+                    continue
+                indicator_cache.put(key, fingerprint, fill_start, fill_end, computed[0])
+                resolved[i] = computed[0].slice(start_ts, end_ts)
+        return [arrays for arrays in resolved if arrays is not None]
+    finally:
+        archive.close()
 
-        interval_minutes = _INTERVAL_MINUTES[interval]
-        bucket_ms = interval_minutes * 60 * 1000
 
-        # Fetch 1m candles
-        conditions = ["symbol = ?", "interval = '1m'"]
-        params: list[object] = [symbol]
-        if start_ts is not None:
-            conditions.append("open_time >= ?")
-            params.append(start_ts)
-        if end_ts is not None:
-            conditions.append("open_time < ?")
-            params.append(end_ts)
-        where = " AND ".join(conditions)
+@router.get("/indicators/{symbol}", response_model=IndicatorsResponse)
+async def compute_indicators_endpoint(
+    symbol: str,
+    interval: str = Query(default="1h"),
+    start: str | None = Query(default=None),
+    end: str | None = Query(default=None),
+    indicators: str = Query(default="[]"),
+) -> IndicatorsResponse:
+    from vibe_quant.data.indicator_compute import to_indicator_series
+
+    arrays = _indicator_arrays_for_request(symbol, interval, start, end, indicators)
+    return IndicatorsResponse(symbol=symbol, interval=interval, series=to_indicator_series(arrays))
 
-        sql = f"""
-            SELECT open_time, open, high, low, close, volume
-            FROM raw_klines
-            WHERE {where}
-            ORDER BY open_time
-        """
-        rows = archive.conn.execute(sql, tuple(params)).fetchall()
-
-        if not rows:
-            return IndicatorsResponse(symbol=symbol, interval=interval, series=[])
-
-        # Build DataFrame
-        raw_df = pd.DataFrame(rows, columns=["open_time", "open", "high", "low", "close", "volume"])
-
-        # Aggregate to requested interval if > 1m
-        if interval_minutes > 1:
-            raw_df["bucket"] = (raw_df["open_time"] // bucket_ms) * bucket_ms
-            df = raw_df.groupby("bucket").agg(
-                open_time=("bucket", "first"),
-                open=("open", "first"),
-                high=("high", "max"),
-                low=("low", "min"),
-                close=("close", "last"),
-                volume=("volume", "sum"),
-            ).reset_index(drop=True)
-        else:
-            df = raw_df
 
-        series = compute_indicators(df, indicator_configs)
-        return IndicatorsResponse(symbol=symbol, interval=interval, series=series)
+@router.get("/indicators/{symbol}/columnar", response_model=IndicatorsColumnarResponse)
+async def compute_indicators_columnar_endpoint(
+    symbol: str,
+    interval: str = Query(default="1h"),
+    start: str | None = Query(default=None),
+    end: str | None = Query(default=None),
+    indicators: str = Query(default="[]"),
+) -> IndicatorsColumnarResponse:
+    """Compact variant: one shared ``time`` array plus one ``values`` array per output."""
+    from vibe_quant.data.indicator_compute import to_columnar
+
+    arrays = _indicator_arrays_for_request(symbol, interval, start, end, indicators)
+    if not arrays:
+        return IndicatorsColumnarResponse(symbol=symbol, interval=interval, time=[], series=[])
+    times = arrays[0].times
+    return IndicatorsColumnarResponse(
+        symbol=symbol,
+        interval=interval,
+        time=times.tolist(),
+        series=[IndicatorColumn(**col) for col in to_columnar(arrays, times)],
+    )
+
+
+# --- Window statistics ---
+
+
+@router.get("/window-stats/{symbol}", response_model=WindowStatsResponse)
+async def window_stats(
+    symbol: str,
+    start: str = Query(...),
+    end: str = Query(...),
+) -> WindowStatsResponse:
+    from vibe_quant.data.window_stats import get_window_stats
+
+    archive = _get_archive()
+    try:
+        try:
+            stats = get_window_stats(archive, symbol, start, end)
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=f"Invalid date: {exc}") from exc
+        if stats is None:
+            raise HTTPException(
+                status_code=404, detail=f"No 1m data for {symbol} between {start} and {end}"
+            )
+        return WindowStatsResponse(
+            symbol=symbol,
+            start_date=start,
+            end_date=end,
+            start_price=stats.start_price,
+            end_price=stats.end_price,
+            total_return=stats.total_return,
+            realized_vol=stats.realized_vol,
+            regime=stats.regime,
+            n_days=stats.n_days,
+        )
     finally:
         archive.close()
 
@@ -427,26 +427,33 @@ def _discovery_entry_is_short_only(entry: dict[str, object]) -> bool:
 def _window_regime_sign(symbol: str, start_date: str, end_date: str) -> int:
     """Classify a window as bull (+1), bear (-1), or neutral (0).
 
-    Returns 0 if data is unavailable or window is sideways.
+    Uses two indexed point lookups (first open, last close) instead of
+    loading every 1m bar. Returns 0 if data is unavailable or window is
+    sideways.
     """
-    try:
-        from vibe_quant.validation.random_baseline import load_ohlc
+    from vibe_quant.data.archive import RawDataArchive
+    from vibe_quant.data.window_stats import get_window_stats
 
-        bars = load_ohlc(symbol, "1m", start_date, end_date)
+    archive = RawDataArchive()
+    try:
+        stats = get_window_stats(
+            archive,
+            symbol,
+            start_date,
+            end_date,
+            with_volatility=False,
+            regime_threshold=_REGIME_RETURN_THRESHOLD,
+        )
     except Exception:
         logger.warning(
             "Regime sign: failed to load OHLC for %s %s→%s, treating as neutral",
             symbol, start_date, end_date, exc_info=True,
         )
         return 0
+    finally:
+        archive.close()
 
-    if len(bars) < 2 or bars[0].open <= 0:
-        return 0
-
-    total_return = (bars[-1].close - bars[0].open) / bars[0].open
-    if abs(total_return) < _REGIME_RETURN_THRESHOLD:
-        return 0
-    return 1 if total_return > 0 else -1
+    return 0 if stats is None else stats.regime
 
 
 def _shift_window(start_date: str, end_date: str, months: int) -> tuple[str, str]:
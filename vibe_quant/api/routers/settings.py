@@ -242,6 +242,7 @@ async def get_system_info(mgr: StateMgr) -> SystemInfoResponse:
         catalog_size_bytes=catalog_size,
         db_size_bytes=_file_size(db_path),
         table_counts=_get_table_counts(mgr),
+        db_write_stats=mgr.write_stats(),
     )
 
 
@@ -66,6 +66,23 @@ class IndicatorsResponse(BaseModel):
     series: list[IndicatorSeries]
 
 
+class IndicatorColumn(BaseModel):
+    name: str
+    output_name: str
+    indicator_type: str
+    display_label: str
+    pane: str
+    params: dict[str, object]
+    values: list[float | None]  # aligned with IndicatorsColumnarResponse.time
+
+
+class IndicatorsColumnarResponse(BaseModel):
+    symbol: str
+    interval: str
+    time: list[int]  # open_time ms, shared by every series
+    series: list[IndicatorColumn]
+
+
 class OhlcError(BaseModel):
     timestamp: str
     error_type: str  # 'high_lt_low', 'zero_close', 'negative_volume', 'zero_open'
@@ -79,3 +96,15 @@ class DataQualityResponse(BaseModel):
     ohlc_errors: list[OhlcError] = []
     ohlc_error_count: int = 0
     error: str | None = None
+
+
+class WindowStatsResponse(BaseModel):
+    symbol: str
+    start_date: str
+    end_date: str
+    start_price: float
+    end_price: float
+    total_return: float
+    realized_vol: float | None
+    regime: int  # +1 bull, -1 bear, 0 sideways
+    n_days: int
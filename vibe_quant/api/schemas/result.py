@@ -96,6 +96,7 @@ class SweepResultResponse(BaseModel):
     passed_deflated_sharpe: bool | None
     passed_walk_forward: bool | None
     passed_purged_kfold: bool | None
+    passed_cpcv: bool | None = None
 
 
 class RunSummaryItem(BaseModel):
@@ -61,6 +61,7 @@ class SystemInfoResponse(BaseModel):
     catalog_size_bytes: int
     db_size_bytes: int
     table_counts: dict[str, int]
+    db_write_stats: dict[str, float] = {}
 
 
 class DatabaseInfoResponse(BaseModel):
@@ -1,4 +1,14 @@
-"""WebSocket connection manager for vibe-quant API."""
+"""WebSocket connection manager for vibe-quant API.
+
+Each connected client gets a bounded outbound queue drained by its own
+writer task, so ``broadcast`` is a non-blocking enqueue and one slow or
+half-dead browser tab cannot delay updates to everyone else.
+
+When a client's queue is full, progress-style messages (same ``type`` and
+``run_id``) are coalesced so only the latest survives. A client whose
+queue stays full with nothing left to coalesce, or whose socket blocks on
+a single send for longer than ``_SEND_TIMEOUT``, is evicted.
+"""
 
 from __future__ import annotations
 
@@ -6,6 +16,7 @@ import asyncio
 import contextlib
 import json
 import logging
+from collections import deque
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -14,12 +25,70 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 _HEARTBEAT_INTERVAL: float = 30.0
+_QUEUE_MAXSIZE: int = 64
+_SEND_TIMEOUT: float = 10.0
+_CLOSE_TIMEOUT: float = 1.0
+
+# Message types where only the most recent value per run matters.
+_COALESCE_TYPES: frozenset[str] = frozenset({"ping", "heartbeat", "progress", "job_progress"})
+
+_CoalesceKey = tuple[str, object]
+
+
+def _coalesce_key(data: dict[str, object]) -> _CoalesceKey | None:
+    msg_type = data.get("type")
+    if not isinstance(msg_type, str) or msg_type not in _COALESCE_TYPES:
+        return None
+    return (msg_type, data.get("run_id"))
+
+
+class _Subscriber:
+    """Outbound queue + writer task for one (websocket, channel) pair."""
+
+    def __init__(self, websocket: WebSocket, channel: str, maxsize: int) -> None:
+        self.websocket = websocket
+        self.channel = channel
+        self.maxsize = maxsize
+        self.queue: deque[tuple[_CoalesceKey | None, str]] = deque()
+        self.wakeup = asyncio.Event()
+        self.task: asyncio.Task[None] | None = None
+        self.coalesced = 0
+
+    def offer(self, key: _CoalesceKey | None, payload: str) -> bool:
+        """Enqueue ``payload`` without blocking. Returns False if client is behind."""
+        if len(self.queue) < self.maxsize:
+            self.queue.append((key, payload))
+            self.wakeup.set()
+            return True
+        if key is not None:
+            # Latest-wins: replace the queued message for the same key.
+            for i, (queued_key, _) in enumerate(self.queue):
+                if queued_key == key:
+                    del self.queue[i]
+                    self.queue.append((key, payload))
+                    self.coalesced += 1
+                    return True
+        # Make room by dropping the oldest superseded-kind message, if any.
+        for i, (queued_key, _) in enumerate(self.queue):
+            if queued_key is not None:
+                del self.queue[i]
+                self.queue.append((key, payload))
+                self.coalesced += 1
+                return True
+        return False
 
 
 class ConnectionManager:
-    def __init__(self) -> None:
-        self._channels: dict[str, set[WebSocket]] = {}
+    def __init__(
+        self,
+        queue_maxsize: int = _QUEUE_MAXSIZE,
+        send_timeout: float = _SEND_TIMEOUT,
+    ) -> None:
+        self._channels: dict[str, dict[WebSocket, _Subscriber]] = {}
         self._heartbeat_task: asyncio.Task[None] | None = None
+        self._queue_maxsize = queue_maxsize
+        self._send_timeout = send_timeout
+        self.evicted_count = 0
 
     async def start(self) -> None:
         self._heartbeat_task = asyncio.create_task(self._heartbeat_loop())
@@ -30,55 +99,108 @@ class ConnectionManager:
             with contextlib.suppress(asyncio.CancelledError):
                 await self._heartbeat_task
             self._heartbeat_task = None
+        tasks: list[asyncio.Task[None]] = []
+        for conns in self._channels.values():
+            for sub in conns.values():
+                if sub.task is not None:
+                    sub.task.cancel()
+                    tasks.append(sub.task)
+        self._channels.clear()
+        for task in tasks:
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await task
 
     async def connect(self, websocket: WebSocket, channel: str) -> None:
         await websocket.accept()
-        if channel not in self._channels:
-            self._channels[channel] = set()
-        self._channels[channel].add(websocket)
-        logger.debug("ws connect channel=%s clients=%d", channel, len(self._channels[channel]))
+        conns = self._channels.setdefault(channel, {})
+        old = conns.pop(websocket, None)
+        if old is not None and old.task is not None:
+            old.task.cancel()
+        sub = _Subscriber(websocket, channel, self._queue_maxsize)
+        sub.task = asyncio.create_task(self._writer_loop(sub))
+        conns[websocket] = sub
+        logger.debug("ws connect channel=%s clients=%d", channel, len(conns))
 
     def disconnect(self, websocket: WebSocket, channel: str) -> None:
-        conns = self._channels.get(channel)
-        if conns is not None:
-            conns.discard(websocket)
-            if not conns:
-                del self._channels[channel]
+        self._remove(websocket, channel)
         logger.debug("ws disconnect channel=%s", channel)
 
+    def client_count(self, channel: str) -> int:
+        return len(self._channels.get(channel, {}))
+
     async def broadcast(self, channel: str, data: dict[str, object]) -> None:
+        """Enqueue ``data`` for every client on ``channel``; never awaits a send."""
         conns = self._channels.get(channel)
         if not conns:
             return
         payload = json.dumps(data)
-        dead: list[WebSocket] = []
-        for ws in conns:
-            try:
-                await ws.send_text(payload)
-            except Exception:  # noqa: BLE001
-                dead.append(ws)
-        for ws in dead:
-            conns.discard(ws)
-            logger.debug("ws removed dead connection channel=%s", channel)
-        if not conns:
-            del self._channels[channel]
+        key = _coalesce_key(data)
+        behind = [sub for sub in conns.values() if not sub.offer(key, payload)]
+        for sub in behind:
+            self._evict(sub, "outbound queue full")
 
     async def send_personal(self, websocket: WebSocket, data: dict[str, object]) -> None:
         payload = json.dumps(data)
+        for conns in self._channels.values():
+            sub = conns.get(websocket)
+            if sub is not None:
+                # Route through the writer so replies stay ordered with broadcasts.
+                if not sub.offer(_coalesce_key(data), payload):
+                    self._evict(sub, "outbound queue full")
+                return
         await websocket.send_text(payload)
 
+    def _remove(self, websocket: WebSocket, channel: str) -> _Subscriber | None:
+        conns = self._channels.get(channel)
+        if conns is None:
+            return None
+        sub = conns.pop(websocket, None)
+        if not conns:
+            del self._channels[channel]
+        if sub is not None and sub.task is not None and sub.task is not asyncio.current_task():
+            sub.task.cancel()
+        return sub
+
+    def _evict(self, sub: _Subscriber, reason: str) -> None:
+        if self._remove(sub.websocket, sub.channel) is None:
+            return
+        self.evicted_count += 1
+        logger.warning(
+            "ws evicted slow client channel=%s reason=%s queued=%d coalesced=%d",
+            sub.channel,
+            reason,
+            len(sub.queue),
+            sub.coalesced,
+        )
+        sub.queue.clear()
+        asyncio.get_running_loop().create_task(self._close_quietly(sub.websocket))
+
+    async def _close_quietly(self, websocket: WebSocket) -> None:
+        with contextlib.suppress(Exception):
+            # 1013 = "try again later"; the frontend reconnects on close.
+            await asyncio.wait_for(websocket.close(code=1013), timeout=_CLOSE_TIMEOUT)
+
+    async def _writer_loop(self, sub: _Subscriber) -> None:
+        while True:
+            if not sub.queue:
+                sub.wakeup.clear()
+                await sub.wakeup.wait()
+                continue
+            _, payload = sub.queue.popleft()
+            try:
+                await asyncio.wait_for(sub.websocket.send_text(payload), timeout=self._send_timeout)
+            except TimeoutError:
+                self._evict(sub, "send timeout")
+                return
+            except asyncio.CancelledError:
+                raise
+            except Exception:  # noqa: BLE001
+                self._remove(sub.websocket, sub.channel)
+                logger.debug("ws removed dead connection channel=%s", sub.channel)
+                return
+
     async def _heartbeat_loop(self) -> None:
         while True:
             await asyncio.sleep(_HEARTBEAT_INTERVAL)
-            for channel, conns in list(self._channels.items()):
-                dead: list[WebSocket] = []
-                for ws in conns:
-                    try:
-                        await ws.send_json({"type": "ping"})
-                    except Exception:  # noqa: BLE001
-                        dead.append(ws)
-                for ws in dead:
-                    conns.discard(ws)
-                    logger.debug("ws heartbeat removed stale connection channel=%s", channel)
-                if not conns:
-                    del self._channels[channel]
+            for channel in list(self._channels):
+                await self.broadcast(channel, {"type": "ping"})
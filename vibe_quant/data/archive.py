@@ -52,6 +52,29 @@ CREATE INDEX IF NOT EXISTS idx_raw_klines_symbol_time
 CREATE INDEX IF NOT EXISTS idx_raw_funding_symbol_time
     ON raw_funding_rates(symbol, funding_time);
 
+-- Per (symbol, interval) kline version: the max raw_klines id after the
+-- last insert that added rows for that pair
+CREATE TABLE IF NOT EXISTS kline_versions (
+    symbol TEXT NOT NULL,
+    interval TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    PRIMARY KEY (symbol, interval)
+) WITHOUT ROWID;
+
+-- Derived OHLCV rollups of 1m klines (rebuildable from raw_klines, never source data)
+CREATE TABLE IF NOT EXISTS kline_rollups (
+    symbol TEXT NOT NULL,
+    resolution TEXT NOT NULL,
+    bucket_start INTEGER NOT NULL,
+    open REAL NOT NULL,
+    high REAL NOT NULL,
+    low REAL NOT NULL,
+    close REAL NOT NULL,
+    volume REAL NOT NULL,
+    bar_count INTEGER NOT NULL,
+    PRIMARY KEY (symbol, resolution, bucket_start)
+) WITHOUT ROWID;
+
 -- Download session audit log
 CREATE TABLE IF NOT EXISTS download_sessions (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -152,12 +175,18 @@ class RawDataArchive:
                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
             rows,
         )
-        self.conn.commit()
-
         after = self.conn.execute(
             "SELECT COUNT(*) FROM raw_klines WHERE symbol = ? AND interval = ?",
             (symbol, interval),
         ).fetchone()[0]
+        if after != before:
+            self.conn.execute(
+                """INSERT INTO kline_versions (symbol, interval, version)
+                   VALUES (?, ?, (SELECT MAX(id) FROM raw_klines))
+                   ON CONFLICT (symbol, interval) DO UPDATE SET version = excluded.version""",
+                (symbol, interval),
+            )
+        self.conn.commit()
         return int(after - before)
 
     def insert_funding_rates(
@@ -277,6 +306,32 @@ class RawDataArchive:
             return (row[0], row[1])
         return None
 
+    def data_version(self, symbol: str, interval: str) -> int:
+        """Get a version stamp for one symbol's klines at an interval.
+
+        ``insert_klines`` records the archive's max row id whenever it adds
+        rows for the pair, so the stamp only changes when that pair's data
+        does. Pairs written before versions were tracked fall back to their
+        max row id.
+
+        Args:
+            symbol: Trading symbol.
+            interval: Candle interval.
+
+        Returns:
+            Version stamp, or 0 if the pair has no klines.
+        """
+        row = self.conn.execute(
+            "SELECT version FROM kline_versions WHERE symbol = ? AND interval = ?",
+            (symbol, interval),
+        ).fetchone()
+        if row is None:
+            row = self.conn.execute(
+                "SELECT MAX(id) FROM raw_klines WHERE symbol = ? AND interval = ?",
+                (symbol, interval),
+            ).fetchone()
+        return int(row[0]) if row and row[0] is not None else 0
+
     def get_kline_count(self, symbol: str, interval: str) -> int:
         """Get count of stored klines.
 
@@ -303,6 +303,19 @@ def _aggregate_group(
     )
 
 
+def get_bar_spec(interval: str) -> BarSpecification:
+    """Get NautilusTrader BarSpecification (e.g. ``1-HOUR-LAST``) for an interval.
+
+    Args:
+        interval: Candle interval (e.g., '1m', '5m', '1h').
+
+    Returns:
+        NautilusTrader BarSpecification of LAST-price bars.
+    """
+    step, aggregation = INTERVAL_TO_AGGREGATION[interval]
+    return BarSpecification(step, aggregation, PriceType.LAST)
+
+
 def get_bar_type(symbol: str, interval: str) -> BarType:
     """Get NautilusTrader BarType for a symbol and interval.
 
@@ -314,12 +327,9 @@ def get_bar_type(symbol: str, interval: str) -> BarType:
         NautilusTrader BarType.
     """
     instrument_id = InstrumentId(Symbol(f"{symbol}-PERP"), BINANCE_VENUE)
-    step, aggregation = INTERVAL_TO_AGGREGATION[interval]
-
-    bar_spec = BarSpecification(step, aggregation, PriceType.LAST)
     return BarType(
         instrument_id=instrument_id,
-        bar_spec=bar_spec,
+        bar_spec=get_bar_spec(interval),
     )
 
 
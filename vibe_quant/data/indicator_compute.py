@@ -1,15 +1,23 @@
 """On-demand indicator computation from OHLCV data using pandas-ta-classic.
 
-Used by the /api/data/indicators/{symbol} endpoint to compute indicator
-series for chart overlays. No storage — computed fresh each request.
+Used by the /api/data/indicators/{symbol} endpoints to compute indicator
+series for chart overlays. Results are computed into NumPy arrays
+(:class:`IndicatorArrays`) and kept in :data:`indicator_cache`, keyed by
+(symbol, interval, indicator, params, archive fingerprint), so panning or
+zooming inside an already computed range only slices arrays.
 """
 
 from __future__ import annotations
 
+import json
 import logging
-import math
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
+
 if TYPE_CHECKING:
     import pandas as pd
 
@@ -74,25 +82,27 @@ def _make_display_label(indicator_type: str, output_name: str, params: dict[str,
     return upper
 
 
-def _safe_value(v: Any) -> float | None:
-    """Convert to float or None for NaN/inf."""
-    if v is None or (isinstance(v, float) and (math.isnan(v) or math.isinf(v))):
-        return None
-    try:
-        f = float(v)
-        if math.isnan(f) or math.isinf(f):
-            return None
-        return f
-    except (TypeError, ValueError):
-        return None
-
-
 def _series_to_points(times: pd.Series, values: pd.Series) -> list[IndicatorSeriesPoint]:
     """Convert pandas series pair to list of IndicatorSeriesPoint."""
-    points: list[IndicatorSeriesPoint] = []
-    for t, v in zip(times, values, strict=True):
-        points.append(IndicatorSeriesPoint(time=int(t), value=_safe_value(v)))
-    return points
+    return _arrays_to_points(
+        np.asarray(times, dtype=np.int64), np.asarray(values, dtype=np.float64)
+    )
+
+
+def _finite_or_none(values: np.ndarray) -> list[float | None]:
+    """Convert a float array to a JSON-safe list (NaN/inf -> None)."""
+    out: list[float | None] = values.tolist()
+    bad = np.flatnonzero(~np.isfinite(values))
+    for i in bad.tolist():
+        out[i] = None
+    return out
+
+
+def _arrays_to_points(times: np.ndarray, values: np.ndarray) -> list[IndicatorSeriesPoint]:
+    return [
+        IndicatorSeriesPoint(time=t, value=v)
+        for t, v in zip(times.tolist(), _finite_or_none(values), strict=True)
+    ]
 
 
 def _compute_single(
@@ -283,33 +293,66 @@ def _compute_single(
     return []
 
 
-def compute_indicators(
+@dataclass(frozen=True, slots=True)
+class IndicatorArrays:
+    """Computed outputs of one indicator config on a shared time axis."""
+
+    indicator_type: str
+    params: dict[str, Any]
+    times: np.ndarray  # int64 open_time ms, ascending
+    outputs: tuple[tuple[str, np.ndarray], ...]  # (output_name, float64 values)
+
+    @property
+    def name(self) -> str:
+        period = self.params.get("period")
+        name_suffix = f"_{period}" if period else ""
+        return f"{self.indicator_type.lower()}{name_suffix}"
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.times.nbytes + sum(v.nbytes for _, v in self.outputs))
+
+    def slice(self, start_ts: int | None, end_ts: int | None) -> IndicatorArrays:
+        """Return the ``[start_ts, end_ts)`` viewport (views, no copies)."""
+        lo = 0 if start_ts is None else int(np.searchsorted(self.times, start_ts, "left"))
+        hi = len(self.times) if end_ts is None else int(np.searchsorted(self.times, end_ts, "left"))
+        return IndicatorArrays(
+            indicator_type=self.indicator_type,
+            params=self.params,
+            times=self.times[lo:hi],
+            outputs=tuple((name, values[lo:hi]) for name, values in self.outputs),
+        )
+
+
+def _normalize_config(ind_cfg: dict[str, Any]) -> tuple[str, dict[str, Any]] | None:
+    ind_type = str(ind_cfg.get("type", "")).upper()
+    if not ind_type:
+        return None
+    params = {k: v for k, v in ind_cfg.items() if k != "type" and v is not None}
+    return ind_type, params
+
+
+def compute_indicator_arrays(
     df: pd.DataFrame,
     indicators: list[dict[str, Any]],
-) -> list[IndicatorSeries]:
-    """Compute multiple indicators from OHLCV DataFrame.
+) -> list[IndicatorArrays]:
+    """Compute indicators into NumPy arrays.
 
     Args:
         df: DataFrame with columns: open_time, open, high, low, close, volume
         indicators: List of indicator configs (dicts with 'type', 'period', etc.)
 
     Returns:
-        List of IndicatorSeries ready for API response.
+        One IndicatorArrays per config that computed successfully, in order.
     """
-    times = df["open_time"]
-    results: list[IndicatorSeries] = []
+    times = df["open_time"].to_numpy(dtype=np.int64)
+    results: list[IndicatorArrays] = []
 
     for ind_cfg in indicators:
-        ind_type = ind_cfg.get("type", "").upper()
-        if not ind_type:
+        normalized = _normalize_config(ind_cfg)
+        if normalized is None:
             continue
-
-        params = {k: v for k, v in ind_cfg.items() if k != "type" and v is not None}
-        pane = _classify_pane(ind_type)
-
-        period = params.get("period")
-        name_suffix = f"_{period}" if period else ""
-        base_name = f"{ind_type.lower()}{name_suffix}"
+        ind_type, params = normalized
 
         try:
             outputs = _compute_single(df, ind_type, params)
@@ -317,20 +360,243 @@ def compute_indicators(
             logger.exception("Failed to compute indicator %s", ind_type)
             continue
 
-        for output_name, series_data in outputs:
-            display_label = _make_display_label(ind_type, output_name, params)
-            points = _series_to_points(times, series_data)
+        results.append(
+            IndicatorArrays(
+                indicator_type=ind_type,
+                params=params,
+                times=times,
+                outputs=tuple(
+                    (output_name, series_data.to_numpy(dtype=np.float64, na_value=np.nan))
+                    for output_name, series_data in outputs
+                ),
+            )
+        )
 
+    return results
+
+
+def to_indicator_series(arrays: list[IndicatorArrays]) -> list[IndicatorSeries]:
+    """Render computed arrays as per-point IndicatorSeries (legacy wire format)."""
+    results: list[IndicatorSeries] = []
+    for item in arrays:
+        pane = _classify_pane(item.indicator_type)
+        for output_name, values in item.outputs:
             results.append(
                 IndicatorSeries(
-                    name=base_name,
+                    name=item.name,
                     output_name=output_name,
-                    indicator_type=ind_type,
-                    display_label=display_label,
+                    indicator_type=item.indicator_type,
+                    display_label=_make_display_label(item.indicator_type, output_name, item.params),
                     pane=pane,
-                    params=params,
-                    data=points,
+                    params=item.params,
+                    data=_arrays_to_points(item.times, values),
                 )
             )
-
     return results
+
+
+def _align(item_times: np.ndarray, values: np.ndarray, times: np.ndarray) -> np.ndarray:
+    if np.array_equal(item_times, times):
+        return values
+    out = np.full(len(times), np.nan)
+    idx = np.searchsorted(item_times, times)
+    ok = idx < len(item_times)
+    ok[ok] = item_times[idx[ok]] == times[ok]
+    out[ok] = values[idx[ok]]
+    return out
+
+
+def to_columnar(arrays: list[IndicatorArrays], times: np.ndarray) -> list[dict[str, Any]]:
+    """Render computed arrays as columns aligned to ``times``.
+
+    Every returned ``values`` list has ``len(times)`` entries; bars an
+    indicator has no value for are ``None``.
+    """
+    columns: list[dict[str, Any]] = []
+    for item in arrays:
+        pane = _classify_pane(item.indicator_type)
+        for output_name, values in item.outputs:
+            columns.append(
+                {
+                    "name": item.name,
+                    "output_name": output_name,
+                    "indicator_type": item.indicator_type,
+                    "display_label": _make_display_label(
+                        item.indicator_type, output_name, item.params
+                    ),
+                    "pane": pane,
+                    "params": item.params,
+                    "values": _finite_or_none(_align(item.times, values, times)),
+                }
+            )
+    return columns
+
+
+def compute_indicators(
+    df: pd.DataFrame,
+    indicators: list[dict[str, Any]],
+) -> list[IndicatorSeries]:
+    """Compute multiple indicators from OHLCV DataFrame.
+
+    Args:
+        df: DataFrame with columns: open_time, open, high, low, close, volume
+        indicators: List of indicator configs (dicts with 'type', 'period', etc.)
+
+    Returns:
+        List of IndicatorSeries ready for API response.
+    """
+    return to_indicator_series(compute_indicator_arrays(df, indicators))
+
+
+# ---------------------------------------------------------------------------
+# Cache
+# ---------------------------------------------------------------------------
+
+_CacheKey = tuple[str, str, str, str]
+_EntryKey = tuple[_CacheKey, int | None, int | None]
+
+
+@dataclass(frozen=True, slots=True)
+class _CacheEntry:
+    start_ts: int | None  # computed range, None = open-ended
+    end_ts: int | None
+    fingerprint: int
+    arrays: IndicatorArrays
+
+    def covers(self, start_ts: int | None, end_ts: int | None) -> bool:
+        start_ok = self.start_ts is None or (start_ts is not None and self.start_ts <= start_ts)
+        end_ok = self.end_ts is None or (end_ts is not None and end_ts <= self.end_ts)
+        return start_ok and end_ok
+
+    def overlaps(self, start_ts: int | None, end_ts: int | None) -> bool:
+        before_end = end_ts is None or self.start_ts is None or self.start_ts <= end_ts
+        after_start = start_ts is None or self.end_ts is None or start_ts <= self.end_ts
+        return before_end and after_start
+
+
+class IndicatorCache:
+    """Thread-safe LRU of computed indicator arrays.
+
+    Entries are keyed by (symbol, interval, indicator type, params) and tagged
+    with the range they were computed over plus a data fingerprint. A lookup
+    hits when a same-fingerprint entry covers the requested range; the
+    result is sliced to the viewport. Because values in a slice were
+    computed with the wider range as warmup, bars at the start of a zoomed-in
+    viewport may have values where a fresh computation would still be warming
+    up.
+
+    On a miss, :meth:`fill_range` widens the range to compute so that it
+    absorbs overlapping cached ranges and a viewport of margin on each
+    side; :meth:`put` then replaces the entries the new one covers. Panning
+    by up to one viewport therefore hits, and a panned-over key keeps one
+    growing entry rather than many fragments.
+    """
+
+    def __init__(self, max_bytes: int = 256 * 1024 * 1024) -> None:
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[_EntryKey, _CacheEntry] = OrderedDict()
+        self._by_key: dict[_CacheKey, set[_EntryKey]] = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(symbol: str, interval: str, ind_cfg: dict[str, Any]) -> _CacheKey | None:
+        normalized = _normalize_config(ind_cfg)
+        if normalized is None:
+            return None
+        ind_type, params = normalized
+        return (symbol, interval, ind_type, json.dumps(params, sort_keys=True, default=str))
+
+    def get(
+        self,
+        key: _CacheKey,
+        fingerprint: int,
+        start_ts: int | None,
+        end_ts: int | None,
+    ) -> IndicatorArrays | None:
+        with self._lock:
+            for entry_key in self._by_key.get(key, ()):
+                entry = self._entries[entry_key]
+                if entry.fingerprint == fingerprint and entry.covers(start_ts, end_ts):
+                    self._entries.move_to_end(entry_key)
+                    self.hits += 1
+                    return entry.arrays.slice(start_ts, end_ts)
+            self.misses += 1
+            return None
+
+    def fill_range(
+        self,
+        key: _CacheKey,
+        fingerprint: int,
+        start_ts: int | None,
+        end_ts: int | None,
+    ) -> tuple[int | None, int | None]:
+        """Range to compute for a missed ``[start_ts, end_ts)`` request.
+
+        A bounded request is padded by its own width on each side, then
+        extended over every same-fingerprint cached range it overlaps.
+        """
+        if start_ts is not None and end_ts is not None:
+            width = max(end_ts - start_ts, 0)
+            start_ts, end_ts = start_ts - width, end_ts + width
+        with self._lock:
+            for entry_key in self._by_key.get(key, ()):
+                entry = self._entries[entry_key]
+                if entry.fingerprint != fingerprint or not entry.overlaps(start_ts, end_ts):
+                    continue
+                if start_ts is not None:
+                    start_ts = None if entry.start_ts is None else min(start_ts, entry.start_ts)
+                if end_ts is not None:
+                    end_ts = None if entry.end_ts is None else max(end_ts, entry.end_ts)
+        return start_ts, end_ts
+
+    def put(
+        self,
+        key: _CacheKey,
+        fingerprint: int,
+        start_ts: int | None,
+        end_ts: int | None,
+        arrays: IndicatorArrays,
+    ) -> None:
+        entry_key = (key, start_ts, end_ts)
+        entry = _CacheEntry(start_ts, end_ts, fingerprint, arrays)
+        with self._lock:
+            # Drop the entry being replaced, entries made stale by a newer
+            # fingerprint, and ranges the new entry covers.
+            for old_key in list(self._by_key.get(key, ())):
+                old = self._entries[old_key]
+                if (
+                    old_key == entry_key
+                    or old.fingerprint != fingerprint
+                    or entry.covers(old.start_ts, old.end_ts)
+                ):
+                    self._remove(old_key)
+            self._entries[entry_key] = entry
+            self._by_key.setdefault(key, set()).add(entry_key)
+            self._bytes += arrays.nbytes
+            while self._bytes > self._max_bytes and len(self._entries) > 1:
+                self._remove(next(iter(self._entries)))
+
+    def _remove(self, entry_key: _EntryKey) -> None:
+        """Drop one entry. Caller holds ``_lock``."""
+        self._bytes -= self._entries.pop(entry_key).arrays.nbytes
+        siblings = self._by_key[entry_key[0]]
+        siblings.discard(entry_key)
+        if not siblings:
+            del self._by_key[entry_key[0]]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._by_key.clear()
+            self._bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+indicator_cache = IndicatorCache()
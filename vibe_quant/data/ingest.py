@@ -26,6 +26,7 @@ from vibe_quant.data.downloader import (
     get_months_in_range,
     get_years_months_to_download,
 )
+from vibe_quant.data.rollups import refresh_rollups
 from vibe_quant.data.verify import verify_symbol
 
 
@@ -83,6 +84,16 @@ def _interval_to_seconds(interval: str) -> int:
         raise ValueError(msg)
 
 
+def _refresh_rollup_pyramid(archive: RawDataArchive, symbol: str, verbose: bool) -> None:
+    """Bring the 1h/1d/1w browse rollups up to date after new klines land."""
+    date_range = archive.get_date_range(symbol, "1m")
+    if date_range is None:
+        return
+    written = refresh_rollups(archive.conn, symbol, "1w", date_range[0], date_range[1] + 60_000)
+    if verbose and written:
+        print(f"  Refreshed {written} rollup buckets")
+
+
 def get_download_preview(
     symbols: list[str],
     start_date: datetime,
@@ -197,6 +208,7 @@ def update_symbol(
         counts["new_klines"] = len(new_klines)
         if verbose:
             print(f"  Archived {len(new_klines)} new klines")
+        _refresh_rollup_pyramid(archive, symbol, verbose)
     else:
         if verbose:
             print("  No new klines available")
@@ -406,6 +418,8 @@ def ingest_symbol(
                 if verbose:
                     print(f"  REST API: {len(recent)} fetched ({inserted} new)")
 
+    _refresh_rollup_pyramid(archive, symbol, verbose)
+
     # Create and write instrument
     instrument = create_instrument(symbol)
     catalog.write_instrument(instrument)
@@ -0,0 +1,206 @@
+"""Level-of-detail OHLCV pyramid over archived 1m klines.
+
+The ``kline_rollups`` table in the archive DB holds pre-aggregated bars at
+``1h``, ``1d`` and ``1w`` resolution. Each level is built from the one below
+(1m -> 1h -> 1d -> 1w), so refreshing a coarse level over a long range
+scans the finer rollups, not millions of 1m rows.
+
+Rollups are derived data and can always be rebuilt from ``raw_klines``.
+A bucket is final once it holds its full complement of 1m bars. Partial
+buckets, such as the current hour or a gap still being backfilled, are
+re-aggregated on every refresh so appended klines are picked up.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import sqlite3
+
+MINUTE_MS = 60_000
+HOUR_MS = 60 * MINUTE_MS
+DAY_MS = 24 * HOUR_MS
+WEEK_MS = 7 * DAY_MS
+# Epoch day 0 (1970-01-01) was a Thursday; Binance weeks start on Monday.
+_WEEK_OFFSET_MS = 4 * DAY_MS
+
+
+@dataclass(frozen=True, slots=True)
+class RollupLevel:
+    """One pyramid level."""
+
+    resolution: str
+    bucket_ms: int
+    offset_ms: int
+    source: str | None  # finer rollup level, None = raw 1m klines
+
+    @property
+    def bars_per_bucket(self) -> int:
+        return self.bucket_ms // MINUTE_MS
+
+    def floor(self, ts: int) -> int:
+        return ((ts - self.offset_ms) // self.bucket_ms) * self.bucket_ms + self.offset_ms
+
+    def ceil(self, ts: int) -> int:
+        floored = self.floor(ts)
+        return floored if floored == ts else floored + self.bucket_ms
+
+
+LEVELS: dict[str, RollupLevel] = {
+    "1h": RollupLevel("1h", HOUR_MS, 0, None),
+    "1d": RollupLevel("1d", DAY_MS, 0, "1h"),
+    "1w": RollupLevel("1w", WEEK_MS, _WEEK_OFFSET_MS, "1d"),
+}
+
+# Open/close are correlated point lookups on the unique (symbol, interval,
+# open_time) key, evaluated once per grouped bucket. Written as joins, the
+# planner may drive the lookups from the outer loop and rescan the grouped
+# subquery for every 1m row.
+_FROM_KLINES_SQL = """
+INSERT OR REPLACE INTO kline_rollups
+    (symbol, resolution, bucket_start, open, high, low, close, volume, bar_count)
+SELECT :symbol, :resolution, b.bucket,
+    (SELECT open FROM raw_klines
+     WHERE symbol = :symbol AND interval = '1m' AND open_time = b.first_t),
+    b.high, b.low,
+    (SELECT close FROM raw_klines
+     WHERE symbol = :symbol AND interval = '1m' AND open_time = b.last_t),
+    b.volume, b.n
+FROM (
+    SELECT ((open_time - :offset) / :bucket_ms) * :bucket_ms + :offset AS bucket,
+           MIN(open_time) AS first_t, MAX(open_time) AS last_t,
+           MAX(high) AS high, MIN(low) AS low, SUM(volume) AS volume, COUNT(*) AS n
+    FROM raw_klines
+    WHERE symbol = :symbol AND interval = '1m' AND open_time >= :start AND open_time < :end
+    GROUP BY bucket
+) b
+"""
+
+_FROM_ROLLUPS_SQL = """
+INSERT OR REPLACE INTO kline_rollups
+    (symbol, resolution, bucket_start, open, high, low, close, volume, bar_count)
+SELECT :symbol, :resolution, b.bucket,
+    (SELECT open FROM kline_rollups
+     WHERE symbol = :symbol AND resolution = :source AND bucket_start = b.first_t),
+    b.high, b.low,
+    (SELECT close FROM kline_rollups
+     WHERE symbol = :symbol AND resolution = :source AND bucket_start = b.last_t),
+    b.volume, b.n
+FROM (
+    SELECT ((bucket_start - :offset) / :bucket_ms) * :bucket_ms + :offset AS bucket,
+           MIN(bucket_start) AS first_t, MAX(bucket_start) AS last_t,
+           MAX(high) AS high, MIN(low) AS low, SUM(volume) AS volume, SUM(bar_count) AS n
+    FROM kline_rollups
+    WHERE symbol = :symbol AND resolution = :source
+      AND bucket_start >= :start AND bucket_start < :end
+    GROUP BY bucket
+) b
+"""
+
+# Gaps between consecutive final buckets, with ``:end`` appended as a
+# sentinel so a trailing gap is reported too.
+_MISSING_RUNS_SQL = """
+SELECT COALESCE(prev + :bucket_ms, :start), bucket_start
+FROM (
+    SELECT bucket_start, LAG(bucket_start) OVER (ORDER BY bucket_start) AS prev
+    FROM (
+        SELECT bucket_start FROM kline_rollups
+        WHERE symbol = :symbol AND resolution = :resolution
+          AND bucket_start >= :start AND bucket_start < :end AND bar_count >= :bars
+        UNION ALL
+        SELECT :end
+    )
+)
+WHERE bucket_start > COALESCE(prev + :bucket_ms, :start)
+"""
+
+
+def _missing_runs(
+    conn: sqlite3.Connection, symbol: str, level: RollupLevel, start: int, end: int
+) -> list[tuple[int, int]]:
+    """Return contiguous ``[start, end)`` ranges of buckets that are not final."""
+    params = {
+        "symbol": symbol,
+        "resolution": level.resolution,
+        "start": start,
+        "end": end,
+        "bars": level.bars_per_bucket,
+        "bucket_ms": level.bucket_ms,
+    }
+    return [(int(a), int(b)) for a, b in conn.execute(_MISSING_RUNS_SQL, params)]
+
+
+def _refresh_level(
+    conn: sqlite3.Connection, symbol: str, level: RollupLevel, start: int, end: int
+) -> int:
+    sql = _FROM_KLINES_SQL if level.source is None else _FROM_ROLLUPS_SQL
+    written = 0
+    for run_start, run_end in _missing_runs(conn, symbol, level, start, end):
+        params = {
+            "symbol": symbol,
+            "resolution": level.resolution,
+            "source": level.source,
+            "offset": level.offset_ms,
+            "bucket_ms": level.bucket_ms,
+            "start": run_start,
+            "end": run_end,
+        }
+        written += conn.execute(sql, params).rowcount
+    return written
+
+
+def refresh_rollups(
+    conn: sqlite3.Connection,
+    symbol: str,
+    resolution: str,
+    start_ms: int,
+    end_ms: int,
+) -> int:
+    """Bring one pyramid level (and every finer level) up to date for a range.
+
+    Args:
+        conn: Archive connection (``kline_rollups`` must exist).
+        symbol: Trading symbol.
+        resolution: Target level, one of :data:`LEVELS`.
+        start_ms: Range start (ms); widened to the enclosing bucket.
+        end_ms: Range end (ms, exclusive); widened to the enclosing bucket.
+
+    Returns:
+        Number of rollup rows written across all levels.
+    """
+    level = LEVELS[resolution]
+    start = level.floor(start_ms)
+    end = level.ceil(end_ms)
+    written = 0
+    if level.source is not None:
+        written += refresh_rollups(conn, symbol, level.source, start, end)
+    written += _refresh_level(conn, symbol, level, start, end)
+    if written:
+        conn.commit()
+    return written
+
+
+def read_rollups(
+    conn: sqlite3.Connection,
+    symbol: str,
+    resolution: str,
+    start_ms: int | None,
+    end_ms: int | None,
+) -> list[tuple[int, float, float, float, float, float]]:
+    """Read ``(bucket_start, open, high, low, close, volume)`` rows in time order."""
+    conditions = ["symbol = ?", "resolution = ?"]
+    params: list[object] = [symbol, resolution]
+    if start_ms is not None:
+        conditions.append("bucket_start >= ?")
+        params.append(start_ms)
+    if end_ms is not None:
+        conditions.append("bucket_start < ?")
+        params.append(end_ms)
+    where = " AND ".join(conditions)
+    return conn.execute(
+        f"SELECT bucket_start, open, high, low, close, volume FROM kline_rollups "
+        f"WHERE {where} ORDER BY bucket_start",
+        tuple(params),
+    ).fetchall()
@@ -0,0 +1,141 @@
+"""Window statistics over archived 1m klines without loading every bar.
+
+Start/end prices come from two indexed point lookups on
+``raw_klines(symbol, interval, open_time)``. Realized volatility is
+computed from the daily level of the ``kline_rollups`` pyramid (see
+:mod:`vibe_quant.data.rollups`), so a multi-year window reads one row per
+day instead of every 1m bar.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+
+from vibe_quant.data.rollups import DAY_MS, read_rollups, refresh_rollups
+
+if TYPE_CHECKING:
+    import sqlite3
+
+    from vibe_quant.data.archive import RawDataArchive
+
+# |return| below this is a sideways window (regime 0)
+REGIME_RETURN_THRESHOLD = 0.05
+# Crypto trades every day of the year
+_TRADING_DAYS_PER_YEAR = 365
+
+
+@dataclass(frozen=True, slots=True)
+class WindowStats:
+    """Price summary for one (symbol, start, end) window of 1m data."""
+
+    symbol: str
+    start_ms: int
+    end_ms: int
+    start_price: float
+    end_price: float
+    total_return: float
+    regime: int  # +1 bull, -1 bear, 0 sideways
+    realized_vol: float | None = None  # annualized, from daily log returns
+    n_days: int = 0
+
+
+def date_to_ms(date_str: str) -> int:
+    """Convert ``YYYY-MM-DD`` (UTC midnight) to epoch milliseconds."""
+    return int(datetime.strptime(date_str, "%Y-%m-%d").replace(tzinfo=UTC).timestamp() * 1000)
+
+
+def classify_regime(total_return: float, threshold: float = REGIME_RETURN_THRESHOLD) -> int:
+    """Classify a window return as bull (+1), bear (-1) or sideways (0)."""
+    if abs(total_return) < threshold:
+        return 0
+    return 1 if total_return > 0 else -1
+
+
+def _endpoint_prices(
+    conn: sqlite3.Connection, symbol: str, start_ms: int, end_ms: int
+) -> tuple[float, float] | None:
+    first = conn.execute(
+        "SELECT open FROM raw_klines "
+        "WHERE symbol = ? AND interval = '1m' AND open_time >= ? AND open_time < ? "
+        "ORDER BY open_time LIMIT 1",
+        (symbol, start_ms, end_ms),
+    ).fetchone()
+    if first is None:
+        return None
+    last = conn.execute(
+        "SELECT close FROM raw_klines "
+        "WHERE symbol = ? AND interval = '1m' AND open_time >= ? AND open_time < ? "
+        "ORDER BY open_time DESC LIMIT 1",
+        (symbol, start_ms, end_ms),
+    ).fetchone()
+    return float(first[0]), float(last[0])
+
+
+def _realized_vol(
+    conn: sqlite3.Connection, symbol: str, start_ms: int, end_ms: int
+) -> tuple[float | None, int]:
+    refresh_rollups(conn, symbol, "1d", start_ms, end_ms)
+    rows = read_rollups(conn, symbol, "1d", (start_ms // DAY_MS) * DAY_MS, end_ms)
+    closes = [float(row[4]) for row in rows]
+    log_returns = [
+        math.log(b / a) for a, b in zip(closes, closes[1:], strict=False) if a > 0 and b > 0
+    ]
+    if len(log_returns) < 2:
+        return None, len(closes)
+    mean = sum(log_returns) / len(log_returns)
+    var = sum((r - mean) ** 2 for r in log_returns) / (len(log_returns) - 1)
+    return math.sqrt(var) * math.sqrt(_TRADING_DAYS_PER_YEAR), len(closes)
+
+
+def get_window_stats(
+    archive: RawDataArchive,
+    symbol: str,
+    start_date: str,
+    end_date: str,
+    *,
+    with_volatility: bool = True,
+    regime_threshold: float = REGIME_RETURN_THRESHOLD,
+) -> WindowStats | None:
+    """Summarize a window of archived 1m klines.
+
+    Args:
+        archive: Raw data archive to read from.
+        symbol: Trading symbol, e.g. ``"BTCUSDT"``.
+        start_date: ISO date, inclusive.
+        end_date: ISO date, exclusive.
+        with_volatility: Also compute realized volatility from daily
+            rollups. When False only the two point lookups run.
+        regime_threshold: Minimum |return| for a bull/bear label.
+
+    Returns:
+        WindowStats, or None if the window has no bars or a non-positive
+        start price.
+    """
+    start_ms = date_to_ms(start_date)
+    end_ms = date_to_ms(end_date)
+    conn = archive.conn
+    prices = _endpoint_prices(conn, symbol, start_ms, end_ms)
+    if prices is None or prices[0] <= 0:
+        return None
+    start_price, end_price = prices
+    total_return = (end_price - start_price) / start_price
+
+    realized_vol: float | None = None
+    n_days = 0
+    if with_volatility:
+        realized_vol, n_days = _realized_vol(conn, symbol, start_ms, end_ms)
+
+    return WindowStats(
+        symbol=symbol,
+        start_ms=start_ms,
+        end_ms=end_ms,
+        start_price=start_price,
+        end_price=end_price,
+        total_return=total_return,
+        regime=classify_regime(total_return, regime_threshold),
+        realized_vol=realized_vol,
+        n_days=n_days,
+    )
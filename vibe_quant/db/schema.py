@@ -11,7 +11,7 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 # Bump when adding new migrations to _migrate_add_columns
-SCHEMA_VERSION: int = 4
+SCHEMA_VERSION: int = 6
 
 SCHEMA_SQL = """
 -- Strategy definitions (DSL configs)
@@ -45,6 +45,15 @@ CREATE TABLE IF NOT EXISTS risk_configs (
     created_at TEXT DEFAULT (datetime('now'))
 );
 
+-- Calibrated execution models (slippage/latency fitted from recorded fills)
+CREATE TABLE IF NOT EXISTS execution_models (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL UNIQUE,
+    model JSON NOT NULL,
+    created_at TEXT DEFAULT (datetime('now')),
+    updated_at TEXT DEFAULT (datetime('now'))
+);
+
 -- Backtest runs (both screening and validation)
 CREATE TABLE IF NOT EXISTS backtest_runs (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -94,6 +103,9 @@ CREATE TABLE IF NOT EXISTS backtest_results (
     total_fees REAL,
     total_funding REAL,
     total_slippage REAL,
+    time_in_market REAL,
+    avg_mae REAL,
+    avg_mfe REAL,
     skewness REAL,
     kurtosis REAL,
     deflated_sharpe REAL,
@@ -147,7 +159,8 @@ CREATE TABLE IF NOT EXISTS sweep_results (
     is_pareto_optimal BOOLEAN DEFAULT 0,
     passed_deflated_sharpe BOOLEAN,
     passed_walk_forward BOOLEAN,
-    passed_purged_kfold BOOLEAN
+    passed_purged_kfold BOOLEAN,
+    passed_cpcv BOOLEAN
 );
 
 -- Background job tracking for process management
@@ -219,6 +232,10 @@ def _migrate_add_columns(conn: sqlite3.Connection) -> None:
         ("sweep_results", "kurtosis", "REAL"),
         ("backtest_results", "skewness", "REAL"),
         ("backtest_results", "kurtosis", "REAL"),
+        ("sweep_results", "passed_cpcv", "BOOLEAN"),
+        ("backtest_results", "time_in_market", "REAL"),
+        ("backtest_results", "avg_mae", "REAL"),
+        ("backtest_results", "avg_mfe", "REAL"),
     ]
     applied = 0
     for table, column, col_type in migrations:
@@ -2,21 +2,33 @@
 
 from __future__ import annotations
 
+import contextlib
 import json
+import sqlite3
 import threading
-from typing import TYPE_CHECKING, Any
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Any, TypeVar
 
 from vibe_quant.db.connection import get_connection
 from vibe_quant.db.schema import init_schema
 
 if TYPE_CHECKING:
-    import sqlite3
-    from collections.abc import Sequence
+    from collections.abc import Callable, Sequence
     from pathlib import Path
 
 # Type alias for JSON-like dict structures from database
 JsonDict = dict[str, Any]
 
+_T = TypeVar("_T")
+
+# Upper bound on ops folded into one group-commit transaction
+_MAX_WRITE_BATCH = 256
+# BEGIN IMMEDIATE retries once busy_timeout expires (another process holds
+# the WAL write lock); backoff doubles from _LOCK_BACKOFF_S.
+_LOCK_RETRIES = 5
+_LOCK_BACKOFF_S = 0.05
+
 # Column whitelists per table (must match schema.py definitions)
 _BACKTEST_RESULTS_COLUMNS: frozenset[str] = frozenset(
     {
@@ -44,6 +56,9 @@ _BACKTEST_RESULTS_COLUMNS: frozenset[str] = frozenset(
         "total_fees",
         "total_funding",
         "total_slippage",
+        "time_in_market",
+        "avg_mae",
+        "avg_mfe",
         "deflated_sharpe",
         "walk_forward_efficiency",
         "purged_kfold_mean_sharpe",
@@ -97,6 +112,7 @@ _SWEEP_RESULTS_COLUMNS: frozenset[str] = frozenset(
         "passed_deflated_sharpe",
         "passed_walk_forward",
         "passed_purged_kfold",
+        "passed_cpcv",
     }
 )
 
@@ -108,11 +124,79 @@ def _validate_columns(columns: list[str], allowed: frozenset[str], table: str) -
         raise ValueError(f"Unknown columns for {table}: {sorted(bad)}")
 
 
+class WriteStats:
+    """Counters for the StateManager group-commit write path.
+
+    ``queue_wait_s`` is the time writes spent queued behind other writers
+    plus their transaction, i.e. what a caller actually waited for.
+    """
+
+    __slots__ = (
+        "failed_writes",
+        "lock_retries",
+        "max_batch",
+        "max_queue_wait_s",
+        "queue_wait_s",
+        "transactions",
+        "writes",
+    )
+
+    def __init__(self) -> None:
+        self.transactions = 0
+        self.writes = 0
+        self.failed_writes = 0
+        self.max_batch = 0
+        self.lock_retries = 0
+        self.queue_wait_s = 0.0
+        self.max_queue_wait_s = 0.0
+
+    def as_dict(self) -> dict[str, float]:
+        """Snapshot as a plain dict (adds ``avg_batch``)."""
+        return {
+            "transactions": self.transactions,
+            "writes": self.writes,
+            "failed_writes": self.failed_writes,
+            "avg_batch": self.writes / self.transactions if self.transactions else 0.0,
+            "max_batch": self.max_batch,
+            "lock_retries": self.lock_retries,
+            "queue_wait_s": self.queue_wait_s,
+            "max_queue_wait_s": self.max_queue_wait_s,
+        }
+
+
+class _PendingWrite:
+    """One queued write op and, once its batch commits, its outcome."""
+
+    __slots__ = ("done", "enqueued_at", "error", "op", "result")
+
+    def __init__(self, op: Callable[[sqlite3.Connection], Any]) -> None:
+        self.op = op
+        self.enqueued_at = time.perf_counter()
+        self.done = False
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+def _is_locked(exc: sqlite3.OperationalError) -> bool:
+    msg = str(exc).lower()
+    return "locked" in msg or "busy" in msg
+
+
 class StateManager:
     """Manager for vibe-quant SQLite state database.
 
     Provides CRUD operations for strategies, configs, backtest runs, and results.
     All connections use WAL mode for concurrent read/write access.
+
+    Writes go through a group-commit queue: every write is enqueued, and
+    whichever thread gets the write lock drains the queue into a single
+    ``BEGIN IMMEDIATE`` transaction on a dedicated writer connection. Each
+    op runs under its own savepoint so one failing write does not roll back
+    its neighbours. Callers still block until their write is committed, so
+    read-your-writes holds. Reads use one connection per thread.
+
+    ``conn`` remains a shared general-purpose connection for callers that
+    run ad-hoc SQL.
     """
 
     def __init__(self, db_path: Path | None = None) -> None:
@@ -125,6 +209,14 @@ class StateManager:
         self._conn: sqlite3.Connection | None = None
         self._lock = threading.Lock()
         self._write_lock = threading.Lock()
+        self._writer_conn: sqlite3.Connection | None = None
+        self._pending: deque[_PendingWrite] = deque()
+        self._pending_lock = threading.Lock()
+        self._write_stats = WriteStats()
+        self._local = threading.local()
+        self._readers: list[tuple[threading.Thread, sqlite3.Connection]] = []
+        # Bumped by close() so threads drop their stale read connections
+        self._generation = 0
 
     @property
     def conn(self) -> sqlite3.Connection:
@@ -135,13 +227,156 @@ class StateManager:
                 init_schema(self._conn)
             return self._conn
 
+    @property
+    def _reader(self) -> sqlite3.Connection:
+        """Read connection owned by the calling thread."""
+        cached = getattr(self._local, "reader", None)
+        if cached is not None and cached[0] == self._generation:
+            return cached[1]  # type: ignore[no-any-return]
+        _ = self.conn  # schema must exist before the first read
+        reader = get_connection(self._db_path)
+        with self._lock:
+            # Threads that exited never release their reader; reap them here
+            live: list[tuple[threading.Thread, sqlite3.Connection]] = []
+            for owner, conn in self._readers:
+                if owner.is_alive():
+                    live.append((owner, conn))
+                else:
+                    conn.close()
+            live.append((threading.current_thread(), reader))
+            self._readers = live
+            generation = self._generation
+        self._local.reader = (generation, reader)
+        return reader
+
+    def _writer(self) -> sqlite3.Connection:
+        """Dedicated group-commit connection. Caller holds ``_write_lock``."""
+        if self._writer_conn is None:
+            _ = self.conn
+            writer = get_connection(self._db_path)
+            writer.isolation_level = None  # transactions are managed explicitly
+            self._writer_conn = writer
+        return self._writer_conn
+
     def close(self) -> None:
-        """Close database connection."""
+        """Close all database connections."""
+        with self._write_lock:
+            if self._writer_conn is not None:
+                self._writer_conn.close()
+                self._writer_conn = None
         with self._lock:
+            for _, reader in self._readers:
+                reader.close()
+            self._readers.clear()
+            self._generation += 1
             if self._conn is not None:
                 self._conn.close()
                 self._conn = None
 
+    # --- Group-commit write path ---
+
+    def write(self, op: Callable[[sqlite3.Connection], _T]) -> _T:
+        """Queue ``op`` for the next group commit and wait for its result.
+
+        Other writers to the same database (e.g. the job manager's
+        heartbeats) use this so one process holds a single write connection.
+
+        Args:
+            op: Callable run inside the batch transaction. It must not
+                commit or roll back itself.
+
+        Returns:
+            Whatever ``op`` returned.
+
+        Raises:
+            Exception: Whatever ``op`` raised, or the transaction error if
+                the batch could not be committed.
+        """
+        pending = _PendingWrite(op)
+        with self._pending_lock:
+            self._pending.append(pending)
+        with self._write_lock:
+            while not pending.done:
+                self._commit_batch()
+        if pending.error is not None:
+            raise pending.error
+        return pending.result  # type: ignore[no-any-return]
+
+    def _execute_write(self, sql: str, params: Sequence[Any] = ()) -> int:
+        """Run one write statement through the queue; returns ``lastrowid``."""
+        return self.write(lambda conn: conn.execute(sql, params).lastrowid or 0)
+
+    def _commit_batch(self) -> None:
+        """Drain up to ``_MAX_WRITE_BATCH`` queued ops into one transaction."""
+        with self._pending_lock:
+            size = min(len(self._pending), _MAX_WRITE_BATCH)
+            batch = [self._pending.popleft() for _ in range(size)]
+        if not batch:
+            return
+        committed = False
+        try:
+            conn = self._writer()
+            self._begin_immediate(conn)
+            for pending in batch:
+                conn.execute("SAVEPOINT write_op")
+                try:
+                    pending.result = pending.op(conn)
+                except Exception as exc:
+                    conn.execute("ROLLBACK TO write_op")
+                    pending.error = exc
+                conn.execute("RELEASE write_op")
+            conn.execute("COMMIT")
+            committed = True
+        except Exception as exc:
+            for pending in batch:
+                pending.error = pending.error or exc
+        finally:
+            # Also reached on BaseException (e.g. KeyboardInterrupt in an op):
+            # never leave the writer mid-transaction or report a lost write
+            # as committed.
+            if not committed:
+                if self._writer_conn is not None and self._writer_conn.in_transaction:
+                    with contextlib.suppress(sqlite3.Error):
+                        self._writer_conn.execute("ROLLBACK")
+                for pending in batch:
+                    if pending.error is None:
+                        pending.error = sqlite3.OperationalError("group commit was interrupted")
+            self._record_batch(batch)
+
+    def _begin_immediate(self, conn: sqlite3.Connection) -> None:
+        """Take the WAL write lock, backing off if another process holds it."""
+        for attempt in range(_LOCK_RETRIES + 1):
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                return
+            except sqlite3.OperationalError as exc:
+                if not _is_locked(exc) or attempt == _LOCK_RETRIES:
+                    raise
+                self._write_stats.lock_retries += 1
+                time.sleep(_LOCK_BACKOFF_S * 2**attempt)
+
+    def _record_batch(self, batch: list[_PendingWrite]) -> None:
+        now = time.perf_counter()
+        stats = self._write_stats
+        stats.transactions += 1
+        stats.writes += len(batch)
+        stats.max_batch = max(stats.max_batch, len(batch))
+        for pending in batch:
+            waited = now - pending.enqueued_at
+            stats.queue_wait_s += waited
+            stats.max_queue_wait_s = max(stats.max_queue_wait_s, waited)
+            if pending.error is not None:
+                stats.failed_writes += 1
+            pending.done = True
+
+    def write_stats(self) -> dict[str, float]:
+        """Write-path contention counters (see :class:`WriteStats`)."""
+        with self._write_lock:
+            stats = self._write_stats.as_dict()
+        with self._lock:
+            stats["read_connections"] = len(self._readers)
+        return stats
+
     # --- Strategy CRUD ---
 
     def create_strategy(
@@ -162,14 +397,11 @@ class StateManager:
         Returns:
             ID of created strategy.
         """
-        with self._write_lock:
-            cursor = self.conn.execute(
-                """INSERT INTO strategies (name, dsl_config, description, strategy_type)
-                   VALUES (?, ?, ?, ?)""",
-                (name, json.dumps(dsl_config), description, strategy_type),
-            )
-            self.conn.commit()
-            return cursor.lastrowid or 0
+        return self._execute_write(
+            """INSERT INTO strategies (name, dsl_config, description, strategy_type)
+               VALUES (?, ?, ?, ?)""",
+            (name, json.dumps(dsl_config), description, strategy_type),
+        )
 
     def get_strategy(self, strategy_id: int) -> JsonDict | None:
         """Get strategy by ID.
@@ -180,7 +412,7 @@ class StateManager:
         Returns:
             Strategy dict or None if not found.
         """
-        cursor = self.conn.execute("SELECT * FROM strategies WHERE id = ?", (strategy_id,))
+        cursor = self._reader.execute("SELECT * FROM strategies WHERE id = ?", (strategy_id,))
         row = cursor.fetchone()
         if row is None:
             return None
@@ -197,7 +429,7 @@ class StateManager:
         Returns:
             Strategy dict or None if not found.
         """
-        cursor = self.conn.execute("SELECT * FROM strategies WHERE name = ?", (name,))
+        cursor = self._reader.execute("SELECT * FROM strategies WHERE name = ?", (name,))
         row = cursor.fetchone()
         if row is None:
             return None
@@ -219,7 +451,7 @@ class StateManager:
             query += " WHERE is_active = 1"
         query += " ORDER BY updated_at DESC"
 
-        cursor = self.conn.execute(query)
+        cursor = self._reader.execute(query)
         results = []
         for row in cursor:
             result = dict(row)
@@ -265,9 +497,7 @@ class StateManager:
             params.append(is_active)
 
         params.append(strategy_id)
-        with self._write_lock:
-            self.conn.execute(f"UPDATE strategies SET {', '.join(updates)} WHERE id = ?", params)
-            self.conn.commit()
+        self._execute_write(f"UPDATE strategies SET {', '.join(updates)} WHERE id = ?", params)
 
     # --- Sizing Config CRUD ---
 
@@ -282,17 +512,14 @@ class StateManager:
         Returns:
             ID of created config.
         """
-        with self._write_lock:
-            cursor = self.conn.execute(
-                "INSERT INTO sizing_configs (name, method, config) VALUES (?, ?, ?)",
-                (name, method, json.dumps(config)),
-            )
-            self.conn.commit()
-            return cursor.lastrowid or 0
+        return self._execute_write(
+            "INSERT INTO sizing_configs (name, method, config) VALUES (?, ?, ?)",
+            (name, method, json.dumps(config)),
+        )
 
     def get_sizing_config(self, config_id: int) -> JsonDict | None:
         """Get sizing config by ID."""
-        cursor = self.conn.execute("SELECT * FROM sizing_configs WHERE id = ?", (config_id,))
+        cursor = self._reader.execute("SELECT * FROM sizing_configs WHERE id = ?", (config_id,))
         row = cursor.fetchone()
         if row is None:
             return None
@@ -302,7 +529,7 @@ class StateManager:
 
     def list_sizing_configs(self) -> list[JsonDict]:
         """List all sizing configs."""
-        cursor = self.conn.execute("SELECT * FROM sizing_configs ORDER BY name")
+        cursor = self._reader.execute("SELECT * FROM sizing_configs ORDER BY name")
         results = []
         for row in cursor:
             result = dict(row)
@@ -314,18 +541,14 @@ class StateManager:
         self, config_id: int, name: str, method: str, config: JsonDict
     ) -> None:
         """Update an existing sizing configuration."""
-        with self._write_lock:
-            self.conn.execute(
-                "UPDATE sizing_configs SET name = ?, method = ?, config = ? WHERE id = ?",
-                (name, method, json.dumps(config), config_id),
-            )
-            self.conn.commit()
+        self._execute_write(
+            "UPDATE sizing_configs SET name = ?, method = ?, config = ? WHERE id = ?",
+            (name, method, json.dumps(config), config_id),
+        )
 
     def delete_sizing_config(self, config_id: int) -> None:
         """Delete a sizing configuration by ID."""
-        with self._write_lock:
-            self.conn.execute("DELETE FROM sizing_configs WHERE id = ?", (config_id,))
-            self.conn.commit()
+        self._execute_write("DELETE FROM sizing_configs WHERE id = ?", (config_id,))
 
     # --- Risk Config CRUD ---
 
@@ -342,18 +565,15 @@ class StateManager:
         Returns:
             ID of created config.
         """
-        with self._write_lock:
-            cursor = self.conn.execute(
-                """INSERT INTO risk_configs (name, strategy_level, portfolio_level)
-                   VALUES (?, ?, ?)""",
-                (name, json.dumps(strategy_level), json.dumps(portfolio_level)),
-            )
-            self.conn.commit()
-            return cursor.lastrowid or 0
+        return self._execute_write(
+            """INSERT INTO risk_configs (name, strategy_level, portfolio_level)
+               VALUES (?, ?, ?)""",
+            (name, json.dumps(strategy_level), json.dumps(portfolio_level)),
+        )
 
     def get_risk_config(self, config_id: int) -> JsonDict | None:
         """Get risk config by ID."""
-        cursor = self.conn.execute("SELECT * FROM risk_configs WHERE id = ?", (config_id,))
+        cursor = self._reader.execute("SELECT * FROM risk_configs WHERE id = ?", (config_id,))
         row = cursor.fetchone()
         if row is None:
             return None
@@ -364,7 +584,7 @@ class StateManager:
 
     def list_risk_configs(self) -> list[JsonDict]:
         """List all risk configs."""
-        cursor = self.conn.execute("SELECT * FROM risk_configs ORDER BY name")
+        cursor = self._reader.execute("SELECT * FROM risk_configs ORDER BY name")
         results = []
         for row in cursor:
             result = dict(row)
@@ -377,18 +597,50 @@ class StateManager:
         self, config_id: int, name: str, strategy_level: JsonDict, portfolio_level: JsonDict
     ) -> None:
         """Update an existing risk configuration."""
-        with self._write_lock:
-            self.conn.execute(
-                "UPDATE risk_configs SET name = ?, strategy_level = ?, portfolio_level = ? WHERE id = ?",
-                (name, json.dumps(strategy_level), json.dumps(portfolio_level), config_id),
-            )
-            self.conn.commit()
+        self._execute_write(
+            "UPDATE risk_configs SET name = ?, strategy_level = ?, portfolio_level = ? WHERE id = ?",
+            (name, json.dumps(strategy_level), json.dumps(portfolio_level), config_id),
+        )
 
     def delete_risk_config(self, config_id: int) -> None:
         """Delete a risk configuration by ID."""
-        with self._write_lock:
-            self.conn.execute("DELETE FROM risk_configs WHERE id = ?", (config_id,))
-            self.conn.commit()
+        self._execute_write("DELETE FROM risk_configs WHERE id = ?", (config_id,))
+
+    # --- Execution Models ---
+
+    def save_execution_model(self, name: str, model: JsonDict) -> None:
+        """Create or replace a calibrated execution model.
+
+        Args:
+            name: Unique model name.
+            model: Serialized model (``CalibratedExecutionModel.to_dict()``).
+        """
+        self._execute_write(
+            """INSERT INTO execution_models (name, model) VALUES (?, ?)
+               ON CONFLICT(name) DO UPDATE SET
+                   model = excluded.model, updated_at = datetime('now')""",
+            (name, json.dumps(model)),
+        )
+
+    def get_execution_model(self, name: str) -> JsonDict | None:
+        """Get a calibrated execution model by name."""
+        cursor = self._reader.execute("SELECT * FROM execution_models WHERE name = ?", (name,))
+        row = cursor.fetchone()
+        if row is None:
+            return None
+        result = dict(row)
+        result["model"] = json.loads(result["model"])
+        return result
+
+    def list_execution_models(self) -> list[JsonDict]:
+        """List all calibrated execution models."""
+        cursor = self._reader.execute("SELECT * FROM execution_models ORDER BY name")
+        results = []
+        for row in cursor:
+            result = dict(row)
+            result["model"] = json.loads(result["model"])
+            results.append(result)
+        return results
 
     # --- System state (kill switch) ---
 
@@ -399,7 +651,7 @@ class StateManager:
             Dict with keys: kill_switch (bool), reason (str|None),
             killed_at (str|None), killed_by (str|None), updated_at (str).
         """
-        row = self.conn.execute(
+        row = self._reader.execute(
             "SELECT kill_switch, reason, killed_at, killed_by, updated_at "
             "FROM system_state WHERE id = 1"
         ).fetchone()
@@ -422,25 +674,21 @@ class StateManager:
 
     def set_kill_switch(self, reason: str, killed_by: str | None = None) -> None:
         """Engage the kill switch. Idempotent — re-setting updates reason."""
-        with self._write_lock:
-            self.conn.execute(
-                "UPDATE system_state SET kill_switch = 1, reason = ?, "
-                "killed_at = datetime('now'), killed_by = ?, updated_at = datetime('now') "
-                "WHERE id = 1",
-                (reason, killed_by),
-            )
-            self.conn.commit()
+        self._execute_write(
+            "UPDATE system_state SET kill_switch = 1, reason = ?, "
+            "killed_at = datetime('now'), killed_by = ?, updated_at = datetime('now') "
+            "WHERE id = 1",
+            (reason, killed_by),
+        )
 
     def clear_kill_switch(self, cleared_by: str | None = None) -> None:
         """Release the kill switch. Logs who cleared it in ``killed_by``."""
-        with self._write_lock:
-            self.conn.execute(
-                "UPDATE system_state SET kill_switch = 0, reason = NULL, "
-                "killed_at = NULL, killed_by = ?, updated_at = datetime('now') "
-                "WHERE id = 1",
-                (cleared_by,),
-            )
-            self.conn.commit()
+        self._execute_write(
+            "UPDATE system_state SET kill_switch = 0, reason = NULL, "
+            "killed_at = NULL, killed_by = ?, updated_at = datetime('now') "
+            "WHERE id = 1",
+            (cleared_by,),
+        )
 
     # --- Backtest Run CRUD ---
 
@@ -474,31 +722,28 @@ class StateManager:
         Returns:
             ID of created run.
         """
-        with self._write_lock:
-            cursor = self.conn.execute(
-                """INSERT INTO backtest_runs
-                   (strategy_id, sizing_config_id, risk_config_id, run_mode, symbols,
-                    timeframe, start_date, end_date, parameters, latency_preset)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                (
-                    strategy_id,
-                    sizing_config_id,
-                    risk_config_id,
-                    run_mode,
-                    json.dumps(list(symbols)),
-                    timeframe,
-                    start_date,
-                    end_date,
-                    json.dumps(parameters),
-                    latency_preset,
-                ),
-            )
-            self.conn.commit()
-            return cursor.lastrowid or 0
+        return self._execute_write(
+            """INSERT INTO backtest_runs
+               (strategy_id, sizing_config_id, risk_config_id, run_mode, symbols,
+                timeframe, start_date, end_date, parameters, latency_preset)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            (
+                strategy_id,
+                sizing_config_id,
+                risk_config_id,
+                run_mode,
+                json.dumps(list(symbols)),
+                timeframe,
+                start_date,
+                end_date,
+                json.dumps(parameters),
+                latency_preset,
+            ),
+        )
 
     def get_backtest_run(self, run_id: int) -> JsonDict | None:
         """Get backtest run by ID."""
-        cursor = self.conn.execute("SELECT * FROM backtest_runs WHERE id = ?", (run_id,))
+        cursor = self._reader.execute("SELECT * FROM backtest_runs WHERE id = ?", (run_id,))
         row = cursor.fetchone()
         if row is None:
             return None
@@ -537,20 +782,16 @@ class StateManager:
                 params.append(error_message)
 
         params.append(run_id)
-        with self._write_lock:
-            self.conn.execute(
-                f"UPDATE backtest_runs SET {', '.join(updates)} WHERE id = ?", params
-            )
-            self.conn.commit()
+        self._execute_write(
+            f"UPDATE backtest_runs SET {', '.join(updates)} WHERE id = ?", params
+        )
 
     def update_heartbeat(self, run_id: int) -> None:
         """Update heartbeat timestamp for a running backtest."""
-        with self._write_lock:
-            self.conn.execute(
-                "UPDATE backtest_runs SET heartbeat_at = datetime('now') WHERE id = ?",
-                (run_id,),
-            )
-            self.conn.commit()
+        self._execute_write(
+            "UPDATE backtest_runs SET heartbeat_at = datetime('now') WHERE id = ?",
+            (run_id,),
+        )
 
     def list_backtest_runs(
         self, strategy_id: int | None = None, status: str | None = None
@@ -568,7 +809,7 @@ class StateManager:
 
         query += " ORDER BY created_at DESC"
 
-        cursor = self.conn.execute(query, params)
+        cursor = self._reader.execute(query, params)
         results = []
         for row in cursor:
             result = dict(row)
@@ -594,17 +835,14 @@ class StateManager:
         placeholders = ", ".join(["?"] * len(columns))
         values = [run_id] + list(metrics.values())
 
-        with self._write_lock:
-            cursor = self.conn.execute(
-                f"INSERT INTO backtest_results ({', '.join(columns)}) VALUES ({placeholders})",
-                values,
-            )
-            self.conn.commit()
-            return cursor.lastrowid or 0
+        return self._execute_write(
+            f"INSERT INTO backtest_results ({', '.join(columns)}) VALUES ({placeholders})",
+            values,
+        )
 
     def get_backtest_result(self, run_id: int) -> JsonDict | None:
         """Get backtest result for a run."""
-        cursor = self.conn.execute("SELECT * FROM backtest_results WHERE run_id = ?", (run_id,))
+        cursor = self._reader.execute("SELECT * FROM backtest_results WHERE run_id = ?", (run_id,))
         row = cursor.fetchone()
         return dict(row) if row else None
 
@@ -642,7 +880,7 @@ class StateManager:
             query += " LIMIT ?"
             params.append(limit)
 
-        cursor = self.conn.execute(query, params)
+        cursor = self._reader.execute(query, params)
         results = []
         for row in cursor:
             result = dict(row)
@@ -659,12 +897,10 @@ class StateManager:
             run_id: Backtest run ID.
             notes: Notes text to store.
         """
-        with self._write_lock:
-            self.conn.execute(
-                "UPDATE backtest_results SET notes = ? WHERE run_id = ?",
-                (notes, run_id),
-            )
-            self.conn.commit()
+        self._execute_write(
+            "UPDATE backtest_results SET notes = ? WHERE run_id = ?",
+            (notes, run_id),
+        )
 
     # --- Trade CRUD ---
 
@@ -683,13 +919,10 @@ class StateManager:
         _validate_columns(columns, _TRADES_COLUMNS, "trades")
         placeholders = ", ".join(["?"] * len(columns))
 
-        with self._write_lock:
-            cursor = self.conn.execute(
-                f"INSERT INTO trades ({', '.join(columns)}) VALUES ({placeholders})",
-                list(trade_data.values()),
-            )
-            self.conn.commit()
-            return cursor.lastrowid or 0
+        return self._execute_write(
+            f"INSERT INTO trades ({', '.join(columns)}) VALUES ({placeholders})",
+            list(trade_data.values()),
+        )
 
     def save_trades_batch(self, run_id: int, trades: Sequence[JsonDict]) -> None:
         """Save multiple trades in a batch.
@@ -706,16 +939,16 @@ class StateManager:
         _validate_columns(columns, _TRADES_COLUMNS, "trades")
         placeholders = ", ".join(["?"] * len(columns))
 
-        with self._write_lock:
-            self.conn.executemany(
-                f"INSERT INTO trades ({', '.join(columns)}) VALUES ({placeholders})",
-                [[run_id] + list(t.values()) for t in trades],
+        rows = [[run_id] + list(t.values()) for t in trades]
+        self.write(
+            lambda conn: conn.executemany(
+                f"INSERT INTO trades ({', '.join(columns)}) VALUES ({placeholders})", rows
             )
-            self.conn.commit()
+        )
 
     def get_trades(self, run_id: int) -> list[JsonDict]:
         """Get all trades for a backtest run."""
-        cursor = self.conn.execute(
+        cursor = self._reader.execute(
             "SELECT * FROM trades WHERE run_id = ? ORDER BY entry_time", (run_id,)
         )
         return [dict(row) for row in cursor]
@@ -740,13 +973,10 @@ class StateManager:
         _validate_columns(columns, _SWEEP_RESULTS_COLUMNS, "sweep_results")
         placeholders = ", ".join(["?"] * len(columns))
 
-        with self._write_lock:
-            cursor = self.conn.execute(
-                f"INSERT INTO sweep_results ({', '.join(columns)}) VALUES ({placeholders})",
-                list(result_data.values()),
-            )
-            self.conn.commit()
-            return cursor.lastrowid or 0
+        return self._execute_write(
+            f"INSERT INTO sweep_results ({', '.join(columns)}) VALUES ({placeholders})",
+            list(result_data.values()),
+        )
 
     def save_sweep_results_batch(self, run_id: int, results: Sequence[JsonDict]) -> None:
         """Save multiple sweep results in a batch.
@@ -768,15 +998,14 @@ class StateManager:
         _validate_columns(columns, _SWEEP_RESULTS_COLUMNS, "sweep_results")
         placeholders = ", ".join(["?"] * len(columns))
 
-        with self._write_lock:
-            self.conn.execute(
-                "DELETE FROM sweep_results WHERE run_id = ?", (run_id,)
-            )
-            self.conn.executemany(
+        def _replace(conn: sqlite3.Connection) -> None:
+            conn.execute("DELETE FROM sweep_results WHERE run_id = ?", (run_id,))
+            conn.executemany(
                 f"INSERT INTO sweep_results ({', '.join(columns)}) VALUES ({placeholders})",
                 [list(r.values()) for r in processed],
             )
-            self.conn.commit()
+
+        self.write(_replace)
 
     def get_sweep_results(self, run_id: int, pareto_only: bool = False) -> list[JsonDict]:
         """Get sweep results for a backtest run.
@@ -793,7 +1022,7 @@ class StateManager:
             query += " AND is_pareto_optimal = 1"
         query += " ORDER BY sharpe_ratio DESC"
 
-        cursor = self.conn.execute(query, (run_id,))
+        cursor = self._reader.execute(query, (run_id,))
         results = []
         for row in cursor:
             result = dict(row)
@@ -810,12 +1039,10 @@ class StateManager:
         if not result_ids:
             return
         placeholders = ", ".join(["?"] * len(result_ids))
-        with self._write_lock:
-            self.conn.execute(
-                f"UPDATE sweep_results SET is_pareto_optimal = 1 WHERE id IN ({placeholders})",
-                list(result_ids),
-            )
-            self.conn.commit()
+        self._execute_write(
+            f"UPDATE sweep_results SET is_pareto_optimal = 1 WHERE id IN ({placeholders})",
+            list(result_ids),
+        )
 
     # --- Background Jobs CRUD ---
     # NOTE: Job operations are also implemented in jobs/manager.py (BacktestJobManager).
@@ -837,24 +1064,21 @@ class StateManager:
         Returns:
             ID of created job.
         """
-        with self._write_lock:
-            cursor = self.conn.execute(
-                """INSERT INTO background_jobs (run_id, pid, job_type, log_file)
-                   VALUES (?, ?, ?, ?)""",
-                (run_id, pid, job_type, log_file),
-            )
-            self.conn.commit()
-            return cursor.lastrowid or 0
+        return self._execute_write(
+            """INSERT INTO background_jobs (run_id, pid, job_type, log_file)
+               VALUES (?, ?, ?, ?)""",
+            (run_id, pid, job_type, log_file),
+        )
 
     def get_job(self, run_id: int) -> JsonDict | None:
         """Get job by run ID."""
-        cursor = self.conn.execute("SELECT * FROM background_jobs WHERE run_id = ?", (run_id,))
+        cursor = self._reader.execute("SELECT * FROM background_jobs WHERE run_id = ?", (run_id,))
         row = cursor.fetchone()
         return dict(row) if row else None
 
     def get_running_jobs(self) -> list[JsonDict]:
         """Get all running jobs."""
-        cursor = self.conn.execute("SELECT * FROM background_jobs WHERE status = 'running'")
+        cursor = self._reader.execute("SELECT * FROM background_jobs WHERE status = 'running'")
         return [dict(row) for row in cursor]
 
     def update_job_status(self, run_id: int, status: str, error: str | None = None) -> None:
@@ -865,20 +1089,18 @@ class StateManager:
             status: New status (running, completed, failed, killed).
             error: Optional error message.
         """
-        with self._write_lock:
-            if status in ("completed", "failed", "killed"):
-                self.conn.execute(
-                    """UPDATE background_jobs
-                       SET status = ?, completed_at = datetime('now'), error_message = ?
-                       WHERE run_id = ?""",
-                    (status, error, run_id),
-                )
-            else:
-                self.conn.execute(
-                    "UPDATE background_jobs SET status = ? WHERE run_id = ?",
-                    (status, run_id),
-                )
-            self.conn.commit()
+        if status in ("completed", "failed", "killed"):
+            self._execute_write(
+                """UPDATE background_jobs
+                   SET status = ?, completed_at = datetime('now'), error_message = ?
+                   WHERE run_id = ?""",
+                (status, error, run_id),
+            )
+        else:
+            self._execute_write(
+                "UPDATE background_jobs SET status = ? WHERE run_id = ?",
+                (status, run_id),
+            )
 
     def list_runs_with_results(
         self,
@@ -937,7 +1159,7 @@ class StateManager:
 
         query += " ORDER BY r.created_at DESC"
 
-        cursor = self.conn.execute(query, params)
+        cursor = self._reader.execute(query, params)
         results = []
         for row in cursor:
             result = dict(row)
@@ -948,10 +1170,8 @@ class StateManager:
 
     def update_job_heartbeat(self, run_id: int) -> None:
         """Update job heartbeat timestamp."""
-        with self._write_lock:
-            self.conn.execute(
-                """UPDATE background_jobs SET heartbeat_at = datetime('now')
-                   WHERE run_id = ?""",
-                (run_id,),
-            )
-            self.conn.commit()
+        self._execute_write(
+            """UPDATE background_jobs SET heartbeat_at = datetime('now')
+               WHERE run_id = ?""",
+            (run_id,),
+        )
@@ -10,7 +10,9 @@ import time
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from vibe_quant.discovery.islands import MIGRATION_TOPOLOGIES, IslandConfig, IslandModel
 from vibe_quant.discovery.pipeline import DiscoveryConfig, DiscoveryPipeline, DiscoveryResult
+from vibe_quant.discovery.steady_state import SteadyStateGA
 
 logger = logging.getLogger(__name__)
 
@@ -478,6 +480,82 @@ def build_parser() -> argparse.ArgumentParser:
         help="Number of random seeds to run. >1 enables multi-seed ensemble: "
         "runs GA N times, ranks by median Sharpe (default: 1)",
     )
+    parser.add_argument(
+        "--islands",
+        action="store_true",
+        help="Run the --num-seeds populations concurrently as islands on one "
+        "worker pool, with periodic migration of top individuals between them.",
+    )
+    parser.add_argument(
+        "--steady-state",
+        action="store_true",
+        help="Evaluate asynchronously: breed and submit a new child whenever a "
+        "worker frees up instead of waiting for whole generations (single seed only).",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue an interrupted run from its last per-generation checkpoint "
+        "(single-seed generational runs only).",
+    )
+    parser.add_argument(
+        "--migration-interval",
+        type=int,
+        default=3,
+        help="Generations between island migrations (default: 3)",
+    )
+    parser.add_argument(
+        "--migration-size",
+        type=int,
+        default=2,
+        help="Top individuals each island sends per migration (default: 2)",
+    )
+    parser.add_argument(
+        "--migration-topology",
+        choices=MIGRATION_TOPOLOGIES,
+        default="ring",
+        help="Island migration topology (default: ring)",
+    )
+    parser.add_argument(
+        "--surrogate-fraction",
+        type=float,
+        default=1.0,
+        help="Fraction of each generation to backtest once the fitness surrogate "
+        "is trained; the rest get predicted scores (default: 1.0 = disabled)",
+    )
+    parser.add_argument(
+        "--surrogate-exploration",
+        type=float,
+        default=0.25,
+        help="Share of the surrogate backtest budget picked at random (default: 0.25)",
+    )
+    parser.add_argument(
+        "--fidelity-fraction",
+        type=float,
+        default=1.0,
+        help="Screen each generation on a random sub-window covering this share "
+        "of the training range; only the best-ranked get the full multi-window "
+        "backtest (default: 1.0 = disabled)",
+    )
+    parser.add_argument(
+        "--promotion-rate",
+        type=float,
+        default=0.5,
+        help="Initial share of screened individuals promoted to the full backtest; "
+        "adapts to screen/full rank agreement (default: 0.5)",
+    )
+    parser.add_argument(
+        "--min-promotion-rate",
+        type=float,
+        default=0.2,
+        help="Floor for the adaptive promotion rate (default: 0.2)",
+    )
+    parser.add_argument(
+        "--multi-objective",
+        action="store_true",
+        help="NSGA-II selection over Sharpe, drawdown, trade count and window "
+        "consistency instead of the weighted fitness score",
+    )
     parser.add_argument(
         "--bootstrap-min-sharpe",
         type=float,
@@ -528,12 +606,6 @@ def build_parser() -> argparse.ArgumentParser:
         default=True,
         help="Disable deterministic crowding selection (falls back to classic tournament).",
     )
-    parser.add_argument(
-        "--seed-from-run",
-        type=int,
-        default=None,
-        help="Warm-start GA from top chromosomes of a prior discovery run ID.",
-    )
     parser.add_argument("--db", type=str, default=None, help="Database path")
     parser.add_argument("--mock", action="store_true", help="Force mock backtest (no NT)")
     return parser
@@ -554,7 +626,7 @@ def main() -> int:
 
     db_path = Path(args.db) if args.db else DEFAULT_DB_PATH
     state = StateManager(db_path)
-    job_manager, stop_heartbeat = run_with_heartbeat(args.run_id, db_path)
+    job_manager, stop_heartbeat = run_with_heartbeat(args.run_id, db_path, state=state)
     started_at = time.perf_counter()
 
     try:
@@ -653,6 +725,12 @@ def main() -> int:
             use_crowding=args.use_crowding,
             immigrant_fraction=args.immigrant_fraction,
             entropy_threshold=args.entropy_threshold,
+            surrogate_eval_fraction=args.surrogate_fraction,
+            surrogate_exploration=args.surrogate_exploration,
+            multi_objective=args.multi_objective,
+            fidelity_window_fraction=args.fidelity_fraction,
+            promotion_rate=args.promotion_rate,
+            min_promotion_rate=args.min_promotion_rate,
         )
 
         # Log environment details for debugging and journal entries
@@ -701,7 +779,11 @@ def main() -> int:
 
         # Create backtest factory for cross-window and/or WFA validation
         backtest_fn_factory = None
-        needs_factory = bool(cross_window_months) or args.wfa_oos_step_days > 0
+        needs_factory = (
+            bool(cross_window_months)
+            or args.wfa_oos_step_days > 0
+            or args.fidelity_fraction < 1.0
+        )
         if needs_factory:
             if use_mock:
                 backtest_fn_factory = lambda s, e: _mock_backtest  # noqa: E731
@@ -729,8 +811,38 @@ def main() -> int:
 
         num_seeds = max(1, args.num_seeds)
         progress_file = f"logs/discovery_{args.run_id}_progress.json"
+        checkpoint_file = f"logs/discovery_{args.run_id}_checkpoint.json"
+        if args.steady_state and num_seeds > 1:
+            logger.warning("--steady-state only applies to single-seed runs; ignoring it")
+        if args.resume and (num_seeds > 1 or args.steady_state):
+            logger.warning("--resume only applies to single-seed generational runs; ignoring it")
+        island_config = IslandConfig(
+            num_islands=num_seeds,
+            migration_interval=args.migration_interval,
+            migration_size=args.migration_size,
+            topology=args.migration_topology,
+        )
+        island_notes = (
+            {
+                "topology": island_config.topology,
+                "migration_interval": island_config.migration_interval,
+                "migration_size": island_config.migration_size,
+            }
+            if args.islands and num_seeds > 1
+            else None
+        )
 
-        if num_seeds == 1:
+        if num_seeds == 1 and args.steady_state:
+            # Steady-state GA: no generation barrier, workers never wait
+            result = SteadyStateGA(
+                config=config,
+                backtest_fn=backtest_fn,
+                progress_file=progress_file,
+                holdout_backtest_fn=holdout_backtest_fn,
+                backtest_fn_factory=backtest_fn_factory,
+                seed_chromosomes=seed_chromosomes,
+            ).run()
+        elif num_seeds == 1:
             # Single-seed run (default)
             pipeline = DiscoveryPipeline(
                 config=config,
@@ -739,8 +851,21 @@ def main() -> int:
                 holdout_backtest_fn=holdout_backtest_fn,
                 backtest_fn_factory=backtest_fn_factory,
                 seed_chromosomes=seed_chromosomes,
+                checkpoint_file=checkpoint_file,
+                resume=args.resume,
             )
             result = pipeline.run()
+        elif args.islands:
+            # Island model: seeds evolve concurrently and exchange migrants
+            result = IslandModel(
+                config=config,
+                islands=island_config,
+                backtest_fn=backtest_fn,
+                progress_file=progress_file,
+                holdout_backtest_fn=holdout_backtest_fn,
+                backtest_fn_factory=backtest_fn_factory,
+                seed_chromosomes=seed_chromosomes,
+            ).run()
         else:
             # Multi-seed ensemble: run N times with different seeds
             result = _run_multi_seed(
@@ -786,6 +911,7 @@ def main() -> int:
                 "train_test_split": split_ratio if split_ratio > 0 else None,
                 "direction": args.direction,
                 "num_seeds": num_seeds if num_seeds > 1 else None,
+                "islands": island_notes,
                 "top_strategies": [],
             }
             state.save_backtest_result(
@@ -925,6 +1051,7 @@ def main() -> int:
                         ),
                         "wfa_oos_step_days": args.wfa_oos_step_days if args.wfa_oos_step_days > 0 else None,
                         "num_seeds": num_seeds if num_seeds > 1 else None,
+                        "islands": island_notes,
                         "top_strategies": top_dsls,
                     }
                 ),
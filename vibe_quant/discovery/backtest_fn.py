@@ -88,6 +88,7 @@ class NTBacktestFn:
         - max_drawdown: max (worst case)
         - profit_factor: trade-weighted mean
         - total_return: mean per-window return
+        - consistency: fraction of windows with a positive return
         """
         n = len(results)
         per_window_trades = [int(r["total_trades"]) for r in results]
@@ -116,6 +117,7 @@ class NTBacktestFn:
             "profit_factor": pf_weighted,
             "total_trades": total_trades_sum,
             "total_return": sum(float(r["total_return"]) for r in results) / n,
+            "consistency": sum(float(r["total_return"]) > 0 for r in results) / n,
             "skewness": sum(float(r.get("skewness", 0.0)) for r in results) / n,  # type: ignore[arg-type]
             "kurtosis": max(float(r.get("kurtosis", 3.0)) for r in results),  # type: ignore[arg-type]
             "trade_returns": sum(
@@ -38,11 +38,14 @@ import logging
 import subprocess
 import sys
 import uuid
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Collection
+
     from vibe_quant.db.state_manager import StateManager
 
 logger = logging.getLogger(__name__)
@@ -207,8 +210,14 @@ def run_discovery_subprocess(
     window: TrainWindow,
     python_bin: str = sys.executable,
     log_dir: Path | str | None = None,
+    max_workers: int | None = None,
 ) -> int:
-    """Launch a single discovery as a subprocess. Returns exit code."""
+    """Launch a single discovery as a subprocess. Returns exit code.
+
+    ``max_workers`` caps the discovery's own process pool; None leaves the
+    CLI default (one worker per CPU).
+    """
+    worker_args = ["--max-workers", str(max_workers)] if max_workers is not None else []
     cmd = [
         python_bin,
         "-m",
@@ -221,6 +230,7 @@ def run_discovery_subprocess(
         "--direction", window.direction,
         "--population-size", str(config.population_size),
         "--max-generations", str(config.max_generations),
+        *worker_args,
         *config.extra_discovery_args,
     ]
     log_path = Path(log_dir) / f"regime_cross_{run_id}.log" if log_dir else None
@@ -255,14 +265,19 @@ def extract_top_chromosomes(
 
 
 def plan_oos_validations(
-    plan: CampaignPlan, state: StateManager
+    plan: CampaignPlan,
+    state: StateManager,
+    windows: Collection[str] | None = None,
 ) -> CampaignPlan:
     """For each discovery's survivors, create a strategy + OOS run per OOS window.
 
     Mutates ``plan.oos_runs`` in place. Safe to re-call — existing OOS
     rows matching ``(train_label, champion_idx, oos_label)`` are kept.
+    ``windows`` restricts planning to those training-window labels.
     """
     for tw in plan.config.train_windows:
+        if windows is not None and tw.label not in windows:
+            continue
         disc_run_id = plan.discovery_runs.get(tw.label)
         if disc_run_id is None:
             continue
@@ -346,33 +361,134 @@ def run_campaign(
     state: StateManager,
     log_dir: Path | str | None = None,
     skip_existing: bool = True,
+    max_parallel: int = 1,
+    total_workers: int | None = None,
+    on_progress: Callable[[MatrixReport], None] | None = None,
 ) -> CampaignPlan:
-    """Execute discoveries then OOS validations sequentially.
+    """Execute discoveries and their OOS validations, up to ``max_parallel`` at once.
+
+    Each training window is an independent cell: its OOS validations are
+    planned and queued as soon as its discovery finishes, without waiting
+    for the other windows. Subprocesses run on driver threads; all
+    database access stays on the calling thread.
 
     When ``skip_existing`` is true, any run already marked ``completed``
-    is skipped — this makes the runner resumable after crashes.
+    is skipped — this makes the runner resumable after crashes, since run
+    status is persisted in ``backtest_runs`` by the subprocesses.
+
+    Args:
+        plan: Campaign plan; ``plan.oos_runs`` is filled in as cells finish.
+        state: State manager holding the campaign rows.
+        log_dir: Directory for per-run subprocess logs.
+        skip_existing: Skip runs already marked ``completed``.
+        max_parallel: Most subprocesses running at once.
+        total_workers: Cap on worker processes across all running
+            subprocesses. Each discovery gets an equal share as its
+            ``--max-workers``; each OOS validation counts as one. None
+            leaves discoveries on their CLI default.
+        on_progress: Called with a fresh matrix report after every
+            completed OOS validation.
+
+    Returns:
+        The updated plan.
+
+    Raises:
+        ValueError: If ``max_parallel`` or ``total_workers`` is below 1.
     """
-    # Phase 2: discoveries
-    for tw in plan.config.train_windows:
-        run_id = plan.discovery_runs[tw.label]
+    if max_parallel < 1:
+        msg = f"max_parallel must be >= 1, got {max_parallel}"
+        raise ValueError(msg)
+    if total_workers is not None and total_workers < 1:
+        msg = f"total_workers must be >= 1, got {total_workers}"
+        raise ValueError(msg)
+
+    windows = {tw.label: tw for tw in plan.config.train_windows}
+    pending_discoveries: list[str] = []
+    finished_windows: list[str] = []
+    for label in windows:
+        run_id = plan.discovery_runs[label]
         if skip_existing and _run_completed(run_id, state):
             logger.info("skipping completed discovery run_id=%d", run_id)
-            continue
-        rc = run_discovery_subprocess(run_id, plan.config, tw, log_dir=log_dir)
-        if rc != 0:
-            logger.warning(
-                "discovery run_id=%d returned non-zero (%d); continuing", run_id, rc
+            finished_windows.append(label)
+        else:
+            pending_discoveries.append(label)
+
+    discovery_workers: int | None = None
+    if total_workers is not None and pending_discoveries:
+        concurrent = min(max_parallel, len(pending_discoveries))
+        discovery_workers = max(1, total_workers // concurrent)
+    budget = total_workers if total_workers is not None else max_parallel
+
+    pending_oos: list[tuple[str, int, str]] = []
+    queued_oos: set[tuple[str, int, str]] = set()
+
+    def queue_oos(labels: list[str]) -> None:
+        plan_oos_validations(plan, state, windows=labels)
+        for key, run_id in plan.oos_runs.items():
+            if key[0] not in labels or key in queued_oos:
+                continue
+            queued_oos.add(key)
+            if skip_existing and _run_completed(run_id, state):
+                logger.info("skipping completed oos run_id=%d (%s)", run_id, key)
+                continue
+            pending_oos.append(key)
+
+    queue_oos(finished_windows)
+
+    discovery_cost = discovery_workers or 1
+    running_discoveries: dict[Future[int], str] = {}
+    running_oos: dict[Future[int], tuple[str, int, str]] = {}
+    used = 0
+
+    def has_room(cost: int) -> bool:
+        n_running = len(running_discoveries) + len(running_oos)
+        return n_running < max_parallel and (used + cost <= budget or n_running == 0)
+
+    with ThreadPoolExecutor(max_workers=max_parallel) as pool:
+        while pending_discoveries or pending_oos or running_discoveries or running_oos:
+            # Start the long discoveries first; OOS validations backfill free slots
+            while pending_discoveries and has_room(discovery_cost):
+                label = pending_discoveries.pop(0)
+                future = pool.submit(
+                    run_discovery_subprocess,
+                    plan.discovery_runs[label],
+                    plan.config,
+                    windows[label],
+                    log_dir=log_dir,
+                    max_workers=discovery_workers,
+                )
+                running_discoveries[future] = label
+                used += discovery_cost
+            while pending_oos and has_room(1):
+                key = pending_oos.pop(0)
+                future = pool.submit(run_oos_subprocess, plan.oos_runs[key], log_dir=log_dir)
+                running_oos[future] = key
+                used += 1
+
+            done, _ = wait(
+                [*running_discoveries, *running_oos], return_when=FIRST_COMPLETED
             )
-
-    # Phase 3: plan OOS once discoveries are done, then run them
-    plan_oos_validations(plan, state)
-    for key, run_id in plan.oos_runs.items():
-        if skip_existing and _run_completed(run_id, state):
-            logger.info("skipping completed oos run_id=%d (%s)", run_id, key)
-            continue
-        rc = run_oos_subprocess(run_id, log_dir=log_dir)
-        if rc != 0:
-            logger.warning("oos run_id=%d returned non-zero (%d); continuing", run_id, rc)
+            for future in done:
+                rc = future.result()
+                if future in running_discoveries:
+                    label = running_discoveries.pop(future)
+                    used -= discovery_cost
+                    if rc != 0:
+                        logger.warning(
+                            "discovery run_id=%d returned non-zero (%d); continuing",
+                            plan.discovery_runs[label], rc,
+                        )
+                    queue_oos([label])
+                else:
+                    key = running_oos.pop(future)
+                    used -= 1
+                    if rc != 0:
+                        logger.warning(
+                            "oos run_id=%d returned non-zero (%d); continuing",
+                            plan.oos_runs[key], rc,
+                        )
+                    if on_progress is not None:
+                        on_progress(build_matrix_report(plan.campaign_id, state))
 
     return plan
 
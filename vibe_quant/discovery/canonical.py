@@ -0,0 +1,146 @@
+"""Canonical genome form for detecting semantically identical strategies.
+
+Many valid chromosomes compile to the same strategy. Conditions in an
+entry or exit list are ANDed, so gene order does not matter, a repeated
+condition adds nothing, and of two one-sided comparisons on the same
+indicator output (``RSI > 30`` and ``RSI > 50``) only the stricter one
+binds. The DSL also truncates period parameters to integers, ignores
+parameters an indicator config does not read, rounds stop-loss and
+take-profit to two decimals, and only emits per-direction SL/TP overrides
+for ``Direction.BOTH``.
+
+:func:`canonicalize` rewrites a chromosome into one representative of its
+equivalence class; :func:`genome_key` is a hashable key equal for any two
+chromosomes that compile to the same strategy. Equivalence is judged
+through :mod:`vibe_quant.discovery.genome`'s own DSL builders, so the key
+follows whatever the compiler actually sees.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+from vibe_quant.discovery.genome import (
+    _gene_to_condition_str,
+    _gene_to_indicator_config,
+    _ma_gene_to_condition_str,
+    _ma_gene_to_indicator_config,
+)
+from vibe_quant.discovery.operators import ConditionType, Direction
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+
+    from vibe_quant.discovery.operators import (
+        PriceVsMAConditionGene,
+        StrategyChromosome,
+        StrategyGene,
+    )
+
+# One-sided comparisons: of several on the same output, the strictest binds
+_STRICTEST: dict[ConditionType, Callable[[float, float], float]] = {
+    ConditionType.GT: max,
+    ConditionType.GTE: max,
+    ConditionType.LT: min,
+    ConditionType.LTE: min,
+}
+
+
+def _config_key(config: dict[str, object]) -> tuple[tuple[str, str], ...]:
+    return tuple(sorted((k, repr(v)) for k, v in config.items()))
+
+
+def _gene_key(gene: StrategyGene) -> tuple[object, ...]:
+    # Empty indicator name: the condition string keeps op, sub-value and
+    # threshold exactly as the DSL would format them
+    return (
+        gene.indicator_type,
+        _config_key(_gene_to_indicator_config(gene)),
+        _gene_to_condition_str(gene, ""),
+    )
+
+
+def _ma_gene_key(gene: PriceVsMAConditionGene) -> tuple[object, ...]:
+    return (
+        gene.indicator_type,
+        _config_key(_ma_gene_to_indicator_config(gene)),
+        _ma_gene_to_condition_str(gene, ""),
+    )
+
+
+def _simplify_genes(genes: list[StrategyGene]) -> list[StrategyGene]:
+    """Drop repeated and dominated conditions of an ANDed list; sort the rest."""
+    kept: dict[tuple[object, ...], StrategyGene] = {}
+    for gene in genes:
+        strictest = _STRICTEST.get(gene.condition)
+        if strictest is None:
+            group = _gene_key(gene)
+        else:
+            config = _config_key(_gene_to_indicator_config(gene))
+            group = (config, gene.sub_value, gene.condition)
+        current = kept.get(group)
+        if current is None or (
+            strictest is not None
+            and strictest(gene.threshold, current.threshold) != current.threshold
+        ):
+            kept[group] = gene
+    return sorted(kept.values(), key=_gene_key)
+
+
+def _simplify_ma_genes(genes: list[PriceVsMAConditionGene]) -> list[PriceVsMAConditionGene]:
+    unique = {_ma_gene_key(g): g for g in reversed(genes)}
+    return sorted(unique.values(), key=_ma_gene_key)
+
+
+def canonicalize(chrom: StrategyChromosome) -> StrategyChromosome:
+    """Rewrite ``chrom`` in place into the canonical member of its equivalence class.
+
+    Sorts genes, drops repeated and dominated conditions, and clears
+    per-direction SL/TP overrides the DSL ignores. Never removes the last
+    gene of a list, so a valid chromosome stays valid. Parameters are left
+    untouched (truncating them could break constraints such as MACD
+    ``fast < slow``); :func:`genome_key` compares them as the DSL sees them.
+
+    Returns:
+        The same chromosome, for chaining.
+    """
+    chrom.entry_genes = _simplify_genes(chrom.entry_genes)
+    chrom.exit_genes = _simplify_genes(chrom.exit_genes)
+    chrom.ma_entry_genes = _simplify_ma_genes(chrom.ma_entry_genes)
+    chrom.ma_exit_genes = _simplify_ma_genes(chrom.ma_exit_genes)
+    if chrom.direction != Direction.BOTH:
+        chrom.stop_loss_long_pct = None
+        chrom.stop_loss_short_pct = None
+        chrom.take_profit_long_pct = None
+        chrom.take_profit_short_pct = None
+    return chrom
+
+
+def genome_key(chrom: StrategyChromosome) -> Hashable:
+    """Hashable key shared by all chromosomes that compile to the same strategy.
+
+    Does not modify ``chrom``; it need not be canonicalized first.
+    """
+    overrides: tuple[float | None, ...] = ()
+    if chrom.direction == Direction.BOTH:
+        overrides = tuple(
+            round(v, 2) if v is not None else None
+            for v in (
+                chrom.stop_loss_long_pct,
+                chrom.stop_loss_short_pct,
+                chrom.take_profit_long_pct,
+                chrom.take_profit_short_pct,
+            )
+        )
+    return (
+        chrom.direction.value,
+        tuple(_gene_key(g) for g in _simplify_genes(chrom.entry_genes)),
+        tuple(_gene_key(g) for g in _simplify_genes(chrom.exit_genes)),
+        tuple(_ma_gene_key(g) for g in _simplify_ma_genes(chrom.ma_entry_genes)),
+        tuple(_ma_gene_key(g) for g in _simplify_ma_genes(chrom.ma_exit_genes)),
+        round(chrom.stop_loss_pct, 2),
+        round(chrom.take_profit_pct, 2),
+        overrides,
+        json.dumps(chrom.time_filters, sort_keys=True, default=str),
+    )
@@ -0,0 +1,188 @@
+"""Per-generation checkpoints for resuming long discovery runs.
+
+After each generation is evaluated, :class:`DiscoveryPipeline` can write
+everything the rest of the search depends on: the population and its
+fitness, the generation history (which drives convergence), every scored
+candidate seen so far (the top-K pool), the state of the global ``random``
+module, and the adaptive components (surrogate archive, Pareto archive,
+promotion rate). Resuming from that file replays the remaining generations
+exactly as the uninterrupted run would have.
+
+The file is JSON, written to a temporary sibling and renamed into place so
+a crash mid-write never leaves a truncated checkpoint.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from vibe_quant.discovery.fitness import FitnessResult
+from vibe_quant.discovery.genome import chromosome_to_serializable, serializable_to_chromosome
+
+if TYPE_CHECKING:
+    from vibe_quant.discovery.operators import StrategyChromosome
+    from vibe_quant.discovery.pipeline import GenerationResult
+
+CHECKPOINT_VERSION: int = 1
+
+
+@dataclass(frozen=True, slots=True)
+class DiscoveryCheckpoint:
+    """Search state at the end of one generation's evaluation.
+
+    Attributes:
+        generation: Index of the last evaluated generation (0-based).
+        population: The evaluated population.
+        fitness_results: Its fitness, parallel to ``population``.
+        generation_results: Per-generation metrics so far.
+        all_scored: Every positively scored (chromosome, fitness) so far.
+        total_evaluated: Cumulative backtests.
+        elapsed: Search wall time so far, in seconds.
+        rng_state: ``random.getstate()`` right after the evaluation.
+        config: DiscoveryConfig fields of the run.
+        surrogate: Surrogate archive ``(chromosome, score)`` entries, if enabled.
+        pareto_archive: Pareto archive members, if multi-objective.
+        promotion: ``(rate, last_correlation)`` of the promotion schedule, if enabled.
+    """
+
+    generation: int
+    population: list[StrategyChromosome]
+    fitness_results: list[FitnessResult]
+    generation_results: list[GenerationResult]
+    all_scored: list[tuple[StrategyChromosome, FitnessResult]]
+    total_evaluated: int
+    elapsed: float
+    rng_state: tuple[Any, ...]
+    config: dict[str, Any]
+    surrogate: list[tuple[StrategyChromosome, float]] | None = None
+    pareto_archive: list[tuple[StrategyChromosome, FitnessResult]] | None = None
+    promotion: tuple[float, float | None] | None = None
+
+
+def _chromosome_to_json(chrom: StrategyChromosome) -> dict[str, object]:
+    return {"uid": chrom.uid, **chromosome_to_serializable(chrom)}
+
+
+def _chromosome_from_json(data: dict[str, Any]) -> StrategyChromosome:
+    chrom = serializable_to_chromosome(data)
+    chrom.uid = str(data["uid"])
+    return chrom
+
+
+def _fitness_from_json(data: dict[str, Any]) -> FitnessResult:
+    return FitnessResult(**{**data, "trade_returns": tuple(data.get("trade_returns", ()))})
+
+
+def _scored_to_json(
+    scored: list[tuple[StrategyChromosome, FitnessResult]],
+) -> list[dict[str, object]]:
+    return [
+        {"chromosome": _chromosome_to_json(c), "fitness": dataclasses.asdict(fr)}
+        for c, fr in scored
+    ]
+
+
+def _scored_from_json(data: list[dict[str, Any]]) -> list[tuple[StrategyChromosome, FitnessResult]]:
+    return [
+        (_chromosome_from_json(d["chromosome"]), _fitness_from_json(d["fitness"])) for d in data
+    ]
+
+
+def save_checkpoint(checkpoint: DiscoveryCheckpoint, path: str | Path) -> None:
+    """Atomically write ``checkpoint`` to ``path`` as JSON."""
+    version, internal, gauss_next = checkpoint.rng_state
+    data = {
+        "version": CHECKPOINT_VERSION,
+        "generation": checkpoint.generation,
+        "population": [_chromosome_to_json(c) for c in checkpoint.population],
+        "fitness_results": [dataclasses.asdict(fr) for fr in checkpoint.fitness_results],
+        "generation_results": [
+            {
+                **{
+                    f.name: getattr(gr, f.name)
+                    for f in dataclasses.fields(gr)
+                    if f.name != "best_chromosome"
+                },
+                "best_chromosome": _chromosome_to_json(gr.best_chromosome),
+            }
+            for gr in checkpoint.generation_results
+        ],
+        "all_scored": _scored_to_json(checkpoint.all_scored),
+        "total_evaluated": checkpoint.total_evaluated,
+        "elapsed": checkpoint.elapsed,
+        "rng_state": [version, list(internal), gauss_next],
+        "config": checkpoint.config,
+        "surrogate": (
+            [
+                {"chromosome": _chromosome_to_json(c), "score": score}
+                for c, score in checkpoint.surrogate
+            ]
+            if checkpoint.surrogate is not None
+            else None
+        ),
+        "pareto_archive": (
+            _scored_to_json(checkpoint.pareto_archive)
+            if checkpoint.pareto_archive is not None
+            else None
+        ),
+        "promotion": list(checkpoint.promotion) if checkpoint.promotion is not None else None,
+    }
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(data))
+    tmp.replace(path)
+
+
+def load_checkpoint(path: str | Path) -> DiscoveryCheckpoint | None:
+    """Read a checkpoint written by :func:`save_checkpoint`.
+
+    Returns:
+        The checkpoint, or None if ``path`` does not exist.
+
+    Raises:
+        ValueError: If the file was written by an incompatible version.
+    """
+    path = Path(path)
+    if not path.exists():
+        return None
+    data = json.loads(path.read_text())
+    if data.get("version") != CHECKPOINT_VERSION:
+        msg = f"Unsupported checkpoint version {data.get('version')!r} in {path}"
+        raise ValueError(msg)
+
+    from vibe_quant.discovery.pipeline import GenerationResult
+
+    version, internal, gauss_next = data["rng_state"]
+    promotion = data["promotion"]
+    return DiscoveryCheckpoint(
+        generation=int(data["generation"]),
+        population=[_chromosome_from_json(c) for c in data["population"]],
+        fitness_results=[_fitness_from_json(fr) for fr in data["fitness_results"]],
+        generation_results=[
+            GenerationResult(
+                **{**gr, "best_chromosome": _chromosome_from_json(gr["best_chromosome"])}
+            )
+            for gr in data["generation_results"]
+        ],
+        all_scored=_scored_from_json(data["all_scored"]),
+        total_evaluated=int(data["total_evaluated"]),
+        elapsed=float(data["elapsed"]),
+        rng_state=(version, tuple(internal), gauss_next),
+        config=data["config"],
+        surrogate=(
+            [(_chromosome_from_json(e["chromosome"]), float(e["score"])) for e in data["surrogate"]]
+            if data["surrogate"] is not None
+            else None
+        ),
+        pareto_archive=(
+            _scored_from_json(data["pareto_archive"])
+            if data["pareto_archive"] is not None
+            else None
+        ),
+        promotion=(float(promotion[0]), promotion[1]) if promotion is not None else None,
+    )
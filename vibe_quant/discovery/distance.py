@@ -11,7 +11,14 @@ threshold tweak is a parameter variation.
 
 from __future__ import annotations
 
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
 from vibe_quant.discovery.operators import (
+    MAX_ENTRY_GENES,
+    MAX_EXIT_GENES,
     SL_RANGE,
     TP_RANGE,
     StrategyChromosome,
@@ -19,6 +26,11 @@ from vibe_quant.discovery.operators import (
     _ensure_pool,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from numpy.typing import NDArray
+
 # Weights for gene components (structural vs parametric)
 _W_INDICATOR: float = 2.0   # categorical: 0 or 1
 _W_CONDITION: float = 1.0   # categorical: 0 or 1
@@ -163,3 +175,249 @@ def chromosome_distance(a: StrategyChromosome, b: StrategyChromosome) -> float:
     weighted_sum += _W_TP * (abs(a.take_profit_pct - b.take_profit_pct) / tp_range)
 
     return min(1.0, weighted_sum / total_weight)
+
+
+# ---------------------------------------------------------------------------
+# Vectorized distances
+# ---------------------------------------------------------------------------
+
+# Distance cells per block in distance_matrix (bounds the per-slot param tensor)
+_BLOCK_CELLS: int = 1 << 21
+
+# Integer codes for categorical features, shared by every encoding in the
+# process so features from different calls can be compared.
+_INDICATOR_CODES: dict[str, int] = {}
+_CONDITION_CODES: dict[str, int] = {}
+
+# Direction codes index _DIRECTION_TABLE; the last row/column is "unknown"
+_DIRECTION_CODES: dict[str, int] = {"long": 0, "short": 1, "both": 2}
+_UNKNOWN_DIRECTION: int = 3
+_DIRECTION_TABLE = np.array(
+    [
+        [0.0, 1.0, 0.5, 1.0],
+        [1.0, 0.0, 0.5, 1.0],
+        [0.5, 0.5, 0.0, 1.0],
+        [1.0, 1.0, 1.0, 1.0],
+    ]
+)
+
+
+def _code(codes: dict[str, int], key: str) -> int:
+    return codes.setdefault(key, len(codes))
+
+
+def _pad(arr: NDArray[Any], width: int, axis: int, fill: float) -> NDArray[Any]:
+    missing = width - arr.shape[axis]
+    if missing <= 0:
+        return arr
+    pad = [(0, 0)] * arr.ndim
+    pad[axis] = (0, missing)
+    return np.pad(arr, pad, constant_values=fill)
+
+
+@dataclass(frozen=True, slots=True)
+class _GeneBlock:
+    """Fixed-width encoding of one gene list (entry or exit) per chromosome.
+
+    Missing slots have ``indicator == -1``. ``threshold`` is divided by the
+    indicator's threshold range and ``params`` holds range-normalized values
+    in INDICATOR_POOL order, so differences match :func:`gene_distance`.
+    """
+
+    indicator: NDArray[np.int64]  # (n, slots)
+    condition: NDArray[np.int64]  # (n, slots)
+    threshold: NDArray[np.float64]  # (n, slots)
+    params: NDArray[np.float64]  # (n, slots, max_params)
+    n_params: NDArray[np.int64]  # (n, slots)
+
+    @classmethod
+    def encode(cls, gene_lists: Sequence[Sequence[StrategyGene]], min_slots: int) -> _GeneBlock:
+        from vibe_quant.discovery.operators import INDICATOR_POOL, THRESHOLD_RANGES
+
+        n = len(gene_lists)
+        slots = max([min_slots, *(len(genes) for genes in gene_lists)])
+        max_params = max([1, *(len(r) for r in INDICATOR_POOL.values())])
+        indicator = np.full((n, slots), -1, dtype=np.int64)
+        condition = np.full((n, slots), -1, dtype=np.int64)
+        threshold = np.zeros((n, slots))
+        params = np.zeros((n, slots, max_params))
+        n_params = np.zeros((n, slots), dtype=np.int64)
+        for row, genes in enumerate(gene_lists):
+            for slot, gene in enumerate(genes):
+                indicator[row, slot] = _code(_INDICATOR_CODES, gene.indicator_type)
+                condition[row, slot] = _code(_CONDITION_CODES, str(gene.condition))
+                if gene.indicator_type in THRESHOLD_RANGES:
+                    tlo, thi = THRESHOLD_RANGES[gene.indicator_type]
+                    trange = thi - tlo
+                    threshold[row, slot] = gene.threshold / trange if trange > 0 else 0.0
+                else:
+                    threshold[row, slot] = gene.threshold / _THRESHOLD_GLOBAL_RANGE
+                ranges = INDICATOR_POOL.get(gene.indicator_type, {})
+                n_params[row, slot] = len(ranges)
+                for p, (pname, (lo, hi)) in enumerate(ranges.items()):
+                    prange = hi - lo
+                    value = gene.parameters.get(pname, lo)
+                    params[row, slot, p] = (value - lo) / prange if prange > 0 else 0.0
+        return cls(indicator, condition, threshold, params, n_params)
+
+    def widened(self, slots: int, max_params: int) -> _GeneBlock:
+        return _GeneBlock(
+            _pad(self.indicator, slots, 1, -1),
+            _pad(self.condition, slots, 1, -1),
+            _pad(self.threshold, slots, 1, 0.0),
+            _pad(_pad(self.params, slots, 1, 0.0), max_params, 2, 0.0),
+            _pad(self.n_params, slots, 1, 0),
+        )
+
+    def take(self, rows: Any) -> _GeneBlock:
+        return _GeneBlock(
+            self.indicator[rows],
+            self.condition[rows],
+            self.threshold[rows],
+            self.params[rows],
+            self.n_params[rows],
+        )
+
+    def concat(self, other: _GeneBlock) -> _GeneBlock:
+        slots = max(self.indicator.shape[1], other.indicator.shape[1])
+        max_params = max(self.params.shape[2], other.params.shape[2])
+        a, b = self.widened(slots, max_params), other.widened(slots, max_params)
+        return _GeneBlock(
+            np.concatenate([a.indicator, b.indicator]),
+            np.concatenate([a.condition, b.condition]),
+            np.concatenate([a.threshold, b.threshold]),
+            np.concatenate([a.params, b.params]),
+            np.concatenate([a.n_params, b.n_params]),
+        )
+
+
+def _gene_block_distances(
+    a: _GeneBlock, b: _GeneBlock
+) -> tuple[NDArray[np.float64], NDArray[np.int64]]:
+    """Summed slot distances and compared-slot counts for every (a, b) pair."""
+    slots = max(a.indicator.shape[1], b.indicator.shape[1])
+    max_params = max(a.params.shape[2], b.params.shape[2])
+    a, b = a.widened(slots, max_params), b.widened(slots, max_params)
+
+    total_weight = _W_INDICATOR + _W_CONDITION + _W_THRESHOLD + _W_PARAMS
+    dist_sum = np.zeros((len(a.indicator), len(b.indicator)))
+    count = np.zeros(dist_sum.shape, dtype=np.int64)
+    for s in range(slots):
+        present_a = a.indicator[:, s, None] >= 0
+        present_b = b.indicator[None, :, s] >= 0
+        if not (present_a.any() or present_b.any()):
+            continue
+        both = present_a & present_b
+        either = present_a | present_b
+        same = a.indicator[:, s, None] == b.indicator[None, :, s]
+
+        t_dist = np.minimum(1.0, np.abs(a.threshold[:, s, None] - b.threshold[None, :, s]))
+        p_sum = np.abs(a.params[:, None, s, :] - b.params[None, :, s, :]).sum(axis=2)
+        n_params = a.n_params[:, s, None]
+        p_dist = np.where(n_params > 0, p_sum / np.maximum(n_params, 1), 0.5)
+        gene = (
+            _W_INDICATOR * ~same
+            + _W_CONDITION * (a.condition[:, s, None] != b.condition[None, :, s])
+            + np.where(same, _W_THRESHOLD * t_dist + _W_PARAMS * p_dist, _W_THRESHOLD + _W_PARAMS)
+        ) / total_weight
+
+        dist_sum += np.where(both, gene, np.where(either, 1.0, 0.0))
+        count += either
+    return dist_sum, count
+
+
+@dataclass(frozen=True, slots=True)
+class ChromosomeFeatures:
+    """Fixed-width numeric/categorical encoding of a batch of chromosomes.
+
+    Built with :func:`encode_chromosomes`; compared with
+    :func:`distance_matrix`. Rows can be selected with :meth:`take` and
+    batches joined with :meth:`concat` for incremental updates.
+    """
+
+    entry: _GeneBlock
+    exit: _GeneBlock
+    direction: NDArray[np.int64]
+    stop_loss: NDArray[np.float64]  # divided by SL range
+    take_profit: NDArray[np.float64]  # divided by TP range
+
+    def __len__(self) -> int:
+        return len(self.direction)
+
+    def take(self, rows: Any) -> ChromosomeFeatures:
+        """Subset of rows (index array, list or slice)."""
+        return ChromosomeFeatures(
+            self.entry.take(rows),
+            self.exit.take(rows),
+            self.direction[rows],
+            self.stop_loss[rows],
+            self.take_profit[rows],
+        )
+
+    def concat(self, other: ChromosomeFeatures) -> ChromosomeFeatures:
+        """Rows of ``self`` followed by rows of ``other``."""
+        return ChromosomeFeatures(
+            self.entry.concat(other.entry),
+            self.exit.concat(other.exit),
+            np.concatenate([self.direction, other.direction]),
+            np.concatenate([self.stop_loss, other.stop_loss]),
+            np.concatenate([self.take_profit, other.take_profit]),
+        )
+
+
+def encode_chromosomes(chromosomes: Sequence[StrategyChromosome]) -> ChromosomeFeatures:
+    """Encode chromosomes for :func:`distance_matrix`."""
+    _ensure_pool()
+    directions = [
+        c.direction.value if hasattr(c.direction, "value") else str(c.direction)
+        for c in chromosomes
+    ]
+    return ChromosomeFeatures(
+        entry=_GeneBlock.encode([c.entry_genes for c in chromosomes], MAX_ENTRY_GENES),
+        exit=_GeneBlock.encode([c.exit_genes for c in chromosomes], MAX_EXIT_GENES),
+        direction=np.array(
+            [_DIRECTION_CODES.get(d, _UNKNOWN_DIRECTION) for d in directions], dtype=np.int64
+        ),
+        stop_loss=np.array([c.stop_loss_pct for c in chromosomes], dtype=np.float64)
+        / (SL_RANGE[1] - SL_RANGE[0]),
+        take_profit=np.array([c.take_profit_pct for c in chromosomes], dtype=np.float64)
+        / (TP_RANGE[1] - TP_RANGE[0]),
+    )
+
+
+def distance_matrix(
+    a: ChromosomeFeatures, b: ChromosomeFeatures | None = None
+) -> NDArray[np.float64]:
+    """Pairwise :func:`chromosome_distance` between two encoded batches.
+
+    Args:
+        a: Row chromosomes.
+        b: Column chromosomes (defaults to ``a``).
+
+    Returns:
+        ``(len(a), len(b))`` matrix of Gower distances in [0, 1].
+    """
+    if b is None:
+        b = a
+    out = np.empty((len(a), len(b)))
+    if out.size == 0:
+        return out
+    total_weight = _W_GENES + _W_DIRECTION + _W_SL + _W_TP
+    max_params = max(a.entry.params.shape[2], b.entry.params.shape[2])
+    step = max(1, _BLOCK_CELLS // (len(b) * max_params))
+    for start in range(0, len(a), step):
+        rows = slice(start, start + step)
+        block = a.take(rows)
+        entry_sum, entry_count = _gene_block_distances(block.entry, b.entry)
+        exit_sum, exit_count = _gene_block_distances(block.exit, b.exit)
+        count = entry_count + exit_count
+        avg_gene = np.where(count > 0, (entry_sum + exit_sum) / np.maximum(count, 1), 0.0)
+        weighted = (
+            _W_GENES * avg_gene
+            + _W_DIRECTION * _DIRECTION_TABLE[block.direction[:, None], b.direction[None, :]]
+            + _W_SL * np.abs(block.stop_loss[:, None] - b.stop_loss[None, :])
+            + _W_TP * np.abs(block.take_profit[:, None] - b.take_profit[None, :])
+        )
+        out[rows] = np.minimum(1.0, weighted / total_weight)
+    return out
+
@@ -1,19 +1,30 @@
 """Population diversity metrics and interventions for GA discovery.
 
 Monitors Shannon entropy across indicator types, directions, and conditions.
-Injects random immigrants when diversity drops below threshold.
+Injects random immigrants when diversity drops below threshold, and in
+place of genomes that duplicate a strategy already in the population.
 """
 
 from __future__ import annotations
 
 import math
 from collections import Counter
+from typing import TYPE_CHECKING
 
+from vibe_quant.discovery.canonical import canonicalize, genome_key
 from vibe_quant.discovery.operators import (
     StrategyChromosome,
     _random_chromosome,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Hashable, Iterable
+
+    from vibe_quant.discovery.operators import Direction
+
+# Random draws per duplicate before a repeated genome is kept as-is
+_MAX_IMMIGRANT_ATTEMPTS: int = 10
+
 
 def _shannon_entropy(counts: Counter[str]) -> float:
     """Compute Shannon entropy from a frequency counter.
@@ -113,3 +124,41 @@ def inject_random_immigrants(
             new_pop.append(chrom)
 
     return new_pop
+
+
+def replace_duplicates(
+    population: list[StrategyChromosome],
+    direction_constraint: Direction | None = None,
+    taken: Iterable[Hashable] = (),
+) -> tuple[list[StrategyChromosome], int]:
+    """Canonicalize a population and replace repeated strategies with random immigrants.
+
+    The first chromosome of each :func:`genome_key` class is kept; later
+    ones are swapped for fresh random chromosomes, so every backtest goes
+    to a distinct strategy.
+
+    Args:
+        population: Chromosomes to deduplicate (canonicalized in place).
+        direction_constraint: Direction constraint for new chromosomes.
+        taken: Keys of strategies outside ``population`` to avoid as well.
+
+    Returns:
+        ``(new population, number of duplicates replaced)``.
+    """
+    seen = set(taken)
+    new_pop: list[StrategyChromosome] = []
+    replaced = 0
+    for chrom in population:
+        key = genome_key(canonicalize(chrom))
+        if key in seen:
+            replaced += 1
+            for _ in range(_MAX_IMMIGRANT_ATTEMPTS):
+                chrom = canonicalize(
+                    _random_chromosome(direction_constraint=direction_constraint)
+                )
+                key = genome_key(chrom)
+                if key not in seen:
+                    break
+        seen.add(key)
+        new_pop.append(chrom)
+    return new_pop, replaced
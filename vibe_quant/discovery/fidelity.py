@@ -0,0 +1,147 @@
+"""Multi-fidelity evaluation schedule for genetic discovery.
+
+Each generation is first screened on a short random sub-window of the
+training range: one cheap single-window backtest per individual. Only the
+best-ranked fraction is promoted to the full multi-window backtest, so most
+compute goes to candidates that can actually make the top-K.
+
+The promotion rate adapts between generations. The promoted individuals
+have both a screening and a full score; when their rank correlation is
+high the screen is a good proxy and fewer candidates need promoting, when
+it is low the screen says little and more are promoted.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+# Fewest promoted individuals needed to estimate a rank correlation
+_MIN_CORRELATION_SAMPLES: int = 3
+
+
+def random_sub_window(
+    start_date: str,
+    end_date: str,
+    fraction: float,
+    rng: random.Random | None = None,
+) -> tuple[str, str]:
+    """Pick a random contiguous sub-window covering ``fraction`` of a date range.
+
+    Args:
+        start_date: Range start (ISO format YYYY-MM-DD).
+        end_date: Range end (ISO format YYYY-MM-DD).
+        fraction: Share of the range the window covers, in (0, 1].
+        rng: Random source; the global ``random`` module if None.
+
+    Returns:
+        ``(window_start, window_end)`` as ISO date strings.
+
+    Raises:
+        ValueError: If ``fraction`` is out of range or the range is empty.
+    """
+    if not (0.0 < fraction <= 1.0):
+        msg = f"fraction must be in (0, 1], got {fraction}"
+        raise ValueError(msg)
+    start = datetime.strptime(start_date, "%Y-%m-%d")
+    end = datetime.strptime(end_date, "%Y-%m-%d")
+    total_days = (end - start).days
+    if total_days < 1:
+        msg = f"Empty date range {start_date} → {end_date}"
+        raise ValueError(msg)
+    window_days = max(1, round(total_days * fraction))
+    offset = (rng or random).randint(0, total_days - window_days)
+    window_start = start + timedelta(days=offset)
+    window_end = window_start + timedelta(days=window_days)
+    return window_start.strftime("%Y-%m-%d"), window_end.strftime("%Y-%m-%d")
+
+
+class PromotionSchedule:
+    """Adaptive share of screened individuals promoted to full fidelity.
+
+    Args:
+        rate: Initial promotion rate.
+        min_rate: Lower bound, reached when screening ranks perfectly
+            predict full-fidelity ranks.
+        max_rate: Upper bound, reached when they are uncorrelated.
+        smoothing: Weight of the previous rate in each update (0 = jump
+            straight to the target rate).
+    """
+
+    def __init__(
+        self,
+        rate: float = 0.5,
+        min_rate: float = 0.2,
+        max_rate: float = 1.0,
+        smoothing: float = 0.5,
+    ) -> None:
+        if not (0.0 < min_rate <= max_rate <= 1.0):
+            msg = f"Need 0 < min_rate <= max_rate <= 1, got {min_rate}, {max_rate}"
+            raise ValueError(msg)
+        if not (0.0 <= smoothing < 1.0):
+            msg = f"smoothing must be in [0, 1), got {smoothing}"
+            raise ValueError(msg)
+        self._min_rate = min_rate
+        self._max_rate = max_rate
+        self._smoothing = smoothing
+        self._rate = min(max(rate, min_rate), max_rate)
+        self.last_correlation: float | None = None
+
+    @property
+    def rate(self) -> float:
+        """Current promotion rate."""
+        return self._rate
+
+    def restore(self, rate: float, last_correlation: float | None) -> None:
+        """Reset the adapted state, e.g. from a checkpoint."""
+        self._rate = min(max(rate, self._min_rate), self._max_rate)
+        self.last_correlation = last_correlation
+
+    def promote(self, screen_scores: Sequence[float]) -> list[int]:
+        """Indices of the best screened individuals to promote, ascending.
+
+        At least one individual is always promoted.
+        """
+        n = len(screen_scores)
+        if n == 0:
+            return []
+        count = min(n, max(1, math.ceil(self._rate * n)))
+        ranked = sorted(range(n), key=lambda i: screen_scores[i], reverse=True)
+        return sorted(ranked[:count])
+
+    def update(self, screen_scores: Sequence[float], full_scores: Sequence[float]) -> float:
+        """Adapt the rate from the promoted individuals' paired scores.
+
+        Args:
+            screen_scores: Screening scores of the promoted individuals.
+            full_scores: Their full-fidelity scores, in the same order.
+
+        Returns:
+            The new promotion rate. Unchanged when the Spearman correlation
+            cannot be estimated (too few pairs or constant scores).
+
+        Raises:
+            ValueError: If the two score sequences differ in length.
+        """
+        if len(screen_scores) != len(full_scores):
+            msg = f"Score lengths differ: {len(screen_scores)} != {len(full_scores)}"
+            raise ValueError(msg)
+        if (
+            len(screen_scores) < _MIN_CORRELATION_SAMPLES
+            or len(set(screen_scores)) < 2
+            or len(set(full_scores)) < 2
+        ):
+            return self._rate
+
+        from scipy.stats import spearmanr
+
+        rho = float(spearmanr(screen_scores, full_scores).statistic)
+        self.last_correlation = rho
+        target = self._min_rate + (self._max_rate - self._min_rate) * (1.0 - max(rho, 0.0))
+        self._rate = self._smoothing * self._rate + (1.0 - self._smoothing) * target
+        return self._rate
@@ -73,6 +73,11 @@ SL_TP_RATIO_THRESHOLD: float = 5.0
 SL_TP_RATIO_PENALTY_SCALE: float = 0.02  # per unit above threshold
 SL_TP_RATIO_PENALTY_CAP: float = 0.15
 
+# Evaluation fidelity (multi-fidelity discovery): a cheap screen on a short
+# sub-window vs the full multi-window training-range backtest
+SCREEN_FIDELITY: int = 0
+FULL_FIDELITY: int = 1
+
 
 # ---------------------------------------------------------------------------
 # Result dataclass
@@ -95,6 +100,10 @@ class FitnessResult:
         adjusted_score: Final score after all penalties.
         passed_filters: Whether candidate passed overfitting filters.
         filter_results: Per-filter pass/fail results.
+        consistency: Fraction of evaluation windows with a positive return
+            (1.0 for single-window backtests).
+        fidelity: Evaluation fidelity (``SCREEN_FIDELITY`` or ``FULL_FIDELITY``).
+            Results of different fidelities are never ranked on raw score.
     """
 
     sharpe_ratio: float
@@ -112,6 +121,8 @@ class FitnessResult:
     skewness: float = 0.0
     kurtosis: float = 3.0
     trade_returns: tuple[float, ...] = ()
+    consistency: float = 1.0
+    fidelity: int = FULL_FIDELITY
 
 
 # Pre-compute inverse ranges for normalization to avoid repeated division
@@ -293,10 +304,9 @@ def pareto_rank(population_fitness: Sequence[FitnessResult]) -> list[int]:
     """Assign Pareto front ranks to a population.
 
     Front 0 = non-dominated, front 1 = dominated only by front 0, etc.
-
-    Uses a hybrid approach: for each front extraction, uses Python loops
-    for small remaining populations and vectorized dominance for larger ones.
-    The pareto_dominates() function has been inlined for critical path speed.
+    Objectives are the same as :func:`pareto_dominates` (Sharpe,
+    1 - MaxDD, profit factor); the sort itself is the vectorized
+    :func:`vibe_quant.discovery.nsga.non_dominated_sort`.
 
     Args:
         population_fitness: Fitness results for each individual.
@@ -304,57 +314,39 @@ def pareto_rank(population_fitness: Sequence[FitnessResult]) -> list[int]:
     Returns:
         List of rank integers (0-indexed), parallel to input.
     """
-    n = len(population_fitness)
-    if n == 0:
-        return []
-
-    ranks = [-1] * n
-    remaining = set(range(n))
-    current_rank = 0
-
-    # Pre-extract objectives to avoid repeated attribute access
-    sharpes = [f.sharpe_ratio for f in population_fitness]
-    inv_dds = [1.0 - f.max_drawdown for f in population_fitness]
-    pfs = [f.profit_factor for f in population_fitness]
-
-    while remaining:
-        # Find non-dominated set in remaining
-        front: list[int] = []
-        remaining_list = list(remaining)
-
-        for i in remaining_list:
-            dominated = False
-            s_i = sharpes[i]
-            d_i = inv_dds[i]
-            p_i = pfs[i]
-
-            for j in remaining_list:
-                if i == j:
-                    continue
-                s_j = sharpes[j]
-                d_j = inv_dds[j]
-                p_j = pfs[j]
-
-                # Inline pareto_dominates: j dominates i
-                if (
-                    s_j >= s_i
-                    and d_j >= d_i
-                    and p_j >= p_i
-                    and (s_j > s_i or d_j > d_i or p_j > p_i)
-                ):
-                    dominated = True
-                    break
-
-            if not dominated:
-                front.append(i)
-
-        for i in front:
-            ranks[i] = current_rank
-            remaining.discard(i)
-
-        current_rank += 1
-
-    return ranks
+    from vibe_quant.discovery.nsga import non_dominated_sort
+
+    objectives = [
+        (f.sharpe_ratio, 1.0 - f.max_drawdown, f.profit_factor) for f in population_fitness
+    ]
+    return [int(r) for r in non_dominated_sort(objectives)] if objectives else []
+
+
+def fidelity_ranked_scores(fitness_results: Sequence[FitnessResult]) -> list[float]:
+    """Selection scores that rank every result above all lower-fidelity ones.
+
+    Scores within a fidelity level keep their order; a lower level that
+    overlaps the levels above it is shifted to sit strictly below their
+    minimum. With a single fidelity level this is just ``adjusted_score``.
+
+    Args:
+        fitness_results: Fitness results, possibly of mixed fidelity.
+
+    Returns:
+        Scores parallel to ``fitness_results``, usable by selection operators.
+    """
+    scores = [fr.adjusted_score for fr in fitness_results]
+    levels = sorted({fr.fidelity for fr in fitness_results}, reverse=True)
+    floor: float | None = None
+    for level in levels:
+        idx = [i for i, fr in enumerate(fitness_results) if fr.fidelity == level]
+        top = max(scores[i] for i in idx)
+        if floor is not None and top >= floor:
+            shift = floor - top - 1.0
+            for i in idx:
+                scores[i] += shift
+        floor = min(scores[i] for i in idx)
+    return scores
 
 
 # ---------------------------------------------------------------------------
@@ -468,6 +460,7 @@ def _evaluate_single(
         skewness=float(bt.get("skewness", 0.0)),
         kurtosis=float(bt.get("kurtosis", 3.0)),
         trade_returns=tuple(bt.get("trade_returns", ())),  # type: ignore[arg-type]
+        consistency=float(bt.get("consistency", 1.0)),
     )
 
 
@@ -19,7 +19,7 @@ if TYPE_CHECKING:
     from datetime import date
 
     from vibe_quant.discovery.fitness import FitnessResult
-    from vibe_quant.overfitting.bootstrap_sharpe import BootstrapResult
+    from vibe_quant.overfitting.bootstrap_sharpe import BootstrapMethod, BootstrapResult
     from vibe_quant.overfitting.dsr import DSRResult
     from vibe_quant.overfitting.purged_kfold import (
         BacktestRunner as KFoldRunner,
@@ -62,6 +62,7 @@ class GuardrailConfig:
     require_bootstrap_ci: bool = False  # Bootstrap Sharpe CI filter
     bootstrap_min_sharpe: float = 1.0  # Reject if CI lower bound < this
     bootstrap_ci_level: float = 0.95  # Confidence level (95%)
+    bootstrap_method: BootstrapMethod = "iid"  # "iid", "stationary" or "block" (autocorrelated trades)
 
 
 # ---------------------------------------------------------------------------
@@ -391,6 +392,7 @@ def apply_guardrails(
                 trade_returns,
                 ci_level=config.bootstrap_ci_level,
                 min_sharpe=config.bootstrap_min_sharpe,
+                method=config.bootstrap_method,
             )
             bootstrap_passed = bootstrap_result.passed
             if not bootstrap_passed:
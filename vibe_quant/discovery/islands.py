@@ -0,0 +1,353 @@
+"""Island-model genetic discovery.
+
+Runs several GA populations ("islands") side by side. Every generation the
+islands are evaluated together in one batch on a shared worker pool, so the
+pool stays busy for the whole campaign instead of once per seed. Every
+``migration_interval`` generations each island sends copies of its best
+individuals to its neighbours in the migration topology, where they
+replace the worst residents.
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Literal
+
+from vibe_quant.discovery.operators import initialize_population
+from vibe_quant.discovery.pipeline import DiscoveryPipeline, GenerationResult
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+    from vibe_quant.discovery.fitness import FitnessResult
+    from vibe_quant.discovery.operators import StrategyChromosome
+    from vibe_quant.discovery.pipeline import DiscoveryConfig, DiscoveryResult
+
+logger = logging.getLogger(__name__)
+
+MigrationTopology = Literal["ring", "fully_connected", "random"]
+MIGRATION_TOPOLOGIES: tuple[MigrationTopology, ...] = ("ring", "fully_connected", "random")
+
+
+@dataclass(frozen=True, slots=True)
+class IslandConfig:
+    """Configuration for island-model discovery.
+
+    Attributes:
+        num_islands: Number of concurrently evolving populations.
+        migration_interval: Generations between migrations.
+        migration_size: Individuals each island sends per migration.
+        topology: Who sends to whom: ``ring`` (to the next island),
+            ``fully_connected`` (to every other island) or ``random`` (to
+            one random other island, redrawn each migration).
+        seed: Seed for the global RNG used by the GA operators.
+    """
+
+    num_islands: int = 4
+    migration_interval: int = 3
+    migration_size: int = 2
+    topology: MigrationTopology = "ring"
+    seed: int = 42
+
+    def __post_init__(self) -> None:
+        errors: list[str] = []
+        if self.num_islands < 1:
+            errors.append("num_islands must be >= 1")
+        if self.migration_interval < 1:
+            errors.append("migration_interval must be >= 1")
+        if self.migration_size < 0:
+            errors.append("migration_size must be >= 0")
+        if self.topology not in MIGRATION_TOPOLOGIES:
+            errors.append(f"topology must be one of {MIGRATION_TOPOLOGIES}")
+        if errors:
+            raise ValueError("; ".join(errors))
+
+
+def migration_targets(
+    topology: MigrationTopology,
+    num_islands: int,
+    rng: random.Random | None = None,
+) -> dict[int, list[int]]:
+    """Map each island to the islands it sends emigrants to.
+
+    Args:
+        topology: Migration topology.
+        num_islands: Number of islands.
+        rng: Random source for the ``random`` topology.
+
+    Returns:
+        Source island index -> target island indices.
+    """
+    if num_islands < 2:
+        return {i: [] for i in range(num_islands)}
+    if topology == "ring":
+        return {i: [(i + 1) % num_islands] for i in range(num_islands)}
+    if topology == "fully_connected":
+        return {i: [j for j in range(num_islands) if j != i] for i in range(num_islands)}
+    rng = rng or random.Random()
+    return {i: [rng.choice([j for j in range(num_islands) if j != i])] for i in range(num_islands)}
+
+
+def migrate(
+    populations: list[list[StrategyChromosome]],
+    fitness: list[list[FitnessResult]],
+    targets: dict[int, list[int]],
+    migration_size: int,
+) -> int:
+    """Copy each island's best individuals over its targets' worst, in place.
+
+    Emigrants are chosen from a snapshot taken before any replacement, so
+    the outcome does not depend on island order. Migrants keep their
+    fitness, letting selection in the receiving island use them at once.
+    At most ``len(population) - 1`` residents of an island are replaced.
+
+    Args:
+        populations: Evaluated population per island.
+        fitness: Fitness results parallel to ``populations``.
+        targets: Source island -> target islands (see :func:`migration_targets`).
+        migration_size: Individuals sent by each island per target.
+
+    Returns:
+        Number of individuals migrated.
+    """
+    if migration_size <= 0:
+        return 0
+
+    emigrants: list[list[tuple[StrategyChromosome, FitnessResult]]] = []
+    for pop, frs in zip(populations, fitness, strict=True):
+        ranked = sorted(range(len(pop)), key=lambda i: frs[i].adjusted_score, reverse=True)
+        emigrants.append([(pop[i].clone(), frs[i]) for i in ranked[:migration_size]])
+
+    incoming: dict[int, list[tuple[StrategyChromosome, FitnessResult]]] = {}
+    for source, dests in targets.items():
+        for dest in dests:
+            incoming.setdefault(dest, []).extend(emigrants[source])
+
+    moved = 0
+    for dest, migrants in incoming.items():
+        pop, frs = populations[dest], fitness[dest]
+        migrants = sorted(migrants, key=lambda m: m[1].adjusted_score, reverse=True)
+        migrants = migrants[: max(0, len(pop) - 1)]
+        worst = sorted(range(len(pop)), key=lambda i: frs[i].adjusted_score)
+        for slot, (chrom, fr) in zip(worst, migrants, strict=False):
+            pop[slot] = chrom.clone()
+            frs[slot] = fr
+            moved += 1
+    return moved
+
+
+class IslandModel:
+    """Island-model GA sharing one worker pool across all islands.
+
+    Each island evolves like a :class:`DiscoveryPipeline` population
+    (same selection, crowding and immigrant injection). Convergence is
+    judged on the best score across all islands, and the final top-K,
+    guardrails and holdout/cross-window/WFA validation run once on the
+    merged pool of every island's candidates.
+
+    Args:
+        config: Per-island GA configuration (``population_size`` is per island).
+        islands: Island and migration settings.
+        backtest_fn: Backtest callable, as for :class:`DiscoveryPipeline`.
+        progress_file: Single progress JSON covering all islands.
+        holdout_backtest_fn: Optional holdout backtest callable.
+        backtest_fn_factory: Optional factory for cross-window/WFA backtests.
+        seed_chromosomes: Warm-start chromosomes, seeded into the first
+            island only; migration spreads them to the others.
+    """
+
+    def __init__(
+        self,
+        config: DiscoveryConfig,
+        islands: IslandConfig,
+        backtest_fn: Callable[[StrategyChromosome], dict[str, float | int]],
+        *,
+        progress_file: str | Path | None = None,
+        holdout_backtest_fn: Callable[[StrategyChromosome], dict[str, float | int]] | None = None,
+        backtest_fn_factory: Callable[
+            [str, str], Callable[[StrategyChromosome], dict[str, float | int]]
+        ]
+        | None = None,
+        seed_chromosomes: list[StrategyChromosome] | None = None,
+    ) -> None:
+        self.config = config
+        self.islands = islands
+        self._seed_chromosomes = seed_chromosomes
+        self._pipeline = DiscoveryPipeline(
+            config=config,
+            backtest_fn=backtest_fn,
+            progress_file=progress_file,
+            holdout_backtest_fn=holdout_backtest_fn,
+            backtest_fn_factory=backtest_fn_factory,
+        )
+
+    def run(self) -> DiscoveryResult:
+        """Evolve all islands and return the merged discovery result."""
+        cfg = self.config
+        icfg = self.islands
+        pipeline = self._pipeline
+        pipeline._prepare()
+
+        random.seed(icfg.seed)
+        rng = random.Random(icfg.seed)
+        populations = [
+            pipeline._distinct(
+                initialize_population(
+                    cfg.population_size,
+                    direction_constraint=pipeline._direction_constraint,
+                    seed_chromosomes=self._seed_chromosomes if i == 0 else None,
+                )
+            )
+            for i in range(icfg.num_islands)
+        ]
+        island_best: list[list[float]] = [[] for _ in populations]
+        generation_results: list[GenerationResult] = []
+        all_scored: list[tuple[StrategyChromosome, FitnessResult]] = []
+        fitness: list[list[FitnessResult]] = []
+        total_evaluated = 0
+        total_migrated = 0
+        converged = False
+        convergence_gen: int | None = None
+        pipeline_start = time.monotonic()
+
+        logger.info(
+            "=== ISLAND DISCOVERY START: islands=%d pop=%d/island max_gen=%d "
+            "topology=%s migrate %d every %d gens ===",
+            icfg.num_islands,
+            cfg.population_size,
+            cfg.max_generations,
+            icfg.topology,
+            icfg.migration_size,
+            icfg.migration_interval,
+        )
+
+        executor = pipeline._create_executor(
+            cfg.max_workers, cfg.population_size * icfg.num_islands
+        )
+        try:
+            for gen in range(cfg.max_generations):
+                gen_start = time.monotonic()
+
+                # One batch for every island keeps the shared pool saturated
+                flat = [chrom for pop in populations for chrom in pop]
+                flat_fitness, evaluated = pipeline._evaluate(flat, executor)
+                total_evaluated += len(evaluated)
+
+                fitness = []
+                offset = 0
+                for i, pop in enumerate(populations):
+                    frs = flat_fitness[offset : offset + len(pop)]
+                    offset += len(pop)
+                    fitness.append(frs)
+                    island_best[i].append(max(fr.adjusted_score for fr in frs))
+
+                all_scored.extend(
+                    (flat[i].clone(), flat_fitness[i])
+                    for i in evaluated
+                    if flat_fitness[i].adjusted_score > 0
+                )
+
+                scores = [flat_fitness[i].adjusted_score for i in evaluated]
+                best_idx = max(evaluated, key=lambda i: flat_fitness[i].adjusted_score)
+                gen_result = GenerationResult(
+                    generation=gen,
+                    best_fitness=flat_fitness[best_idx].adjusted_score,
+                    mean_fitness=sum(scores) / len(scores),
+                    worst_fitness=min(scores),
+                    best_chromosome=flat[best_idx].clone(),
+                    population_size=len(flat),
+                    num_passed_filters=sum(1 for fr in flat_fitness if fr.passed_filters),
+                )
+                generation_results.append(gen_result)
+
+                gen_elapsed = time.monotonic() - gen_start
+                total_elapsed = time.monotonic() - pipeline_start
+                eta_seconds = total_elapsed / (gen + 1) * (cfg.max_generations - gen - 1)
+                logger.info(
+                    "=== GEN %d/%d === best=%.4f mean=%.4f | islands best=[%s] | "
+                    "gen_time=%.1fs total=%.0fs ETA=%.0fs",
+                    gen + 1,
+                    cfg.max_generations,
+                    gen_result.best_fitness,
+                    gen_result.mean_fitness,
+                    ", ".join(f"{b[-1]:.3f}" for b in island_best),
+                    gen_elapsed,
+                    total_elapsed,
+                    eta_seconds,
+                )
+
+                best_fr = flat_fitness[best_idx]
+                pipeline._write_progress(
+                    generation=gen + 1,
+                    max_generations=cfg.max_generations,
+                    best_fitness=gen_result.best_fitness,
+                    mean_fitness=gen_result.mean_fitness,
+                    worst_fitness=gen_result.worst_fitness,
+                    best_trades=best_fr.total_trades,
+                    best_return=best_fr.total_return,
+                    gen_time=gen_elapsed,
+                    total_elapsed=total_elapsed,
+                    eta_seconds=eta_seconds,
+                    total_evaluated=total_evaluated,
+                    num_islands=icfg.num_islands,
+                    migrated=total_migrated,
+                    islands=[
+                        {
+                            "island": i,
+                            "best_fitness": island_best[i][-1],
+                            "mean_fitness": sum(fr.adjusted_score for fr in frs) / len(frs),
+                        }
+                        for i, frs in enumerate(fitness)
+                    ],
+                )
+
+                if pipeline._check_convergence(generation_results):
+                    converged = True
+                    convergence_gen = gen
+                    logger.info(
+                        "=== CONVERGED at gen %d/%d after %.0fs ===",
+                        gen + 1,
+                        cfg.max_generations,
+                        total_elapsed,
+                    )
+                    break
+                if gen == cfg.max_generations - 1:
+                    break
+
+                if (gen + 1) % icfg.migration_interval == 0:
+                    targets = migration_targets(icfg.topology, icfg.num_islands, rng)
+                    moved = migrate(populations, fitness, targets, icfg.migration_size)
+                    total_migrated += moved
+                    logger.info("  Migration (%s): %d individuals moved", icfg.topology, moved)
+
+                populations = [
+                    pipeline._next_generation(pop, frs)
+                    for pop, frs in zip(populations, fitness, strict=True)
+                ]
+
+            for i, history in enumerate(island_best):
+                logger.info(
+                    "  Island %d: best=%.4f evolution=%s",
+                    i,
+                    max(history, default=0.0),
+                    " → ".join(f"{b:.3f}" for b in history),
+                )
+
+            return pipeline._finalize(
+                population=[chrom for pop in populations for chrom in pop],
+                last_fitness_results=[fr for frs in fitness for fr in frs],
+                all_scored=all_scored,
+                generation_results=generation_results,
+                total_evaluated=total_evaluated,
+                converged=converged,
+                convergence_gen=convergence_gen,
+                pipeline_start=pipeline_start,
+                executor=executor,
+            )
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
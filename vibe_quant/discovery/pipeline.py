@@ -9,18 +9,36 @@ from __future__ import annotations
 
 import json
 import logging
+import math
+import pickle
 import random
 import statistics
 import time
 from collections import Counter
 from concurrent.futures import ProcessPoolExecutor
-from dataclasses import dataclass, field
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import asdict, dataclass, field, replace
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from vibe_quant.discovery.fitness import FitnessResult, evaluate_population
+import numpy as np
+
+from vibe_quant.discovery.checkpoint import DiscoveryCheckpoint, load_checkpoint, save_checkpoint
+from vibe_quant.discovery.fidelity import PromotionSchedule, random_sub_window
+from vibe_quant.discovery.fitness import (
+    SCREEN_FIDELITY,
+    FitnessResult,
+    evaluate_population,
+    fidelity_ranked_scores,
+)
 from vibe_quant.discovery.genome import chromosome_to_dsl
 from vibe_quant.discovery.guardrails import GuardrailConfig, GuardrailResult, apply_guardrails
+from vibe_quant.discovery.nsga import (
+    ParetoArchive,
+    crowded_scores,
+    nsga2_rank,
+    solution_key,
+)
 from vibe_quant.discovery.operators import (
     StrategyChromosome,
     _random_chromosome,
@@ -32,18 +50,25 @@ from vibe_quant.discovery.operators import (
     mutate,
     tournament_select,
 )
+from vibe_quant.discovery.surrogate import KNNSurrogate, predicted_fitness
 from vibe_quant.utils import compute_bar_count
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Sequence
 
+    from vibe_quant.discovery.distance import ChromosomeFeatures
     from vibe_quant.discovery.operators import Direction
+    from vibe_quant.discovery.surrogate import SurrogatePrediction
+    from vibe_quant.overfitting.bootstrap_sharpe import BootstrapMethod
 
 logger = logging.getLogger(__name__)
 
 # Max retries when generating valid offspring via crossover+mutation
 _MAX_OFFSPRING_RETRIES: int = 10
 
+# Candidates encoded per batch when selecting the diverse top-K
+_TOP_K_CHUNK: int = 64
+
 
 # ---------------------------------------------------------------------------
 # Configuration
@@ -69,6 +94,26 @@ class DiscoveryConfig:
         timeframe: Bar timeframe (e.g. "1h").
         start_date: Backtest start date (ISO format).
         end_date: Backtest end date (ISO format).
+        surrogate_eval_fraction: Fraction of each generation to backtest once the
+            surrogate is trained; the rest get predicted fitness. 1.0 disables it.
+        surrogate_exploration: Share of the backtest budget chosen at random
+            rather than by the surrogate.
+        surrogate_min_archive: Backtests collected before screening starts.
+        surrogate_k: Neighbours used per surrogate prediction.
+        multi_objective: Select with NSGA-II rank and crowding distance over
+            Sharpe, drawdown, trade count and window consistency instead of
+            the weighted adjusted_score.
+        pareto_archive_size: Capacity of the cross-generation Pareto archive.
+        fidelity_window_fraction: Screen each generation on a random
+            sub-window covering this share of the training range and give
+            only the best-ranked the full backtest. 1.0 disables it.
+        promotion_rate: Initial share of screened individuals promoted to
+            the full backtest; adapts to how well screening ranks predict
+            full-fidelity ranks.
+        min_promotion_rate: Floor for the adaptive promotion rate.
+        deduplicate_genomes: Canonicalize every population before evaluation
+            and replace chromosomes that compile to an already-present
+            strategy with random immigrants.
     """
 
     population_size: int = 20
@@ -103,7 +148,18 @@ class DiscoveryConfig:
     require_bootstrap_ci: bool = True  # Bootstrap Sharpe CI guardrail
     bootstrap_min_sharpe: float = 1.0  # Reject if CI lower bound < this
     bootstrap_ci_level: float = 0.95  # Confidence level for bootstrap CI
+    bootstrap_method: BootstrapMethod = "iid"  # "iid", "stationary" or "block" resampling
     require_dsr: bool = True  # Deflated Sharpe Ratio guardrail
+    surrogate_eval_fraction: float = 1.0  # <1 = backtest only this fraction per generation
+    surrogate_exploration: float = 0.25  # share of that budget picked at random
+    surrogate_min_archive: int = 30  # backtests before the surrogate starts screening
+    surrogate_k: int = 7  # neighbours per surrogate prediction
+    multi_objective: bool = False  # NSGA-II selection instead of the scalar score
+    pareto_archive_size: int = 100  # max non-dominated solutions kept across generations
+    fidelity_window_fraction: float = 1.0  # <1 = screen on a sub-window this long first
+    promotion_rate: float = 0.5  # initial share promoted to the full backtest
+    min_promotion_rate: float = 0.2  # floor for the adaptive promotion rate
+    deduplicate_genomes: bool = True  # one backtest per distinct strategy
 
     def __post_init__(self) -> None:
         errors: list[str] = []
@@ -132,6 +188,18 @@ class DiscoveryConfig:
             errors.append("top_k must be >= 1")
         if self.train_test_split < 0.0 or self.train_test_split >= 1.0:
             errors.append("train_test_split must be in [0, 1)")
+        if not (0.0 < self.surrogate_eval_fraction <= 1.0):
+            errors.append("surrogate_eval_fraction must be in (0, 1]")
+        if not (0.0 <= self.surrogate_exploration <= 1.0):
+            errors.append("surrogate_exploration must be in [0, 1]")
+        if self.surrogate_k < 1:
+            errors.append("surrogate_k must be >= 1")
+        if self.pareto_archive_size < 1:
+            errors.append("pareto_archive_size must be >= 1")
+        if not (0.0 < self.fidelity_window_fraction <= 1.0):
+            errors.append("fidelity_window_fraction must be in (0, 1]")
+        if not (0.0 < self.min_promotion_rate <= self.promotion_rate <= 1.0):
+            errors.append("need 0 < min_promotion_rate <= promotion_rate <= 1")
         if errors:
             raise ValueError("; ".join(errors))
 
@@ -245,6 +313,7 @@ class DiscoveryResult:
         holdout_results: Per-strategy holdout metrics (parallel to top_strategies). Empty if no split.
         train_dates: (start, end) for train period. None if no split.
         holdout_dates: (start, end) for holdout period. None if no split.
+        pareto_front: Non-dominated archive when multi_objective is enabled.
     """
 
     generations: list[GenerationResult]
@@ -257,6 +326,7 @@ class DiscoveryResult:
     holdout_dates: tuple[str, str] | None = None
     cross_window_results: list[CrossWindowResult] = field(default_factory=list)
     wfa_results: list[WFARollingResult] = field(default_factory=list)
+    pareto_front: list[tuple[StrategyChromosome, FitnessResult]] = field(default_factory=list)
 
 
 def _select_diverse_top_k(
@@ -278,23 +348,107 @@ def _select_diverse_top_k(
     Returns:
         List of up to top_k diverse (chromosome, fitness) tuples.
     """
-    from vibe_quant.discovery.distance import chromosome_distance
+    from vibe_quant.discovery.distance import distance_matrix, encode_chromosomes
 
     selected: list[tuple[StrategyChromosome, FitnessResult | float]] = []
-
-    for chrom, fitness in scored:
+    selected_features: ChromosomeFeatures | None = None
+
+    # Candidates are encoded a chunk at a time: usually the first chunk
+    # fills top_k, so the (possibly huge) tail is never touched.
+    for start in range(0, len(scored), _TOP_K_CHUNK):
+        chunk = scored[start : start + _TOP_K_CHUNK]
+        features = encode_chromosomes([chrom for chrom, _ in chunk])
+        to_selected = (
+            distance_matrix(features, selected_features)
+            if selected_features is not None
+            else np.empty((len(chunk), 0))
+        )
+        within = distance_matrix(features)
+        picked: list[int] = []
+        for i, entry in enumerate(chunk):
+            if len(selected) >= top_k:
+                break
+            if (to_selected[i] >= min_distance).all() and (
+                within[i, picked] >= min_distance
+            ).all():
+                picked.append(i)
+                selected.append(entry)
+        if picked:
+            new = features.take(picked)
+            selected_features = new if selected_features is None else selected_features.concat(new)
         if len(selected) >= top_k:
             break
 
-        is_diverse = all(
-            chromosome_distance(chrom, sel_chrom) >= min_distance
-            for sel_chrom, _ in selected
-        )
+    return selected
 
-        if is_diverse:
-            selected.append((chrom, fitness))
 
-    return selected
+# ---------------------------------------------------------------------------
+# Validation backtests
+# ---------------------------------------------------------------------------
+
+# Recorded when a validation backtest raises
+_FAILED_VALIDATION = HoldoutResult(
+    sharpe_ratio=0.0, max_drawdown=1.0, profit_factor=0.0, total_trades=0, total_return=0.0
+)
+
+
+def _validation_backtest(
+    backtest_fn: Callable[[StrategyChromosome], dict[str, float | int]],
+    chrom: StrategyChromosome,
+) -> HoldoutResult:
+    """Backtest one strategy on one validation window (picklable for workers).
+
+    NaN metrics are replaced with their failure values.
+    """
+    bt = backtest_fn(chrom)
+    sharpe = float(bt.get("sharpe_ratio", 0.0))
+    max_dd = float(bt.get("max_drawdown", 1.0))
+    pf = float(bt.get("profit_factor", 0.0))
+    ret = float(bt.get("total_return", 0.0))
+    return HoldoutResult(
+        sharpe_ratio=0.0 if math.isnan(sharpe) else sharpe,
+        max_drawdown=1.0 if math.isnan(max_dd) else max_dd,
+        profit_factor=0.0 if math.isnan(pf) else pf,
+        total_trades=int(bt.get("total_trades", 0)),
+        total_return=0.0 if math.isnan(ret) else ret,
+    )
+
+
+def _submit_validation(
+    executor: ProcessPoolExecutor | None,
+    backtest_fn: Callable[[StrategyChromosome], dict[str, float | int]],
+    chrom: StrategyChromosome,
+) -> Callable[[], HoldoutResult]:
+    """Queue one validation backtest; the returned callable joins it.
+
+    With an executor the backtest starts right away on the worker pool,
+    otherwise it runs in the driver when joined. Only a task the pool
+    cannot take (a callable that cannot be pickled, a broken pool) falls
+    back to the driver; an exception raised by the backtest itself
+    propagates from the join without a second attempt.
+    """
+    if executor is None:
+        return lambda: _validation_backtest(backtest_fn, chrom)
+    if isinstance(executor, ProcessPoolExecutor):
+        try:
+            pickle.dumps(backtest_fn)
+        except (pickle.PicklingError, AttributeError, TypeError):
+            logger.debug("Validation backtest not picklable; running in driver", exc_info=True)
+            return lambda: _validation_backtest(backtest_fn, chrom)
+    try:
+        future = executor.submit(_validation_backtest, backtest_fn, chrom)
+    except BrokenProcessPool:
+        logger.debug("Validation submit failed; running in driver", exc_info=True)
+        return lambda: _validation_backtest(backtest_fn, chrom)
+
+    def join() -> HoldoutResult:
+        try:
+            return future.result()
+        except BrokenProcessPool:
+            logger.debug("Worker pool broke during validation; retrying", exc_info=True)
+            return _validation_backtest(backtest_fn, chrom)
+
+    return join
 
 
 # ---------------------------------------------------------------------------
@@ -310,6 +464,9 @@ class DiscoveryPipeline:
         backtest_fn: Callable that runs a backtest for a chromosome and returns
             a dict with keys: sharpe_ratio, max_drawdown, profit_factor, total_trades.
         filter_fn: Optional callable for overfitting filter evaluation.
+        checkpoint_file: Where to write a checkpoint after every generation
+            (None disables checkpointing).
+        resume: Continue from ``checkpoint_file`` if it exists.
     """
 
     def __init__(
@@ -322,6 +479,8 @@ class DiscoveryPipeline:
         holdout_backtest_fn: Callable[[StrategyChromosome], dict[str, float | int]] | None = None,
         backtest_fn_factory: Callable[[str, str], Callable[[StrategyChromosome], dict[str, float | int]]] | None = None,
         seed_chromosomes: list[StrategyChromosome] | None = None,
+        checkpoint_file: str | Path | None = None,
+        resume: bool = False,
     ) -> None:
         self.config = config
         self._backtest_fn = backtest_fn
@@ -330,7 +489,22 @@ class DiscoveryPipeline:
         self._holdout_backtest_fn = holdout_backtest_fn
         self._backtest_fn_factory = backtest_fn_factory
         self._seed_chromosomes = seed_chromosomes
+        self._checkpoint_file = Path(checkpoint_file) if checkpoint_file else None
+        self._resume = resume
         self._direction_constraint: Direction | None = None
+        self._surrogate = (
+            KNNSurrogate(k=config.surrogate_k) if config.surrogate_eval_fraction < 1.0 else None
+        )
+        self._pareto_archive = (
+            ParetoArchive(config.pareto_archive_size, timeframe=config.timeframe)
+            if config.multi_objective
+            else None
+        )
+        self._promotion = (
+            PromotionSchedule(config.promotion_rate, config.min_promotion_rate)
+            if config.fidelity_window_fraction < 1.0
+            else None
+        )
 
     # -- public API ---------------------------------------------------------
 
@@ -396,20 +570,14 @@ class DiscoveryPipeline:
             DiscoveryResult containing generation history and top strategies.
         """
         cfg = self.config
-        self._apply_indicator_pool_filter()
-
-        # Parse direction constraint
-        from vibe_quant.discovery.operators import Direction
-        direction_constraint: Direction | None = None
-        if cfg.direction:
-            direction_constraint = Direction(cfg.direction)
-        self._direction_constraint = direction_constraint
+        self._prepare()
 
         population = initialize_population(
             cfg.population_size,
-            direction_constraint=direction_constraint,
+            direction_constraint=self._direction_constraint,
             seed_chromosomes=self._seed_chromosomes,
         )
+        population = self._distinct(population)
         generation_results: list[GenerationResult] = []
         total_evaluated = 0
         last_fitness_results: list[FitnessResult] = []
@@ -445,36 +613,53 @@ class DiscoveryPipeline:
         # overhead (fixes idle workers when pool creation is slower than work)
         executor = self._create_executor(cfg.max_workers, cfg.population_size)
 
-        for gen in range(cfg.max_generations):
+        start_gen = 0
+        checkpoint = self._load_checkpoint() if self._resume else None
+        if checkpoint is not None:
+            population = checkpoint.population
+            last_fitness_results = checkpoint.fitness_results
+            generation_results = checkpoint.generation_results
+            all_scored = checkpoint.all_scored
+            total_evaluated = checkpoint.total_evaluated
+            pipeline_start -= checkpoint.elapsed
+            start_gen = checkpoint.generation + 1
+            logger.info(
+                "Resuming from checkpoint after gen %d/%d (%d evaluated)",
+                start_gen,
+                cfg.max_generations,
+                total_evaluated,
+            )
+            # Finish the checkpointed generation exactly as the original run would have
+            if self._check_convergence(generation_results):
+                converged = True
+                convergence_gen = checkpoint.generation
+                start_gen = cfg.max_generations
+            else:
+                population = self._next_generation(population, last_fitness_results)
+
+        for gen in range(start_gen, cfg.max_generations):
             gen_start = time.monotonic()
 
-            # Evaluate (parallel if max_workers configured)
-            fitness_results = evaluate_population(
-                population,
-                self._backtest_fn,
-                self._filter_fn,
-                max_workers=cfg.max_workers,
-                executor=executor,
-                min_trades=cfg.min_trades,
-                timeframe=cfg.timeframe,
-            )
+            # Evaluate (parallel if max_workers configured). With the surrogate
+            # enabled only part of the population is backtested.
+            fitness_results, evaluated = self._evaluate(population, executor)
             last_fitness_results = fitness_results
-            total_evaluated += len(population)
+            total_evaluated += len(evaluated)
 
             gen_elapsed = time.monotonic() - gen_start
             total_elapsed = time.monotonic() - pipeline_start
 
             # Record per-individual scores (skip zero-fitness to reduce memory)
-            for chrom, fr in zip(population, fitness_results, strict=True):
-                if fr.adjusted_score > 0:
-                    all_scored.append((chrom.clone(), fr))
+            for i in evaluated:
+                if fitness_results[i].adjusted_score > 0:
+                    all_scored.append((population[i].clone(), fitness_results[i]))
 
-            # Build generation metrics
-            scores = [fr.adjusted_score for fr in fitness_results]
-            best_idx = max(range(len(scores)), key=lambda i: scores[i])
+            # Build generation metrics (backtested individuals only)
+            scores = [fitness_results[i].adjusted_score for i in evaluated]
+            best_idx = max(evaluated, key=lambda i: fitness_results[i].adjusted_score)
             gen_result = GenerationResult(
                 generation=gen,
-                best_fitness=scores[best_idx],
+                best_fitness=fitness_results[best_idx].adjusted_score,
                 mean_fitness=sum(scores) / len(scores),
                 worst_fitness=min(scores),
                 best_chromosome=population[best_idx].clone(),
@@ -618,6 +803,15 @@ class DiscoveryPipeline:
                 eta_seconds=eta_seconds,
                 total_evaluated=total_evaluated,
             )
+            self._save_checkpoint(
+                generation=gen,
+                population=population,
+                fitness_results=fitness_results,
+                generation_results=generation_results,
+                all_scored=all_scored,
+                total_evaluated=total_evaluated,
+                elapsed=total_elapsed,
+            )
 
             # Convergence check with progress tracking
             stagnant_gens = self._stagnant_generations(generation_results)
@@ -639,30 +833,242 @@ class DiscoveryPipeline:
                 break
 
             # Evolve next generation (skip on last iteration)
-            population = self._evolve_generation(population, fitness_results)
+            population = self._next_generation(population, fitness_results)
 
-            # Diversity monitoring + immigrant injection
-            from vibe_quant.discovery.diversity import (
-                inject_random_immigrants,
-                population_entropy,
-                should_inject_immigrants,
+        # The pool stays up for the validation backtests of the top strategies
+        try:
+            result = self._finalize(
+                population=population,
+                last_fitness_results=last_fitness_results,
+                all_scored=all_scored,
+                generation_results=generation_results,
+                total_evaluated=total_evaluated,
+                converged=converged,
+                convergence_gen=convergence_gen,
+                pipeline_start=pipeline_start,
+                executor=executor,
             )
-            entropy = population_entropy(population)
-            if should_inject_immigrants(entropy, threshold=cfg.entropy_threshold):
-                scores_for_inject = [fr.adjusted_score for fr in fitness_results]
-                population = inject_random_immigrants(
-                    population, scores_for_inject, fraction=cfg.immigrant_fraction,
-                    direction_constraint=self._direction_constraint,
-                )
-                n_immigrants = max(1, int(len(population) * cfg.immigrant_fraction))
-                logger.info(
-                    "  Diversity intervention: entropy=%.3f < %.1f, injected %d random immigrants",
-                    entropy, cfg.entropy_threshold, n_immigrants,
-                )
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
+        # A finished run must not be resumed into a second finalize
+        if self._checkpoint_file is not None:
+            self._checkpoint_file.unlink(missing_ok=True)
+        return result
+
+    def _prepare(self) -> None:
+        """Apply the indicator pool filter and parse the direction constraint."""
+        self._apply_indicator_pool_filter()
+
+        from vibe_quant.discovery.operators import Direction
+
+        cfg = self.config
+        self._direction_constraint = Direction(cfg.direction) if cfg.direction else None
+        if self._promotion is not None and (
+            self._backtest_fn_factory is None or not (cfg.start_date and cfg.end_date)
+        ):
+            logger.warning(
+                "Multi-fidelity screening needs backtest_fn_factory and start/end dates; "
+                "evaluating every individual at full fidelity"
+            )
+            self._promotion = None
 
-        # Shut down worker pool after all generations complete
-        if executor is not None:
-            executor.shutdown(wait=True)
+    def _evaluate(
+        self,
+        population: list[StrategyChromosome],
+        executor: ProcessPoolExecutor | None,
+    ) -> tuple[list[FitnessResult], list[int]]:
+        """Backtest a population, letting the surrogate skip unpromising members.
+
+        Skipped members get a :func:`predicted_fitness` placeholder so
+        selection can still rank them. Backtested members train the surrogate.
+        With multi-fidelity screening, members not promoted to the full
+        backtest keep their screening result (``SCREEN_FIDELITY``).
+
+        Args:
+            population: Chromosomes to evaluate.
+            executor: Shared worker pool, if any.
+
+        Returns:
+            ``(fitness parallel to population, indices actually backtested)``.
+        """
+        cfg = self.config
+        evaluated = list(range(len(population)))
+        skipped: dict[int, SurrogatePrediction] = {}
+        if self._surrogate is not None and len(self._surrogate) >= cfg.surrogate_min_archive:
+            evaluated, skipped = self._surrogate.screen(
+                population,
+                eval_fraction=cfg.surrogate_eval_fraction,
+                exploration=cfg.surrogate_exploration,
+            )
+
+        screened: dict[int, FitnessResult] = {}
+        if self._promotion is not None and len(evaluated) > 1:
+            screened = self._screen(population, evaluated, executor)
+            promoted = self._promotion.promote([screened[i].adjusted_score for i in evaluated])
+            evaluated = [evaluated[k] for k in promoted]
+
+        results = evaluate_population(
+            [population[i] for i in evaluated],
+            self._backtest_fn,
+            self._filter_fn,
+            max_workers=cfg.max_workers,
+            executor=executor,
+            min_trades=cfg.min_trades,
+            timeframe=cfg.timeframe,
+        )
+        fitness: dict[int, FitnessResult] = dict(zip(evaluated, results, strict=True))
+        if self._surrogate is not None:
+            for i, fr in fitness.items():
+                self._surrogate.add(population[i], fr)
+        if self._pareto_archive is not None:
+            self._pareto_archive.update((population[i], fr) for i, fr in fitness.items())
+        if screened:
+            assert self._promotion is not None
+            rate = self._promotion.rate
+            self._promotion.update(
+                [screened[i].adjusted_score for i in evaluated],
+                [fitness[i].adjusted_score for i in evaluated],
+            )
+            rho = self._promotion.last_correlation
+            logger.info(
+                "  Multi-fidelity: promoted %d/%d at rate %.2f (screen/full rank corr %s) "
+                "-> next rate %.2f",
+                len(evaluated),
+                len(screened),
+                rate,
+                f"{rho:.2f}" if rho is not None else "n/a",
+                self._promotion.rate,
+            )
+            fitness.update({i: fr for i, fr in screened.items() if i not in fitness})
+        if skipped:
+            best_skipped = max(p.score for p in skipped.values())
+            logger.info(
+                "  Surrogate: backtested %d/%d, skipped %d (best predicted score %.4f)",
+                len(evaluated),
+                len(population),
+                len(skipped),
+                best_skipped,
+            )
+            fitness.update({i: predicted_fitness(p) for i, p in skipped.items()})
+        return [fitness[i] for i in range(len(population))], evaluated
+
+    def _screen(
+        self,
+        population: list[StrategyChromosome],
+        indices: list[int],
+        executor: ProcessPoolExecutor | None,
+    ) -> dict[int, FitnessResult]:
+        """Low-fidelity pass: backtest on one random sub-window of the training range.
+
+        The minimum-trade gate is scaled to the window length. Overfitting
+        filters are left to the full backtest, so screened results never
+        count as having passed them.
+        """
+        assert self._backtest_fn_factory is not None
+        cfg = self.config
+        fraction = cfg.fidelity_window_fraction
+        window_start, window_end = random_sub_window(cfg.start_date, cfg.end_date, fraction)
+        logger.info(
+            "  Screening %d individuals on %s → %s", len(indices), window_start, window_end
+        )
+        results = evaluate_population(
+            [population[i] for i in indices],
+            self._backtest_fn_factory(window_start, window_end),
+            max_workers=cfg.max_workers,
+            executor=executor,
+            min_trades=max(1, round(cfg.min_trades * fraction)),
+            timeframe=cfg.timeframe,
+        )
+        return {
+            i: replace(fr, fidelity=SCREEN_FIDELITY, passed_filters=False)
+            for i, fr in zip(indices, results, strict=True)
+        }
+
+    def _next_generation(
+        self,
+        population: list[StrategyChromosome],
+        fitness_results: list[FitnessResult],
+    ) -> list[StrategyChromosome]:
+        """Evolve a generation, injecting random immigrants when diversity collapses.
+
+        Args:
+            population: Current generation chromosomes.
+            fitness_results: Parallel fitness results.
+
+        Returns:
+            The next population.
+        """
+        cfg = self.config
+        population = self._evolve_generation(population, fitness_results)
+
+        # Diversity monitoring + immigrant injection
+        from vibe_quant.discovery.diversity import (
+            inject_random_immigrants,
+            population_entropy,
+            should_inject_immigrants,
+        )
+        entropy = population_entropy(population)
+        if should_inject_immigrants(entropy, threshold=cfg.entropy_threshold):
+            scores_for_inject = [fr.adjusted_score for fr in fitness_results]
+            population = inject_random_immigrants(
+                population, scores_for_inject, fraction=cfg.immigrant_fraction,
+                direction_constraint=self._direction_constraint,
+            )
+            n_immigrants = max(1, int(len(population) * cfg.immigrant_fraction))
+            logger.info(
+                "  Diversity intervention: entropy=%.3f < %.1f, injected %d random immigrants",
+                entropy, cfg.entropy_threshold, n_immigrants,
+            )
+        return self._distinct(population)
+
+    def _distinct(self, population: list[StrategyChromosome]) -> list[StrategyChromosome]:
+        """Canonicalize a population and replace duplicate strategies with immigrants."""
+        if not self.config.deduplicate_genomes:
+            return population
+        from vibe_quant.discovery.diversity import replace_duplicates
+
+        population, replaced = replace_duplicates(
+            population, direction_constraint=self._direction_constraint
+        )
+        if replaced:
+            logger.info(
+                "  Dedup: replaced %d duplicate genomes with random immigrants", replaced
+            )
+        return population
+
+    def _finalize(
+        self,
+        *,
+        population: list[StrategyChromosome],
+        last_fitness_results: list[FitnessResult],
+        all_scored: list[tuple[StrategyChromosome, FitnessResult]],
+        generation_results: list[GenerationResult],
+        total_evaluated: int,
+        converged: bool,
+        convergence_gen: int | None,
+        pipeline_start: float,
+        executor: ProcessPoolExecutor | None = None,
+    ) -> DiscoveryResult:
+        """Select, validate and report the top strategies of a finished search.
+
+        Args:
+            population: Final population.
+            last_fitness_results: Fitness results of the final population.
+            all_scored: Every (chromosome, fitness) with a positive score.
+            generation_results: Per-generation metrics.
+            total_evaluated: Cumulative evaluations.
+            converged: Whether the search stopped on convergence.
+            convergence_gen: Generation index where convergence was detected.
+            pipeline_start: ``time.monotonic()`` at the start of the search.
+            executor: Worker pool of the search. Holdout, cross-window and
+                WFA backtests are all queued on it before any is joined;
+                without one they run sequentially in the driver.
+
+        Returns:
+            DiscoveryResult with top strategies and validation results.
+        """
+        cfg = self.config
 
         # Select top-K with structural diversity enforcement
         all_scored.sort(key=lambda t: t[1].adjusted_score, reverse=True)
@@ -782,19 +1188,17 @@ class DiscoveryPipeline:
         cross_window_results: list[CrossWindowResult] = []
         wfa_results: list[WFARollingResult] = []
 
-        if self._holdout_backtest_fn is not None and top_strategies and cfg.train_test_split > 0:
-            holdout_results = self._evaluate_holdout(top_strategies)
+        run_holdout = (
+            self._holdout_backtest_fn is not None and bool(top_strategies) and cfg.train_test_split > 0
+        )
+        run_cross_windows = bool(
+            cfg.cross_window_months and self._backtest_fn_factory is not None and top_strategies
+        )
+        if run_holdout:
             train_dates = (cfg.start_date, cfg.end_date)
             holdout_dates = (cfg.holdout_start_date, cfg.holdout_end_date)
 
-        if (
-            cfg.cross_window_months
-            and self._backtest_fn_factory is not None
-            and top_strategies
-        ):
-            # Don't filter here — just compute results
-            cross_window_results, _ = self._evaluate_cross_windows(top_strategies)
-
+        wfa_windows: list[tuple[str, str]] = []
         if cfg.wfa_oos_step_days > 0:
             skip_reason: str | None = None
             if cfg.train_test_split <= 0:
@@ -808,15 +1212,36 @@ class DiscoveryPipeline:
 
             if skip_reason is None:
                 assert holdout_dates is not None
-                wfa_results, _ = self._evaluate_wfa_rolling(
-                    top_strategies, holdout_dates[0], holdout_dates[1],
-                )
+                wfa_windows = self._wfa_window_dates(*holdout_dates)
+                if not wfa_windows:
+                    logger.warning("WFA: holdout period too short for rolling windows")
             else:
                 logger.warning(
                     "WFA requested (wfa_oos_step_days=%d) but skipped: %s",
                     cfg.wfa_oos_step_days, skip_reason,
                 )
 
+        # Queue every validation backtest before joining any, so the stages
+        # share the worker pool instead of running one after another
+        holdout_pending = self._submit_holdout(top_strategies, executor) if run_holdout else None
+        cross_pending = (
+            self._submit_cross_windows(top_strategies, executor) if run_cross_windows else None
+        )
+        wfa_pending = (
+            self._submit_wfa(top_strategies, wfa_windows, executor) if wfa_windows else None
+        )
+
+        if holdout_pending is not None:
+            holdout_results = self._evaluate_holdout(top_strategies, holdout_pending)
+        if cross_pending is not None:
+            # Don't filter here — just compute results
+            cross_window_results, _ = self._evaluate_cross_windows(top_strategies, cross_pending)
+        if wfa_pending is not None:
+            assert holdout_dates is not None
+            wfa_results, _ = self._evaluate_wfa_rolling(
+                top_strategies, holdout_dates[0], holdout_dates[1], wfa_pending,
+            )
+
         # Filter all arrays in sync: keep only strategies that passed all validations
         if cross_window_results or wfa_results:
             keep = []
@@ -852,52 +1277,49 @@ class DiscoveryPipeline:
             holdout_dates=holdout_dates,
             cross_window_results=cross_window_results,
             wfa_results=wfa_results,
+            pareto_front=self._pareto_archive.members if self._pareto_archive else [],
         )
 
+    def _submit_holdout(
+        self,
+        top_strategies: list[tuple[StrategyChromosome, FitnessResult]],
+        executor: ProcessPoolExecutor | None,
+    ) -> list[Callable[[], HoldoutResult]]:
+        """Queue one holdout backtest per strategy (joined by :meth:`_evaluate_holdout`)."""
+        assert self._holdout_backtest_fn is not None
+        return [
+            _submit_validation(executor, self._holdout_backtest_fn, chrom)
+            for chrom, _ in top_strategies
+        ]
+
     def _evaluate_holdout(
         self,
         top_strategies: list[tuple[StrategyChromosome, FitnessResult]],
+        pending: list[Callable[[], HoldoutResult]] | None = None,
     ) -> list[HoldoutResult]:
         """Evaluate top strategies on holdout (out-of-sample) period.
 
+        Args:
+            top_strategies: Strategies to validate.
+            pending: Already-queued backtests from :meth:`_submit_holdout`;
+                run sequentially in the driver if None.
+
         Returns HoldoutResult for each strategy, parallel to top_strategies.
         """
-        assert self._holdout_backtest_fn is not None
-        holdout_fn = self._holdout_backtest_fn
+        if pending is None:
+            pending = self._submit_holdout(top_strategies, None)
         results: list[HoldoutResult] = []
 
         logger.info("=== HOLDOUT EVALUATION: %d strategies ===", len(top_strategies))
 
-        for rank, (chrom, train_fit) in enumerate(top_strategies, 1):
+        for rank, ((chrom, train_fit), join) in enumerate(
+            zip(top_strategies, pending, strict=True), 1
+        ):
             try:
-                bt = holdout_fn(chrom)
-                import math as _math
-                sharpe = float(bt.get("sharpe_ratio", 0.0))
-                max_dd = float(bt.get("max_drawdown", 1.0))
-                pf = float(bt.get("profit_factor", 0.0))
-                trades = int(bt.get("total_trades", 0))
-                ret = float(bt.get("total_return", 0.0))
-                if _math.isnan(sharpe):
-                    sharpe = 0.0
-                if _math.isnan(max_dd):
-                    max_dd = 1.0
-                if _math.isnan(pf):
-                    pf = 0.0
-                if _math.isnan(ret):
-                    ret = 0.0
-                hr = HoldoutResult(
-                    sharpe_ratio=sharpe,
-                    max_drawdown=max_dd,
-                    profit_factor=pf,
-                    total_trades=trades,
-                    total_return=ret,
-                )
+                hr = join()
             except Exception:
                 logger.warning("Holdout eval failed for %s", chrom.uid, exc_info=True)
-                hr = HoldoutResult(
-                    sharpe_ratio=0.0, max_drawdown=1.0,
-                    profit_factor=0.0, total_trades=0, total_return=0.0,
-                )
+                hr = _FAILED_VALIDATION
             results.append(hr)
 
             # Log train vs holdout comparison
@@ -926,37 +1348,66 @@ class DiscoveryPipeline:
 
         return results
 
+    def _cross_window_dates(self) -> list[tuple[str, str]]:
+        """Original training window followed by one window per month offset."""
+        cfg = self.config
+
+        from datetime import datetime as _dt
+
+        from dateutil.relativedelta import relativedelta
+
+        base_start = _dt.strptime(cfg.start_date, "%Y-%m-%d")
+        base_end = _dt.strptime(cfg.end_date, "%Y-%m-%d")
+
+        windows: list[tuple[str, str]] = [(cfg.start_date, cfg.end_date)]
+        for months in cfg.cross_window_months:
+            ws = (base_start + relativedelta(months=months)).strftime("%Y-%m-%d")
+            we = (base_end + relativedelta(months=months)).strftime("%Y-%m-%d")
+            windows.append((ws, we))
+        return windows
+
+    def _submit_cross_windows(
+        self,
+        top_strategies: list[tuple[StrategyChromosome, FitnessResult]],
+        executor: ProcessPoolExecutor | None,
+    ) -> list[list[Callable[[], HoldoutResult]]]:
+        """Queue every (strategy, shifted window) backtest.
+
+        The original window reuses the training fitness, so only the
+        shifted windows are queued: one list per strategy, in window order.
+        """
+        assert self._backtest_fn_factory is not None
+        shifted = [self._backtest_fn_factory(ws, we) for ws, we in self._cross_window_dates()[1:]]
+        return [
+            [_submit_validation(executor, bt_fn, chrom) for bt_fn in shifted]
+            for chrom, _ in top_strategies
+        ]
+
     def _evaluate_cross_windows(
         self,
         top_strategies: list[tuple[StrategyChromosome, FitnessResult]],
+        pending: list[list[Callable[[], HoldoutResult]]] | None = None,
     ) -> tuple[list[CrossWindowResult], list[tuple[StrategyChromosome, FitnessResult]]]:
         """Evaluate top strategies across shifted time windows.
 
         Creates shifted windows by offsetting start/end dates by N months.
         Filters strategies that don't pass on enough windows.
 
+        Args:
+            top_strategies: Strategies to validate.
+            pending: Already-queued backtests from :meth:`_submit_cross_windows`;
+                run sequentially in the driver if None.
+
         Returns:
             (cross_window_results, filtered_top_strategies)
         """
-        assert self._backtest_fn_factory is not None
         cfg = self.config
         offsets = cfg.cross_window_months
         min_sharpe = cfg.cross_window_min_sharpe
         min_pass = cfg.cross_window_min_pass
-
-        from datetime import datetime as _dt
-
-        from dateutil.relativedelta import relativedelta
-
-        base_start = _dt.strptime(cfg.start_date, "%Y-%m-%d")
-        base_end = _dt.strptime(cfg.end_date, "%Y-%m-%d")
-
-        # Build list of windows: original + shifted
-        windows: list[tuple[str, str]] = [(cfg.start_date, cfg.end_date)]
-        for months in offsets:
-            ws = (base_start + relativedelta(months=months)).strftime("%Y-%m-%d")
-            we = (base_end + relativedelta(months=months)).strftime("%Y-%m-%d")
-            windows.append((ws, we))
+        windows = self._cross_window_dates()
+        if pending is None:
+            pending = self._submit_cross_windows(top_strategies, None)
 
         logger.info(
             "=== CROSS-WINDOW VALIDATION: %d strategies × %d windows ===",
@@ -969,11 +1420,13 @@ class DiscoveryPipeline:
         cross_results: list[CrossWindowResult] = []
         filtered: list[tuple[StrategyChromosome, FitnessResult]] = []
 
-        for rank, (chrom, train_fit) in enumerate(top_strategies, 1):
+        for rank, ((chrom, train_fit), joins) in enumerate(
+            zip(top_strategies, pending, strict=True), 1
+        ):
             window_hrs: list[HoldoutResult] = []
             passes = 0
 
-            for w_idx, (ws, we) in enumerate(windows):
+            for w_idx in range(len(windows)):
                 try:
                     if w_idx == 0:
                         # Original window — use train fitness directly
@@ -985,38 +1438,13 @@ class DiscoveryPipeline:
                             total_return=train_fit.total_return,
                         )
                     else:
-                        bt_fn = self._backtest_fn_factory(ws, we)
-                        bt = bt_fn(chrom)
-                        import math as _math
-                        sharpe = float(bt.get("sharpe_ratio", 0.0))
-                        max_dd = float(bt.get("max_drawdown", 1.0))
-                        pf = float(bt.get("profit_factor", 0.0))
-                        trades = int(bt.get("total_trades", 0))
-                        ret = float(bt.get("total_return", 0.0))
-                        if _math.isnan(sharpe):
-                            sharpe = 0.0
-                        if _math.isnan(max_dd):
-                            max_dd = 1.0
-                        if _math.isnan(pf):
-                            pf = 0.0
-                        if _math.isnan(ret):
-                            ret = 0.0
-                        hr = HoldoutResult(
-                            sharpe_ratio=sharpe,
-                            max_drawdown=max_dd,
-                            profit_factor=pf,
-                            total_trades=trades,
-                            total_return=ret,
-                        )
+                        hr = joins[w_idx - 1]()
                 except Exception:
                     logger.warning(
                         "Cross-window eval failed: %s window %d", chrom.uid, w_idx,
                         exc_info=True,
                     )
-                    hr = HoldoutResult(
-                        sharpe_ratio=0.0, max_drawdown=1.0,
-                        profit_factor=0.0, total_trades=0, total_return=0.0,
-                    )
+                    hr = _FAILED_VALIDATION
 
                 window_hrs.append(hr)
                 if hr.total_return > 0 and hr.sharpe_ratio >= min_sharpe:
@@ -1064,11 +1492,45 @@ class DiscoveryPipeline:
 
         return cross_results, filtered
 
+    def _wfa_window_dates(self, holdout_start: str, holdout_end: str) -> list[tuple[str, str]]:
+        """Rolling OOS windows of ``wfa_oos_step_days`` covering the holdout period."""
+        step = self.config.wfa_oos_step_days
+
+        from datetime import datetime as _dt
+        from datetime import timedelta
+
+        start = _dt.strptime(holdout_start, "%Y-%m-%d")
+        end = _dt.strptime(holdout_end, "%Y-%m-%d")
+
+        windows: list[tuple[str, str]] = []
+        current = start
+        while current + timedelta(days=step) <= end:
+            ws = current.strftime("%Y-%m-%d")
+            we = (current + timedelta(days=step)).strftime("%Y-%m-%d")
+            windows.append((ws, we))
+            current += timedelta(days=step)
+        return windows
+
+    def _submit_wfa(
+        self,
+        top_strategies: list[tuple[StrategyChromosome, FitnessResult]],
+        windows: list[tuple[str, str]],
+        executor: ProcessPoolExecutor | None,
+    ) -> list[list[Callable[[], HoldoutResult]]]:
+        """Queue every (strategy, OOS window) backtest, one list per strategy."""
+        assert self._backtest_fn_factory is not None
+        window_fns = [self._backtest_fn_factory(ws, we) for ws, we in windows]
+        return [
+            [_submit_validation(executor, bt_fn, chrom) for bt_fn in window_fns]
+            for chrom, _ in top_strategies
+        ]
+
     def _evaluate_wfa_rolling(
         self,
         top_strategies: list[tuple[StrategyChromosome, FitnessResult]],
         holdout_start: str,
         holdout_end: str,
+        pending: list[list[Callable[[], HoldoutResult]]] | None = None,
     ) -> tuple[list[WFARollingResult], list[tuple[StrategyChromosome, FitnessResult]]]:
         """Walk-Forward rolling OOS validation.
 
@@ -1076,28 +1538,20 @@ class DiscoveryPipeline:
         and evaluates each strategy on every window. Filters strategies that
         don't meet wfa_min_consistency.
 
+        Args:
+            top_strategies: Strategies to validate.
+            holdout_start: Holdout period start (ISO date).
+            holdout_end: Holdout period end (ISO date).
+            pending: Already-queued backtests from :meth:`_submit_wfa`;
+                run sequentially in the driver if None.
+
         Returns:
             (wfa_results, filtered_strategies)
         """
-        assert self._backtest_fn_factory is not None
         cfg = self.config
         step = cfg.wfa_oos_step_days
         min_consistency = cfg.wfa_min_consistency
-
-        from datetime import datetime as _dt
-        from datetime import timedelta
-
-        start = _dt.strptime(holdout_start, "%Y-%m-%d")
-        end = _dt.strptime(holdout_end, "%Y-%m-%d")
-
-        # Generate rolling OOS windows
-        windows: list[tuple[str, str]] = []
-        current = start
-        while current + timedelta(days=step) <= end:
-            ws = current.strftime("%Y-%m-%d")
-            we = (current + timedelta(days=step)).strftime("%Y-%m-%d")
-            windows.append((ws, we))
-            current += timedelta(days=step)
+        windows = self._wfa_window_dates(holdout_start, holdout_end)
 
         if not windows:
             logger.warning("WFA: holdout period too short for rolling windows")
@@ -1109,43 +1563,25 @@ class DiscoveryPipeline:
         )
         for i, (ws, we) in enumerate(windows):
             logger.info("  Window %d: %s → %s", i, ws, we)
+        if pending is None:
+            pending = self._submit_wfa(top_strategies, windows, None)
 
         wfa_results: list[WFARollingResult] = []
         filtered: list[tuple[StrategyChromosome, FitnessResult]] = []
 
-        for rank, (chrom, train_fit) in enumerate(top_strategies, 1):
+        for rank, ((chrom, train_fit), joins) in enumerate(
+            zip(top_strategies, pending, strict=True), 1
+        ):
             oos_results: list[HoldoutResult] = []
             profitable = 0
             sharpe_positive = 0
 
-            for ws, we in windows:
+            for join in joins:
                 try:
-                    bt_fn = self._backtest_fn_factory(ws, we)
-                    bt = bt_fn(chrom)
-                    import math as _math
-                    sharpe = float(bt.get("sharpe_ratio", 0.0))
-                    max_dd = float(bt.get("max_drawdown", 1.0))
-                    pf = float(bt.get("profit_factor", 0.0))
-                    trades = int(bt.get("total_trades", 0))
-                    ret = float(bt.get("total_return", 0.0))
-                    if _math.isnan(sharpe):
-                        sharpe = 0.0
-                    if _math.isnan(max_dd):
-                        max_dd = 1.0
-                    if _math.isnan(pf):
-                        pf = 0.0
-                    if _math.isnan(ret):
-                        ret = 0.0
-                    hr = HoldoutResult(
-                        sharpe_ratio=sharpe, max_drawdown=max_dd,
-                        profit_factor=pf, total_trades=trades, total_return=ret,
-                    )
+                    hr = join()
                 except Exception:
                     logger.warning("WFA eval failed: %s", chrom.uid, exc_info=True)
-                    hr = HoldoutResult(
-                        sharpe_ratio=0.0, max_drawdown=1.0,
-                        profit_factor=0.0, total_trades=0, total_return=0.0,
-                    )
+                    hr = _FAILED_VALIDATION
 
                 oos_results.append(hr)
                 if hr.total_return > 0:
@@ -1208,6 +1644,95 @@ class DiscoveryPipeline:
         except Exception:
             logger.debug("Failed to write progress file", exc_info=True)
 
+    def _save_checkpoint(
+        self,
+        *,
+        generation: int,
+        population: list[StrategyChromosome],
+        fitness_results: list[FitnessResult],
+        generation_results: list[GenerationResult],
+        all_scored: list[tuple[StrategyChromosome, FitnessResult]],
+        total_evaluated: int,
+        elapsed: float,
+    ) -> None:
+        """Write the resumable search state after a generation's evaluation."""
+        if self._checkpoint_file is None:
+            return
+        checkpoint = DiscoveryCheckpoint(
+            generation=generation,
+            population=population,
+            fitness_results=fitness_results,
+            generation_results=generation_results,
+            all_scored=all_scored,
+            total_evaluated=total_evaluated,
+            elapsed=elapsed,
+            rng_state=random.getstate(),
+            config=self._config_fingerprint(),
+            surrogate=self._surrogate.entries if self._surrogate is not None else None,
+            pareto_archive=(
+                self._pareto_archive.members if self._pareto_archive is not None else None
+            ),
+            promotion=(
+                (self._promotion.rate, self._promotion.last_correlation)
+                if self._promotion is not None
+                else None
+            ),
+        )
+        try:
+            save_checkpoint(checkpoint, self._checkpoint_file)
+        except OSError:
+            logger.warning("Failed to write checkpoint %s", self._checkpoint_file, exc_info=True)
+
+    def _load_checkpoint(self) -> DiscoveryCheckpoint | None:
+        """Load the checkpoint and restore RNG and adaptive-component state.
+
+        Returns:
+            The checkpoint, or None when there is nothing to resume from.
+
+        Raises:
+            ValueError: If the checkpoint was written with a different config.
+        """
+        if self._checkpoint_file is None:
+            logger.warning("Resume requested without a checkpoint file; starting fresh")
+            return None
+        checkpoint = load_checkpoint(self._checkpoint_file)
+        if checkpoint is None:
+            logger.warning("No checkpoint at %s; starting fresh", self._checkpoint_file)
+            return None
+
+        current = self._config_fingerprint()
+        changed = sorted(
+            key
+            for key in current.keys() | checkpoint.config.keys()
+            if current.get(key) != checkpoint.config.get(key)
+        )
+        if changed:
+            msg = (
+                f"Checkpoint {self._checkpoint_file} was written with a different config: "
+                f"{changed}"
+            )
+            raise ValueError(msg)
+
+        random.setstate(checkpoint.rng_state)
+        if self._surrogate is not None and checkpoint.surrogate is not None:
+            self._surrogate.restore(checkpoint.surrogate)
+        if self._pareto_archive is not None and checkpoint.pareto_archive is not None:
+            self._pareto_archive.update(checkpoint.pareto_archive)
+        if self._promotion is not None and checkpoint.promotion is not None:
+            self._promotion.restore(*checkpoint.promotion)
+        return checkpoint
+
+    def _config_fingerprint(self) -> dict[str, object]:
+        """JSON-normalized config fields that determine the search trajectory.
+
+        ``max_workers`` is left out: results do not depend on the pool size,
+        so a run may resume with a different number of workers.
+        """
+        fields = asdict(self.config)
+        fields.pop("max_workers", None)
+        normalized: dict[str, object] = json.loads(json.dumps(fields))
+        return normalized
+
     # -- internal -----------------------------------------------------------
 
     def _evolve_generation(
@@ -1215,7 +1740,7 @@ class DiscoveryPipeline:
         population: list[StrategyChromosome],
         fitness_results: list[FitnessResult],
     ) -> list[StrategyChromosome]:
-        """Produce next generation via crowding or classic tournament.
+        """Produce next generation via NSGA-II, crowding or classic tournament.
 
         Args:
             population: Current generation chromosomes.
@@ -1225,12 +1750,62 @@ class DiscoveryPipeline:
             New population of the same size.
         """
         cfg = self.config
-        scores = [fr.adjusted_score for fr in fitness_results]
+        if cfg.multi_objective:
+            return self._evolve_nsga2(population, fitness_results)
 
+        scores = fidelity_ranked_scores(fitness_results)
         if cfg.use_crowding:
             return self._evolve_crowding(population, scores)
         return self._evolve_tournament(population, scores)
 
+    def _valid_offspring(self, child: StrategyChromosome) -> tuple[StrategyChromosome, int, bool]:
+        """Re-mutate an invalid child, falling back to a random chromosome.
+
+        Returns:
+            ``(valid child, mutation retries used, whether the random fallback fired)``.
+        """
+        valid = child
+        for attempt in range(_MAX_OFFSPRING_RETRIES):
+            if is_valid_chromosome(valid):
+                return valid, attempt, False
+            valid = mutate(child, self.config.mutation_rate)
+        if is_valid_chromosome(valid):
+            return valid, 0, False
+        return _random_chromosome(direction_constraint=self._direction_constraint), 0, True
+
+    def _evolve_nsga2(
+        self,
+        population: list[StrategyChromosome],
+        fitness_results: list[FitnessResult],
+    ) -> list[StrategyChromosome]:
+        """NSGA-II evolution: (population + Pareto archive) truncated by crowded rank.
+
+        The archive supplies the elitism NSGA-II gets from merging parents
+        and offspring. Survivors are bred with the classic tournament path
+        using crowded scores, so lower front wins and crowding breaks ties.
+        """
+        cfg = self.config
+        archive = self._pareto_archive.members if self._pareto_archive else []
+        pool = list(zip(population, fitness_results, strict=True))
+        seen = {solution_key(chrom, fr) for chrom, fr in pool}
+        pool += [(chrom, fr) for chrom, fr in archive if solution_key(chrom, fr) not in seen]
+        ranks, crowding = nsga2_rank([fr for _, fr in pool], cfg.timeframe)
+        scores = crowded_scores(ranks, crowding)
+
+        survivors = sorted(range(len(pool)), key=lambda i: scores[i], reverse=True)
+        survivors = survivors[: cfg.population_size]
+        logger.info(
+            "  NSGA-II: front0=%d/%d archive=%d fronts=%d",
+            int((ranks == 0).sum()),
+            len(pool),
+            len(archive),
+            int(ranks.max()) + 1 if len(ranks) else 0,
+        )
+        return self._evolve_tournament(
+            [pool[i][0] for i in survivors],
+            [float(scores[i]) for i in survivors],
+        )
+
     def _evolve_tournament(
         self,
         population: list[StrategyChromosome],
@@ -1260,17 +1835,9 @@ class DiscoveryPipeline:
             for child in (child_a, child_b):
                 if remaining <= 0:
                     break
-                valid_child = child
-                for attempt in range(_MAX_OFFSPRING_RETRIES):
-                    if is_valid_chromosome(valid_child):
-                        if attempt > 0:
-                            retries += attempt
-                        break
-                    valid_child = mutate(child, cfg.mutation_rate)
-                else:
-                    if not is_valid_chromosome(valid_child):
-                        valid_child = _random_chromosome(direction_constraint=self._direction_constraint)
-                        random_fallbacks += 1
+                valid_child, attempts, fallback = self._valid_offspring(child)
+                retries += attempts
+                random_fallbacks += fallback
                 new_pop.append(valid_child)
                 remaining -= 1
 
@@ -1337,17 +1904,9 @@ class DiscoveryPipeline:
             # Validate offspring
             children = []
             for child in (child_a, child_b):
-                valid = child
-                for attempt in range(_MAX_OFFSPRING_RETRIES):
-                    if is_valid_chromosome(valid):
-                        if attempt > 0:
-                            retries += attempt
-                        break
-                    valid = mutate(child, cfg.mutation_rate)
-                else:
-                    if not is_valid_chromosome(valid):
-                        valid = _random_chromosome(direction_constraint=self._direction_constraint)
-                        random_fallbacks += 1
+                valid, attempts, fallback = self._valid_offspring(child)
+                retries += attempts
+                random_fallbacks += fallback
                 children.append(valid)
 
             # Crowding replacement: offspring compete against similar parent
@@ -1441,6 +2000,7 @@ class DiscoveryPipeline:
             require_bootstrap_ci=self.config.require_bootstrap_ci,
             bootstrap_min_sharpe=self.config.bootstrap_min_sharpe,
             bootstrap_ci_level=self.config.bootstrap_ci_level,
+            bootstrap_method=self.config.bootstrap_method,
         )
 
         # Use actual bar count for DSR (not total_trades * 5 proxy)
@@ -1519,7 +2079,7 @@ class DiscoveryPipeline:
         Returns:
             List of DSL YAML dicts for the top-K strategies.
         """
-        scores = [fr.adjusted_score for fr in fitness_results]
+        scores = fidelity_ranked_scores(fitness_results)
         ranked = sorted(range(len(scores)), key=lambda i: scores[i], reverse=True)
         top_indices = ranked[: self.config.top_k]
 
@@ -0,0 +1,428 @@
+"""Asynchronous steady-state genetic discovery.
+
+The generational pipeline waits for the whole population before breeding,
+so workers idle while the slowest backtest of a generation finishes. Here
+every worker is kept busy: whenever a backtest completes, its result is
+merged into the population and a new child is bred from the current
+population and submitted right away.
+
+Replacement follows the configured selection scheme:
+
+- crowding (``use_crowding``): the child competes with the more similar of
+  its two parents and replaces it if at least as fit. A parent replaced
+  while the child was evaluated no longer competes; if both are gone the
+  child competes with the most similar individual;
+- tournament: the child replaces the worst non-elite individual if at least
+  as fit;
+- NSGA-II (``multi_objective``): the individual with the worst crowded rank
+  among population + child is dropped.
+
+The run is budgeted in evaluations (``population_size * max_generations``).
+Every ``population_size`` evaluations counts as one generation for
+metrics, progress and convergence, so results stay comparable with the
+generational pipeline.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import random
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from typing import TYPE_CHECKING
+
+from vibe_quant.discovery.canonical import genome_key
+from vibe_quant.discovery.distance import chromosome_distance
+from vibe_quant.discovery.diversity import replace_duplicates
+from vibe_quant.discovery.fitness import FitnessResult, _evaluate_single
+from vibe_quant.discovery.nsga import crowded_scores, nsga2_rank
+from vibe_quant.discovery.operators import (
+    crossover,
+    initialize_population,
+    mutate,
+    tournament_select,
+)
+from vibe_quant.discovery.pipeline import DiscoveryPipeline, GenerationResult
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from concurrent.futures import Executor
+    from pathlib import Path
+
+    from vibe_quant.discovery.operators import StrategyChromosome
+    from vibe_quant.discovery.pipeline import DiscoveryConfig, DiscoveryResult
+
+logger = logging.getLogger(__name__)
+
+# Fitness assigned when a worker raises instead of returning a result
+_FAILED = FitnessResult(
+    sharpe_ratio=0.0,
+    max_drawdown=1.0,
+    profit_factor=0.0,
+    total_trades=0,
+    total_return=-1.0,
+    complexity_penalty=0.0,
+    overtrade_penalty=0.0,
+    sl_tp_penalty=0.0,
+    raw_score=0.0,
+    adjusted_score=0.0,
+    passed_filters=False,
+    filter_results={},
+)
+
+
+class SteadyStateGA:
+    """Steady-state GA that keeps every worker busy with one backtest each.
+
+    Args:
+        config: GA configuration; ``max_generations`` sets the evaluation
+            budget as ``population_size * max_generations``.
+        backtest_fn: Backtest callable, as for :class:`DiscoveryPipeline`.
+        progress_file: Progress JSON, written once per generation-equivalent.
+        holdout_backtest_fn: Optional holdout backtest callable.
+        backtest_fn_factory: Optional factory for cross-window/WFA backtests.
+        seed_chromosomes: Warm-start chromosomes for the initial population.
+    """
+
+    def __init__(
+        self,
+        config: DiscoveryConfig,
+        backtest_fn: Callable[[StrategyChromosome], dict[str, float | int]],
+        *,
+        progress_file: str | Path | None = None,
+        holdout_backtest_fn: Callable[[StrategyChromosome], dict[str, float | int]] | None = None,
+        backtest_fn_factory: Callable[
+            [str, str], Callable[[StrategyChromosome], dict[str, float | int]]
+        ]
+        | None = None,
+        seed_chromosomes: list[StrategyChromosome] | None = None,
+    ) -> None:
+        self.config = config
+        self._seed_chromosomes = seed_chromosomes
+        self._pipeline = DiscoveryPipeline(
+            config=config,
+            backtest_fn=backtest_fn,
+            progress_file=progress_file,
+            holdout_backtest_fn=holdout_backtest_fn,
+            backtest_fn_factory=backtest_fn_factory,
+        )
+        self._population: list[StrategyChromosome] = []
+        self._fitness: list[FitnessResult | None] = []
+        self.replacements = 0
+
+    # -- evaluation ---------------------------------------------------------
+
+    def _submit(
+        self, executor: Executor | None, chrom: StrategyChromosome
+    ) -> Future[FitnessResult]:
+        cfg = self.config
+        pipeline = self._pipeline
+        if executor is not None:
+            return executor.submit(
+                _evaluate_single,
+                chrom,
+                pipeline._backtest_fn,
+                pipeline._filter_fn,
+                cfg.min_trades,
+                cfg.timeframe,
+            )
+        # Sequential mode: evaluate now and hand back an already-finished future
+        future: Future[FitnessResult] = Future()
+        future.set_result(
+            _evaluate_single(
+                chrom,
+                pipeline._backtest_fn,
+                pipeline._filter_fn,
+                min_trades=cfg.min_trades,
+                timeframe=cfg.timeframe,
+            )
+        )
+        return future
+
+    # -- breeding and replacement --------------------------------------------
+
+    def _evaluated(self) -> list[int]:
+        return [i for i, fr in enumerate(self._fitness) if fr is not None]
+
+    def _score(self, i: int) -> float:
+        fr = self._fitness[i]
+        return fr.adjusted_score if fr is not None else 0.0
+
+    def _breed(self) -> tuple[StrategyChromosome, tuple[StrategyChromosome, StrategyChromosome]]:
+        """One valid child and its parents."""
+        cfg = self.config
+        pipeline = self._pipeline
+        pool = self._evaluated()
+        if cfg.use_crowding and not cfg.multi_objective:
+            i, j = random.sample(pool, 2)
+        else:
+            scores = [self._score(k) for k in pool]
+            candidates = [self._population[k] for k in pool]
+            slot_of = {id(c): k for k, c in zip(pool, candidates, strict=True)}
+            i = slot_of[id(tournament_select(candidates, scores, cfg.tournament_size))]
+            j = slot_of[id(tournament_select(candidates, scores, cfg.tournament_size))]
+
+        parent_a, parent_b = self._population[i], self._population[j]
+        if random.random() < cfg.crossover_rate:
+            child, _ = crossover(parent_a, parent_b)
+        else:
+            child = parent_a.clone()
+        child = mutate(child, cfg.mutation_rate)
+        if pipeline._direction_constraint is not None:
+            child.direction = pipeline._direction_constraint
+        child, _, _ = pipeline._valid_offspring(child)
+        if cfg.deduplicate_genomes:
+            taken = [genome_key(c) for c in self._population]
+            (child,), _ = replace_duplicates(
+                [child], direction_constraint=pipeline._direction_constraint, taken=taken
+            )
+        return child, (parent_a, parent_b)
+
+    def _replace(
+        self,
+        child: StrategyChromosome,
+        fitness: FitnessResult,
+        parents: tuple[StrategyChromosome, StrategyChromosome],
+    ) -> None:
+        """Merge an evaluated child into the population per the selection rules.
+
+        Parents are matched by identity: slots are reused as children
+        replace individuals, so a slot captured at breeding time may hold
+        an unrelated individual by now.
+        """
+        cfg = self.config
+        pool = self._evaluated()
+        if cfg.multi_objective:
+            frs = [self._fitness[k] for k in pool]
+            ranks, crowding = nsga2_rank([*frs, fitness], cfg.timeframe)  # type: ignore[list-item]
+            scores = crowded_scores(ranks, crowding)
+            loser = int(scores.argmin())
+            if loser == len(pool):
+                return
+            slot = pool[loser]
+        elif cfg.use_crowding:
+            rivals = [k for k in pool if any(self._population[k] is p for p in parents)]
+            slot = min(
+                rivals or pool, key=lambda k: chromosome_distance(child, self._population[k])
+            )
+            if fitness.adjusted_score < self._score(slot):
+                return
+        else:
+            protected = set(
+                sorted(pool, key=self._score, reverse=True)[: min(cfg.elite_count, len(pool) - 1)]
+            )
+            slot = min((k for k in pool if k not in protected), key=self._score)
+            if fitness.adjusted_score < self._score(slot):
+                return
+        self._population[slot] = child
+        self._fitness[slot] = fitness
+        self.replacements += 1
+
+    # -- main loop ----------------------------------------------------------
+
+    def run(self) -> DiscoveryResult:
+        """Evolve until the evaluation budget or convergence; return the result."""
+        cfg = self.config
+        pipeline = self._pipeline
+        pipeline._prepare()
+        if cfg.surrogate_eval_fraction < 1.0 or cfg.fidelity_window_fraction < 1.0:
+            logger.warning(
+                "Surrogate and multi-fidelity screening are not used in steady-state mode"
+            )
+
+        self._population = pipeline._distinct(
+            initialize_population(
+                cfg.population_size,
+                direction_constraint=pipeline._direction_constraint,
+                seed_chromosomes=self._seed_chromosomes,
+            )
+        )
+        self._fitness = [None] * len(self._population)
+        budget = cfg.population_size * cfg.max_generations
+
+        executor = pipeline._create_executor(cfg.max_workers, cfg.population_size)
+        workers = 1
+        if executor is not None:
+            workers = cfg.max_workers if cfg.max_workers else (os.cpu_count() or 4)
+            workers = min(workers, cfg.population_size)
+
+        logger.info(
+            "=== STEADY-STATE DISCOVERY START: pop=%d budget=%d evaluations workers=%d ===",
+            cfg.population_size,
+            budget,
+            workers,
+        )
+
+        generation_results: list[GenerationResult] = []
+        all_scored: list[tuple[StrategyChromosome, FitnessResult]] = []
+        total_evaluated = 0
+        submitted = 0
+        converged = False
+        convergence_gen: int | None = None
+        pipeline_start = time.monotonic()
+        window_start = pipeline_start
+        busy_seconds = 0.0
+        # future -> (chromosome, initial slot or None, parents, submit time)
+        in_flight: dict[
+            Future[FitnessResult],
+            tuple[
+                StrategyChromosome,
+                int | None,
+                tuple[StrategyChromosome, StrategyChromosome],
+                float,
+            ],
+        ] = {}
+
+        def submit_next() -> None:
+            nonlocal submitted
+            if submitted < cfg.population_size:
+                slot: int | None = submitted
+                chrom = self._population[submitted]
+                parents = (chrom, chrom)
+            elif len(self._evaluated()) >= 2:
+                slot = None
+                chrom, parents = self._breed()
+            else:
+                return
+            submitted += 1
+            in_flight[self._submit(executor, chrom)] = (chrom, slot, parents, time.monotonic())
+
+        try:
+            while len(in_flight) < workers and submitted < budget:
+                submit_next()
+
+            while in_flight:
+                done, _ = wait(list(in_flight), return_when=FIRST_COMPLETED)
+                for future in done:
+                    chrom, slot, parents, started = in_flight.pop(future)
+                    busy_seconds += time.monotonic() - started
+                    try:
+                        fitness = future.result()
+                    except Exception:
+                        logger.warning("Steady-state eval failed for %s", chrom.uid, exc_info=True)
+                        fitness = _FAILED
+                    total_evaluated += 1
+                    if slot is not None:
+                        self._fitness[slot] = fitness
+                    else:
+                        self._replace(chrom, fitness, parents)
+                    if fitness.adjusted_score > 0:
+                        all_scored.append((chrom.clone(), fitness))
+                    if pipeline._pareto_archive is not None:
+                        pipeline._pareto_archive.update([(chrom, fitness)])
+                    if pipeline._surrogate is not None:
+                        pipeline._surrogate.add(chrom, fitness)
+
+                    if total_evaluated % cfg.population_size == 0:
+                        now = time.monotonic()
+                        gen_result = self._report(
+                            generation=len(generation_results),
+                            total_evaluated=total_evaluated,
+                            budget=budget,
+                            window_seconds=now - window_start,
+                            busy_seconds=busy_seconds,
+                            workers=workers,
+                            total_elapsed=now - pipeline_start,
+                        )
+                        generation_results.append(gen_result)
+                        window_start = now
+                        busy_seconds = 0.0
+                        if not converged and pipeline._check_convergence(generation_results):
+                            converged = True
+                            convergence_gen = len(generation_results) - 1
+                            logger.info(
+                                "=== CONVERGED after %d evaluations; draining %d in flight ===",
+                                total_evaluated,
+                                len(in_flight),
+                            )
+
+                while not converged and len(in_flight) < workers and submitted < budget:
+                    before = submitted
+                    submit_next()
+                    if submitted == before:
+                        break
+
+            evaluated = self._evaluated()
+            logger.info(
+                "=== STEADY-STATE DONE: %d evaluations, %d replacements in %.0fs ===",
+                total_evaluated,
+                self.replacements,
+                time.monotonic() - pipeline_start,
+            )
+            return pipeline._finalize(
+                population=[self._population[i] for i in evaluated],
+                last_fitness_results=[self._fitness[i] for i in evaluated],  # type: ignore[misc]
+                all_scored=all_scored,
+                generation_results=generation_results,
+                total_evaluated=total_evaluated,
+                converged=converged,
+                convergence_gen=convergence_gen,
+                pipeline_start=pipeline_start,
+                executor=executor,
+            )
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
+
+    def _report(
+        self,
+        *,
+        generation: int,
+        total_evaluated: int,
+        budget: int,
+        window_seconds: float,
+        busy_seconds: float,
+        workers: int,
+        total_elapsed: float,
+    ) -> GenerationResult:
+        """Log, write progress and return metrics for the current population."""
+        cfg = self.config
+        evaluated = self._evaluated()
+        scores = [self._score(i) for i in evaluated]
+        best = max(evaluated, key=self._score)
+        best_fr = self._fitness[best]
+        assert best_fr is not None
+        gen_result = GenerationResult(
+            generation=generation,
+            best_fitness=best_fr.adjusted_score,
+            mean_fitness=sum(scores) / len(scores),
+            worst_fitness=min(scores),
+            best_chromosome=self._population[best].clone(),
+            population_size=len(evaluated),
+            num_passed_filters=sum(
+                1 for i in evaluated if (fr := self._fitness[i]) is not None and fr.passed_filters
+            ),
+        )
+        utilization = busy_seconds / (window_seconds * workers) if window_seconds > 0 else 0.0
+        eta_seconds = total_elapsed / total_evaluated * (budget - total_evaluated)
+        logger.info(
+            "=== EVALS %d/%d === best=%.4f mean=%.4f replacements=%d "
+            "worker_util=%.0f%% total=%.0fs ETA=%.0fs",
+            total_evaluated,
+            budget,
+            gen_result.best_fitness,
+            gen_result.mean_fitness,
+            self.replacements,
+            utilization * 100,
+            total_elapsed,
+            eta_seconds,
+        )
+        self._pipeline._write_progress(
+            generation=generation + 1,
+            max_generations=cfg.max_generations,
+            best_fitness=gen_result.best_fitness,
+            mean_fitness=gen_result.mean_fitness,
+            worst_fitness=gen_result.worst_fitness,
+            best_trades=best_fr.total_trades,
+            best_return=best_fr.total_return,
+            gen_time=window_seconds,
+            total_elapsed=total_elapsed,
+            eta_seconds=eta_seconds,
+            total_evaluated=total_evaluated,
+            evaluation_budget=budget,
+            replacements=self.replacements,
+            worker_utilization=round(utilization, 3),
+            mode="steady_state",
+        )
+        return gen_result
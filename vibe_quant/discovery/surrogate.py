@@ -0,0 +1,218 @@
+"""Surrogate fitness model for skipping unpromising backtests.
+
+A k-nearest-neighbour regressor over Gower chromosome distance, trained
+online on the chromosomes a discovery run has already backtested. For a
+new child it predicts the adjusted score (distance-weighted mean of its
+neighbours) and an uncertainty that grows with neighbour disagreement and
+with distance from anything evaluated so far.
+
+:meth:`KNNSurrogate.screen` picks which individuals of a generation get a
+real backtest: a random exploration quota first, so the surrogate cannot
+steer the population into the region it already knows, then the rest by
+upper confidence bound (prediction + uncertainty).
+"""
+
+from __future__ import annotations
+
+import math
+import random
+from collections import deque
+from dataclasses import dataclass
+from itertools import islice
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from vibe_quant.discovery.distance import distance_matrix, encode_chromosomes
+from vibe_quant.discovery.fitness import FitnessResult
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from vibe_quant.discovery.distance import ChromosomeFeatures
+    from vibe_quant.discovery.operators import StrategyChromosome
+
+# Keeps 1/d weights finite for exact matches
+_DISTANCE_EPS: float = 1e-6
+
+
+@dataclass(frozen=True, slots=True)
+class SurrogatePrediction:
+    """Predicted fitness for one chromosome.
+
+    Attributes:
+        score: Predicted adjusted_score.
+        uncertainty: Weighted neighbour score std plus mean neighbour distance.
+        nearest_distance: Distance to the closest evaluated chromosome.
+    """
+
+    score: float
+    uncertainty: float
+    nearest_distance: float
+
+    @property
+    def upper_bound(self) -> float:
+        """Optimistic score used to rank candidates for backtesting."""
+        return self.score + self.uncertainty
+
+
+class KNNSurrogate:
+    """k-NN fitness surrogate over Gower chromosome distance.
+
+    Args:
+        k: Neighbours per prediction.
+        max_archive: Most recent evaluations kept for prediction.
+    """
+
+    def __init__(self, k: int = 7, max_archive: int = 1000) -> None:
+        if k < 1:
+            msg = f"k must be >= 1, got {k}"
+            raise ValueError(msg)
+        self._k = k
+        self._max_archive = max_archive
+        self._archive: deque[StrategyChromosome] = deque(maxlen=max_archive)
+        self._scores: deque[float] = deque(maxlen=max_archive)
+        # Encoded features of the first _n_encoded archive entries, plus
+        # _n_evicted older rows not yet trimmed
+        self._features: ChromosomeFeatures | None = None
+        self._n_encoded = 0
+        self._n_evicted = 0
+
+    def __len__(self) -> int:
+        return len(self._archive)
+
+    def add(self, chromosome: StrategyChromosome, fitness: FitnessResult) -> None:
+        """Record a backtested chromosome and its fitness."""
+        if len(self._archive) == self._max_archive and self._n_encoded > 0:
+            # The deque drops the oldest entry; its features row is trimmed
+            # lazily at the next prediction
+            self._n_encoded -= 1
+            self._n_evicted += 1
+        self._archive.append(chromosome.clone())
+        self._scores.append(fitness.adjusted_score)
+
+    @property
+    def entries(self) -> list[tuple[StrategyChromosome, float]]:
+        """Archived ``(chromosome, adjusted_score)`` pairs, oldest first."""
+        return list(zip(self._archive, self._scores, strict=True))
+
+    def restore(self, entries: Sequence[tuple[StrategyChromosome, float]]) -> None:
+        """Replace the archive with ``entries`` (e.g. loaded from a checkpoint)."""
+        self._archive.clear()
+        self._scores.clear()
+        for chrom, score in entries:
+            self._archive.append(chrom.clone())
+            self._scores.append(score)
+        self._features = None
+        self._n_encoded = 0
+        self._n_evicted = 0
+
+    def _archive_features(self) -> ChromosomeFeatures:
+        """Encode only the entries added since the last prediction."""
+        if self._features is not None and self._n_evicted:
+            self._features = self._features.take(slice(self._n_evicted, None))
+            self._n_evicted = 0
+        if self._features is None or self._n_encoded < len(self._archive):
+            fresh = encode_chromosomes(list(islice(self._archive, self._n_encoded, None)))
+            self._features = fresh if self._features is None else self._features.concat(fresh)
+            self._n_encoded = len(self._archive)
+        return self._features
+
+    def predict(self, chromosome: StrategyChromosome) -> SurrogatePrediction:
+        """Predict the adjusted score of an unevaluated chromosome.
+
+        Raises:
+            ValueError: If nothing has been evaluated yet.
+        """
+        return self.predict_many([chromosome])[0]
+
+    def predict_many(
+        self, chromosomes: Sequence[StrategyChromosome]
+    ) -> list[SurrogatePrediction]:
+        """Predict a batch with one vectorized distance matrix to the archive.
+
+        Raises:
+            ValueError: If nothing has been evaluated yet.
+        """
+        if not self._archive:
+            msg = "Cannot predict with an empty surrogate archive"
+            raise ValueError(msg)
+        if not chromosomes:
+            return []
+
+        dist = distance_matrix(encode_chromosomes(chromosomes), self._archive_features())
+        k = min(self._k, dist.shape[1])
+        nearest = np.argsort(dist, axis=1, kind="stable")[:, :k]
+        d = np.take_along_axis(dist, nearest, axis=1)
+        scores = np.asarray(self._scores)[nearest]
+        weights = 1.0 / (d + _DISTANCE_EPS)
+        total = weights.sum(axis=1)
+        mean = (weights * scores).sum(axis=1) / total
+        var = (weights * (scores - mean[:, None]) ** 2).sum(axis=1) / total
+        uncertainty = np.sqrt(var) + d.mean(axis=1)
+        return [
+            SurrogatePrediction(
+                score=float(mean[i]),
+                uncertainty=float(uncertainty[i]),
+                nearest_distance=float(d[i, 0]),
+            )
+            for i in range(len(chromosomes))
+        ]
+
+    def screen(
+        self,
+        population: Sequence[StrategyChromosome],
+        eval_fraction: float,
+        exploration: float,
+        rng: random.Random | None = None,
+    ) -> tuple[list[int], dict[int, SurrogatePrediction]]:
+        """Choose which individuals to backtest.
+
+        Args:
+            population: Candidates for evaluation.
+            eval_fraction: Fraction of the population to backtest (0, 1].
+            exploration: Fraction of that budget drawn uniformly at random.
+            rng: Random source for the exploration draw (global ``random`` if None).
+
+        Returns:
+            ``(indices to backtest in ascending order, predictions for the rest)``.
+        """
+        n = len(population)
+        budget = min(n, max(1, math.ceil(eval_fraction * n)))
+        if budget >= n or not self._archive:
+            return list(range(n)), {}
+
+        predictions = dict(enumerate(self.predict_many(population)))
+        n_explore = min(budget, math.ceil(exploration * budget))
+        sample = rng.sample if rng is not None else random.sample
+        chosen = set(sample(range(n), n_explore))
+        ranked = sorted(
+            (i for i in range(n) if i not in chosen),
+            key=lambda i: predictions[i].upper_bound,
+            reverse=True,
+        )
+        chosen.update(ranked[: budget - n_explore])
+        skipped = {i: p for i, p in predictions.items() if i not in chosen}
+        return sorted(chosen), skipped
+
+
+def predicted_fitness(prediction: SurrogatePrediction) -> FitnessResult:
+    """Placeholder FitnessResult for a chromosome the surrogate skipped.
+
+    Only ``adjusted_score`` carries information (for selection); it never
+    passes filters and reports no trades, so it cannot reach the top-K.
+    """
+    return FitnessResult(
+        sharpe_ratio=0.0,
+        max_drawdown=1.0,
+        profit_factor=0.0,
+        total_trades=0,
+        total_return=0.0,
+        complexity_penalty=0.0,
+        overtrade_penalty=0.0,
+        sl_tp_penalty=0.0,
+        raw_score=prediction.score,
+        adjusted_score=prediction.score,
+        passed_filters=False,
+        filter_results={"surrogate": False},
+    )
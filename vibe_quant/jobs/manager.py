@@ -15,6 +15,7 @@ from typing import TYPE_CHECKING, Any
 
 from vibe_quant.db.connection import get_connection
 from vibe_quant.db.schema import init_schema
+from vibe_quant.db.state_manager import StateManager
 
 if TYPE_CHECKING:
     import sqlite3
@@ -80,18 +81,27 @@ class BacktestJobManager:
     - Heartbeat protocol (30s updates, 120s stale threshold)
     - Job termination (kill)
     - Stale job cleanup
+
+    Job writes (registration, heartbeats, status changes) go through a
+    StateManager's group-commit queue, so they batch with the process's
+    other state writes instead of contending on a second write connection.
     """
 
-    def __init__(self, db_path: Path | None = None) -> None:
+    def __init__(self, db_path: Path | None = None, state: StateManager | None = None) -> None:
         """Initialize job manager.
 
         Args:
             db_path: Path to database. Uses default if not specified.
+            state: StateManager for the same database whose write queue job
+                writes join. A private one is created (and closed by
+                :meth:`close`) if not given.
         """
         self._db_path = db_path
         self._log_handles: dict[int, Any] = {}  # run_id → file handle
         self._conn: sqlite3.Connection | None = None
         self._start_lock = threading.Lock()
+        self._state = state
+        self._owns_state = state is None
 
     @property
     def conn(self) -> sqlite3.Connection:
@@ -101,11 +111,21 @@ class BacktestJobManager:
             init_schema(self._conn)
         return self._conn
 
+    @property
+    def state(self) -> StateManager:
+        """StateManager whose group-commit queue carries job writes."""
+        if self._state is None:
+            self._state = StateManager(self._db_path)
+        return self._state
+
     def close(self) -> None:
-        """Close database connection."""
+        """Close database connections (and the StateManager if owned)."""
         if self._conn is not None:
             self._conn.close()
             self._conn = None
+        if self._owns_state and self._state is not None:
+            self._state.close()
+            self._state = None
 
     def start_job(
         self,
@@ -180,34 +200,36 @@ class BacktestJobManager:
             # Register job in database while still holding lock to prevent
             # race: two callers both passing the active-job check, both
             # spawning processes, second write clobbering first PID.
-            existing_rec = self.conn.execute(
-                "SELECT id FROM background_jobs WHERE run_id = ?", (run_id,)
-            ).fetchone()
-            if existing_rec:
-                self.conn.execute(
-                    """UPDATE background_jobs
-                       SET pid = ?, job_type = ?, status = 'running',
-                           log_file = ?, started_at = datetime('now'),
-                           heartbeat_at = datetime('now'), completed_at = NULL,
-                           error_message = NULL
-                       WHERE run_id = ?""",
-                    (pid, job_type, log_file, run_id),
-                )
-            else:
-                self.conn.execute(
-                    """INSERT INTO background_jobs
-                       (run_id, pid, job_type, status, log_file, started_at, heartbeat_at)
-                       VALUES (?, ?, ?, 'running', ?, datetime('now'), datetime('now'))""",
-                    (run_id, pid, job_type, log_file),
+            def register(conn: sqlite3.Connection) -> None:
+                existing_rec = conn.execute(
+                    "SELECT id FROM background_jobs WHERE run_id = ?", (run_id,)
+                ).fetchone()
+                if existing_rec:
+                    conn.execute(
+                        """UPDATE background_jobs
+                           SET pid = ?, job_type = ?, status = 'running',
+                               log_file = ?, started_at = datetime('now'),
+                               heartbeat_at = datetime('now'), completed_at = NULL,
+                               error_message = NULL
+                           WHERE run_id = ?""",
+                        (pid, job_type, log_file, run_id),
+                    )
+                else:
+                    conn.execute(
+                        """INSERT INTO background_jobs
+                           (run_id, pid, job_type, status, log_file, started_at, heartbeat_at)
+                           VALUES (?, ?, ?, 'running', ?, datetime('now'), datetime('now'))""",
+                        (run_id, pid, job_type, log_file),
+                    )
+                # Also update backtest_runs table
+                conn.execute(
+                    """UPDATE backtest_runs
+                       SET status = 'running', pid = ?, started_at = datetime('now'), heartbeat_at = datetime('now')
+                       WHERE id = ?""",
+                    (pid, run_id),
                 )
-            # Also update backtest_runs table
-            self.conn.execute(
-                """UPDATE backtest_runs
-                   SET status = 'running', pid = ?, started_at = datetime('now'), heartbeat_at = datetime('now')
-                   WHERE id = ?""",
-                (pid, run_id),
-            )
-            self.conn.commit()
+
+            self.state.write(register)
 
         return pid
 
@@ -354,17 +376,20 @@ class BacktestJobManager:
         Args:
             run_id: Backtest run ID.
         """
-        self.conn.execute(
-            """UPDATE background_jobs SET heartbeat_at = datetime('now')
-               WHERE run_id = ?""",
-            (run_id,),
-        )
-        self.conn.execute(
-            """UPDATE backtest_runs SET heartbeat_at = datetime('now')
-               WHERE id = ?""",
-            (run_id,),
-        )
-        self.conn.commit()
+
+        def beat(conn: sqlite3.Connection) -> None:
+            conn.execute(
+                """UPDATE background_jobs SET heartbeat_at = datetime('now')
+                   WHERE run_id = ?""",
+                (run_id,),
+            )
+            conn.execute(
+                """UPDATE backtest_runs SET heartbeat_at = datetime('now')
+                   WHERE id = ?""",
+                (run_id,),
+            )
+
+        self.state.write(beat)
 
     def mark_completed(self, run_id: int, error: str | None = None) -> None:
         """Mark a job as completed or failed.
@@ -471,13 +496,26 @@ class BacktestJobManager:
 
     def _update_job_status(self, run_id: int, status: JobStatus, error: str | None = None) -> None:
         """Update job status in database."""
-        if status in (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.KILLED):
+        terminal = status in (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.KILLED)
+        if terminal:
             # Close log file handle to prevent FD leak
             handle = self._log_handles.pop(run_id, None)
             if handle is not None:
                 with contextlib.suppress(Exception):
                     handle.close()
-            self.conn.execute(
+
+        def update(conn: sqlite3.Connection) -> None:
+            if not terminal:
+                conn.execute(
+                    "UPDATE background_jobs SET status = ? WHERE run_id = ?",
+                    (status.value, run_id),
+                )
+                conn.execute(
+                    "UPDATE backtest_runs SET status = ? WHERE id = ?",
+                    (status.value, run_id),
+                )
+                return
+            conn.execute(
                 """UPDATE background_jobs
                    SET status = ?, completed_at = datetime('now'),
                        error_message = ?
@@ -486,29 +524,21 @@ class BacktestJobManager:
             )
             # Also update backtest_runs
             if error:
-                self.conn.execute(
+                conn.execute(
                     """UPDATE backtest_runs
                        SET status = ?, completed_at = datetime('now'), error_message = ?
                        WHERE id = ?""",
                     (status.value, error, run_id),
                 )
             else:
-                self.conn.execute(
+                conn.execute(
                     """UPDATE backtest_runs
                        SET status = ?, completed_at = datetime('now')
                        WHERE id = ?""",
                     (status.value, run_id),
                 )
-        else:
-            self.conn.execute(
-                "UPDATE background_jobs SET status = ? WHERE run_id = ?",
-                (status.value, run_id),
-            )
-            self.conn.execute(
-                "UPDATE backtest_runs SET status = ? WHERE id = ?",
-                (status.value, run_id),
-            )
-        self.conn.commit()
+
+        self.state.write(update)
 
     def _record_to_info(self, record: RowDict) -> JobInfo:
         """Convert database record to JobInfo."""
@@ -538,6 +568,7 @@ def run_with_heartbeat(
     run_id: int,
     db_path: Path | None = None,
     interval: int = HEARTBEAT_INTERVAL_SECONDS,
+    state: StateManager | None = None,
 ) -> tuple[BacktestJobManager, Callable[[], None]]:
     """Create job manager and start heartbeat thread for a running job.
 
@@ -549,6 +580,8 @@ def run_with_heartbeat(
         run_id: Backtest run ID.
         db_path: Path to database.
         interval: Heartbeat interval in seconds (default 30).
+        state: The script's StateManager, so heartbeats share its write
+            queue. A private one is used if not given.
 
     Returns:
         Tuple of (BacktestJobManager, stop_fn). Call stop_fn() to terminate
@@ -556,7 +589,7 @@ def run_with_heartbeat(
     """
     import threading
 
-    manager = BacktestJobManager(db_path)
+    manager = BacktestJobManager(db_path, state=state)
     stop_event = threading.Event()
 
     def heartbeat_loop() -> None:
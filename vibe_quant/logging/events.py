@@ -175,6 +175,9 @@ class TimeFilterEvent(Event):
 class OrderEvent(Event):
     """Order submission event.
 
+    The market context fields describe the book at submission; execution
+    model calibration compares fills against them.
+
     Attributes:
         order_id: Unique order identifier.
         side: Order side ('BUY' or 'SELL').
@@ -182,6 +185,11 @@ class OrderEvent(Event):
         price: Order price (limit) or None for market.
         order_type: Order type ('MARKET', 'LIMIT', etc.).
         reason: Why order was submitted.
+        symbol: Instrument identifier.
+        reference_price: Arrival price (quote mid) at submission.
+        avg_volume: Average recent bar volume.
+        volatility: Per-bar log-return volatility of recent bars.
+        spread: Bid-ask spread as a fraction of the mid price.
     """
 
     order_id: str = ""
@@ -190,6 +198,11 @@ class OrderEvent(Event):
     price: float | None = None
     order_type: str = "MARKET"
     reason: str = ""
+    symbol: str = ""
+    reference_price: float | None = None
+    avg_volume: float | None = None
+    volatility: float | None = None
+    spread: float | None = None
 
     def __post_init__(self) -> None:
         """Populate data dict from typed fields."""
@@ -201,6 +214,11 @@ class OrderEvent(Event):
             "price": self.price,
             "order_type": self.order_type,
             "reason": self.reason,
+            "symbol": self.symbol,
+            "reference_price": self.reference_price,
+            "avg_volume": self.avg_volume,
+            "volatility": self.volatility,
+            "spread": self.spread,
         }
 
 
@@ -406,7 +424,19 @@ _EVENT_TYPE_TO_CLASS: dict[EventType, type[Event]] = {
 _EVENT_SUBCLASS_FIELDS: dict[EventType, tuple[str, ...]] = {
     EventType.SIGNAL: ("indicator", "value", "condition", "side"),
     EventType.TIME_FILTER: ("filter_name", "passed", "reason"),
-    EventType.ORDER: ("order_id", "side", "quantity", "price", "order_type", "reason"),
+    EventType.ORDER: (
+        "order_id",
+        "side",
+        "quantity",
+        "price",
+        "order_type",
+        "reason",
+        "symbol",
+        "reference_price",
+        "avg_volume",
+        "volatility",
+        "spread",
+    ),
     EventType.FILL: ("order_id", "fill_price", "quantity", "fees", "slippage"),
     EventType.POSITION_OPEN: (
         "position_id",
@@ -4,6 +4,7 @@ Provides toggleable filters for detecting overfit strategies:
 - Deflated Sharpe Ratio (DSR): multiple testing correction
 - Walk-Forward Analysis (WFA): sliding train/test windows
 - Purged K-Fold CV: cross-validation with embargo
+- Combinatorial Purged CV (CPCV): OOS Sharpe distribution and PBO
 - Pipeline Orchestrator: toggleable filter chain
 """
 
@@ -11,6 +12,13 @@ from vibe_quant.overfitting.bootstrap_sharpe import (
     BootstrapResult,
     bootstrap_sharpe_ci,
 )
+from vibe_quant.overfitting.cpcv import (
+    CombinatorialPurgedCV,
+    CPCVConfig,
+    CPCVResult,
+    GroupResult,
+    PBOResult,
+)
 from vibe_quant.overfitting.dsr import (
     DeflatedSharpeRatio,
     DSRResult,
@@ -43,6 +51,12 @@ __all__ = [
     # Bootstrap Sharpe CI
     "BootstrapResult",
     "bootstrap_sharpe_ci",
+    # Combinatorial Purged CV
+    "CPCVConfig",
+    "CPCVResult",
+    "CombinatorialPurgedCV",
+    "GroupResult",
+    "PBOResult",
     # Deflated Sharpe Ratio
     "DSRResult",
     "DeflatedSharpeRatio",
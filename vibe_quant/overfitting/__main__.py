@@ -22,7 +22,8 @@ from vibe_quant.overfitting.wfa import WFAConfig
 def parse_filters(filters_str: str) -> FilterConfig:
     """Parse comma-separated filter names into FilterConfig.
 
-    Empty string or ``"all"`` enables all filters.
+    Empty string or ``"all"`` enables DSR, WFA and Purged K-Fold; CPCV
+    (``"cpcv"``) is opt-in because it adds one backtest per group.
     """
     if not filters_str or filters_str.lower() == "all":
         return FilterConfig.default()
@@ -35,6 +36,7 @@ def parse_filters(filters_str: str) -> FilterConfig:
         enable_dsr=enable_dsr,
         enable_wfa=enable_wfa,
         enable_purged_kfold=enable_cv,
+        enable_cpcv="cpcv" in filters,
     )
 
 
@@ -118,6 +120,14 @@ def cmd_run(args: argparse.Namespace) -> int:
     wfa_config = build_wfa_config(args)
     if wfa_config is not None:
         config = dataclasses.replace(config, wfa_config=wfa_config)
+    wfa_workers = getattr(args, "wfa_workers", None)
+    if wfa_workers is not None:
+        config = dataclasses.replace(config, wfa_max_workers=wfa_workers)
+    workers = getattr(args, "workers", None)
+    if workers is not None:
+        config = dataclasses.replace(config, max_workers=workers)
+    if getattr(args, "fail_fast", False):
+        config = dataclasses.replace(config, fail_fast=True)
 
     # Parse dates if provided
     data_start = None
@@ -141,14 +151,20 @@ def cmd_run(args: argparse.Namespace) -> int:
         from vibe_quant.overfitting.nt_cv_runner import NTPurgedKFoldRunner
 
         resolved_db = db_path or Path("data/state.db")
-        cv_runner = NTPurgedKFoldRunner(run_id=args.run_id, db_path=resolved_db)
+        cv_runner = NTPurgedKFoldRunner(
+            run_id=args.run_id,
+            db_path=resolved_db,
+            start_date=data_start,
+            end_date=data_end,
+        )
     pipeline = OverfittingPipeline(db_path, wfa_runner=wfa_runner, cv_runner=cv_runner)
 
     try:
         # Run pipeline
         print(f"Running overfitting pipeline on run_id={args.run_id}...")
         print(
-            f"  Filters: DSR={config.enable_dsr}, WFA={config.enable_wfa}, CV={config.enable_purged_kfold}"
+            f"  Filters: DSR={config.enable_dsr}, WFA={config.enable_wfa}, "
+            f"CV={config.enable_purged_kfold}, CPCV={config.enable_cpcv}"
         )
         print()
 
@@ -167,6 +183,7 @@ def cmd_run(args: argparse.Namespace) -> int:
             data_end=data_end,
             n_samples=effective_samples,
             allow_mock=args.allow_mock,
+            resume=getattr(args, "resume", False),
         )
 
         # Print summary
@@ -184,6 +201,8 @@ def cmd_run(args: argparse.Namespace) -> int:
             summary_parts.append(f"{result.passed_wfa} passed WFA")
         if config.enable_purged_kfold:
             summary_parts.append(f"{result.passed_cv} passed PKFOLD")
+        if config.enable_cpcv:
+            summary_parts.append(f"{result.passed_cpcv} passed CPCV")
 
         summary_parts.append(f"{result.passed_all} final")
 
@@ -223,6 +242,19 @@ def cmd_run(args: argparse.Namespace) -> int:
                 f"  PKFOLD (Purged K-Fold CV):  {result.passed_cv:4d} / {result.total_candidates:4d}  ({pct:5.1f}%)"
             )
 
+        if config.enable_cpcv:
+            pct = (
+                (result.passed_cpcv / result.total_candidates * 100)
+                if result.total_candidates
+                else 0
+            )
+            print(
+                f"  CPCV (Combinatorial CV):    {result.passed_cpcv:4d} / {result.total_candidates:4d}  ({pct:5.1f}%)"
+            )
+            if result.pbo is not None:
+                survivors = " (fail-fast survivors only)" if result.pbo_survivors_only else ""
+                print(f"  PBO (Backtest Overfitting): {result.pbo.pbo:.3f}{survivors}")
+
         print()
         pct = (result.passed_all / result.total_candidates * 100) if result.total_candidates else 0
         print(
@@ -357,7 +389,7 @@ def main(argv: list[str] | None = None) -> int:
         "--filters",
         type=str,
         default="all",
-        help="Comma-separated filters: dsr,wfa,pkfold (default: all)",
+        help="Comma-separated filters: dsr,wfa,pkfold,cpcv (default: all = dsr,wfa,pkfold)",
     )
     run_parser.add_argument(
         "--db",
@@ -411,7 +443,8 @@ def main(argv: list[str] | None = None) -> int:
         help=(
             "Use real NT-backed backtest runner for purged k-fold CV. "
             "Loads bar timestamps from the catalog and runs one NT "
-            "screening backtest per fold's train and test span. "
+            "screening backtest per fold's train and test span (one per "
+            "group for --filters cpcv). "
             "--samples is auto-overridden by the catalog's bar count."
         ),
     )
@@ -447,6 +480,27 @@ def main(argv: list[str] | None = None) -> int:
         ),
     )
 
+    run_parser.add_argument(
+        "--wfa-workers",
+        type=int,
+        help="Run WFA windows on N worker processes (0 = cpu_count; default: sequential)",
+    )
+    run_parser.add_argument(
+        "--workers",
+        type=int,
+        help="Run candidate filter stages on N worker processes (0 = cpu_count)",
+    )
+    run_parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Skip WFA/CV for a candidate once an earlier filter rejects it",
+    )
+    run_parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Keep stored per-filter results and only run stages that have none",
+    )
+
     # Report command
     report_parser = subparsers.add_parser("report", help="View filtered candidates")
     report_parser.add_argument(
@@ -6,6 +6,15 @@ bound falls below a threshold are rejected as statistically
 insignificant — they may have achieved high Sharpe by luck from
 a small number of trades.
 
+Resamples are drawn in chunks of at most ``max_chunk_elements`` values, so
+memory stays bounded regardless of ``n_bootstrap * n_trades``; only the
+``n_bootstrap`` Sharpe samples are kept. The IID chunks consume the random
+stream in the same order as one big draw, so results are identical for a
+given seed. For autocorrelated returns, ``method="stationary"`` (Politis &
+Romano, random geometric block lengths) or ``method="block"`` (circular
+moving blocks of fixed length) resample contiguous runs instead of single
+trades.
+
 Usage:
     from vibe_quant.overfitting.bootstrap_sharpe import (
         bootstrap_sharpe_ci, BootstrapResult
@@ -20,11 +29,17 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
+from typing import Literal
 
 import numpy as np
 
 logger = logging.getLogger(__name__)
 
+BootstrapMethod = Literal["iid", "stationary", "block"]
+
+# Upper bound on resampled values held at once (~32 MB of float64 per buffer)
+DEFAULT_MAX_CHUNK_ELEMENTS = 1 << 22
+
 
 @dataclass(frozen=True, slots=True)
 class BootstrapResult:
@@ -69,6 +84,74 @@ def _sharpe_from_returns(returns: np.ndarray) -> float:
     return mean / std * np.sqrt(n)
 
 
+def default_block_length(n: int) -> float:
+    """Rule-of-thumb mean block length, ``n ** (1/3)`` (at least 1)."""
+    return max(1.0, float(np.cbrt(n)))
+
+
+def _block_indices(
+    rng: np.random.Generator,
+    rows: int,
+    n: int,
+    method: BootstrapMethod,
+    block_length: float,
+) -> np.ndarray:
+    """Resample indices of shape ``(rows, n)`` for block bootstraps.
+
+    Each position either starts a new block at a uniform random index or
+    continues the previous block (wrapping around the end of the sample).
+    The stationary bootstrap starts a new block with probability
+    ``1 / block_length``; the moving block bootstrap every ``block_length``
+    positions.
+    """
+    positions = np.arange(n)
+    # One uniform draw per row holds both the block-start flags and the
+    # start indices, so the stream is consumed row by row and results do
+    # not depend on the chunk size.
+    if method == "stationary":
+        u = rng.random((rows, 2 * n))
+        new_block = u[:, :n] < 1.0 / block_length
+        new_block[:, 0] = True
+        u = u[:, n:]
+    else:
+        u = rng.random((rows, n))
+        new_block = np.broadcast_to(positions % max(1, round(block_length)) == 0, (rows, n))
+    starts = np.minimum((u * n).astype(np.int64), n - 1)
+    # Position of the most recent block start at or before each position
+    last_start = np.maximum.accumulate(np.where(new_block, positions, 0), axis=1)
+    offsets = positions - last_start
+    return (np.take_along_axis(starts, last_start, axis=1) + offsets) % n
+
+
+def _bootstrap_sharpes(
+    returns: np.ndarray,
+    rng: np.random.Generator,
+    n_bootstrap: int,
+    method: BootstrapMethod,
+    block_length: float,
+    max_chunk_elements: int,
+) -> np.ndarray:
+    """Sharpe ratio of each resample, computed ``max_chunk_elements`` at a time."""
+    n = len(returns)
+    chunk_rows = max(1, max_chunk_elements // n)
+    boot_sharpes = np.empty(n_bootstrap, dtype=np.float64)
+    for start in range(0, n_bootstrap, chunk_rows):
+        rows = min(chunk_rows, n_bootstrap - start)
+        if method == "iid":
+            indices = rng.integers(0, n, size=(rows, n))
+        else:
+            indices = _block_indices(rng, rows, n, method, block_length)
+        samples = returns[indices]  # (rows, n)
+
+        means = np.mean(samples, axis=1)
+        stds = np.std(samples, axis=1, ddof=1)
+        # Avoid division by zero, then zero out where std was effectively zero
+        safe_stds = np.where(stds < 1e-10, 1.0, stds)
+        sharpes = means / safe_stds * np.sqrt(n)
+        boot_sharpes[start : start + rows] = np.where(stds < 1e-10, 0.0, sharpes)
+    return boot_sharpes
+
+
 def bootstrap_sharpe_ci(
     trade_returns: np.ndarray | list[float],
     *,
@@ -76,6 +159,9 @@ def bootstrap_sharpe_ci(
     ci_level: float = 0.95,
     min_sharpe: float = 1.0,
     seed: int | None = 42,
+    method: BootstrapMethod = "iid",
+    block_length: float | None = None,
+    max_chunk_elements: int = DEFAULT_MAX_CHUNK_ELEMENTS,
 ) -> BootstrapResult:
     """Compute bootstrap confidence interval for trade-level Sharpe.
 
@@ -89,10 +175,30 @@ def bootstrap_sharpe_ci(
         ci_level: Confidence level (default 0.95 = 95% CI).
         min_sharpe: Minimum Sharpe for the lower CI bound to pass.
         seed: Random seed for reproducibility.
+        method: ``"iid"`` resamples single trades; ``"stationary"`` and
+            ``"block"`` resample contiguous runs to preserve serial
+            correlation.
+        block_length: Mean (stationary) or fixed (block) block length.
+            Defaults to :func:`default_block_length`.
+        max_chunk_elements: Maximum resampled values held in memory at
+            once. Does not affect results.
 
     Returns:
         BootstrapResult with CI bounds, pass/fail, and full distribution.
+
+    Raises:
+        ValueError: If method, block_length or max_chunk_elements is invalid.
     """
+    if method not in ("iid", "stationary", "block"):
+        msg = f"method must be 'iid', 'stationary' or 'block', got {method!r}"
+        raise ValueError(msg)
+    if block_length is not None and block_length < 1:
+        msg = f"block_length must be >= 1, got {block_length}"
+        raise ValueError(msg)
+    if max_chunk_elements < 1:
+        msg = f"max_chunk_elements must be >= 1, got {max_chunk_elements}"
+        raise ValueError(msg)
+
     returns = np.asarray(trade_returns, dtype=np.float64)
     n = len(returns)
 
@@ -113,19 +219,14 @@ def bootstrap_sharpe_ci(
     rng = np.random.default_rng(seed)
     observed = _sharpe_from_returns(returns)
 
-    # Vectorized bootstrap: generate all resamples at once
-    # Shape: (n_bootstrap, n) — each row is one bootstrap sample
-    indices = rng.integers(0, n, size=(n_bootstrap, n))
-    samples = returns[indices]  # (n_bootstrap, n)
-
-    # Compute Sharpe for each bootstrap sample
-    means = np.mean(samples, axis=1)
-    stds = np.std(samples, axis=1, ddof=1)
-    # Avoid division by zero
-    safe_stds = np.where(stds < 1e-10, 1.0, stds)
-    boot_sharpes = means / safe_stds * np.sqrt(n)
-    # Zero out where std was effectively zero
-    boot_sharpes = np.where(stds < 1e-10, 0.0, boot_sharpes)
+    boot_sharpes = _bootstrap_sharpes(
+        returns,
+        rng,
+        n_bootstrap,
+        method,
+        block_length if block_length is not None else default_block_length(n),
+        max_chunk_elements,
+    )
 
     alpha = 1.0 - ci_level
     ci_lower = float(np.percentile(boot_sharpes, alpha / 2 * 100))
@@ -134,12 +235,13 @@ def bootstrap_sharpe_ci(
     passed = ci_lower >= min_sharpe
 
     logger.debug(
-        "Bootstrap Sharpe CI: observed=%.2f [%.2f, %.2f] (n=%d, %d bootstrap) → %s",
+        "Bootstrap Sharpe CI: observed=%.2f [%.2f, %.2f] (n=%d, %d %s bootstrap) → %s",
         observed,
         ci_lower,
         ci_upper,
         n,
         n_bootstrap,
+        method,
         "PASS" if passed else "FAIL",
     )
 
@@ -0,0 +1,386 @@
+"""Combinatorial Purged Cross-Validation (CPCV) and PBO.
+
+Implements López de Prado's CPCV ("Advances in Financial Machine Learning",
+ch. 12) and the Probability of Backtest Overfitting of Bailey, Borwein,
+López de Prado & Zhu (2015) on top of per-group backtests.
+
+The sample is cut into N contiguous groups. Each of the C(N, k) ways of
+choosing k test groups is one train/test combination. A backtest is run
+once per group and summarised by its per-period return moments
+(:class:`GroupResult`). Every combination's in-sample and out-of-sample
+Sharpe ratios are then recombined from those moments exactly, so CPCV
+costs N backtests per candidate instead of one per combination.
+
+Groups are backtested in isolation, so no indicator state crosses a group
+boundary. The embargo trims the head of every group after the first, which
+keeps serially correlated bars just after one group out of the next
+regardless of which side of the split each group lands on.
+
+Example with n_groups=6, n_test_groups=2:
+    15 combinations, 5 backtest paths, 6 backtests per candidate.
+"""
+
+from __future__ import annotations
+
+import itertools
+import math
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Protocol
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from numpy.typing import NDArray
+
+_MIN_GROUP_SAMPLES = 10
+
+
+class GroupBacktestRunner(Protocol):
+    """Protocol for per-group backtest execution used by CPCV."""
+
+    def run_group(self, indices: list[int]) -> GroupResult:
+        """Run one backtest over a contiguous group of sample indices.
+
+        Args:
+            indices: Sample indices of the group, in ascending order.
+
+        Returns:
+            GroupResult with the group's per-period return moments.
+        """
+        ...
+
+
+@dataclass(frozen=True)
+class GroupResult:
+    """Per-period return moments of one group's backtest.
+
+    Attributes:
+        group_index: Zero-based group index (set by CPCV).
+        n_obs: Number of return periods in the group.
+        mean_return: Mean per-period return.
+        std_return: Sample standard deviation of per-period returns.
+    """
+
+    group_index: int
+    n_obs: int
+    mean_return: float
+    std_return: float
+
+    @classmethod
+    def from_metrics(
+        cls,
+        group_index: int,
+        sharpe: float,
+        total_return: float,
+        n_obs: int,
+        periods_per_year: float,
+    ) -> GroupResult:
+        """Reconstruct moments from headline metrics.
+
+        For runners that only report an annualized Sharpe ratio and a total
+        return. The per-period mean is ``total_return / n_obs`` (signed by the
+        Sharpe ratio) and the standard deviation is implied by the Sharpe
+        ratio. A zero Sharpe ratio yields zero mean and zero spread.
+
+        Args:
+            group_index: Zero-based group index.
+            sharpe: Annualized Sharpe ratio of the group.
+            total_return: Total return over the group.
+            n_obs: Number of return periods in the group.
+            periods_per_year: Annualization factor of ``sharpe``.
+
+        Returns:
+            GroupResult with implied moments.
+        """
+        n = max(1, n_obs)
+        if sharpe == 0.0 or not math.isfinite(sharpe):
+            return cls(group_index, n, 0.0, 0.0)
+        mean = math.copysign(abs(total_return) / n, sharpe)
+        std = abs(mean) * math.sqrt(periods_per_year) / abs(sharpe)
+        return cls(group_index, n, mean, std)
+
+
+@dataclass(frozen=True)
+class CPCVConfig:
+    """Configuration for Combinatorial Purged Cross-Validation.
+
+    Attributes:
+        n_groups: Number of contiguous groups (N).
+        n_test_groups: Groups per test set (k), 1 <= k < N.
+        embargo_pct: Fraction of total samples dropped from the head of
+            every group after the first.
+        periods_per_year: Annualization factor for Sharpe ratios built from
+            :class:`GroupResult` moments (365 = daily crypto returns).
+        min_oos_sharpe: Minimum mean OOS Sharpe across combinations.
+        min_positive_frac: Minimum fraction of combinations with OOS Sharpe > 0.
+    """
+
+    n_groups: int = 6
+    n_test_groups: int = 2
+    embargo_pct: float = 0.01
+    periods_per_year: float = 365.0
+    min_oos_sharpe: float = 0.5
+    min_positive_frac: float = 0.6
+
+    def __post_init__(self) -> None:
+        """Validate configuration parameters."""
+        if self.n_groups < 2:
+            msg = f"n_groups must be >= 2, got {self.n_groups}"
+            raise ValueError(msg)
+        if not 1 <= self.n_test_groups < self.n_groups:
+            msg = f"n_test_groups must be in [1, {self.n_groups}), got {self.n_test_groups}"
+            raise ValueError(msg)
+        if not 0.0 <= self.embargo_pct < 1.0:
+            msg = f"embargo_pct must be in [0, 1), got {self.embargo_pct}"
+            raise ValueError(msg)
+        if self.periods_per_year <= 0:
+            msg = f"periods_per_year must be > 0, got {self.periods_per_year}"
+            raise ValueError(msg)
+
+    @property
+    def n_combinations(self) -> int:
+        """Number of train/test combinations, C(N, k)."""
+        return math.comb(self.n_groups, self.n_test_groups)
+
+    @property
+    def n_paths(self) -> int:
+        """Number of backtest paths, C(N-1, k-1)."""
+        return math.comb(self.n_groups - 1, self.n_test_groups - 1)
+
+
+@dataclass(frozen=True)
+class CPCVResult:
+    """CPCV result for one candidate.
+
+    Attributes:
+        group_results: Per-group backtest moments (reused for PBO).
+        oos_sharpes: OOS Sharpe of each test combination, in
+            ``itertools.combinations`` order.
+        mean_oos_sharpe: Mean OOS Sharpe across combinations.
+        std_oos_sharpe: Standard deviation of OOS Sharpe across combinations.
+        positive_frac: Fraction of combinations with OOS Sharpe > 0.
+        is_robust: True if mean OOS Sharpe and positive fraction both meet
+            the configured minimums.
+    """
+
+    group_results: list[GroupResult]
+    oos_sharpes: list[float]
+    mean_oos_sharpe: float
+    std_oos_sharpe: float
+    positive_frac: float
+    is_robust: bool
+
+
+@dataclass(frozen=True)
+class PBOResult:
+    """Probability of Backtest Overfitting across a set of candidates.
+
+    Attributes:
+        pbo: Fraction of combinations where the in-sample winner ranks at or
+            below the OOS median (logit <= 0).
+        logits: Relative-rank logit of the in-sample winner per combination.
+        path_sharpes: OOS Sharpe of each CPCV backtest path for the
+            "pick the in-sample best" selection rule.
+        n_candidates: Number of candidates compared.
+    """
+
+    pbo: float
+    logits: list[float]
+    path_sharpes: list[float] = field(default_factory=list)
+    n_candidates: int = 0
+
+
+def _moment_sums(
+    group_results: Sequence[Sequence[GroupResult]],
+) -> tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]]:
+    """(count, sum, sum of squares) arrays of shape (candidates, groups)."""
+    n = np.array([[g.n_obs for g in row] for row in group_results], dtype=np.float64)
+    mean = np.array([[g.mean_return for g in row] for row in group_results], dtype=np.float64)
+    std = np.array([[g.std_return for g in row] for row in group_results], dtype=np.float64)
+    s1 = n * mean
+    s2 = np.maximum(n - 1.0, 0.0) * std**2 + n * mean**2
+    return n, s1, s2
+
+
+def _pooled_sharpe(
+    n: NDArray[np.float64],
+    s1: NDArray[np.float64],
+    s2: NDArray[np.float64],
+    periods_per_year: float,
+) -> NDArray[np.float64]:
+    """Annualized Sharpe of pooled returns from summed moments (elementwise)."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = s1 / n
+        var = (s2 - n * mean**2) / (n - 1.0)
+        sharpe = mean / np.sqrt(np.maximum(var, 0.0)) * math.sqrt(periods_per_year)
+    return np.where(np.isfinite(sharpe), sharpe, 0.0)
+
+
+class CombinatorialPurgedCV:
+    """Combinatorial Purged Cross-Validation over per-group backtests.
+
+    Args:
+        config: CPCV configuration.
+
+    Example:
+        >>> cpcv = CombinatorialPurgedCV(CPCVConfig(n_groups=6, n_test_groups=2))
+        >>> result = cpcv.run(n_samples=5000, runner=runner)
+        >>> result.mean_oos_sharpe, len(result.oos_sharpes)  # 15 combinations
+    """
+
+    def __init__(self, config: CPCVConfig | None = None) -> None:
+        self.config = config or CPCVConfig()
+        combos = list(
+            itertools.combinations(range(self.config.n_groups), self.config.n_test_groups)
+        )
+        # (combinations, groups) boolean test-membership matrix
+        self._test_mask = np.zeros((len(combos), self.config.n_groups), dtype=bool)
+        for c, groups in enumerate(combos):
+            self._test_mask[c, list(groups)] = True
+
+    def groups(self, n_samples: int) -> list[range]:
+        """Split ``n_samples`` into contiguous, embargoed groups.
+
+        Args:
+            n_samples: Total number of samples in the dataset.
+
+        Returns:
+            One index range per group.
+
+        Raises:
+            ValueError: If a group would have too few samples.
+        """
+        n_groups = self.config.n_groups
+        embargo_len = int(n_samples * self.config.embargo_pct)
+        group_size = n_samples // n_groups
+        if group_size - embargo_len < _MIN_GROUP_SAMPLES:
+            msg = (
+                f"Not enough samples ({n_samples}) for {n_groups} groups "
+                f"with embargo={embargo_len}. "
+                f"Need at least {n_groups * (_MIN_GROUP_SAMPLES + embargo_len)}."
+            )
+            raise ValueError(msg)
+        bounds = [i * group_size for i in range(n_groups)] + [n_samples]
+        return [
+            range(bounds[g] + (embargo_len if g > 0 else 0), bounds[g + 1]) for g in range(n_groups)
+        ]
+
+    def run(self, n_samples: int, runner: GroupBacktestRunner) -> CPCVResult:
+        """Backtest each group once and evaluate every combination.
+
+        Args:
+            n_samples: Total number of samples in dataset.
+            runner: Runner executing one backtest per group.
+
+        Returns:
+            CPCVResult for the candidate.
+        """
+        group_results: list[GroupResult] = []
+        for g, indices in enumerate(self.groups(n_samples)):
+            r = runner.run_group(list(indices))
+            group_results.append(GroupResult(g, r.n_obs, r.mean_return, r.std_return))
+        return self.evaluate(group_results)
+
+    def evaluate(self, group_results: Sequence[GroupResult]) -> CPCVResult:
+        """Recombine per-group moments into per-combination OOS Sharpe ratios.
+
+        Args:
+            group_results: One result per group, in group order.
+
+        Returns:
+            CPCVResult with the OOS Sharpe distribution.
+
+        Raises:
+            ValueError: If the number of results doesn't match n_groups.
+        """
+        if len(group_results) != self.config.n_groups:
+            msg = f"Expected {self.config.n_groups} group results, got {len(group_results)}"
+            raise ValueError(msg)
+        n, s1, s2 = _moment_sums([group_results])
+        mask = self._test_mask.astype(np.float64)
+        oos = _pooled_sharpe(mask @ n[0], mask @ s1[0], mask @ s2[0], self.config.periods_per_year)
+
+        mean_sharpe = float(oos.mean())
+        std_sharpe = float(oos.std(ddof=1)) if oos.size > 1 else 0.0
+        positive_frac = float((oos > 0).mean())
+        is_robust = (
+            mean_sharpe >= self.config.min_oos_sharpe
+            and positive_frac >= self.config.min_positive_frac
+        )
+        return CPCVResult(
+            group_results=list(group_results),
+            oos_sharpes=oos.tolist(),
+            mean_oos_sharpe=mean_sharpe,
+            std_oos_sharpe=std_sharpe,
+            positive_frac=positive_frac,
+            is_robust=is_robust,
+        )
+
+    def probability_of_backtest_overfitting(
+        self, group_results: Sequence[Sequence[GroupResult]]
+    ) -> PBOResult:
+        """PBO of selecting the best in-sample candidate.
+
+        For every combination, the candidate with the highest in-sample
+        (train groups) Sharpe is picked and its OOS (test groups) Sharpe is
+        ranked among all candidates. PBO is the fraction of combinations in
+        which that rank falls at or below the median. The winners' test
+        groups are also stitched into the C(N-1, k-1) CPCV backtest paths.
+
+        Args:
+            group_results: Per-candidate group results, shape
+                (candidates, n_groups).
+
+        Returns:
+            PBOResult.
+
+        Raises:
+            ValueError: If fewer than two candidates are given or a row has
+                the wrong number of groups.
+        """
+        n_candidates = len(group_results)
+        if n_candidates < 2:
+            msg = f"PBO needs at least 2 candidates, got {n_candidates}"
+            raise ValueError(msg)
+        if any(len(row) != self.config.n_groups for row in group_results):
+            msg = f"Every candidate needs {self.config.n_groups} group results"
+            raise ValueError(msg)
+
+        ppy = self.config.periods_per_year
+        n, s1, s2 = _moment_sums(group_results)
+        test = self._test_mask.astype(np.float64)
+        train = 1.0 - test
+        # (combinations, candidates)
+        is_sharpe = _pooled_sharpe(train @ n.T, train @ s1.T, train @ s2.T, ppy)
+        oos_sharpe = _pooled_sharpe(test @ n.T, test @ s1.T, test @ s2.T, ppy)
+
+        rows = np.arange(len(test))
+        best = is_sharpe.argmax(axis=1)
+        best_oos = oos_sharpe[rows, best][:, None]
+        below = (oos_sharpe < best_oos).sum(axis=1)
+        ties = (oos_sharpe == best_oos).sum(axis=1) - 1
+        omega = (below + 0.5 * ties + 1.0) / (n_candidates + 1.0)
+        logits = np.log(omega / (1.0 - omega))
+
+        # Path j takes, for every group, the winner of the j-th combination
+        # that tests that group.
+        combos_of_group = np.stack(
+            [np.flatnonzero(self._test_mask[:, g]) for g in range(n.shape[1])]
+        )
+        chosen = best[combos_of_group]  # (groups, paths)
+        cols = np.arange(n.shape[1])[:, None]
+        path_sharpes = _pooled_sharpe(
+            n[chosen, cols].sum(axis=0),
+            s1[chosen, cols].sum(axis=0),
+            s2[chosen, cols].sum(axis=0),
+            ppy,
+        )
+
+        return PBOResult(
+            pbo=float((logits <= 0).mean()),
+            logits=logits.tolist(),
+            path_sharpes=path_sharpes.tolist(),
+            n_candidates=n_candidates,
+        )
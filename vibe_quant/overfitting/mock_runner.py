@@ -1,18 +1,22 @@
 """Mock backtest runner for testing overfitting pipelines.
 
-Provides synthetic (deterministic) results for WFA and Purged K-Fold CV
-without requiring real NautilusTrader backtests.
+Provides synthetic (deterministic) results for WFA, Purged K-Fold CV and
+CPCV without requiring real NautilusTrader backtests.
 """
 
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from vibe_quant.overfitting.cpcv import GroupResult
 from vibe_quant.overfitting.purged_kfold import FoldResult
 
 if TYPE_CHECKING:
     from datetime import date
 
+    import numpy as np
+    from numpy.typing import NDArray
+
 
 class MockBacktestRunner:
     """Mock backtest runner for testing pipeline without real backtests."""
@@ -43,7 +47,7 @@ class MockBacktestRunner:
         """Return mock backtest result."""
         return self._oos_sharpe, self._oos_return
 
-    def run(self, train_indices: list[int], test_indices: list[int]) -> FoldResult:
+    def run(self, train_indices: NDArray[np.int64], test_indices: NDArray[np.int64]) -> FoldResult:
         """Return mock fold result for purged k-fold."""
         return FoldResult(
             fold_index=0,
@@ -54,3 +58,13 @@ class MockBacktestRunner:
             train_return=self._oos_return * 1.1,
             test_return=self._oos_return,
         )
+
+    def run_group(self, indices: list[int]) -> GroupResult:
+        """Return mock group moments for CPCV (OOS Sharpe on every group)."""
+        return GroupResult.from_metrics(
+            group_index=0,
+            sharpe=self._oos_sharpe,
+            total_return=self._oos_return,
+            n_obs=len(indices),
+            periods_per_year=365.0,
+        )
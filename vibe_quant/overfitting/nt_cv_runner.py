@@ -13,6 +13,12 @@ train span. Train metrics are diagnostic only — ``CVResult.is_robust``
 only consults ``test_sharpe``/``test_return`` (see
 ``PurgedKFoldCV._aggregate_results``), so the train span overlap with
 the test fold is acceptable for the robustness check.
+
+Bar timestamps are held as one int64 NumPy array per (bar directory,
+date range) in a small process-wide cache, so every candidate of a run
+(and every pool worker, after its first task) shares a single load.
+Files are ordered and range-pruned from their parquet ``ts_event``
+row-group statistics before the column itself is read.
 """
 
 from __future__ import annotations
@@ -21,11 +27,20 @@ import glob
 import json
 import logging
 import sqlite3
-from datetime import UTC, datetime
+import threading
+from collections import OrderedDict
+from datetime import UTC, date, datetime
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from numpy.typing import NDArray
+
+    from vibe_quant.overfitting.cpcv import GroupResult
     from vibe_quant.overfitting.purged_kfold import FoldResult
 
 logger = logging.getLogger(__name__)
@@ -41,6 +56,142 @@ _TIMEFRAME_TO_DIR_SUFFIX: dict[str, str] = {
     "1d": "1-DAY",
 }
 
+_NS_PER_DAY = 86_400 * 10**9
+# Screening Sharpe ratios are annualized from daily returns
+_DAYS_PER_YEAR = 365.0
+# Distinct (bar_dir, range) timestamp arrays kept per process
+_TS_CACHE_MAX_ENTRIES = 8
+
+# key -> (file fingerprint, timestamps)
+_ts_cache: OrderedDict[
+    tuple[str, int | None, int | None], tuple[tuple[tuple[str, int, int], ...], NDArray[np.int64]]
+] = OrderedDict()
+_ts_cache_lock = threading.Lock()
+
+
+def _date_to_ns(value: date | None, *, end: bool = False) -> int | None:
+    """UTC midnight of ``value`` in ns; the following midnight when ``end``."""
+    if value is None:
+        return None
+    ns = int(datetime(value.year, value.month, value.day, tzinfo=UTC).timestamp()) * 10**9
+    return ns + _NS_PER_DAY if end else ns
+
+
+def _file_ts_bounds(path: str) -> tuple[int, int] | None:
+    """(min, max) ``ts_event`` from parquet row-group statistics, if present."""
+    import pyarrow.parquet as pq
+
+    meta = pq.read_metadata(path)
+    col_idx = meta.schema.to_arrow_schema().get_field_index("ts_event")
+    if col_idx < 0:
+        return None
+    lo: int | None = None
+    hi: int | None = None
+    for rg in range(meta.num_row_groups):
+        stats = meta.row_group(rg).column(col_idx).statistics
+        if stats is None or not stats.has_min_max:
+            return None
+        lo = stats.min if lo is None else min(lo, stats.min)
+        hi = stats.max if hi is None else max(hi, stats.max)
+    if lo is None or hi is None:
+        return None
+    return int(lo), int(hi)
+
+
+def _read_bar_timestamps(
+    files: list[str], start_ns: int | None, end_ns: int | None
+) -> NDArray[np.int64]:
+    """Read ``ts_event`` from ``files`` into one sorted int64 array.
+
+    Files whose statistics fall entirely outside ``[start_ns, end_ns)``
+    are skipped unread. When the statistics show the files are disjoint,
+    concatenating in min-timestamp order is already sorted and the full
+    sort is skipped.
+    """
+    import pyarrow.parquet as pq
+
+    bounded: list[tuple[int, int, str]] = []
+    unbounded: list[str] = []
+    for f in files:
+        bounds = _file_ts_bounds(f)
+        if bounds is None:
+            unbounded.append(f)
+            continue
+        lo, hi = bounds
+        if (start_ns is not None and hi < start_ns) or (end_ns is not None and lo >= end_ns):
+            continue
+        bounded.append((lo, hi, f))
+    bounded.sort()
+
+    chunks: list[NDArray[np.int64]] = []
+    for f in [b[2] for b in bounded] + unbounded:
+        column = pq.read_table(f, columns=["ts_event"]).column("ts_event")
+        chunks.append(column.to_numpy().astype(np.int64, copy=False))
+    if not chunks:
+        return np.empty(0, dtype=np.int64)
+    ts = np.concatenate(chunks)
+
+    disjoint = not unbounded and all(
+        prev[1] < nxt[0] for prev, nxt in zip(bounded, bounded[1:], strict=False)
+    )
+    if not disjoint or (ts.size > 1 and bool(np.any(ts[1:] < ts[:-1]))):
+        ts.sort(kind="stable")
+
+    if start_ns is not None or end_ns is not None:
+        lo_idx = 0 if start_ns is None else int(np.searchsorted(ts, start_ns, side="left"))
+        hi_idx = ts.size if end_ns is None else int(np.searchsorted(ts, end_ns, side="left"))
+        ts = ts[lo_idx:hi_idx].copy()
+    ts.flags.writeable = False
+    return ts
+
+
+def load_bar_timestamps(
+    bar_dir: Path, start_ns: int | None = None, end_ns: int | None = None
+) -> NDArray[np.int64]:
+    """Sorted, read-only ``ts_event`` array for one catalog bar directory.
+
+    Results are cached per ``(bar_dir, start_ns, end_ns)`` and invalidated
+    when any parquet file in the directory is added, removed or rewritten.
+
+    Args:
+        bar_dir: ``<catalog>/data/bar/<bar_type>`` directory.
+        start_ns: Inclusive lower bound in ns, or None for no bound.
+        end_ns: Exclusive upper bound in ns, or None for no bound.
+
+    Returns:
+        int64 nanosecond timestamps in ascending order.
+
+    Raises:
+        ValueError: If the directory holds no parquet files.
+    """
+    files = sorted(glob.glob(str(bar_dir / "*.parquet")))
+    if not files:
+        msg = f"No parquet files in {bar_dir}"
+        raise ValueError(msg)
+    fingerprint = tuple(
+        (f, st.st_mtime_ns, st.st_size) for f, st in ((f, Path(f).stat()) for f in files)
+    )
+    key = (str(bar_dir), start_ns, end_ns)
+    with _ts_cache_lock:
+        cached = _ts_cache.get(key)
+        if cached is not None and cached[0] == fingerprint:
+            _ts_cache.move_to_end(key)
+            return cached[1]
+
+    ts = _read_bar_timestamps(files, start_ns, end_ns)
+    with _ts_cache_lock:
+        _ts_cache[key] = (fingerprint, ts)
+        _ts_cache.move_to_end(key)
+        while len(_ts_cache) > _TS_CACHE_MAX_ENTRIES:
+            _ts_cache.popitem(last=False)
+    return ts
+
+
+def clear_bar_timestamp_cache() -> None:
+    """Drop all cached bar timestamp arrays."""
+    with _ts_cache_lock:
+        _ts_cache.clear()
+
 
 class NTPurgedKFoldRunner:
     """Purged-k-fold BacktestRunner backed by NTScreeningRunner.
@@ -49,12 +200,14 @@ class NTPurgedKFoldRunner:
     :mod:`vibe_quant.overfitting.purged_kfold`. Resolves the strategy DSL,
     symbols, and primary timeframe from the overfitting pipeline's
     ``run_id`` once at construction, loads bar timestamps for the first
-    symbol from the parquet catalog, and maps fold indices to date spans
+    symbol from the parquet catalog (optionally limited to
+    ``start_date``..``end_date``), and maps fold indices to date spans
     on each ``run`` call.
 
     Each ``run`` triggers two NT screening backtests (one per fold for
     train + test). With the default ``n_splits=5`` that's 10 backtests
-    per candidate — slow but correct.
+    per candidate — slow but correct. ``run_group`` (CPCV) triggers one
+    backtest per group, so the default 6-group CPCV costs 6 per candidate.
     """
 
     def __init__(
@@ -62,21 +215,50 @@ class NTPurgedKFoldRunner:
         run_id: int,
         db_path: str | Path,
         catalog_path: str | Path | None = None,
+        start_date: date | None = None,
+        end_date: date | None = None,
     ) -> None:
         self._run_id = run_id
         self._db_path = Path(db_path)
         self._catalog_path = Path(catalog_path) if catalog_path else None
+        self._start_ns = _date_to_ns(start_date)
+        self._end_ns = _date_to_ns(end_date, end=True)
         self._dsl_dict: dict[str, object] = {}
         self._symbols: list[str] = []
         self._timeframe: str = ""
-        self._bar_ts_ns: list[int] = []
+        self._bar_ts_ns: NDArray[np.int64] = np.empty(0, dtype=np.int64)
+        self._params: dict[str, float | int] = {}
         self._resolve()
         self._load_bar_timestamps()
 
+    def __getstate__(self) -> dict[str, Any]:
+        # Pool workers reload timestamps through the per-process cache
+        # instead of receiving a copy of the array with every task.
+        state = self.__dict__.copy()
+        state["_bar_ts_ns"] = None
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._load_bar_timestamps()
+
+    def with_params(self, params: dict[str, float | int]) -> NTPurgedKFoldRunner:
+        """Copy of this runner that backtests with ``params`` applied to the DSL.
+
+        Sweep candidates share one persisted DSL and differ only in their
+        parameters, so each candidate's folds and groups must run with its
+        own. The copy shares the loaded bar timestamps.
+        """
+        # Bypass __getstate__, which drops the timestamps for pickling
+        clone = object.__new__(type(self))
+        clone.__dict__.update(self.__dict__)
+        clone._params = dict(params)
+        return clone
+
     @property
     def n_samples(self) -> int:
         """Number of bars available for splitting."""
-        return len(self._bar_ts_ns)
+        return int(self._bar_ts_ns.size)
 
     def _resolve(self) -> None:
         """Look up strategy DSL, symbols, and timeframe for the given run."""
@@ -117,8 +299,6 @@ class NTPurgedKFoldRunner:
         We use the first symbol as representative — multi-symbol runs are
         already approximated elsewhere by intersection of date ranges.
         """
-        import pandas as pd
-
         suffix = _TIMEFRAME_TO_DIR_SUFFIX.get(self._timeframe)
         if suffix is None:
             msg = (
@@ -135,48 +315,29 @@ class NTPurgedKFoldRunner:
             / "bar"
             / f"{first_symbol}-PERP.BINANCE-{suffix}-LAST-EXTERNAL"
         )
-        files = sorted(glob.glob(str(bar_dir / "*.parquet")))
-        if not files:
-            msg = f"No parquet files in {bar_dir}"
-            raise ValueError(msg)
-
-        timestamps: list[int] = []
-        for f in files:
-            df = pd.read_parquet(f, columns=["ts_event"])
-            timestamps.extend(int(t) for t in df["ts_event"].tolist())
-        timestamps.sort()
-        self._bar_ts_ns = timestamps
+        self._bar_ts_ns = load_bar_timestamps(bar_dir, self._start_ns, self._end_ns)
         logger.info(
             "NTPurgedKFoldRunner: loaded %d bars (%s/%s) for run_id=%d",
-            len(timestamps),
+            self._bar_ts_ns.size,
             first_symbol,
             self._timeframe,
             self._run_id,
         )
 
-    def _index_range_to_dates(self, indices: list[int]) -> tuple[str, str]:
-        """Convert an index list to (start_date, end_date) strings.
+    def _index_range_to_dates(self, indices: NDArray[np.int64] | Sequence[int]) -> tuple[str, str]:
+        """Convert an index array to (start_date, end_date) strings.
 
         Uses min/max so non-contiguous train spans collapse to a single
         date range NT can backtest. Trims to date-only (NT's screening
         runner accepts ``YYYY-MM-DD``).
         """
-        if not indices:
+        idx = np.asarray(indices, dtype=np.int64)
+        if idx.size == 0:
             msg = "Cannot convert empty index list to date range"
             raise ValueError(msg)
-        lo, hi = indices[0], indices[-1]
-        # PurgedKFold yields lists, not necessarily sorted across train
-        # ranges. Recompute defensively.
-        for i in indices:
-            if i < lo:
-                lo = i
-            if i > hi:
-                hi = i
-        start_ns = self._bar_ts_ns[lo]
-        end_ns = self._bar_ts_ns[hi]
-        start = datetime.fromtimestamp(start_ns / 1e9, tz=UTC).date().isoformat()
-        end = datetime.fromtimestamp(end_ns / 1e9, tz=UTC).date().isoformat()
-        return start, end
+        bounds = self._bar_ts_ns[[idx.min(), idx.max()]]
+        start, end = np.datetime_as_string(bounds.astype("datetime64[ns]"), unit="D")
+        return str(start), str(end)
 
     def _backtest(self, start_date: str, end_date: str) -> tuple[float, float]:
         """Run one NT screening backtest, return (sharpe, total_return)."""
@@ -189,17 +350,14 @@ class NTPurgedKFoldRunner:
             end_date=end_date,
             catalog_path=str(self._catalog_path) if self._catalog_path else None,
         )
-        # Empty params: use the DSL's defaults (the candidate's params are
-        # already baked into the persisted DSL for discovery runs; for
-        # screening sweeps the per-candidate params would need plumbing
-        # through the candidate row — out of scope for this initial
-        # purged-k-fold wiring).
-        metrics = runner({})
+        # Discovery runs leave _params empty: their params are already baked
+        # into the persisted DSL. Sweep candidates come via with_params().
+        metrics = runner(dict(self._params))
         sharpe = float(getattr(metrics, "sharpe_ratio", 0.0) or 0.0)
         total_return = float(getattr(metrics, "total_return", 0.0) or 0.0)
         return sharpe, total_return
 
-    def run(self, train_indices: list[int], test_indices: list[int]) -> FoldResult:
+    def run(self, train_indices: NDArray[np.int64], test_indices: NDArray[np.int64]) -> FoldResult:
         """Execute one purged-k-fold split via two NT screening backtests."""
         from vibe_quant.overfitting.purged_kfold import FoldResult
 
@@ -218,3 +376,23 @@ class NTPurgedKFoldRunner:
             train_return=train_return,
             test_return=test_return,
         )
+
+    def run_group(self, indices: list[int]) -> GroupResult:
+        """Execute one CPCV group as a single NT screening backtest.
+
+        The screening runner only reports headline metrics, so the group's
+        daily return moments are implied from its Sharpe ratio and total
+        return (see :meth:`GroupResult.from_metrics`).
+        """
+        from vibe_quant.overfitting.cpcv import GroupResult
+
+        start, end = self._index_range_to_dates(indices)
+        sharpe, total_return = self._backtest(start, end)
+        n_days = (date.fromisoformat(end) - date.fromisoformat(start)).days + 1
+        return GroupResult.from_metrics(
+            group_index=0,  # CPCV overrides with the group position
+            sharpe=sharpe,
+            total_return=total_return,
+            n_obs=n_days,
+            periods_per_year=_DAYS_PER_YEAR,
+        )
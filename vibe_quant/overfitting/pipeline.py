@@ -1,22 +1,37 @@
 """Overfitting prevention pipeline orchestrator.
 
 Toggleable filter chain that reads sweep_results, applies DSR/WFA/PurgedKFold
-filters, tags pass/fail per filter, and outputs filtered candidates.
+(and optionally CPCV) filters, tags pass/fail per filter, and outputs filtered
+candidates.
 
 Each filter is independent and can be enabled/disabled. Results are stored
 back in sweep_results with passed_* flags for each filter.
+
+DSR runs inline. WFA, Purged K-Fold and CPCV are scheduled as (candidate, stage)
+work units on one shared executor (``FilterConfig.max_workers``). With
+``fail_fast`` a candidate's stages run in order and a failure cancels the
+rest. Each stage's flag is persisted as soon as it completes, so
+``run(resume=True)`` skips stages an interrupted run already finished.
+CPCV's Probability of Backtest Overfitting is a run-level statistic and is
+computed once every candidate's CPCV stage has finished. Under ``fail_fast``
+only candidates that survived the earlier stages reach CPCV, so the PBO is
+computed over survivors and flagged as such.
 """
 
 from __future__ import annotations
 
 import json
 import logging
+import os
+import pickle
 import sqlite3
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
 from datetime import date
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from vibe_quant.db.connection import DEFAULT_DB_PATH
+from vibe_quant.overfitting.cpcv import CombinatorialPurgedCV, CPCVResult
 from vibe_quant.overfitting.dsr import DeflatedSharpeRatio, DSRResult
 from vibe_quant.overfitting.mock_runner import MockBacktestRunner
 from vibe_quant.overfitting.purged_kfold import CVConfig, CVResult, PurgedKFoldCV
@@ -27,8 +42,156 @@ from vibe_quant.overfitting.types import (
 )
 from vibe_quant.overfitting.wfa import WalkForwardAnalysis, WFAConfig, WFAResult
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    from vibe_quant.overfitting.cpcv import GroupResult
+
 logger = logging.getLogger(__name__)
 
+# Backtest-heavy stages, in fail-fast order. DSR is computed inline first.
+_STAGES = ("wfa", "cv", "cpcv")
+_STAGE_COLUMNS = {
+    "dsr": "passed_deflated_sharpe",
+    "wfa": "passed_walk_forward",
+    "cv": "passed_purged_kfold",
+    "cpcv": "passed_cpcv",
+}
+
+
+def _stage_enabled(config: FilterConfig, stage: str) -> bool:
+    return {
+        "dsr": config.enable_dsr,
+        "wfa": config.enable_wfa,
+        "cv": config.enable_purged_kfold,
+        "cpcv": config.enable_cpcv,
+    }[stage]
+
+
+def _candidate_params(candidate: dict[str, Any]) -> dict[str, Any]:
+    """Strategy parameters of a sweep_results row (JSON string or dict).
+
+    Promoted discovery results store the run's summary notes in the
+    parameters column; their parameters are already baked into the
+    persisted DSL, so they have none to override.
+    """
+    raw_params = candidate.get("parameters", "{}")
+    try:
+        params = json.loads(raw_params) if isinstance(raw_params, str) else (raw_params or {})
+    except json.JSONDecodeError:
+        logger.warning("Invalid JSON in parameters for candidate %d", candidate["id"])
+        return {}
+    if not isinstance(params, dict) or params.get("type") == "discovery":
+        return {}
+    return params
+
+
+def _identical_rows(group_rows: Sequence[Sequence[GroupResult]]) -> bool:
+    """True when every candidate produced the same group results."""
+    first = [(g.n_obs, g.mean_return, g.std_return) for g in group_rows[0]]
+    return all(
+        [(g.n_obs, g.mean_return, g.std_return) for g in row] == first for row in group_rows[1:]
+    )
+
+
+def _run_wfa_stage(
+    wfa: WalkForwardAnalysis,
+    strategy_id: str,
+    data_start: date,
+    data_end: date,
+    param_grid: dict[str, list[object]],
+) -> WFAResult | str:
+    """WFA work unit. A ValueError (too few windows) fails the stage."""
+    try:
+        return wfa.run(
+            strategy_id=strategy_id,
+            data_start=data_start,
+            data_end=data_end,
+            param_grid=param_grid,
+        )
+    except ValueError as e:
+        return str(e)
+
+
+def _run_cv_stage(cv: PurgedKFoldCV, n_samples: int, runner: Any) -> CVResult:
+    """Purged K-Fold work unit."""
+    return cv.run(n_samples=n_samples, runner=runner)
+
+
+def _run_cpcv_stage(cpcv: CombinatorialPurgedCV, n_samples: int, runner: Any) -> CPCVResult:
+    """CPCV work unit: one backtest per group, recombined per combination."""
+    return cpcv.run(n_samples=n_samples, runner=runner)
+
+
+class _InlineExecutor(Executor):
+    """Executor that runs each unit synchronously at submit time."""
+
+    def submit(  # type: ignore[override]
+        self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any
+    ) -> Future[Any]:
+        future: Future[Any] = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as exc:
+            future.set_exception(exc)
+        return future
+
+
+class _CandidateState:
+    """Per-candidate stage outcomes while the pipeline is scheduling."""
+
+    __slots__ = ("candidate", "passed", "results", "submitted")
+
+    def __init__(self, candidate: dict[str, Any]) -> None:
+        self.candidate = candidate
+        self.passed: dict[str, bool] = {}
+        self.results: dict[str, Any] = {}
+        self.submitted: set[str] = set()
+
+    def set_outcome(self, stage: str, passed: bool, result: Any) -> None:
+        self.passed[stage] = passed
+        self.results[stage] = result
+
+    def in_flight(self) -> bool:
+        return any(stage not in self.passed for stage in self.submitted)
+
+    def failed_any(self) -> bool:
+        return not all(self.passed.values())
+
+    def to_result(self, config: FilterConfig) -> CandidateResult:
+        # Disabled or cancelled stages are None; passed_all needs every
+        # enabled stage to have passed.
+        passed_all = all(
+            self.passed.get(stage, False)
+            for stage in ("dsr", *_STAGES)
+            if _stage_enabled(config, stage)
+        )
+        candidate = self.candidate
+        # Normalize types for CandidateResult (expects str parameters, float sharpe/return)
+        raw_params_val = candidate.get("parameters", "{}")
+        norm_params = (
+            json.dumps(raw_params_val)
+            if isinstance(raw_params_val, dict)
+            else str(raw_params_val or "{}")
+        )
+        return CandidateResult(
+            sweep_result_id=candidate["id"],
+            run_id=candidate["run_id"],
+            strategy_name=candidate.get("strategy_name", f"run_{candidate['run_id']}"),
+            parameters=norm_params,
+            sharpe_ratio=float(candidate.get("sharpe_ratio") or 0.0),
+            total_return=float(candidate.get("total_return") or 0.0),
+            passed_dsr=self.passed.get("dsr"),
+            passed_wfa=self.passed.get("wfa"),
+            passed_cv=self.passed.get("cv"),
+            passed_all=passed_all,
+            passed_cpcv=self.passed.get("cpcv"),
+            dsr_result=self.results.get("dsr"),
+            wfa_result=self.results.get("wfa"),
+            cv_result=self.results.get("cv"),
+            cpcv_result=self.results.get("cpcv"),
+        )
+
 
 class OverfittingPipeline:
     """Overfitting prevention filter chain.
@@ -55,6 +218,7 @@ class OverfittingPipeline:
             db_path: Path to SQLite database. Defaults to DEFAULT_DB_PATH.
             wfa_runner: Optional backtest runner for WFA. Uses mock if None.
             cv_runner: Optional backtest runner for Purged K-Fold. Uses mock if None.
+                Also used for CPCV, which needs a ``run_group`` method.
         """
         if db_path is None:
             db_path = DEFAULT_DB_PATH
@@ -91,6 +255,7 @@ class OverfittingPipeline:
         allow_mock: bool = False,
         total_trials: int | None = None,
         trials_sharpe_variance: float | None = None,
+        resume: bool = False,
     ) -> PipelineResult:
         """Run overfitting filter chain on sweep results.
 
@@ -108,6 +273,9 @@ class OverfittingPipeline:
                 correction factor. Use this when candidates are pre-filtered.
             trials_sharpe_variance: Empirical variance of Sharpe ratios across
                 all evaluated trials (for DSR).
+            resume: Keep WFA/CV flags already stored for this run and only
+                schedule the stages that have none. When False, all flags
+                are cleared first.
 
         Returns:
             PipelineResult with all candidate results and filter counts.
@@ -119,7 +287,7 @@ class OverfittingPipeline:
         config = config or FilterConfig.default()
 
         # Load candidates from database
-        candidates = self._load_candidates(run_id)
+        candidates = self._load_candidates(run_id, include_cpcv=config.enable_cpcv)
         if not candidates:
             logger.error("No candidates found for run_id=%d", run_id)
             return PipelineResult(
@@ -132,11 +300,12 @@ class OverfittingPipeline:
             )
 
         logger.info(
-            "Running overfitting pipeline on %d candidates (DSR=%s, WFA=%s, CV=%s)",
+            "Running overfitting pipeline on %d candidates (DSR=%s, WFA=%s, CV=%s, CPCV=%s)",
             len(candidates),
             config.enable_dsr,
             config.enable_wfa,
             config.enable_purged_kfold,
+            config.enable_cpcv,
         )
 
         # Count number of trials for DSR — use total_trials if provided
@@ -147,7 +316,7 @@ class OverfittingPipeline:
         dsr = DeflatedSharpeRatio(significance_level=config.dsr_significance)
 
         wfa_config = config.wfa_config or WFAConfig.default()
-        wfa = WalkForwardAnalysis(config=wfa_config)
+        wfa = WalkForwardAnalysis(config=wfa_config, max_workers=config.wfa_max_workers)
         if self._wfa_runner:
             wfa.runner = self._wfa_runner
         elif config.enable_wfa:
@@ -167,141 +336,138 @@ class OverfittingPipeline:
         cv_config = config.cv_config or CVConfig()
         cv = PurgedKFoldCV(config=cv_config, robustness_threshold=config.cv_robustness_threshold)
 
-        # Process each candidate
-        results: list[CandidateResult] = []
-        passed_dsr_count = 0
-        passed_wfa_count = 0
-        passed_cv_count = 0
-
-        for candidate in candidates:
-            # Apply DSR filter
-            dsr_result: DSRResult | None = None
-            passed_dsr: bool | None = None
-
-            if config.enable_dsr:
-                # Use actual return distribution moments if available in
-                # sweep_results, otherwise fall back to normal distribution
-                # assumption (skewness=0, kurtosis=3). For accurate DSR,
-                # the screening pipeline should store these in sweep_results.
-                sharpe = candidate.get("sharpe_ratio")
-                if sharpe is None:
-                    passed_dsr = False
-                else:
-                    skewness = candidate.get("skewness", 0.0)
-                    kurtosis = candidate.get("kurtosis", 3.0)
-                    dsr_result = dsr.calculate(
-                        observed_sharpe=float(sharpe),
+        if config.enable_purged_kfold and not self._cv_runner:
+            if not allow_mock:
+                raise ValueError(
+                    "Purged K-Fold CV enabled but no backtest runner injected. "
+                    "Pass cv_runner= to OverfittingPipeline, or use --allow-mock / allow_mock=True "
+                    "to fall back to MockBacktestRunner (synthetic results)."
+                )
+            logger.warning(
+                "No CV backtest runner provided - using MockBacktestRunner. "
+                "Results will be synthetic. Pass cv_runner= to OverfittingPipeline "
+                "for real purged k-fold analysis."
+            )
+
+        cpcv = CombinatorialPurgedCV(config.cpcv_config)
+        if config.enable_cpcv:
+            if self._cv_runner is not None and not hasattr(self._cv_runner, "run_group"):
+                msg = "CPCV enabled but the injected cv_runner has no run_group() method."
+                raise ValueError(msg)
+            if self._cv_runner is None and not allow_mock:
+                raise ValueError(
+                    "CPCV enabled but no backtest runner injected. "
+                    "Pass cv_runner= to OverfittingPipeline, or use --allow-mock / allow_mock=True "
+                    "to fall back to MockBacktestRunner (synthetic results)."
+                )
+
+        if not resume:
+            self._reset_flags(run_id, include_cpcv=config.enable_cpcv)
+
+        executor = self._create_executor(config.max_workers, len(candidates), wfa)
+        if not isinstance(executor, _InlineExecutor):
+            # The pipeline pool is the unit of parallelism; don't nest WFA pools
+            wfa = WalkForwardAnalysis(config=wfa_config, runner=wfa.runner)
+
+        # WFA uses provided dates or defaults
+        stage_args: dict[str, Any] = {
+            "data_start": data_start or date(2024, 1, 1),
+            "data_end": data_end or date(2025, 12, 31),
+            "n_samples": n_samples,
+        }
+
+        states = [_CandidateState(candidate) for candidate in candidates]
+        futures: dict[Future[Any], tuple[int, str]] = {}
+
+        def _schedule(idx: int) -> None:
+            """Submit the candidate's next runnable stage(s)."""
+            state = states[idx]
+            for stage in _STAGES:
+                if not _stage_enabled(config, stage) or stage in state.submitted:
+                    continue
+                if config.fail_fast and (state.in_flight() or state.failed_any()):
+                    return  # wait for the earlier stage, or skip the rest
+                state.submitted.add(stage)
+                flag = state.candidate.get(_STAGE_COLUMNS[stage]) if resume else None
+                if flag is not None:
+                    state.set_outcome(stage, bool(flag), None)
+                    continue
+                future = self._submit_stage(
+                    executor, stage, state.candidate, wfa, cv, cpcv, stage_args
+                )
+                futures[future] = (idx, stage)
+
+        try:
+            for idx, state in enumerate(states):
+                if config.enable_dsr:
+                    # DSR is microseconds: always (re)compute inline
+                    passed, dsr_result = self._apply_dsr(
+                        dsr,
+                        state.candidate,
                         num_trials=num_trials,
                         num_observations=num_observations,
-                        skewness=skewness,
-                        kurtosis=kurtosis,
                         trials_sharpe_variance=trials_sharpe_variance,
+                        confidence_threshold=config.dsr_confidence_threshold,
                     )
-                    passed_dsr = dsr.passes_threshold(dsr_result, config.dsr_confidence_threshold)
-                if passed_dsr:
-                    passed_dsr_count += 1
-
-            # Apply WFA filter
-            wfa_result: WFAResult | None = None
-            passed_wfa: bool | None = None
-
-            if config.enable_wfa:
-                # Use provided dates or defaults
-                start = data_start or date(2024, 1, 1)
-                end = data_end or date(2025, 12, 31)
-
-                # Parse parameters for param_grid (may be JSON string or dict)
-                raw_params = candidate.get("parameters", "{}")
-                try:
-                    params = (
-                        json.loads(raw_params)
-                        if isinstance(raw_params, str)
-                        else (raw_params or {})
-                    )
-                except json.JSONDecodeError:
-                    logger.warning("Invalid JSON in parameters for candidate %d", candidate["id"])
-                    params = {}
-                param_grid = {k: [v] for k, v in params.items()}
-
-                try:
-                    wfa_result = wfa.run(
-                        strategy_id=str(candidate["id"]),
-                        data_start=start,
-                        data_end=end,
-                        param_grid=param_grid,
-                    )
-                    passed_wfa = wfa_result.is_robust
-                except ValueError as e:
-                    logger.warning("WFA failed for candidate %d: %s", candidate["id"], e)
-                    passed_wfa = False
-
-                if passed_wfa:
-                    passed_wfa_count += 1
-
-            # Apply Purged K-Fold filter
-            cv_result: CVResult | None = None
-            passed_cv: bool | None = None
-
-            if config.enable_purged_kfold:
-                if self._cv_runner:
-                    runner = self._cv_runner
-                elif not allow_mock:
-                    raise ValueError(
-                        "Purged K-Fold CV enabled but no backtest runner injected. "
-                        "Pass cv_runner= to OverfittingPipeline, or use --allow-mock / allow_mock=True "
-                        "to fall back to MockBacktestRunner (synthetic results)."
-                    )
-                else:
-                    if candidate == candidates[0]:  # Log once
+                    state.set_outcome("dsr", passed, dsr_result)
+                    self._update_stage(state.candidate["id"], "dsr", passed)
+                _schedule(idx)
+
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    idx, stage = futures.pop(future)
+                    state = states[idx]
+                    outcome = future.result()
+                    if stage == "wfa" and isinstance(outcome, str):
                         logger.warning(
-                            "No CV backtest runner provided - using MockBacktestRunner. "
-                            "Results will be synthetic. Pass cv_runner= to OverfittingPipeline "
-                            "for real purged k-fold analysis."
+                            "WFA failed for candidate %d: %s", state.candidate["id"], outcome
                         )
-                    runner = MockBacktestRunner(
-                        oos_sharpe=candidate.get("sharpe_ratio") or 0.0,
-                        oos_return=candidate.get("total_return") or 0.0,
+                        state.set_outcome(stage, False, None)
+                    else:
+                        state.set_outcome(stage, bool(outcome.is_robust), outcome)
+                    self._update_stage(state.candidate["id"], stage, state.passed[stage])
+                    _schedule(idx)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        results = [state.to_result(config) for state in states]
+        passed_dsr_count = sum(1 for r in results if r.passed_dsr)
+        passed_wfa_count = sum(1 for r in results if r.passed_wfa)
+        passed_cv_count = sum(1 for r in results if r.passed_cv)
+        passed_cpcv_count = sum(1 for r in results if r.passed_cpcv)
+
+        # PBO compares candidates, so it needs every CPCV stage to have run.
+        # Flags reused on resume carry no group results and are left out.
+        pbo = None
+        pbo_survivors_only = False
+        group_rows = [r.cpcv_result.group_results for r in results if r.cpcv_result is not None]
+        if config.enable_cpcv and len(group_rows) >= 2:
+            if _identical_rows(group_rows):
+                # Indistinguishable candidates (e.g. a runner that ignores
+                # their parameters) make the in-sample pick arbitrary
+                logger.warning(
+                    "CPCV: all %d candidates produced identical group results; "
+                    "skipping PBO",
+                    len(group_rows),
+                )
+            else:
+                pbo = cpcv.probability_of_backtest_overfitting(group_rows)
+                pbo_survivors_only = any(
+                    "cpcv" not in state.submitted for state in states
+                )
+                logger.info(
+                    "CPCV: PBO=%.3f over %d candidates (%d combinations)",
+                    pbo.pbo,
+                    pbo.n_candidates,
+                    len(pbo.logits),
+                )
+                if pbo_survivors_only:
+                    logger.warning(
+                        "CPCV: fail-fast skipped %d candidates; PBO covers only the "
+                        "survivors of earlier stages and understates overfitting",
+                        len(candidates) - len(group_rows),
                     )
-                cv_result = cv.run(n_samples=n_samples, runner=runner)
-                passed_cv = cv_result.is_robust
-                if passed_cv:
-                    passed_cv_count += 1
-
-            # Determine if passed all enabled filters
-            passed_all = True
-            if config.enable_dsr and not passed_dsr:
-                passed_all = False
-            if config.enable_wfa and not passed_wfa:
-                passed_all = False
-            if config.enable_purged_kfold and not passed_cv:
-                passed_all = False
-
-            # Normalize types for CandidateResult (expects str parameters, float sharpe/return)
-            raw_params_val = candidate.get("parameters", "{}")
-            norm_params = (
-                json.dumps(raw_params_val)
-                if isinstance(raw_params_val, dict)
-                else str(raw_params_val or "{}")
-            )
-            result = CandidateResult(
-                sweep_result_id=candidate["id"],
-                run_id=candidate["run_id"],
-                strategy_name=candidate.get("strategy_name", f"run_{candidate['run_id']}"),
-                parameters=norm_params,
-                sharpe_ratio=float(candidate.get("sharpe_ratio") or 0.0),
-                total_return=float(candidate.get("total_return") or 0.0),
-                passed_dsr=passed_dsr,
-                passed_wfa=passed_wfa,
-                passed_cv=passed_cv,
-                passed_all=passed_all,
-                dsr_result=dsr_result,
-                wfa_result=wfa_result,
-                cv_result=cv_result,
-            )
-            results.append(result)
-
-            # Update database
-            self._update_candidate(candidate["id"], passed_dsr, passed_wfa, passed_cv)
 
         passed_all_count = sum(1 for r in results if r.passed_all)
 
@@ -322,9 +488,93 @@ class OverfittingPipeline:
             passed_cv=passed_cv_count,
             passed_all=passed_all_count,
             candidates=results,
+            passed_cpcv=passed_cpcv_count,
+            pbo=pbo,
+            pbo_survivors_only=pbo_survivors_only,
         )
 
-    def _load_candidates(self, run_id: int) -> list[dict[str, Any]]:
+    def _create_executor(
+        self, max_workers: int | None, num_candidates: int, wfa: WalkForwardAnalysis
+    ) -> Executor:
+        """Process pool for stage work units, or an inline executor.
+
+        Falls back to inline execution when parallelism is off or a runner
+        cannot be pickled into worker processes.
+        """
+        if max_workers is None or max_workers == 1:
+            return _InlineExecutor()
+        try:
+            pickle.dumps((wfa, self._cv_runner))
+        except Exception:
+            logger.warning("Overfitting runners are not picklable; running stages inline")
+            return _InlineExecutor()
+        from concurrent.futures import ProcessPoolExecutor
+
+        workers = max_workers if max_workers > 0 else (os.cpu_count() or 4)
+        return ProcessPoolExecutor(max_workers=max(1, min(workers, num_candidates * 2)))
+
+    def _submit_stage(
+        self,
+        executor: Executor,
+        stage: str,
+        candidate: dict[str, Any],
+        wfa: WalkForwardAnalysis,
+        cv: PurgedKFoldCV,
+        cpcv: CombinatorialPurgedCV,
+        stage_args: dict[str, Any],
+    ) -> Future[Any]:
+        """Submit one (candidate, stage) work unit."""
+        params = _candidate_params(candidate)
+        if stage == "wfa":
+            param_grid = {k: [v] for k, v in params.items()}
+            return executor.submit(
+                _run_wfa_stage,
+                wfa,
+                str(candidate["id"]),
+                stage_args["data_start"],
+                stage_args["data_end"],
+                param_grid,
+            )
+        runner = self._cv_runner or MockBacktestRunner(
+            oos_sharpe=candidate.get("sharpe_ratio") or 0.0,
+            oos_return=candidate.get("total_return") or 0.0,
+        )
+        if params and hasattr(runner, "with_params"):
+            # Backtest this candidate, not the DSL defaults
+            runner = runner.with_params(params)
+        if stage == "cpcv":
+            return executor.submit(_run_cpcv_stage, cpcv, stage_args["n_samples"], runner)
+        return executor.submit(_run_cv_stage, cv, stage_args["n_samples"], runner)
+
+    @staticmethod
+    def _apply_dsr(
+        dsr: DeflatedSharpeRatio,
+        candidate: dict[str, Any],
+        *,
+        num_trials: int,
+        num_observations: int,
+        trials_sharpe_variance: float | None,
+        confidence_threshold: float,
+    ) -> tuple[bool, DSRResult | None]:
+        """Run the DSR filter for one candidate."""
+        # Use actual return distribution moments if available in
+        # sweep_results, otherwise fall back to normal distribution
+        # assumption (skewness=0, kurtosis=3). For accurate DSR,
+        # the screening pipeline should store these in sweep_results.
+        sharpe = candidate.get("sharpe_ratio")
+        if sharpe is None:
+            return False, None
+        dsr_result = dsr.calculate(
+            observed_sharpe=float(sharpe),
+            num_trials=num_trials,
+            num_observations=num_observations,
+            skewness=candidate.get("skewness", 0.0),
+            kurtosis=candidate.get("kurtosis", 3.0),
+            trials_sharpe_variance=trials_sharpe_variance,
+        )
+        return dsr.passes_threshold(dsr_result, confidence_threshold), dsr_result
+
+    def _load_candidates(self, run_id: int, include_cpcv: bool = False) -> list[dict[str, Any]]:
         """Load sweep result candidates from database.
 
         Queries sweep_results first. If empty and the run is a discovery run,
@@ -333,21 +583,25 @@ class OverfittingPipeline:
 
         Args:
             run_id: Backtest run ID.
+            include_cpcv: Also load the passed_cpcv flag (for resume).
 
         Returns:
             List of candidate dictionaries.
         """
+        cpcv_column = ", sr.passed_cpcv" if include_cpcv else ""
         cursor = self.conn.execute(
-            """
+            f"""
             SELECT sr.id, sr.run_id, sr.parameters, sr.sharpe_ratio, sr.total_return,
                    sr.sortino_ratio, sr.max_drawdown, sr.profit_factor, sr.win_rate,
-                   sr.is_pareto_optimal, br.strategy_id, s.name AS strategy_name
+                   sr.is_pareto_optimal, sr.passed_deflated_sharpe,
+                   sr.passed_walk_forward, sr.passed_purged_kfold{cpcv_column},
+                   br.strategy_id, s.name AS strategy_name
             FROM sweep_results sr
             LEFT JOIN backtest_runs br ON sr.run_id = br.id
             LEFT JOIN strategies s ON br.strategy_id = s.id
             WHERE sr.run_id = ?
             ORDER BY sr.sharpe_ratio DESC
-            """,
+            """,  # noqa: S608
             (run_id,),
         )
 
@@ -447,35 +701,26 @@ class OverfittingPipeline:
             }
         ]
 
-    def _update_candidate(
-        self,
-        sweep_result_id: int,
-        passed_dsr: bool | None,
-        passed_wfa: bool | None,
-        passed_cv: bool | None,
-    ) -> None:
-        """Update sweep_result with filter pass/fail flags.
+    def _update_stage(self, sweep_result_id: int, stage: str, passed: bool) -> None:
+        """Persist one stage's pass/fail flag as soon as it is known."""
+        self.conn.execute(
+            f"UPDATE sweep_results SET {_STAGE_COLUMNS[stage]} = ? WHERE id = ?",  # noqa: S608
+            (1 if passed else 0, sweep_result_id),
+        )
+        self.conn.commit()
 
-        Args:
-            sweep_result_id: ID in sweep_results table.
-            passed_dsr: DSR filter result (None if not run).
-            passed_wfa: WFA filter result (None if not run).
-            passed_cv: CV filter result (None if not run).
-        """
+    def _reset_flags(self, run_id: int, include_cpcv: bool = False) -> None:
+        """Clear all filter flags for a run before a fresh (non-resumed) pass."""
+        cpcv_column = ", passed_cpcv = NULL" if include_cpcv else ""
         self.conn.execute(
-            """
+            f"""
             UPDATE sweep_results
-            SET passed_deflated_sharpe = ?,
-                passed_walk_forward = ?,
-                passed_purged_kfold = ?
-            WHERE id = ?
-            """,
-            (
-                1 if passed_dsr else (0 if passed_dsr is not None else None),
-                1 if passed_wfa else (0 if passed_wfa is not None else None),
-                1 if passed_cv else (0 if passed_cv is not None else None),
-                sweep_result_id,
-            ),
+            SET passed_deflated_sharpe = NULL,
+                passed_walk_forward = NULL,
+                passed_purged_kfold = NULL{cpcv_column}
+            WHERE run_id = ?
+            """,  # noqa: S608
+            (run_id,),
         )
         self.conn.commit()
 
@@ -501,6 +746,7 @@ class OverfittingPipeline:
                 AND (passed_deflated_sharpe IS NULL OR passed_deflated_sharpe = 1)
                 AND (passed_walk_forward IS NULL OR passed_walk_forward = 1)
                 AND (passed_purged_kfold IS NULL OR passed_purged_kfold = 1)
+                AND (passed_cpcv IS NULL OR passed_cpcv = 1)
                 ORDER BY sharpe_ratio DESC
             """
         else:
@@ -510,7 +756,8 @@ class OverfittingPipeline:
                 WHERE run_id = ?
                 AND (passed_deflated_sharpe = 1
                      OR passed_walk_forward = 1
-                     OR passed_purged_kfold = 1)
+                     OR passed_purged_kfold = 1
+                     OR passed_cpcv = 1)
                 ORDER BY sharpe_ratio DESC
             """
 
@@ -572,6 +819,22 @@ class OverfittingPipeline:
         else:
             lines.append("  Purged K-Fold CV:        DISABLED")
 
+        if result.config.enable_cpcv:
+            pct = (
+                (result.passed_cpcv / result.total_candidates * 100)
+                if result.total_candidates
+                else 0
+            )
+            lines.append(
+                f"  CPCV:                    {result.passed_cpcv}/{result.total_candidates} ({pct:.1f}%)"
+            )
+            if result.pbo is not None:
+                survivors = " (fail-fast survivors only)" if result.pbo_survivors_only else ""
+                lines.append(
+                    f"  PBO:                     {result.pbo.pbo:.3f} "
+                    f"({len(result.pbo.logits)} combinations){survivors}"
+                )
+
         lines.append("")
         pct = (result.passed_all / result.total_candidates * 100) if result.total_candidates else 0
         lines.append(
@@ -598,6 +861,10 @@ class OverfittingPipeline:
                 lines.append(
                     f"      CV:  {'PASS' if c.passed_cv else ('FAIL' if c.passed_cv is False else 'N/A')}"
                 )
+                if result.config.enable_cpcv:
+                    lines.append(
+                        f"      CPCV: {'PASS' if c.passed_cpcv else ('FAIL' if c.passed_cpcv is False else 'N/A')}"
+                    )
 
         else:
             lines.append("-" * 70)
@@ -19,6 +19,8 @@ import logging
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Protocol
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 _MIN_DEFAULT_PURGE_BARS = 50
@@ -27,6 +29,8 @@ _MIN_FOLD_SAMPLES = 10
 if TYPE_CHECKING:
     from collections.abc import Iterator
 
+    from numpy.typing import NDArray
+
 
 def max_indicator_lookback(dsl_config: dict[str, object]) -> int:
     """Extract the maximum indicator lookback period from a DSL config dict.
@@ -60,7 +64,7 @@ class BacktestRunner(Protocol):
     Implementations should run a backtest on the given indices and return metrics.
     """
 
-    def run(self, train_indices: list[int], test_indices: list[int]) -> FoldResult:
+    def run(self, train_indices: NDArray[np.int64], test_indices: NDArray[np.int64]) -> FoldResult:
         """Run backtest on train/test split.
 
         Args:
@@ -201,21 +205,22 @@ class PurgedKFold:
         self.embargo_pct = embargo_pct
         self.indicator_lookback_bars = indicator_lookback_bars
 
-    def split(self, n_samples: int) -> Iterator[tuple[list[int], list[int]]]:
+    def split(self, n_samples: int) -> Iterator[tuple[NDArray[np.int64], NDArray[np.int64]]]:
         """Generate train/test indices for each fold.
 
         For each fold, the test set is one of the K equal partitions.
         The train set is all other partitions, with purge and embargo gaps
         applied to prevent leakage.
 
-        Uses range slicing and list pre-allocation instead of repeated
-        extend operations for better memory efficiency.
+        Fold membership comes from a single ``searchsorted`` over the fold
+        boundaries; test, purge and embargo are boolean masks over it.
 
         Args:
             n_samples: Total number of samples in the dataset.
 
         Yields:
-            Tuple of (train_indices, test_indices) for each fold.
+            Tuple of ascending int64 (train_indices, test_indices) arrays
+            for each fold.
 
         Raises:
             ValueError: If n_samples is too small for the configuration.
@@ -276,52 +281,24 @@ class PurgedKFold:
             )
             raise ValueError(msg)
 
-        # Pre-compute fold boundaries once (avoid repeated multiplication)
+        # Fold boundaries, and each sample's fold found by one searchsorted.
         fold_size = n_samples // self.n_splits
-        fold_starts = [i * fold_size for i in range(self.n_splits)]
-        fold_ends = [
-            fold_starts[i + 1] if i < self.n_splits - 1 else n_samples for i in range(self.n_splits)
-        ]
+        bounds = np.arange(self.n_splits + 1, dtype=np.int64) * fold_size
+        bounds[-1] = n_samples
+        positions = np.arange(n_samples, dtype=np.int64)
+        fold_of = np.searchsorted(bounds, positions, side="right") - 1
 
         for fold_idx in range(self.n_splits):
-            # Test set is the current fold
-            test_indices = list(range(fold_starts[fold_idx], fold_ends[fold_idx]))
-
-            # Build train set from all other folds, applying purge/embargo
-            # Collect ranges first, then build list in one shot
-            train_ranges: list[range] = []
-
-            for train_fold_idx in range(self.n_splits):
-                if train_fold_idx == fold_idx:
-                    continue
-
-                train_fold_start = fold_starts[train_fold_idx]
-                train_fold_end = fold_ends[train_fold_idx]
-
-                # Apply purge if train fold immediately precedes test fold
-                if train_fold_idx == fold_idx - 1:
-                    purge_start = max(train_fold_start, train_fold_end - purge_len)
-                    train_fold_end = purge_start
-
-                # Apply embargo if train fold immediately follows test fold
-                if train_fold_idx == fold_idx + 1:
-                    embargo_end = min(train_fold_end, train_fold_start + embargo_len)
-                    train_fold_start = embargo_end
-
-                # Only add if we have samples left after purge/embargo
-                if train_fold_start < train_fold_end:
-                    train_ranges.append(range(train_fold_start, train_fold_end))
-
-            # Build train indices from collected ranges
-            total_train = sum(len(r) for r in train_ranges)
-            train_indices: list[int] = [0] * total_train
-            offset = 0
-            for r in train_ranges:
-                rlen = len(r)
-                train_indices[offset : offset + rlen] = r
-                offset += rlen
+            test_start = bounds[fold_idx]
+            test_end = bounds[fold_idx + 1]
+            test_mask = fold_of == fold_idx
+            # Purge the tail of the preceding fold, embargo the head of the
+            # following one; neither gap reaches past that neighbouring fold.
+            purge_mask = (fold_of == fold_idx - 1) & (positions >= test_start - purge_len)
+            embargo_mask = (fold_of == fold_idx + 1) & (positions < test_end + embargo_len)
+            train_mask = ~(test_mask | purge_mask | embargo_mask)
 
-            yield train_indices, test_indices
+            yield positions[train_mask], positions[test_start:test_end]
 
     def get_n_splits(self) -> int:
         """Return number of splits."""
@@ -468,7 +445,7 @@ class PurgedKFoldCV:
             is_robust=is_robust,
         )
 
-    def get_splits(self, n_samples: int) -> list[tuple[list[int], list[int]]]:
+    def get_splits(self, n_samples: int) -> list[tuple[NDArray[np.int64], NDArray[np.int64]]]:
         """Get all train/test splits without running backtests.
 
         Useful for inspecting splits or running backtests in parallel.
@@ -10,6 +10,7 @@ from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from vibe_quant.overfitting.cpcv import CPCVConfig, CPCVResult, PBOResult
     from vibe_quant.overfitting.dsr import DSRResult
     from vibe_quant.overfitting.purged_kfold import CVConfig, CVResult
     from vibe_quant.overfitting.wfa import WFAConfig, WFAResult
@@ -23,11 +24,21 @@ class FilterConfig:
         enable_dsr: Enable Deflated Sharpe Ratio filter.
         enable_wfa: Enable Walk-Forward Analysis filter.
         enable_purged_kfold: Enable Purged K-Fold CV filter.
+        enable_cpcv: Enable Combinatorial Purged CV filter. Also reports the
+            run's Probability of Backtest Overfitting.
         dsr_significance: DSR significance level (default 0.05).
         dsr_confidence_threshold: Confidence threshold for pass (default 0.95).
         wfa_config: WFA configuration. Uses default if None.
         cv_config: Purged K-Fold configuration. Uses default if None.
         cv_robustness_threshold: Threshold for CV robustness (default 0.5).
+        cpcv_config: CPCV configuration. Uses default if None.
+        wfa_max_workers: Process pool size for WFA windows. None = sequential,
+            0 = auto (cpu_count). Not applied when stages run on the
+            ``max_workers`` pool.
+        max_workers: Process pool size for (candidate, stage) work units.
+            None = sequential, 0 = auto (cpu_count).
+        fail_fast: Run a candidate's stages in order (DSR, WFA, CV, CPCV) and
+            skip the remaining ones after the first failure.
     """
 
     enable_dsr: bool = True
@@ -38,6 +49,11 @@ class FilterConfig:
     wfa_config: WFAConfig | None = None
     cv_config: CVConfig | None = None
     cv_robustness_threshold: float = 0.5
+    enable_cpcv: bool = False
+    cpcv_config: CPCVConfig | None = None
+    wfa_max_workers: int | None = None
+    max_workers: int | None = None
+    fail_fast: bool = False
 
     @classmethod
     def default(cls) -> FilterConfig:
@@ -59,6 +75,11 @@ class FilterConfig:
         """Return configuration with only Purged K-Fold enabled."""
         return cls(enable_dsr=False, enable_wfa=False, enable_purged_kfold=True)
 
+    @classmethod
+    def cpcv_only(cls) -> FilterConfig:
+        """Return configuration with only Combinatorial Purged CV enabled."""
+        return cls(enable_dsr=False, enable_wfa=False, enable_purged_kfold=False, enable_cpcv=True)
+
 
 @dataclass(frozen=True, slots=True)
 class CandidateResult:
@@ -75,9 +96,11 @@ class CandidateResult:
         passed_wfa: Whether passed WFA filter (None if disabled).
         passed_cv: Whether passed Purged K-Fold filter (None if disabled).
         passed_all: Whether passed all enabled filters.
+        passed_cpcv: Whether passed CPCV filter (None if disabled).
         dsr_result: Full DSR result (None if disabled).
         wfa_result: Full WFA result (None if disabled).
         cv_result: Full CV result (None if disabled).
+        cpcv_result: Full CPCV result (None if disabled).
     """
 
     sweep_result_id: int
@@ -90,9 +113,11 @@ class CandidateResult:
     passed_wfa: bool | None
     passed_cv: bool | None
     passed_all: bool
+    passed_cpcv: bool | None = None
     dsr_result: DSRResult | None = None
     wfa_result: WFAResult | None = None
     cv_result: CVResult | None = None
+    cpcv_result: CPCVResult | None = None
 
 
 @dataclass
@@ -107,6 +132,13 @@ class PipelineResult:
         passed_cv: Number passing Purged K-Fold (0 if disabled).
         passed_all: Number passing all enabled filters.
         candidates: List of all candidate results.
+        passed_cpcv: Number passing CPCV (0 if disabled).
+        pbo: Probability of Backtest Overfitting across candidates with a
+            CPCV result (None if CPCV is disabled, fewer than two ran, or
+            all produced identical group results).
+        pbo_survivors_only: True when fail-fast kept some candidates out of
+            CPCV, so ``pbo`` covers only the survivors of earlier stages and
+            is biased low.
         filtered_candidates: Candidates that passed all enabled filters.
     """
 
@@ -117,6 +149,9 @@ class PipelineResult:
     passed_cv: int
     passed_all: int
     candidates: list[CandidateResult] = field(default_factory=list)
+    passed_cpcv: int = 0
+    pbo: PBOResult | None = None
+    pbo_survivors_only: bool = False
 
     @property
     def filtered_candidates(self) -> list[CandidateResult]:
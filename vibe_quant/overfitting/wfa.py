@@ -12,14 +12,25 @@ Configuration (from SPEC.md for 2-year data):
 Filter criteria:
 - Walk-forward efficiency > 0.5 (mean OOS / mean IS return)
 - > 50% of OOS windows profitable
+
+Windows are independent, so ``run`` can fan them out over a process pool
+(``max_workers``); results are always assembled in window order.
 """
 
 from __future__ import annotations
 
+import logging
+import os
+import pickle
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import date, timedelta
-from typing import Protocol, runtime_checkable
+from typing import TYPE_CHECKING, Protocol, runtime_checkable
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass(frozen=True, slots=True)
@@ -236,6 +247,11 @@ class BaseBacktestRunner(ABC):
         ...
 
 
+# (runner, strategy_id, window_index, (is_start, is_end, oos_start, oos_end), param_grid)
+_WindowJob = tuple[
+    BacktestRunner, str, int, tuple[date, date, date, date], dict[str, list[object]]
+]
+
 _MIN_IS_RETURN = 0.001
 _MAX_EFFICIENCY = 5.0
 
@@ -251,15 +267,20 @@ class WalkForwardAnalysis:
         self,
         config: WFAConfig | None = None,
         runner: BacktestRunner | None = None,
+        max_workers: int | None = None,
     ) -> None:
         """Initialize WFA.
 
         Args:
             config: WFA configuration. Uses default if None.
             runner: Backtest runner. Must be provided before run().
+            max_workers: Process pool size for window-level parallelism.
+                None or 1 = sequential, 0 = auto (cpu_count). The runner
+                must be picklable; otherwise windows run sequentially.
         """
         self._config = config or WFAConfig.default()
         self._runner = runner
+        self._max_workers = max_workers
 
     @property
     def config(self) -> WFAConfig:
@@ -332,6 +353,7 @@ class WalkForwardAnalysis:
         data_start: date,
         data_end: date,
         param_grid: dict[str, list[object]],
+        executor: Executor | None = None,
     ) -> WFAResult:
         """Execute Walk-Forward Analysis.
 
@@ -340,6 +362,8 @@ class WalkForwardAnalysis:
             data_start: First available data date.
             data_end: Last available data date.
             param_grid: Parameter grid for optimization.
+            executor: Optional long-lived pool to run windows on (caller
+                manages its lifecycle). Overrides ``max_workers``.
 
         Returns:
             WFAResult with all windows and aggregated metrics.
@@ -360,35 +384,26 @@ class WalkForwardAnalysis:
             )
             raise ValueError(msg)
 
-        # Execute each window
-        windows: list[WFAWindow] = []
-        for idx, (is_start, is_end, oos_start, oos_end) in enumerate(window_dates):
-            # Optimize on IS
-            best_params, is_sharpe, is_return = self._runner.optimize(
-                strategy_id, is_start, is_end, param_grid
-            )
-
-            # Test on OOS with optimized params
-            oos_sharpe, oos_return = self._runner.backtest(
-                strategy_id, oos_start, oos_end, best_params
-            )
-
-            window = WFAWindow(
-                window_index=idx,
-                is_start_date=is_start.isoformat(),
-                is_end_date=is_end.isoformat(),
-                oos_start_date=oos_start.isoformat(),
-                oos_end_date=oos_end.isoformat(),
-                is_sharpe=is_sharpe,
-                oos_sharpe=oos_sharpe,
-                is_return=is_return,
-                oos_return=oos_return,
-                best_params=best_params,
-            )
-            windows.append(window)
+        runner = self._runner
+        jobs: list[_WindowJob] = [
+            (runner, strategy_id, idx, dates, param_grid)
+            for idx, dates in enumerate(window_dates)
+        ]
+        pool_size = self._pool_size(len(jobs))
+        if (executor is not None or pool_size > 1) and _is_picklable(runner):
+            windows = _run_windows_parallel(jobs, executor, pool_size)
+        else:
+            windows = [_run_window(*job) for job in jobs]
 
         return self._aggregate_results(windows)
 
+    def _pool_size(self, num_windows: int) -> int:
+        """Resolve ``max_workers`` into a pool size for ``num_windows`` jobs."""
+        if self._max_workers is None:
+            return 1
+        workers = self._max_workers if self._max_workers > 0 else (os.cpu_count() or 4)
+        return max(1, min(workers, num_windows))
+
     def _aggregate_results(self, windows: list[WFAWindow]) -> WFAResult:
         """Aggregate window results into final WFAResult.
 
@@ -533,3 +548,64 @@ class WalkForwardAnalysis:
             )
 
         return "\n".join(lines)
+
+
+def _run_window(
+    runner: BacktestRunner,
+    strategy_id: str,
+    idx: int,
+    dates: tuple[date, date, date, date],
+    param_grid: dict[str, list[object]],
+) -> WFAWindow:
+    """Optimize on one IS window, then test the winner on its OOS window.
+
+    Module-level so it can be submitted to a ProcessPoolExecutor.
+    """
+    is_start, is_end, oos_start, oos_end = dates
+    best_params, is_sharpe, is_return = runner.optimize(
+        strategy_id, is_start, is_end, param_grid
+    )
+    oos_sharpe, oos_return = runner.backtest(strategy_id, oos_start, oos_end, best_params)
+    return WFAWindow(
+        window_index=idx,
+        is_start_date=is_start.isoformat(),
+        is_end_date=is_end.isoformat(),
+        oos_start_date=oos_start.isoformat(),
+        oos_end_date=oos_end.isoformat(),
+        is_sharpe=is_sharpe,
+        oos_sharpe=oos_sharpe,
+        is_return=is_return,
+        oos_return=oos_return,
+        best_params=best_params,
+    )
+
+
+def _run_windows_parallel(
+    jobs: list[_WindowJob],
+    executor: Executor | None,
+    pool_size: int,
+) -> list[WFAWindow]:
+    """Run window jobs on a pool and return results in window order.
+
+    A runner exception in any window propagates, as in the sequential path.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    if executor is not None:
+        futures = [executor.submit(_run_window, *job) for job in jobs]
+        return [f.result() for f in futures]
+    with ProcessPoolExecutor(max_workers=pool_size) as pool:
+        futures = [pool.submit(_run_window, *job) for job in jobs]
+        return [f.result() for f in futures]
+
+
+def _is_picklable(runner: object) -> bool:
+    try:
+        pickle.dumps(runner)
+    except Exception:
+        logger.warning(
+            "WFA runner %s is not picklable; running windows sequentially",
+            type(runner).__name__,
+        )
+        return False
+    return True
@@ -0,0 +1,209 @@
+"""ORDER/FILL event payloads from NautilusTrader order events.
+
+The paper node subscribes to ``events.order.*`` and turns submissions and
+fills into event log records. ORDER records carry the arrival price and the
+market context (spread, average bar volume, bar volatility) taken from the
+node cache, which is what ``vibe_quant.validation.calibration`` fits
+execution models from. Volume and volatility are
+:func:`~vibe_quant.validation.fill_model.trailing_market_stats` of the
+strategy's bar series, the statistic validation applies the fitted model
+with.
+
+Everything here is duck-typed against the NautilusTrader objects so the
+payload logic can be exercised without a running node.
+"""
+
+from __future__ import annotations
+
+import math
+from datetime import UTC, datetime
+from typing import Any
+
+import numpy as np
+
+from vibe_quant.validation.fill_model import MARKET_CONTEXT_BARS, trailing_market_stats
+
+
+def event_timestamp(event: object) -> datetime | None:
+    """Convert a NautilusTrader ``ts_event`` (UNIX ns) to a UTC datetime."""
+    ts_event = getattr(event, "ts_event", None)
+    if not isinstance(ts_event, int) or ts_event <= 0:
+        return None
+    return datetime.fromtimestamp(ts_event / 1e9, tz=UTC)
+
+
+def order_submitted_data(
+    event: object, cache: object, timeframe: str | None = None
+) -> dict[str, object] | None:
+    """Build ORDER event data for an ``OrderSubmitted`` event.
+
+    Args:
+        event: NautilusTrader ``OrderSubmitted`` event.
+        cache: Node cache holding the order, quotes and bars.
+        timeframe: Strategy timeframe, selecting the bar series of the
+            market context.
+
+    Returns:
+        ORDER event data, or None if the order is not in the cache.
+    """
+    client_order_id = getattr(event, "client_order_id", None)
+    order = _call(cache, "order", client_order_id)
+    if order is None:
+        return None
+
+    instrument_id = getattr(event, "instrument_id", None)
+    price = _as_float(getattr(order, "price", None)) if getattr(order, "has_price", False) else None
+    data: dict[str, object] = {
+        "order_id": str(client_order_id),
+        "side": str(_call(order, "side_string") or ""),
+        "quantity": _as_float(getattr(order, "quantity", None)) or 0.0,
+        "price": price,
+        "order_type": str(_call(order, "type_string") or "MARKET"),
+        "symbol": str(instrument_id) if instrument_id is not None else "",
+    }
+    data.update(market_context(cache, instrument_id, timeframe))
+    return data
+
+
+def order_filled_data(event: object, reference_price: float | None) -> dict[str, object]:
+    """Build FILL event data for an ``OrderFilled`` event.
+
+    Args:
+        event: NautilusTrader ``OrderFilled`` event.
+        reference_price: Price recorded when the order was submitted.
+
+    Returns:
+        FILL event data. ``slippage`` is the adverse move from the
+        reference price as a fraction of it (0.0 without a reference).
+    """
+    fill_price = _as_float(getattr(event, "last_px", None)) or 0.0
+    slippage = 0.0
+    if reference_price is not None and reference_price > 0 and fill_price > 0:
+        slippage = (fill_price - reference_price) / reference_price
+        if _side_name(getattr(event, "order_side", None)) == "SELL":
+            slippage = -slippage
+    return {
+        "order_id": str(getattr(event, "client_order_id", "")),
+        "fill_price": fill_price,
+        "quantity": _as_float(getattr(event, "last_qty", None)) or 0.0,
+        "fees": _as_float(getattr(event, "commission", None)) or 0.0,
+        "slippage": slippage,
+    }
+
+
+def market_context(
+    cache: object, instrument_id: object, timeframe: str | None = None
+) -> dict[str, float | None]:
+    """Arrival price, spread, average volume and volatility for an instrument.
+
+    The reference price is the quote mid, falling back to the last trade
+    and then the last bar close. Volume and volatility are the trailing
+    window statistics validation uses at trade entry, over the bar series
+    of ``timeframe`` (else the one with the most bars, as in validation).
+
+    Args:
+        cache: Node cache.
+        instrument_id: Instrument to describe.
+        timeframe: Strategy timeframe (e.g. ``"1h"``), if known.
+
+    Returns:
+        Dict with ``reference_price``, ``spread``, ``avg_volume`` and
+        ``volatility``; values the cache cannot supply are None.
+    """
+    context: dict[str, float | None] = {
+        "reference_price": None,
+        "spread": None,
+        "avg_volume": None,
+        "volatility": None,
+    }
+    if instrument_id is None:
+        return context
+
+    quote = _call(cache, "quote_tick", instrument_id)
+    if quote is not None:
+        bid = _as_float(getattr(quote, "bid_price", None))
+        ask = _as_float(getattr(quote, "ask_price", None))
+        if bid is not None and ask is not None and bid > 0 and ask >= bid:
+            mid = (bid + ask) / 2.0
+            context["reference_price"] = mid
+            context["spread"] = (ask - bid) / mid
+
+    if context["reference_price"] is None:
+        trade = _call(cache, "trade_tick", instrument_id)
+        if trade is not None:
+            context["reference_price"] = _positive(_as_float(getattr(trade, "price", None)))
+
+    bars = _recent_bars(cache, instrument_id, timeframe)
+    if bars:
+        volume = np.array([_as_float(getattr(b, "volume", None)) or 0.0 for b in bars])
+        close = np.array([_as_float(getattr(b, "close", None)) or 0.0 for b in bars])
+        if context["reference_price"] is None:
+            context["reference_price"] = _positive(float(close[-1]))
+        avg_volume, volatility = trailing_market_stats(volume, close, np.array([len(bars)]))
+        context["avg_volume"] = _as_float(avg_volume[0])
+        context["volatility"] = _as_float(volatility[0])
+    return context
+
+
+def _recent_bars(cache: object, instrument_id: object, timeframe: str | None) -> list[object]:
+    """Oldest-first last N bars of the bar type validation would pick."""
+    from vibe_quant.data.catalog import INTERVAL_TO_AGGREGATION, get_bar_spec
+
+    wanted_spec = None
+    if timeframe is not None and timeframe in INTERVAL_TO_AGGREGATION:
+        wanted_spec = str(get_bar_spec(timeframe))
+    best: list[object] = []
+    best_rank = (False, 0)
+    for bar_type in _call(cache, "bar_types", instrument_id) or []:
+        bars = _call(cache, "bars", bar_type) or []
+        rank = (str(getattr(bar_type, "spec", "")) == wanted_spec, len(bars))
+        if bars and rank > best_rank:
+            best, best_rank = list(bars), rank
+    # The cache returns the newest bar first.
+    return best[:MARKET_CONTEXT_BARS][::-1]
+
+
+def _call(obj: object, method: str, *args: object) -> Any:
+    """Call ``obj.method(*args)``; None when missing or failing."""
+    fn = getattr(obj, method, None)
+    if fn is None:
+        return None
+    try:
+        return fn(*args)
+    except Exception:
+        return None
+
+
+def _side_name(side: object) -> str:
+    """Order side as ``BUY``/``SELL`` from an enum, int or string."""
+    name = getattr(side, "name", side)
+    if name == 1:
+        return "BUY"
+    if name == 2:
+        return "SELL"
+    return str(name).upper()
+
+
+def _as_float(value: object) -> float | None:
+    """Float conversion for NautilusTrader value objects and numbers."""
+    if value is None:
+        return None
+    try:
+        result = float(value)  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        return None
+    return result if math.isfinite(result) else None
+
+
+def _positive(value: float | None) -> float | None:
+    """Return value if it is a positive price, else None."""
+    return value if value is not None and value > 0 else None
+
+
+__all__ = [
+    "MARKET_CONTEXT_BARS",
+    "event_timestamp",
+    "market_context",
+    "order_filled_data",
+    "order_submitted_data",
+]
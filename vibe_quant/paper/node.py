@@ -26,6 +26,11 @@ from vibe_quant.paper.config import (
     create_trading_node_config,
 )
 from vibe_quant.paper.errors import ErrorContext, ErrorHandler
+from vibe_quant.paper.execution_events import (
+    event_timestamp,
+    order_filled_data,
+    order_submitted_data,
+)
 from vibe_quant.paper.persistence import StateCheckpoint, StatePersistence
 
 if TYPE_CHECKING:
@@ -36,6 +41,11 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Order events after which no further fills arrive.
+_ORDER_TERMINAL_EVENTS = frozenset(
+    {"OrderCanceled", "OrderDenied", "OrderExpired", "OrderRejected"},
+)
+
 
 class _TradingNodeLifecycle(Protocol):
     """Minimal lifecycle contract for live trading node integration."""
@@ -194,6 +204,8 @@ class PaperTradingNode:
             on_alert=self._on_error_alert,
         )
         self._previous_state: NodeState | None = None  # For resume from halt
+        # Submission reference price per client order ID, for FILL slippage
+        self._order_references: dict[str, float] = {}
 
         # Optional Telegram alerts (if env vars configured)
         self._telegram: TelegramBot | None = None
@@ -422,6 +434,8 @@ class PaperTradingNode:
         node.add_data_client_factory("BINANCE", BinanceLiveDataClientFactory)
         node.add_exec_client_factory("BINANCE", BinanceLiveExecClientFactory)
         node.build()
+        # Log submissions and fills for execution model calibration.
+        node.kernel.msgbus.subscribe(topic="events.order.*", handler=self._on_order_event)
         return node
 
     def _setup_signal_handlers(self) -> None:
@@ -519,12 +533,18 @@ class PaperTradingNode:
             "locked": _as_currency_amounts(getattr(account, "balances_locked", lambda: None)()),
         }
 
-    def _write_event(self, event_type: EventType, data: dict[str, object]) -> None:
+    def _write_event(
+        self,
+        event_type: EventType,
+        data: dict[str, object],
+        timestamp: datetime | None = None,
+    ) -> None:
         """Write event to log.
 
         Args:
             event_type: Type of event.
             data: Event data.
+            timestamp: Event time (defaults to now).
         """
         if self._event_writer is not None:
             strategy_name = self._strategy.name if self._strategy else "unknown"
@@ -533,9 +553,54 @@ class PaperTradingNode:
                 run_id=self._config.trader_id,
                 strategy_name=strategy_name,
                 data=data,  # type: ignore[arg-type]
+                timestamp=timestamp,
             )
             self._event_writer.write(event)
 
+    def _on_order_event(self, event: object) -> None:
+        """Log ORDER on submission and FILL on each fill.
+
+        Subscribed to the NautilusTrader ``events.order.*`` topic. ORDER
+        events carry the arrival price and market context from the cache
+        so paper runs can be fed to execution model calibration. Errors
+        are logged and swallowed so the message bus is never interrupted.
+
+        Args:
+            event: NautilusTrader order event.
+        """
+        kind = type(event).__name__
+        try:
+            if kind == "OrderSubmitted":
+                cache = getattr(self._trading_node, "cache", None)
+                timeframe = self._strategy.timeframe if self._strategy is not None else None
+                data = order_submitted_data(event, cache, timeframe)
+                if data is None:
+                    return
+                # Arrival price, as calibration measures slippage against it
+                reference = data["reference_price"] or data["price"]
+                if isinstance(reference, float) and reference > 0:
+                    self._order_references[str(data["order_id"])] = reference
+                self._write_event(EventType.ORDER, data, timestamp=event_timestamp(event))
+            elif kind == "OrderFilled":
+                order_id = str(getattr(event, "client_order_id", ""))
+                data = order_filled_data(event, self._order_references.get(order_id))
+                self._write_event(EventType.FILL, data, timestamp=event_timestamp(event))
+                if self._order_closed(order_id, event):
+                    self._order_references.pop(order_id, None)
+            elif kind in _ORDER_TERMINAL_EVENTS:
+                self._order_references.pop(str(getattr(event, "client_order_id", "")), None)
+        except Exception:
+            logger.warning("Failed to log %s order event", kind, exc_info=True)
+
+    def _order_closed(self, order_id: str, event: object) -> bool:
+        """Whether the cached order for a fill is closed (fully filled)."""
+        cache = getattr(self._trading_node, "cache", None)
+        order = None
+        if cache is not None:
+            with contextlib.suppress(Exception):
+                order = cache.order(getattr(event, "client_order_id", order_id))
+        return order is None or bool(getattr(order, "is_closed", True))
+
     def _cancel_open_orders_for_halt(self) -> int:
         """Best-effort cancellation of all open orders before halt shutdown."""
         if self._trading_node is None:
@@ -60,7 +60,7 @@ def cmd_run(args: argparse.Namespace) -> int:
 
     db_path = Path(args.db) if args.db else DEFAULT_DB_PATH
     state = StateManager(db_path)
-    manager, stop_heartbeat = run_with_heartbeat(args.run_id, db_path)
+    manager, stop_heartbeat = run_with_heartbeat(args.run_id, db_path, state=state)
 
     try:
         run_config = state.get_backtest_run(args.run_id)
@@ -201,7 +201,7 @@ def cmd_status(args: argparse.Namespace) -> int:
 
     db_path = Path(args.db) if args.db else DEFAULT_DB_PATH
     state = StateManager(db_path)
-    job_mgr = BacktestJobManager(db_path)
+    job_mgr = BacktestJobManager(db_path, state=state)
 
     try:
         run_config = state.get_backtest_run(args.run_id)
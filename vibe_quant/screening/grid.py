@@ -99,9 +99,9 @@ def compute_pareto_front(
     A result is Pareto-optimal if no other result dominates it
     (i.e., is better in ALL objectives simultaneously).
 
-    Optimized with inlined comparisons and pre-extracted attributes
-    to eliminate function-call overhead and tuple allocation in the
-    inner loop. ~3-4x faster than the original implementation.
+    Uses the vectorized dominance matrix from
+    :func:`vibe_quant.discovery.nsga.pareto_front` instead of a pairwise
+    Python loop.
 
     Args:
         results: List of backtest metrics
@@ -112,36 +112,7 @@ def compute_pareto_front(
     if not results:
         return []
 
-    n = len(results)
-    if n == 1:
-        return [0]
+    from vibe_quant.discovery.nsga import pareto_front
 
-    # Pre-extract objectives to avoid repeated attribute access in O(n^2) loop
-    sharpes = [r.sharpe_ratio for r in results]
-    inv_dds = [1.0 - r.max_drawdown for r in results]
-    pfs = [r.profit_factor for r in results]
-
-    is_pareto = [True] * n
-
-    for i in range(n):
-        if not is_pareto[i]:
-            continue
-
-        s_i = sharpes[i]
-        d_i = inv_dds[i]
-        p_i = pfs[i]
-
-        for j in range(n):
-            if i == j or not is_pareto[j]:
-                continue
-
-            s_j = sharpes[j]
-            d_j = inv_dds[j]
-            p_j = pfs[j]
-
-            # Inlined dominance check: j >= i in all AND j > i in at least one
-            if s_j >= s_i and d_j >= d_i and p_j >= p_i and (s_j > s_i or d_j > d_i or p_j > p_i):
-                is_pareto[i] = False
-                break
-
-    return [i for i in range(n) if is_pareto[i]]
+    objectives = [(r.sharpe_ratio, 1.0 - r.max_drawdown, r.profit_factor) for r in results]
+    return [int(i) for i in pareto_front(objectives)]
@@ -139,6 +139,7 @@ class NTScreeningRunner:
             SortinoRatio,
             WinRate,
         )
+        from nautilus_trader.model.data import Bar
 
         from vibe_quant.data.catalog import (
             INTERVAL_TO_AGGREGATION,
@@ -183,10 +184,12 @@ class NTScreeningRunner:
                 if tf not in INTERVAL_TO_AGGREGATION:
                     continue
                 step, agg = INTERVAL_TO_AGGREGATION[tf]
+                # data_cls must be the class: NT only applies bar_spec when
+                # ``data_cls is Bar``, otherwise every bar type is loaded
                 data_configs.append(
                     BacktestDataConfig(
                         catalog_path=str(catalog_path.resolve()),
-                        data_cls="nautilus_trader.model.data:Bar",
+                        data_cls=Bar,
                         instrument_id=instrument_id,
                         bar_spec=f"{step}-{agg.name}-LAST",
                         start_time=self._start_date,
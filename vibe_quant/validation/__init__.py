@@ -4,9 +4,15 @@ This module provides:
 - Venue configuration with realistic latency and slippage modeling
 - Custom fill models plus SPEC slippage estimation (post-fill)
 - Latency presets for different execution environments
+- Slippage/latency calibration from recorded paper/live fills
 - ValidationRunner for full-fidelity backtesting
 """
 
+from vibe_quant.validation.calibration import (
+    CalibratedExecutionModel,
+    FillObservation,
+    calibrate,
+)
 from vibe_quant.validation.extraction import (
     compute_extended_metrics,
     estimate_market_stats,
@@ -21,6 +27,7 @@ from vibe_quant.validation.fill_model import (
     VolumeSlippageFillModelConfig,
     create_screening_fill_model,
     create_validation_fill_model,
+    trailing_market_stats,
 )
 from vibe_quant.validation.latency import (
     LATENCY_PRESETS,
@@ -32,12 +39,16 @@ from vibe_quant.validation.latency import (
 from vibe_quant.validation.random_baseline import (
     BaselineConfig,
     BaselineResult,
+    OHLCArrays,
     load_ohlc,
+    load_ohlc_arrays,
     run_all_champions,
+    run_random_baseline,
     run_random_short_baseline,
 )
 from vibe_quant.validation.results import TradeRecord, ValidationResult
 from vibe_quant.validation.runner import (
+    ValidationBatchError,
     ValidationRunner,
     ValidationRunnerError,
     list_validation_runs,
@@ -65,6 +76,11 @@ __all__ = [
     "ScreeningFillModelConfig",
     "create_screening_fill_model",
     "create_validation_fill_model",
+    "trailing_market_stats",
+    # Calibration
+    "CalibratedExecutionModel",
+    "FillObservation",
+    "calibrate",
     # Venue
     "VenueConfig",
     "BINANCE_MAKER_FEE",
@@ -81,13 +97,17 @@ __all__ = [
     # Runner
     "ValidationRunner",
     "ValidationRunnerError",
+    "ValidationBatchError",
     "ValidationResult",
     "TradeRecord",
     "list_validation_runs",
     # Random baseline
     "BaselineConfig",
     "BaselineResult",
+    "OHLCArrays",
+    "run_random_baseline",
     "run_random_short_baseline",
     "run_all_champions",
     "load_ohlc",
+    "load_ohlc_arrays",
 ]
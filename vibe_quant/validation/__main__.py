@@ -19,6 +19,20 @@ def main() -> int:
         choices=["1s", "5s"],
         help="Sub-bar timeframe for realistic fill simulation (auto-detects if omitted)",
     )
+    parser.add_argument(
+        "--detail-mode",
+        type=str,
+        default="stream",
+        choices=["stream", "on_demand"],
+        help="Feed detail bars for the whole run (stream) or only while orders are working "
+        "(on_demand, cheaper when orders are rarely open)",
+    )
+    parser.add_argument(
+        "--execution-model",
+        type=str,
+        default=None,
+        help="Calibrated slippage/latency model to validate with",
+    )
     args = parser.parse_args()
 
     from vibe_quant.db.connection import DEFAULT_DB_PATH
@@ -30,7 +44,12 @@ def main() -> int:
 
     runner = ValidationRunner(db_path=db_path)
     try:
-        result = runner.run(args.run_id, detail_timeframe=args.detail_timeframe)
+        result = runner.run(
+            args.run_id,
+            detail_timeframe=args.detail_timeframe,
+            detail_mode=args.detail_mode,
+            execution_model=args.execution_model,
+        )
         job_manager.mark_completed(args.run_id)
         # total_return is stored as a fraction (0.15 = 15%); multiply by 100 for display
         print(
@@ -8,7 +8,7 @@ from typing import TYPE_CHECKING
 
 from vibe_quant.data.ingest import ingest_all
 from vibe_quant.db.state_manager import StateManager
-from vibe_quant.validation.runner import ValidationRunner
+from vibe_quant.validation.runner import ValidationBatchError, ValidationRunner
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -17,7 +17,10 @@ if TYPE_CHECKING:
 
 @dataclass(frozen=True)
 class ValidationBatchResult:
-    """Summary of one validation run created by the batch helper."""
+    """Summary of one validation run created by the batch helper.
+
+    A failed run has zero metrics and its error message in ``error``.
+    """
 
     strategy_id: int
     strategy_name: str
@@ -28,6 +31,7 @@ class ValidationBatchResult:
     total_trades: int
     win_rate: float
     profit_factor: float
+    error: str | None = None
 
 
 def parse_strategy_ids(raw_value: str) -> list[int]:
@@ -135,8 +139,35 @@ def run_validation_batch(
     latency_preset: str | None = None,
     ensure_data: bool = False,
     verbose: bool = True,
+    max_workers: int | None = None,
+    execution_model: str | None = None,
 ) -> list[ValidationBatchResult]:
-    """Create and execute validation runs for multiple strategies on one scenario window."""
+    """Create and execute validation runs for multiple strategies on one scenario window.
+
+    Runs are executed by :meth:`ValidationRunner.run_batch`, which loads
+    the scenario's bars once per group of strategies that need the same
+    data and venue, so validating many discovery outputs costs one data
+    load per group rather than one per strategy.
+
+    Args:
+        strategy_ids: Strategies to validate.
+        symbol: Scenario symbol.
+        timeframe: Timeframe recorded on the created runs.
+        start_date: Scenario start date (YYYY-MM-DD).
+        end_date: Scenario end date (YYYY-MM-DD).
+        db_path: State database path.
+        latency_preset: Latency preset override.
+        ensure_data: Download missing raw history first.
+        verbose: Print progress.
+        max_workers: Worker processes for data groups. None or 1 =
+            sequential, 0 = auto (cpu_count).
+        execution_model: Name of a calibrated execution model to price
+            slippage and latency with.
+
+    Returns:
+        One result per strategy, in ``strategy_ids`` order. A run that
+        failed is reported with its ``error`` instead of aborting the batch.
+    """
     ensure_data_window(
         [symbol],
         start_date=start_date,
@@ -148,32 +179,72 @@ def run_validation_batch(
     state = StateManager(db_path)
     runner = ValidationRunner(db_path=db_path)
     try:
-        results: list[ValidationBatchResult] = []
+        run_ids: list[int] = []
+        names: dict[int, str] = {}
         for strategy_id in strategy_ids:
             strategy = state.get_strategy(strategy_id)
             if strategy is None:
                 raise ValueError(f"Strategy {strategy_id} not found")
+            names[strategy_id] = str(strategy["name"])
+
+            run_ids.append(
+                state.create_backtest_run(
+                    strategy_id=strategy_id,
+                    run_mode="validation",
+                    symbols=[symbol],
+                    timeframe=timeframe,
+                    start_date=start_date,
+                    end_date=end_date,
+                    parameters={},
+                    latency_preset=latency_preset,
+                )
+            )
 
-            strategy_name = str(strategy["name"])
-            run_id = state.create_backtest_run(
-                strategy_id=strategy_id,
-                run_mode="validation",
-                symbols=[symbol],
-                timeframe=timeframe,
-                start_date=start_date,
-                end_date=end_date,
-                parameters={},
-                latency_preset=latency_preset,
+        if verbose:
+            print(
+                f"Running validation for {len(run_ids)} strategies "
+                f"on {symbol} {timeframe} {start_date} -> {end_date}"
             )
 
+        try:
+            validation_results = dict(
+                zip(
+                    run_ids,
+                    runner.run_batch(
+                        run_ids,
+                        latency_preset=latency_preset,
+                        max_workers=max_workers,
+                        execution_model=execution_model,
+                    ),
+                    strict=True,
+                )
+            )
+            errors: dict[int, str] = {}
+        except ValidationBatchError as e:
             if verbose:
-                print(
-                    f"Running validation for sid={strategy_id} ({strategy_name}) "
-                    f"on {symbol} {timeframe} {start_date} -> {end_date}"
+                print(str(e))
+            validation_results, errors = e.results, e.errors
+
+        batch_results: list[ValidationBatchResult] = []
+        for strategy_id, run_id in zip(strategy_ids, run_ids, strict=True):
+            result = validation_results.get(run_id)
+            if result is None:
+                batch_results.append(
+                    ValidationBatchResult(
+                        strategy_id=strategy_id,
+                        strategy_name=names[strategy_id],
+                        run_id=run_id,
+                        total_return=0.0,
+                        sharpe_ratio=0.0,
+                        max_drawdown=0.0,
+                        total_trades=0,
+                        win_rate=0.0,
+                        profit_factor=0.0,
+                        error=errors.get(run_id, "no result"),
+                    )
                 )
-
-            result = runner.run(run_id, latency_preset=latency_preset)
-            results.append(
+                continue
+            batch_results.append(
                 ValidationBatchResult(
                     strategy_id=strategy_id,
                     strategy_name=result.strategy_name,
@@ -186,8 +257,7 @@ def run_validation_batch(
                     profit_factor=result.profit_factor,
                 )
             )
-
-        return results
+        return batch_results
     finally:
         runner.close()
         state.close()
@@ -201,6 +271,12 @@ def format_batch_results_markdown(results: Sequence[ValidationBatchResult]) -> s
     ]
 
     for result in results:
+        if result.error is not None:
+            lines.append(
+                f"| {result.strategy_id} | {result.strategy_name} | {result.run_id} | "
+                f"FAILED: {result.error.replace('|', '/')} | | | | | |"
+            )
+            continue
         lines.append(
             "| "
             f"{result.strategy_id} | "
@@ -0,0 +1,546 @@
+"""Execution model calibration from recorded paper/live fills.
+
+Validation prices execution with static assumptions: the SPEC square-root
+impact formula with ``k = 0.1`` and fixed latency presets. This module fits
+both from fills a paper or live run actually received, so validation can
+price execution the way the venue did.
+
+Fills are read from a run's ``logs/events/{run_id}.jsonl`` event log
+(same schema as :mod:`vibe_quant.reconciliation`). Paper nodes write these
+events to ``logs/paper/{trader_id}.jsonl`` from their order submissions and
+fills (see :mod:`vibe_quant.paper.execution_events`). Each ``ORDER`` event
+is paired with its ``FILL`` events by ``order_id``:
+
+- ``ORDER.data``: ``order_id``, ``side``, ``quantity`` and a reference
+  price: ``reference_price`` (arrival price, the quote mid at submission),
+  else ``price`` (the limit price). Limit prices are chosen away from the
+  market, so measuring against them would bias the impact fit. Optional
+  market context at submission: ``symbol``, ``avg_volume``, ``volatility``
+  (per-bar, from
+  :func:`~vibe_quant.validation.fill_model.trailing_market_stats`, which
+  validation also applies the model with) and ``spread`` (fraction of
+  price).
+- ``FILL.data``: ``order_id``, ``fill_price``, ``quantity``.
+
+Typical usage::
+
+    from vibe_quant.validation.calibration import calibrate
+
+    model = calibrate(["PAPER-001", "PAPER-002"], name="binance_retail", base_path="logs/paper")
+    print(model.summary())
+    state.save_execution_model(model.name, model.to_dict())
+
+The stored model is selected in validation by name
+(``ValidationRunner.run(..., execution_model="binance_retail")``).
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from vibe_quant.logging.query import _DEFAULT_BASE_PATH, _validate_run_id
+from vibe_quant.validation.latency import LatencyValues
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+logger = logging.getLogger(__name__)
+
+# Impact exponents tried when fitting slippage = base + k * vol * (q / V)^a.
+# 0.5 is the SPEC square-root law; linear impact is the upper end.
+_IMPACT_EXPONENTS: tuple[float, ...] = tuple(np.round(np.linspace(0.25, 1.0, 16), 4))
+
+
+@dataclass(frozen=True, slots=True)
+class FillObservation:
+    """One order's fill compared to the price it was submitted against.
+
+    Attributes:
+        order_id: Order identifier from the event log.
+        symbol: Instrument symbol ("" when not recorded).
+        side: ``BUY`` or ``SELL``.
+        quantity: Filled quantity.
+        reference_price: Arrival price at submission, or the limit price
+            when no arrival price was recorded.
+        fill_price: Volume-weighted average fill price.
+        submitted_at: Timestamp of the ORDER event.
+        filled_at: Timestamp of the first FILL event.
+        avg_volume: Average bar volume at submission, if recorded.
+        volatility: Per-bar volatility at submission, if recorded.
+        spread: Bid-ask spread as a fraction of price, if recorded.
+    """
+
+    order_id: str
+    symbol: str
+    side: str
+    quantity: float
+    reference_price: float
+    fill_price: float
+    submitted_at: datetime
+    filled_at: datetime
+    avg_volume: float | None = None
+    volatility: float | None = None
+    spread: float | None = None
+
+    @property
+    def slippage(self) -> float:
+        """Adverse slippage as a fraction of the reference price."""
+        diff = self.fill_price - self.reference_price
+        if self.side.upper() == "SELL":
+            diff = -diff
+        return diff / self.reference_price
+
+    @property
+    def latency_ms(self) -> float:
+        """Time from order submission to first fill in milliseconds."""
+        return (self.filled_at - self.submitted_at).total_seconds() * 1000.0
+
+    @property
+    def has_market_context(self) -> bool:
+        """Whether volume and volatility were recorded for the impact fit."""
+        return (
+            self.avg_volume is not None
+            and self.avg_volume > 0
+            and self.volatility is not None
+            and self.volatility > 0
+        )
+
+
+@dataclass(frozen=True)
+class SlippageFit:
+    """Fitted slippage curve and its fit quality.
+
+    ``slippage = spread/2 + base_slippage
+    + impact_coefficient * volatility * (order_size / avg_volume) ** impact_exponent``
+
+    Attributes:
+        base_slippage: Constant slippage not explained by the spread.
+        impact_coefficient: Market impact coefficient k.
+        impact_exponent: Participation exponent (0.5 = square-root law).
+        n_observations: Fills used for the fit.
+        r_squared: Coefficient of determination on the fitted fills.
+        rmse: Root-mean-square residual (fraction of price).
+    """
+
+    base_slippage: float
+    impact_coefficient: float
+    impact_exponent: float
+    n_observations: int
+    r_squared: float
+    rmse: float
+
+
+@dataclass(frozen=True)
+class LatencyFit:
+    """Distribution of submission-to-fill latency.
+
+    NautilusTrader's LatencyModel applies one fixed delay, so ``base_ms``
+    is the ``quantile`` of the observed distribution; the other
+    percentiles are kept for reporting.
+
+    Attributes:
+        base_ms: Latency used for simulation.
+        quantile: Quantile of the distribution ``base_ms`` was taken at.
+        mean_ms: Mean latency.
+        p50_ms: Median latency.
+        p90_ms: 90th percentile latency.
+        p99_ms: 99th percentile latency.
+        n_observations: Fills used for the fit.
+    """
+
+    base_ms: float
+    quantile: float
+    mean_ms: float
+    p50_ms: float
+    p90_ms: float
+    p99_ms: float
+    n_observations: int
+
+    def to_latency_values(self) -> LatencyValues:
+        """Latency values equivalent to a preset with ``base_ms``."""
+        return LatencyValues(base_ms=self.base_ms, insert_ms=0.0, update_ms=0.0, cancel_ms=0.0)
+
+
+@dataclass(frozen=True)
+class CalibratedExecutionModel:
+    """Named slippage and latency model fitted from recorded fills.
+
+    Attributes:
+        name: Name the model is stored and selected under.
+        slippage: Fitted slippage curve.
+        latency: Fitted latency distribution.
+        source_runs: Event log run IDs the fills came from.
+    """
+
+    name: str
+    slippage: SlippageFit
+    latency: LatencyFit
+    source_runs: tuple[str, ...] = ()
+
+    def to_dict(self) -> dict[str, object]:
+        """JSON-serializable representation for storage."""
+        return {
+            "name": self.name,
+            "slippage": {
+                "base_slippage": self.slippage.base_slippage,
+                "impact_coefficient": self.slippage.impact_coefficient,
+                "impact_exponent": self.slippage.impact_exponent,
+                "n_observations": self.slippage.n_observations,
+                "r_squared": self.slippage.r_squared,
+                "rmse": self.slippage.rmse,
+            },
+            "latency": {
+                "base_ms": self.latency.base_ms,
+                "quantile": self.latency.quantile,
+                "mean_ms": self.latency.mean_ms,
+                "p50_ms": self.latency.p50_ms,
+                "p90_ms": self.latency.p90_ms,
+                "p99_ms": self.latency.p99_ms,
+                "n_observations": self.latency.n_observations,
+            },
+            "source_runs": list(self.source_runs),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, object]) -> CalibratedExecutionModel:
+        """Rebuild a model stored with :meth:`to_dict`."""
+        slippage = data["slippage"]
+        latency = data["latency"]
+        if not isinstance(slippage, dict) or not isinstance(latency, dict):
+            msg = "Execution model needs 'slippage' and 'latency' objects"
+            raise ValueError(msg)
+        source_runs = data.get("source_runs") or []
+        return cls(
+            name=str(data["name"]),
+            slippage=SlippageFit(**slippage),
+            latency=LatencyFit(**latency),
+            source_runs=tuple(str(r) for r in source_runs),  # type: ignore[attr-defined]
+        )
+
+    def summary(self) -> str:
+        """Human-readable fit report."""
+        s = self.slippage
+        lat = self.latency
+        return (
+            f"Execution model: {self.name} ({', '.join(self.source_runs) or 'no runs'})\n"
+            f"  Slippage fills:       {s.n_observations}\n"
+            f"  Base slippage:        {s.base_slippage * 1e4:.2f} bps\n"
+            f"  Impact coefficient:   {s.impact_coefficient:.4f}\n"
+            f"  Impact exponent:      {s.impact_exponent:.2f}\n"
+            f"  R^2:                  {s.r_squared:.3f}\n"
+            f"  RMSE:                 {s.rmse * 1e4:.2f} bps\n"
+            f"  Latency fills:        {lat.n_observations}\n"
+            f"  Latency mean/p50:     {lat.mean_ms:.1f} / {lat.p50_ms:.1f} ms\n"
+            f"  Latency p90/p99:      {lat.p90_ms:.1f} / {lat.p99_ms:.1f} ms\n"
+            f"  Simulated latency:    {lat.base_ms:.1f} ms (q={lat.quantile:.2f})\n"
+        )
+
+
+def load_fill_observations(
+    run_id: str,
+    base_path: Path | str | None = None,
+) -> list[FillObservation]:
+    """Pair a run's ORDER and FILL events into fill observations.
+
+    Partial fills of one order are combined: quantity is summed, the fill
+    price is volume-weighted and the first fill sets ``filled_at``. Orders
+    without a reference price or without fills are skipped.
+
+    Args:
+        run_id: Event log run identifier (trader_id for paper runs).
+        base_path: Override the default ``logs/events/`` directory.
+
+    Returns:
+        Observations in submission order.
+
+    Raises:
+        FileNotFoundError: If no log file exists for the run.
+    """
+    _validate_run_id(run_id)
+    resolved = Path(base_path) if base_path is not None else _DEFAULT_BASE_PATH
+    log_path = resolved / f"{run_id}.jsonl"
+
+    orders: dict[str, tuple[datetime, dict[str, object]]] = {}
+    fills: dict[str, list[tuple[datetime, float, float]]] = {}
+
+    try:
+        fp = log_path.open("r", encoding="utf-8")
+    except FileNotFoundError as exc:
+        msg = f"Event log not found: {log_path}"
+        raise FileNotFoundError(msg) from exc
+
+    with fp:
+        for line in fp:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            event = record.get("event")
+            if event not in ("ORDER", "FILL"):
+                continue
+            data = record.get("data") or {}
+            order_id = str(data.get("order_id", ""))
+            ts = _parse_ts(record.get("ts"))
+            if not order_id or ts is None:
+                continue
+            if event == "ORDER":
+                orders.setdefault(order_id, (ts, data))
+            else:
+                price = _as_float(data.get("fill_price"))
+                qty = _as_float(data.get("quantity"))
+                if price is not None and price > 0 and qty is not None and qty > 0:
+                    fills.setdefault(order_id, []).append((ts, price, qty))
+
+    observations: list[FillObservation] = []
+    for order_id, (submitted_at, data) in orders.items():
+        order_fills = fills.get(order_id)
+        if not order_fills:
+            continue
+        reference = _as_float(data.get("reference_price"))
+        if reference is None or reference <= 0:
+            reference = _as_float(data.get("price"))
+        if reference is None or reference <= 0:
+            continue
+        quantity = sum(q for _, _, q in order_fills)
+        observations.append(
+            FillObservation(
+                order_id=order_id,
+                symbol=str(data.get("symbol", "")),
+                side=str(data.get("side", "")).upper(),
+                quantity=quantity,
+                reference_price=reference,
+                fill_price=sum(p * q for _, p, q in order_fills) / quantity,
+                submitted_at=submitted_at,
+                filled_at=min(ts for ts, _, _ in order_fills),
+                avg_volume=_as_float(data.get("avg_volume")),
+                volatility=_as_float(data.get("volatility")),
+                spread=_as_float(data.get("spread")),
+            )
+        )
+
+    observations.sort(key=lambda o: o.submitted_at)
+    return observations
+
+
+def fit_slippage(
+    observations: Sequence[FillObservation],
+    exponents: Sequence[float] = _IMPACT_EXPONENTS,
+) -> SlippageFit:
+    """Fit the slippage curve by least squares.
+
+    For each candidate exponent ``a``, ``slippage - spread/2`` is regressed
+    on ``volatility * (quantity / avg_volume) ** a`` with an intercept
+    (``base_slippage``); both coefficients are constrained to be
+    non-negative. The exponent with the smallest residual wins. Fills
+    without market context are left out; when fewer than two have it, only
+    the constant term is fitted.
+
+    Args:
+        observations: Fill observations.
+        exponents: Candidate impact exponents.
+
+    Returns:
+        SlippageFit with coefficients and fit quality.
+
+    Raises:
+        ValueError: If there are no observations or no exponents.
+    """
+    if not observations:
+        msg = "Cannot fit slippage without fill observations"
+        raise ValueError(msg)
+    if not exponents:
+        msg = "At least one impact exponent is required"
+        raise ValueError(msg)
+
+    with_context = [o for o in observations if o.has_market_context]
+    if len(with_context) < 2:
+        logger.warning(
+            "%d of %d fills have volume/volatility context; fitting constant slippage only",
+            len(with_context),
+            len(observations),
+        )
+        y = _net_slippage(observations)
+        base = max(float(y.mean()), 0.0)
+        return _slippage_fit(y, np.full(y.size, base), base, 0.0, 0.5)
+
+    y = _net_slippage(with_context)
+    vol = np.array([o.volatility for o in with_context], dtype=np.float64)
+    participation = np.array(
+        [abs(o.quantity) / o.avg_volume for o in with_context],  # type: ignore[operator]
+        dtype=np.float64,
+    )
+
+    best: tuple[float, float, float, float] | None = None  # sse, base, k, exponent
+    for exponent in exponents:
+        x = vol * participation**exponent
+        base, k = _nonnegative_line(x, y)
+        sse = float(np.sum((y - base - k * x) ** 2))
+        if best is None or sse < best[0]:
+            best = (sse, base, k, float(exponent))
+
+    assert best is not None
+    _, base, k, exponent = best
+    predicted = base + k * vol * participation**exponent
+    return _slippage_fit(y, predicted, base, k, exponent)
+
+
+def fit_latency(observations: Sequence[FillObservation], quantile: float = 0.5) -> LatencyFit:
+    """Summarize submission-to-fill latency.
+
+    Negative latencies (clock skew between event sources) are dropped.
+
+    Args:
+        observations: Fill observations.
+        quantile: Quantile used as the simulated fixed latency.
+
+    Returns:
+        LatencyFit with the simulated latency and percentiles.
+
+    Raises:
+        ValueError: If ``quantile`` is outside [0, 1] or no usable
+            latencies remain.
+    """
+    if not 0.0 <= quantile <= 1.0:
+        msg = f"quantile must be between 0 and 1, got {quantile}"
+        raise ValueError(msg)
+    latencies = np.array([o.latency_ms for o in observations], dtype=np.float64)
+    latencies = latencies[latencies >= 0]
+    if latencies.size == 0:
+        msg = "Cannot fit latency without fills that follow their orders"
+        raise ValueError(msg)
+
+    p50, p90, p99, base = np.quantile(latencies, [0.5, 0.9, 0.99, quantile])
+    return LatencyFit(
+        base_ms=float(base),
+        quantile=quantile,
+        mean_ms=float(latencies.mean()),
+        p50_ms=float(p50),
+        p90_ms=float(p90),
+        p99_ms=float(p99),
+        n_observations=int(latencies.size),
+    )
+
+
+def calibrate(
+    run_ids: Iterable[str],
+    name: str,
+    base_path: Path | str | None = None,
+    latency_quantile: float = 0.5,
+) -> CalibratedExecutionModel:
+    """Fit a named execution model from the fills of one or more runs.
+
+    Args:
+        run_ids: Event log run IDs (paper trader IDs or live run IDs).
+        name: Name for the model.
+        base_path: Override the default ``logs/events/`` directory.
+        latency_quantile: Quantile used as the simulated fixed latency.
+
+    Returns:
+        CalibratedExecutionModel ready to store and select in validation.
+
+    Raises:
+        ValueError: If the runs hold no usable fills.
+        FileNotFoundError: If a run has no event log.
+    """
+    runs = tuple(run_ids)
+    observations: list[FillObservation] = []
+    for run_id in runs:
+        observations.extend(load_fill_observations(run_id, base_path=base_path))
+    if not observations:
+        msg = f"No fills with a reference price in runs: {', '.join(runs)}"
+        raise ValueError(msg)
+
+    return CalibratedExecutionModel(
+        name=name,
+        slippage=fit_slippage(observations),
+        latency=fit_latency(observations, quantile=latency_quantile),
+        source_runs=runs,
+    )
+
+
+def _net_slippage(observations: Sequence[FillObservation]) -> np.ndarray:
+    """Slippage minus half the recorded spread, per observation."""
+    return np.array(
+        [o.slippage - 0.5 * (o.spread or 0.0) for o in observations],
+        dtype=np.float64,
+    )
+
+
+def _nonnegative_line(x: np.ndarray, y: np.ndarray) -> tuple[float, float]:
+    """Least-squares ``y = base + k * x`` with ``base, k >= 0``."""
+    x_var = float(np.var(x))
+    if x_var > 0:
+        k = float(np.cov(x, y, bias=True)[0, 1]) / x_var
+        base = float(y.mean()) - k * float(x.mean())
+        if k >= 0 and base >= 0:
+            return base, k
+    # Constrained optimum lies on a boundary: try k = 0 and base = 0
+    candidates = [(max(float(y.mean()), 0.0), 0.0)]
+    xx = float(np.dot(x, x))
+    if xx > 0:
+        candidates.append((0.0, max(float(np.dot(x, y)) / xx, 0.0)))
+    return min(candidates, key=lambda c: float(np.sum((y - c[0] - c[1] * x) ** 2)))
+
+
+def _slippage_fit(
+    y: np.ndarray,
+    predicted: np.ndarray,
+    base: float,
+    k: float,
+    exponent: float,
+) -> SlippageFit:
+    """Package coefficients with R^2 and RMSE."""
+    sse = float(np.sum((y - predicted) ** 2))
+    sst = float(np.sum((y - y.mean()) ** 2))
+    # A constant target has no variance to explain: perfect only if matched
+    r_squared = 1.0 - sse / sst if sst > 0 else float(sse == 0)
+    return SlippageFit(
+        base_slippage=base,
+        impact_coefficient=k,
+        impact_exponent=exponent,
+        n_observations=int(y.size),
+        r_squared=r_squared,
+        rmse=math.sqrt(sse / y.size),
+    )
+
+
+def _parse_ts(value: object) -> datetime | None:
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            return None
+    return None
+
+
+def _as_float(value: object) -> float | None:
+    if value is None or isinstance(value, bool):
+        return None
+    try:
+        result = float(value)  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        return None
+    return result if math.isfinite(result) else None
+
+
+__all__ = [
+    "CalibratedExecutionModel",
+    "FillObservation",
+    "LatencyFit",
+    "SlippageFit",
+    "calibrate",
+    "fit_latency",
+    "fit_slippage",
+    "load_fill_observations",
+]
@@ -0,0 +1,157 @@
+"""Time-indexed detail bars for on-demand sub-bar fill simulation.
+
+Streaming a 5s/1s detail feed through the whole validation window
+multiplies event count by 12-60x, although detail bars only change fills
+while orders are working. :class:`DetailBarStore` reads one symbol's
+detail bars from the parquet catalog once, indexed by ``ts_init``, and
+materializes NautilusTrader ``Bar`` objects only for the requested
+windows.
+
+The windows come from the orders of a primary-bar-only backtest (see
+``ValidationRunner._run_backtest``): each order's working interval,
+padded by one primary bar on both sides so the matching engine has
+sub-bar prices before the order arrives and after it last changes.
+"""
+
+from __future__ import annotations
+
+import glob
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
+    import pyarrow as pa
+    from nautilus_trader.model.data import Bar
+
+# Bar length per catalog timeframe (keys match INTERVAL_TO_AGGREGATION)
+_TIMEFRAME_SECONDS: dict[str, int] = {
+    "1s": 1,
+    "5s": 5,
+    "1m": 60,
+    "5m": 300,
+    "15m": 900,
+    "1h": 3600,
+    "4h": 14_400,
+    "1d": 86_400,
+}
+
+# Columns of a NautilusTrader bar parquet file, in serializer order
+_BAR_COLUMNS = ("open", "high", "low", "close", "volume", "ts_event", "ts_init")
+
+Window = tuple[int, int]
+# End of the working interval of an order still open when the run ends
+OPEN_END = int(np.iinfo(np.int64).max)
+
+
+def bar_duration_ns(timeframe: str) -> int:
+    """Length of one bar of ``timeframe`` in nanoseconds.
+
+    Raises:
+        ValueError: If the timeframe is unknown.
+    """
+    seconds = _TIMEFRAME_SECONDS.get(timeframe)
+    if seconds is None:
+        msg = f"Unknown timeframe {timeframe!r}"
+        raise ValueError(msg)
+    return seconds * 1_000_000_000
+
+
+def merge_windows(intervals: Iterable[Window], pad_ns: int = 0) -> list[Window]:
+    """Pad closed ``(start_ns, end_ns)`` intervals and merge overlaps.
+
+    Args:
+        intervals: Closed nanosecond intervals, in any order.
+        pad_ns: Amount to widen each interval by on both sides. Ends are
+            capped at :data:`OPEN_END`.
+
+    Returns:
+        Sorted, disjoint closed windows.
+    """
+    padded = ((s - pad_ns, min(e + pad_ns, OPEN_END)) for s, e in intervals)
+    merged: list[Window] = []
+    for start, end in sorted(padded):
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+class DetailBarStore:
+    """One symbol's detail bars, loaded once and sliced by time window.
+
+    Args:
+        bar_dir: ``<catalog>/data/bar/<bar_type>`` directory of the detail
+            bar type.
+        start_ns: Inclusive lower ``ts_init`` bound, or None.
+        end_ns: Inclusive upper ``ts_init`` bound, or None.
+
+    Raises:
+        ValueError: If the directory holds no parquet files.
+    """
+
+    def __init__(self, bar_dir: Path, start_ns: int | None = None, end_ns: int | None = None):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        files = sorted(glob.glob(str(bar_dir / "*.parquet")))
+        if not files:
+            msg = f"No parquet files in {bar_dir}"
+            raise ValueError(msg)
+
+        # Bounds are pushed down to the row-group statistics, so files and
+        # row groups outside the run are skipped instead of read and filtered.
+        filters: list[tuple[str, str, int]] = []
+        if start_ns is not None:
+            filters.append(("ts_init", ">=", start_ns))
+        if end_ns is not None:
+            filters.append(("ts_init", "<=", end_ns))
+        tables = [
+            pq.read_table(f, columns=list(_BAR_COLUMNS), filters=filters or None) for f in files
+        ]
+        # Metadata (bar_type, precisions) is identical per bar type; keep
+        # the first file's so the concatenated table still deserializes.
+        table = pa.concat_tables(tables).replace_schema_metadata(tables[0].schema.metadata)
+        ts = table["ts_init"].to_numpy().astype(np.int64)
+        if ts.size > 1 and np.any(ts[1:] < ts[:-1]):
+            order = np.argsort(ts, kind="stable")
+            table = table.take(pa.array(order))
+            ts = ts[order]
+
+        self._table: pa.Table = table
+        self._ts = ts
+
+    def __len__(self) -> int:
+        return len(self._ts)
+
+    def row_ranges(self, windows: Iterable[Window]) -> list[tuple[int, int]]:
+        """Half-open row ranges of the bars whose ``ts_init`` lies in each window."""
+        ranges: list[tuple[int, int]] = []
+        for start, end in windows:
+            lo = int(np.searchsorted(self._ts, start, side="left"))
+            hi = int(np.searchsorted(self._ts, end, side="right"))
+            if hi > lo:
+                ranges.append((lo, hi))
+        return ranges
+
+    def count(self, windows: Iterable[Window]) -> int:
+        """Number of bars whose ``ts_init`` lies in the windows."""
+        return sum(hi - lo for lo, hi in self.row_ranges(windows))
+
+    def bars(self, windows: Iterable[Window]) -> list[Bar]:
+        """Detail bars inside the given (sorted, disjoint) windows, in time order."""
+        import pyarrow as pa
+        from nautilus_trader.model.data import Bar
+        from nautilus_trader.serialization.arrow.serializer import ArrowSerializer
+
+        ranges = self.row_ranges(windows)
+        if not ranges:
+            return []
+        selected = pa.concat_tables([self._table.slice(lo, hi - lo) for lo, hi in ranges])
+        bars: list[Bar] = Bar.from_pyo3_list(ArrowSerializer.deserialize(Bar, selected))
+        return bars
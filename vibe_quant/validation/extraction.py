@@ -8,10 +8,13 @@ from __future__ import annotations
 
 import logging
 import math
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 
-from vibe_quant.validation.fill_model import SlippageEstimator
+import numpy as np
+
+from vibe_quant.validation.fill_model import SlippageEstimator, trailing_market_stats
 from vibe_quant.validation.results import TradeRecord, ValidationResult
 
 if TYPE_CHECKING:
@@ -34,43 +37,260 @@ def _ns_to_isoformat(ns_timestamp: int | float | str) -> str:
     return datetime.fromtimestamp(ns / 1e9, tz=UTC).isoformat()
 
 
-def _extract_return_moments(result: ValidationResult, engine: BacktestEngine) -> None:
-    """Compute skewness/kurtosis from closed positions and set on result."""
+_NS_PER_HOUR_INT = 3_600_000_000_000
+_NS_PER_HOUR = float(_NS_PER_HOUR_INT)
+_NS_PER_DAY = 24.0 * _NS_PER_HOUR
+
+# Marks a missing/unparseable timestamp in int64 nanosecond arrays
+_MISSING_NS = int(np.iinfo(np.int64).min)
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+
+@dataclass(frozen=True)
+class _PositionArrays:
+    """Closed positions from the engine cache, one array element per position.
+
+    Built once per run so every downstream metric is a NumPy operation
+    instead of another pass over NT Position objects.
+    """
+
+    instrument_ids: list[str]
+    is_long: np.ndarray
+    entry_px: np.ndarray
+    exit_px: np.ndarray
+    quantity: np.ndarray
+    realized_pnl: np.ndarray
+    fees: np.ndarray
+    ts_opened: np.ndarray
+    ts_closed: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.instrument_ids)
+
+    def take(self, index: np.ndarray) -> _PositionArrays:
+        """Return the positions at ``index`` (e.g. a sort order)."""
+        return _PositionArrays(
+            instrument_ids=[self.instrument_ids[i] for i in index],
+            is_long=self.is_long[index],
+            entry_px=self.entry_px[index],
+            exit_px=self.exit_px[index],
+            quantity=self.quantity[index],
+            realized_pnl=self.realized_pnl[index],
+            fees=self.fees[index],
+            ts_opened=self.ts_opened[index],
+            ts_closed=self.ts_closed[index],
+        )
+
+
+@dataclass(frozen=True)
+class _BarSeries:
+    """One bar type of one instrument, sorted by ts_init."""
+
+    ts: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    volume: np.ndarray
+    close: np.ndarray
+
+
+@dataclass(frozen=True)
+class _BarArrays:
+    """Bars from the engine cache.
+
+    Attributes:
+        by_instrument: Instrument ID -> bars of one bar type (see
+            :func:`_bar_arrays`).
+    """
+
+    by_instrument: dict[str, _BarSeries]
+
+
+@dataclass(frozen=True)
+class _TradeArrays:
+    """Per-trade columns used by the extended metrics, in trade order.
+
+    Missing timestamps are ``_MISSING_NS``.
+    """
+
+    net_pnl: np.ndarray
+    roi: np.ndarray
+    entry_ns: np.ndarray
+    exit_ns: np.ndarray
+
+    @classmethod
+    def from_trades(cls, trades: list[TradeRecord]) -> _TradeArrays:
+        """Build from TradeRecords (ISO 8601 entry/exit times)."""
+        n = len(trades)
+        return cls(
+            net_pnl=np.fromiter((t.net_pnl for t in trades), dtype=np.float64, count=n),
+            roi=np.fromiter((t.roi_percent / 100.0 for t in trades), dtype=np.float64, count=n),
+            entry_ns=np.fromiter(
+                (_isoformat_to_ns(t.entry_time) for t in trades), dtype=np.int64, count=n
+            ),
+            exit_ns=np.fromiter(
+                (_isoformat_to_ns(t.exit_time) for t in trades), dtype=np.int64, count=n
+            ),
+        )
+
+
+def _isoformat_to_ns(value: str | None) -> int:
+    """Parse an ISO 8601 timestamp to Unix nanoseconds (naive = UTC)."""
+    if not value:
+        return _MISSING_NS
     try:
+        dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except (ValueError, TypeError):
+        return _MISSING_NS
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=UTC)
+    delta = dt - _EPOCH
+    return (delta.days * 86_400 + delta.seconds) * 1_000_000_000 + delta.microseconds * 1_000
+
+
+def _closed_position_arrays(engine: BacktestEngine) -> _PositionArrays | None:
+    """Read closed positions from the engine cache in a single pass.
+
+    Returns:
+        Position arrays, or None if the cache could not be read.
+    """
+    try:
+        # NT netting mode reuses position IDs: when a position closes and reopens,
+        # it's removed from _index_positions_closed. The closed state is preserved
+        # as a "snapshot". We must combine positions() + position_snapshots() and
+        # filter by is_closed, exactly as NT's own "Total positions" log does.
         cache = engine.kernel.cache
         all_positions = list(cache.positions()) + list(cache.position_snapshots())
         closed = [p for p in all_positions if p.is_closed]
-        if len(closed) < 4:
-            return
-
-        returns: list[float] = []
-        for pos in closed:
-            entry_val = abs(float(pos.peak_qty) * float(pos.avg_px_open))
-            if entry_val > 0:
-                returns.append(float(pos.realized_pnl) / entry_val)
-
-        n = len(returns)
-        if n < 4:
-            return
-
-        mean = sum(returns) / n
-        diffs = [r - mean for r in returns]
-        m2 = sum(d * d for d in diffs) / n
-        if m2 == 0:
-            return
-
-        m3 = sum(d**3 for d in diffs) / n
-        m4 = sum(d**4 for d in diffs) / n
-
-        result.skewness = round(
-            (math.sqrt(n * (n - 1)) / (n - 2)) * (m3 / m2**1.5), 4
-        )
-        excess = ((n + 1) * (n - 1) * m4) / (
-            (n - 2) * (n - 3) * m2**2
-        ) - (3 * (n - 1) ** 2) / ((n - 2) * (n - 3))
-        result.kurtosis = round(max(1.0, excess + 3.0), 4)
+
+        n = len(closed)
+        instrument_ids: list[str] = []
+        is_long = np.empty(n, dtype=bool)
+        numeric = np.empty((5, n), dtype=np.float64)
+        ts = np.empty((2, n), dtype=np.int64)
+        for i, pos in enumerate(closed):
+            instrument_ids.append(str(pos.instrument_id))
+            is_long[i] = getattr(pos.entry, "name", str(pos.entry)).upper() == "BUY"
+            # pos.quantity is 0 for closed positions; use peak_qty for trade size
+            numeric[:, i] = (
+                float(pos.avg_px_open),
+                float(pos.avg_px_close),
+                float(pos.peak_qty),
+                float(pos.realized_pnl),
+                sum(float(c) for c in pos.commissions()),
+            )
+            ts[:, i] = (int(pos.ts_opened), int(pos.ts_closed or 0))
+    except Exception:
+        logger.warning("Could not read positions from engine cache", exc_info=True)
+        return None
+
+    return _PositionArrays(
+        instrument_ids=instrument_ids,
+        is_long=is_long,
+        entry_px=numeric[0],
+        exit_px=numeric[1],
+        quantity=numeric[2],
+        realized_pnl=numeric[3],
+        fees=numeric[4],
+        ts_opened=ts[0],
+        ts_closed=ts[1],
+    )
+
+
+def _bar_arrays(engine: BacktestEngine, timeframe: str | None = None) -> _BarArrays | None:
+    """Read bars from the engine cache in a single pass.
+
+    ``by_instrument`` holds a single bar type per instrument: the one of
+    ``timeframe`` if the cache has it, else the one with the most bars.
+    Mixing types would let coarser (or detail) bars whose range began
+    before a position opened into its price path. Paper nodes pick the
+    bar type for their market context by the same rule.
+
+    Args:
+        engine: BacktestEngine after run.
+        timeframe: Strategy timeframe (e.g. ``"1h"``), if known.
+
+    Returns:
+        Bar arrays, or None if the cache could not be read.
+    """
+    try:
+        bars = engine.kernel.cache.bars()
+        n = len(bars)
+        codes = np.empty(n, dtype=np.intp)
+        code_by_type: dict[str, int] = {}
+        type_info: list[tuple[str, str]] = []  # (instrument_id, bar spec) per code
+        for i, bar in enumerate(bars):
+            key = str(bar.bar_type)
+            code = code_by_type.get(key)
+            if code is None:
+                code = code_by_type[key] = len(type_info)
+                bar_type = bar.bar_type
+                type_info.append((str(bar_type.instrument_id), str(getattr(bar_type, "spec", ""))))
+            codes[i] = code
+        values = np.array(
+            [(float(b.volume), float(b.close), float(b.high), float(b.low)) for b in bars],
+            dtype=np.float64,
+        ).reshape(n, 4)
+        ts = np.fromiter((int(bar.ts_init) for bar in bars), dtype=np.int64, count=n)
     except Exception:
-        logger.warning("Could not compute return moments", exc_info=True)
+        logger.debug("Could not read bars from engine cache", exc_info=True)
+        return None
+
+    wanted_spec = _bar_spec(timeframe)
+    counts = np.bincount(codes, minlength=len(type_info))
+    chosen: dict[str, int] = {}
+    for code, (instrument_id, spec) in enumerate(type_info):
+        best = chosen.get(instrument_id)
+        rank = (spec == wanted_spec, counts[code])
+        if best is None or rank > (type_info[best][1] == wanted_spec, counts[best]):
+            chosen[instrument_id] = code
+
+    by_instrument: dict[str, _BarSeries] = {}
+    for instrument_id, code in chosen.items():
+        sel = np.flatnonzero(codes == code)
+        sel = sel[np.argsort(ts[sel], kind="stable")]
+        by_instrument[instrument_id] = _BarSeries(
+            ts=ts[sel],
+            high=values[sel, 2],
+            low=values[sel, 3],
+            volume=values[sel, 0],
+            close=values[sel, 1],
+        )
+    return _BarArrays(by_instrument=by_instrument)
+
+
+def _bar_spec(timeframe: str | None) -> str | None:
+    """NautilusTrader bar specification string (``1-HOUR-LAST``) of a timeframe."""
+    from vibe_quant.data.catalog import INTERVAL_TO_AGGREGATION, get_bar_spec
+
+    if timeframe is None or timeframe not in INTERVAL_TO_AGGREGATION:
+        return None
+    return str(get_bar_spec(timeframe))
+
+
+def _extract_return_moments(result: ValidationResult, positions: _PositionArrays) -> None:
+    """Compute skewness/kurtosis from closed positions and set on result."""
+    entry_val = np.abs(positions.quantity * positions.entry_px)
+    valid = entry_val > 0
+    returns = positions.realized_pnl[valid] / entry_val[valid]
+
+    n = returns.size
+    if n < 4:
+        return
+
+    diffs = returns - returns.mean()
+    m2 = float(np.mean(diffs**2))
+    if m2 == 0:
+        return
+
+    m3 = float(np.mean(diffs**3))
+    m4 = float(np.mean(diffs**4))
+
+    result.skewness = round((math.sqrt(n * (n - 1)) / (n - 2)) * (m3 / m2**1.5), 4)
+    excess = ((n + 1) * (n - 1) * m4) / ((n - 2) * (n - 3) * m2**2) - (3 * (n - 1) ** 2) / (
+        (n - 2) * (n - 3)
+    )
+    result.kurtosis = round(max(1.0, excess + 3.0), 4)
 
 
 def extract_results(
@@ -79,8 +299,14 @@ def extract_results(
     bt_result: BacktestResult,
     engine: BacktestEngine,
     venue_config: VenueConfig,
+    *,
+    timeframe: str | None = None,
 ) -> ValidationResult:
-    """Extract ValidationResult from NautilusTrader backtest output."""
+    """Extract ValidationResult from NautilusTrader backtest output.
+
+    ``timeframe`` is the strategy's bar timeframe; it picks the bar series
+    that excursions are measured on (see :func:`_bar_arrays`).
+    """
     result = ValidationResult(
         run_id=run_id,
         strategy_name=strategy_name,
@@ -94,8 +320,11 @@ def extract_results(
     result.total_trades = bt_result.total_positions
 
     extract_stats(result, bt_result)
-    extract_trades(result, engine, venue_config)
-    _extract_return_moments(result, engine)
+    positions = _closed_position_arrays(engine)
+    if positions is None:
+        return result
+    extract_trades(result, engine, venue_config, positions=positions, timeframe=timeframe)
+    _extract_return_moments(result, positions)
 
     return result
 
@@ -216,37 +445,35 @@ def extract_trades(
     result: ValidationResult,
     engine: BacktestEngine,
     venue_config: VenueConfig,
+    *,
+    positions: _PositionArrays | None = None,
+    timeframe: str | None = None,
 ) -> None:
     """Extract individual trade records from the engine's closed positions.
 
     Uses the Position objects from the engine cache directly, since the
     positions report DataFrame column names can vary across NT versions.
+    Positions and bars are read into arrays once; slippage, fees, win/loss
+    counts and the extended metrics are then computed on the arrays.
 
     Args:
         result: ValidationResult to populate trades on (mutated in place).
         engine: BacktestEngine after run.
         venue_config: Venue config for default leverage.
+        positions: Closed positions already read from ``engine``.
+        timeframe: Strategy timeframe; selects the bar series used for
+            excursions and the market stats of the slippage estimate.
     """
-    try:
-        # NT netting mode reuses position IDs: when a position closes and reopens,
-        # it's removed from _index_positions_closed. The closed state is preserved
-        # as a "snapshot". We must combine positions() + position_snapshots() and
-        # filter by is_closed, exactly as NT's own "Total positions" log does.
-        cache = engine.kernel.cache
-        all_positions = list(cache.positions()) + list(cache.position_snapshots())
-        positions = [p for p in all_positions if p.is_closed]
-    except Exception:
-        logger.warning("Could not read positions from engine cache", exc_info=True)
+    if positions is None:
+        positions = _closed_position_arrays(engine)
+    if positions is None or len(positions) == 0:
         return
 
-    if not positions:
-        return
+    # Chronological order (extract_trades used to sort by entry_time string)
+    order = np.argsort(positions.ts_opened, kind="stable")
+    positions = positions.take(order)
 
     default_leverage = int(venue_config.default_leverage)
-    winning = 0
-    losing = 0
-    total_fees = 0.0
-    total_slippage = 0.0
 
     fill_cfg = venue_config.fill_config
     impact_k = getattr(fill_cfg, "impact_coefficient", 0.1) if fill_cfg else 0.1
@@ -254,9 +481,6 @@ def extract_trades(
         float(getattr(fill_cfg, "prob_slippage", 0.0)) if fill_cfg is not None else 0.0
     )
     use_post_fill_spec_slippage = engine_prob_slippage <= 0.0
-    slippage_estimator = (
-        SlippageEstimator(impact_coefficient=impact_k) if use_post_fill_spec_slippage else None
-    )
 
     if not use_post_fill_spec_slippage:
         logger.info(
@@ -265,97 +489,82 @@ def extract_trades(
             engine_prob_slippage,
         )
 
-    avg_bar_volume, bar_volatility = estimate_market_stats(engine)
-
-    for pos in positions:
-        realized_pnl = float(pos.realized_pnl)
-        entry_price = float(pos.avg_px_open)
-        exit_price = float(pos.avg_px_close)
-        # pos.quantity is 0 for closed positions; use peak_qty for trade size
-        quantity = float(pos.peak_qty)
-
-        pos_fees = sum(float(c) for c in pos.commissions())
-        total_fees += abs(pos_fees)
-
-        if realized_pnl > 0:
-            winning += 1
-        elif realized_pnl < 0:
-            losing += 1
-
-        if slippage_estimator is not None:
-            slippage_cost = slippage_estimator.estimate_cost(
-                entry_price=entry_price,
-                order_size=quantity,
-                avg_volume=avg_bar_volume,
-                volatility=bar_volatility,
-                spread=0.0001,
-            )
-        else:
-            slippage_cost = 0.0
-        total_slippage += slippage_cost
-
-        if entry_price > 0 and quantity > 0:
-            notional = entry_price * quantity
-            roi_pct = (realized_pnl / notional) * 100.0
-        else:
-            roi_pct = 0.0
-
-        entry_time = _ns_to_isoformat(pos.ts_opened)
-        exit_time = _ns_to_isoformat(pos.ts_closed) if pos.ts_closed else None
-
-        direction = (
-            "LONG" if getattr(pos.entry, "name", str(pos.entry)).upper() == "BUY" else "SHORT"
+    bars = _bar_arrays(engine, timeframe)
+    if use_post_fill_spec_slippage:
+        avg_bar_volume, bar_volatility = _entry_market_stats(positions, bars)
+        slippage_costs = SlippageEstimator(
+            impact_coefficient=impact_k,
+            impact_exponent=getattr(fill_cfg, "impact_exponent", 0.5),
+            base_slippage=getattr(fill_cfg, "base_slippage", 0.0),
+        ).estimate_costs(
+            entry_prices=positions.entry_px,
+            order_sizes=positions.quantity,
+            avg_volume=avg_bar_volume,
+            volatility=bar_volatility,
+            spread=0.0001,
         )
-        instrument_id = str(pos.instrument_id)
-
-        # Split fees 50/50 between entry and exit.
-        # NT's MakerTakerFeeModel uses order.liquidity_side per fill:
-        # market/stop orders → taker, limit orders → maker. Our strategies
-        # use market entry + stop-market SL/TP, so both fills are taker.
-        # The Position only exposes total commissions, not per-fill breakdown,
-        # so we split evenly (both sides same rate in practice).
-        entry_fee = abs(pos_fees) / 2.0
-        exit_fee = abs(pos_fees) / 2.0
-
-        # TODO: NT Position does not expose which child order (SL/TP/signal)
-        # triggered the close. Detecting exit_reason from price vs SL/TP
-        # levels requires correlating with OrderFilled events, which is not
-        # readily available from the Position object alone. Defaulting to
-        # "signal" for now.
-        exit_reason = "signal"
-
-        # TODO: NT Position does not expose cumulative funding fees paid
-        # during the position lifetime. The funding_fees field defaults
-        # to 0.0 until NT provides this data or we accumulate it from
-        # FundingRate events during the backtest.
-        funding_fees = 0.0
-
-        trade = TradeRecord(
-            symbol=instrument_id,
-            direction=direction,
-            leverage=default_leverage,
-            entry_time=entry_time,
-            exit_time=exit_time,
-            entry_price=entry_price,
-            exit_price=exit_price,
-            quantity=quantity,
-            entry_fee=entry_fee,
-            exit_fee=exit_fee,
-            funding_fees=funding_fees,
-            slippage_cost=slippage_cost,
-            gross_pnl=realized_pnl + abs(pos_fees),
-            net_pnl=realized_pnl,
-            roi_percent=roi_pct,
-            exit_reason=exit_reason,
+    else:
+        slippage_costs = np.zeros(len(positions))
+
+    fees = np.abs(positions.fees)
+    notional = positions.entry_px * positions.quantity
+    valid_notional = (positions.entry_px > 0) & (positions.quantity > 0)
+    roi_pct = np.zeros(len(positions))
+    np.divide(positions.realized_pnl, notional, out=roi_pct, where=valid_notional)
+    roi_pct *= 100.0
+
+    # Split fees 50/50 between entry and exit.
+    # NT's MakerTakerFeeModel uses order.liquidity_side per fill:
+    # market/stop orders → taker, limit orders → maker. Our strategies
+    # use market entry + stop-market SL/TP, so both fills are taker.
+    # The Position only exposes total commissions, not per-fill breakdown,
+    # so we split evenly (both sides same rate in practice).
+    half_fees = fees / 2.0
+    gross_pnl = positions.realized_pnl + fees
+
+    # TODO: NT Position does not expose which child order (SL/TP/signal)
+    # triggered the close. Detecting exit_reason from price vs SL/TP
+    # levels requires correlating with OrderFilled events, which is not
+    # readily available from the Position object alone. Defaulting to
+    # "signal" for now.
+    exit_reason = "signal"
+
+    # TODO: NT Position does not expose cumulative funding fees paid
+    # during the position lifetime. The funding_fees field defaults
+    # to 0.0 until NT provides this data or we accumulate it from
+    # FundingRate events during the backtest.
+    funding_fees = 0.0
+
+    for i in range(len(positions)):
+        ts_closed = int(positions.ts_closed[i])
+        result.trades.append(
+            TradeRecord(
+                symbol=positions.instrument_ids[i],
+                direction="LONG" if positions.is_long[i] else "SHORT",
+                leverage=default_leverage,
+                entry_time=_ns_to_isoformat(int(positions.ts_opened[i])),
+                exit_time=_ns_to_isoformat(ts_closed) if ts_closed else None,
+                entry_price=float(positions.entry_px[i]),
+                exit_price=float(positions.exit_px[i]),
+                quantity=float(positions.quantity[i]),
+                entry_fee=float(half_fees[i]),
+                exit_fee=float(half_fees[i]),
+                funding_fees=funding_fees,
+                slippage_cost=float(slippage_costs[i]),
+                gross_pnl=float(gross_pnl[i]),
+                net_pnl=float(positions.realized_pnl[i]),
+                roi_percent=float(roi_pct[i]),
+                exit_reason=exit_reason,
+            )
         )
-        result.trades.append(trade)
 
+    winning = int(np.count_nonzero(positions.realized_pnl > 0))
+    losing = int(np.count_nonzero(positions.realized_pnl < 0))
     result.total_trades = len(result.trades)
-    result.trades.sort(key=lambda t: t.entry_time)
     result.winning_trades = winning
     result.losing_trades = losing
-    result.total_fees = total_fees
-    result.total_slippage = total_slippage
+    result.total_fees = float(fees.sum())
+    result.total_slippage = float(slippage_costs.sum())
     if result.total_trades > 0:
         result.win_rate = winning / result.total_trades
 
@@ -366,22 +575,33 @@ def extract_trades(
             result.run_id,
         )
 
+    trade_arrays = _TradeArrays(
+        net_pnl=positions.realized_pnl,
+        roi=roi_pct / 100.0,
+        entry_ns=positions.ts_opened,
+        exit_ns=np.where(positions.ts_closed != 0, positions.ts_closed, _MISSING_NS),
+    )
+
     # NT 1.222+ may not populate max_drawdown via stats_pnls/stats_returns
     # (the old MaxDrawdown indicator was removed). Compute from equity curve
     # built from trade PnLs as a robust fallback.
-    if result.max_drawdown == 0.0 and result.trades:
-        result.max_drawdown = _compute_max_drawdown_from_trades(
-            result.trades, result.starting_balance
-        )
+    if result.max_drawdown == 0.0:
+        result.max_drawdown = _max_drawdown(trade_arrays.net_pnl, result.starting_balance)
 
-    compute_extended_metrics(result)
+    _compute_extended_metrics(result, trade_arrays)
+    _compute_excursions(result, positions, bars)
 
 
-def estimate_market_stats(engine: BacktestEngine) -> tuple[float, float]:
+def estimate_market_stats(
+    engine: BacktestEngine, timeframe: str | None = None
+) -> tuple[float, float]:
     """Estimate average bar volume and bar-level volatility from engine cache.
 
     Reads bars from the engine cache to compute realistic slippage
-    parameters instead of using hardcoded values.
+    parameters instead of using hardcoded values. The statistics are
+    :func:`~vibe_quant.validation.fill_model.trailing_market_stats` over
+    the last bars of the best-populated instrument's series, the same
+    window paper nodes record with each order.
 
     NOTE: The volatility returned is per-bar (std of log returns between
     consecutive bars), NOT annualized or daily. The timescale depends on
@@ -393,46 +613,55 @@ def estimate_market_stats(engine: BacktestEngine) -> tuple[float, float]:
 
     Args:
         engine: BacktestEngine after run.
+        timeframe: Strategy timeframe, selecting the bar series.
 
     Returns:
         Tuple of (avg_bar_volume, bar_volatility). Falls back to
         conservative defaults (1000.0, 0.02) if data is unavailable.
     """
-    default_volume = 1000.0
-    default_volatility = 0.02
+    bars = _bar_arrays(engine, timeframe)
+    if bars is None or not bars.by_instrument:
+        return _DEFAULT_BAR_VOLUME, _DEFAULT_BAR_VOLATILITY
+    series = max(bars.by_instrument.values(), key=lambda s: s.ts.size)
+    avg_volume, volatility = trailing_market_stats(
+        series.volume, series.close, np.array([series.ts.size])
+    )
+    return (
+        float(np.nan_to_num(avg_volume[0], nan=_DEFAULT_BAR_VOLUME)),
+        float(np.nan_to_num(volatility[0], nan=_DEFAULT_BAR_VOLATILITY)),
+    )
 
-    try:
-        bars = engine.kernel.cache.bars()
-        if not bars:
-            return default_volume, default_volatility
-
-        volumes: list[float] = []
-        closes: list[float] = []
-        for bar in bars:
-            vol = float(bar.volume)
-            if vol > 0:
-                volumes.append(vol)
-            close = float(bar.close)
-            if close > 0:
-                closes.append(close)
-
-        avg_volume = sum(volumes) / len(volumes) if volumes else default_volume
-
-        volatility = default_volatility
-        if len(closes) >= 2:
-            log_returns: list[float] = []
-            for i in range(1, len(closes)):
-                if closes[i - 1] > 0:
-                    log_returns.append(math.log(closes[i] / closes[i - 1]))
-            if len(log_returns) >= 2:
-                mean_r = sum(log_returns) / len(log_returns)
-                var = sum((r - mean_r) ** 2 for r in log_returns) / (len(log_returns) - 1)
-                volatility = math.sqrt(var) if var > 0 else default_volatility
-
-        return avg_volume, volatility
-    except Exception:
-        logger.debug("Could not estimate market stats, using defaults", exc_info=True)
-        return default_volume, default_volatility
+
+# Slippage inputs when no bars describe the market at entry
+_DEFAULT_BAR_VOLUME = 1000.0
+_DEFAULT_BAR_VOLATILITY = 0.02
+
+
+def _entry_market_stats(
+    positions: _PositionArrays, bars: _BarArrays | None
+) -> tuple[np.ndarray, np.ndarray]:
+    """Average bar volume and volatility at each position's entry.
+
+    Uses the trailing window of the instrument's bars closed by the time
+    the position opened, matching what a paper node records when the
+    order is submitted.
+    """
+    avg_volume = np.full(len(positions), np.nan)
+    volatility = np.full(len(positions), np.nan)
+    if bars is not None:
+        ids = np.asarray(positions.instrument_ids, dtype=object)
+        for instrument_id, series in bars.by_instrument.items():
+            sel = np.flatnonzero(ids == instrument_id)
+            if sel.size == 0:
+                continue
+            ends = np.searchsorted(series.ts, positions.ts_opened[sel], side="right")
+            avg_volume[sel], volatility[sel] = trailing_market_stats(
+                series.volume, series.close, ends
+            )
+    return (
+        np.nan_to_num(avg_volume, nan=_DEFAULT_BAR_VOLUME),
+        np.nan_to_num(volatility, nan=_DEFAULT_BAR_VOLATILITY),
+    )
 
 
 def _compute_max_drawdown_from_trades(
@@ -452,116 +681,222 @@ def _compute_max_drawdown_from_trades(
     Returns:
         Max drawdown as a positive fraction (e.g. 0.12 for 12%).
     """
-    if not trades or starting_balance <= 0:
-        return 0.0
+    pnl = np.fromiter((t.net_pnl for t in trades), dtype=np.float64, count=len(trades))
+    return _max_drawdown(pnl, starting_balance)
+
 
-    equity = starting_balance
-    peak = equity
-    max_dd = 0.0
+def _equity_curve(net_pnl: np.ndarray, starting_balance: float) -> tuple[np.ndarray, np.ndarray]:
+    """Equity after each trade (starting balance first) and its running peak."""
+    equity = np.concatenate(([starting_balance], starting_balance + np.cumsum(net_pnl)))
+    return equity, np.maximum.accumulate(equity)
 
-    for trade in trades:
-        equity += trade.net_pnl
-        if equity > peak:
-            peak = equity
-        if peak > 0:
-            dd = (peak - equity) / peak
-            if dd > max_dd:
-                max_dd = dd
 
-    return max_dd
+def _max_drawdown(net_pnl: np.ndarray, starting_balance: float) -> float:
+    """Max peak-to-trough drawdown fraction of the trade equity curve."""
+    if net_pnl.size == 0 or starting_balance <= 0:
+        return 0.0
+    equity, peak = _equity_curve(net_pnl, starting_balance)
+    # The peak never falls below a positive starting balance
+    return max(float(np.max((peak - equity) / peak)), 0.0)
 
 
 def compute_extended_metrics(result: ValidationResult) -> None:
     """Compute SPEC-required extended metrics from trades.
 
     Populates: largest_win/loss, avg_win/loss, max_consecutive_wins/losses,
-    avg_trade_duration_hours, cagr, volatility_annual, calmar_ratio.
+    avg_trade_duration_hours, cagr, volatility_annual, calmar_ratio,
+    max_drawdown_duration_days, time_in_market and pnl_by_hour.
 
     Args:
         result: ValidationResult to populate (mutated in place).
     """
     if not result.trades:
         return
+    _compute_extended_metrics(result, _TradeArrays.from_trades(result.trades))
 
-    wins: list[float] = []
-    losses: list[float] = []
-    durations_hours: list[float] = []
-
-    max_con_wins = 0
-    max_con_losses = 0
-    cur_wins = 0
-    cur_losses = 0
-
-    for trade in result.trades:
-        pnl = trade.net_pnl
-        if pnl > 0:
-            wins.append(pnl)
-            cur_wins += 1
-            max_con_wins = max(max_con_wins, cur_wins)
-            cur_losses = 0
-        elif pnl < 0:
-            losses.append(pnl)
-            cur_losses += 1
-            max_con_losses = max(max_con_losses, cur_losses)
-            cur_wins = 0
-        else:
-            cur_wins = 0
-            cur_losses = 0
-
-        if trade.entry_time and trade.exit_time:
-            try:
-                entry_dt = datetime.fromisoformat(trade.entry_time.replace("Z", "+00:00"))
-                exit_dt = datetime.fromisoformat(trade.exit_time.replace("Z", "+00:00"))
-                duration_h = (exit_dt - entry_dt).total_seconds() / 3600.0
-                if duration_h >= 0:
-                    durations_hours.append(duration_h)
-            except (ValueError, TypeError):
-                pass
-
-    result.max_consecutive_wins = max_con_wins
-    result.max_consecutive_losses = max_con_losses
-
-    if wins:
-        result.largest_win = max(wins)
-        result.avg_win = sum(wins) / len(wins)
-    if losses:
-        result.largest_loss = min(losses)
-        result.avg_loss = sum(losses) / len(losses)
 
-    if durations_hours:
-        result.avg_trade_duration_hours = sum(durations_hours) / len(durations_hours)
+def _compute_extended_metrics(result: ValidationResult, trades: _TradeArrays) -> None:
+    """Vectorized body of :func:`compute_extended_metrics`."""
+    n = trades.net_pnl.size
+    if n == 0:
+        return
 
-    if result.total_return != 0.0 and result.trades:
-        try:
-            first_entry = datetime.fromisoformat(result.trades[0].entry_time.replace("Z", "+00:00"))
-            last_exit_str = result.trades[-1].exit_time or result.trades[-1].entry_time
-            last_exit = datetime.fromisoformat(last_exit_str.replace("Z", "+00:00"))
-            days = max((last_exit - first_entry).total_seconds() / 86400.0, 1.0)
-            # total_return is stored as a decimal fraction from NT stats
-            # (e.g. 0.12 = 12%). Use directly — no heuristic conversion.
-            total_return_frac = result.total_return
-            if total_return_frac == -1.0:
-                # 100% loss: CAGR is -1.0 regardless of duration
-                result.cagr = -1.0
-            elif total_return_frac > -1.0:
-                result.cagr = ((1.0 + total_return_frac) ** (365.0 / days)) - 1.0
-        except (ValueError, TypeError):
-            pass
+    pnl = trades.net_pnl
+    wins = pnl[pnl > 0]
+    losses = pnl[pnl < 0]
+    result.max_consecutive_wins = _longest_run(pnl > 0)
+    result.max_consecutive_losses = _longest_run(pnl < 0)
+
+    if wins.size:
+        result.largest_win = float(wins.max())
+        result.avg_win = float(wins.mean())
+    if losses.size:
+        result.largest_loss = float(losses.min())
+        result.avg_loss = float(losses.mean())
+
+    has_times = (trades.entry_ns != _MISSING_NS) & (trades.exit_ns != _MISSING_NS)
+    durations_ns = trades.exit_ns[has_times] - trades.entry_ns[has_times]
+    durations_hours = durations_ns[durations_ns >= 0] / _NS_PER_HOUR
+    if durations_hours.size:
+        result.avg_trade_duration_hours = float(durations_hours.mean())
+
+    first_entry = int(trades.entry_ns[0])
+    last_exit = int(trades.exit_ns[-1])
+    if last_exit == _MISSING_NS:
+        last_exit = int(trades.entry_ns[-1])
+    if result.total_return != 0.0 and first_entry != _MISSING_NS and last_exit != _MISSING_NS:
+        days = max((last_exit - first_entry) / _NS_PER_DAY, 1.0)
+        # total_return is stored as a decimal fraction from NT stats
+        # (e.g. 0.12 = 12%). Use directly — no heuristic conversion.
+        total_return_frac = result.total_return
+        if total_return_frac == -1.0:
+            # 100% loss: CAGR is -1.0 regardless of duration
+            result.cagr = -1.0
+        elif total_return_frac > -1.0:
+            result.cagr = ((1.0 + total_return_frac) ** (365.0 / days)) - 1.0
 
     # Note: computes volatility from individual trade returns, not daily
     # equity returns. This may differ from standard annual volatility
     # measures that use daily mark-to-market returns.
-    if len(result.trades) >= 2:
-        trade_returns = [t.roi_percent / 100.0 for t in result.trades if t.roi_percent != 0.0]
-        if len(trade_returns) >= 2:
-            mean_r = sum(trade_returns) / len(trade_returns)
-            var = sum((r - mean_r) ** 2 for r in trade_returns) / (len(trade_returns) - 1)
-            if durations_hours:
-                avg_dur_days = max(sum(durations_hours) / len(durations_hours) / 24.0, 0.01)
-                trades_per_year = 365.0 / avg_dur_days
-            else:
-                trades_per_year = 252.0
-            result.volatility_annual = math.sqrt(var * trades_per_year) if var > 0 else 0.0
+    trade_returns = trades.roi[trades.roi != 0.0]
+    if n >= 2 and trade_returns.size >= 2:
+        if durations_hours.size:
+            avg_dur_days = max(float(durations_hours.mean()) / 24.0, 0.01)
+            trades_per_year = 365.0 / avg_dur_days
+        else:
+            trades_per_year = 252.0
+        var = float(np.var(trade_returns, ddof=1))
+        result.volatility_annual = math.sqrt(var * trades_per_year) if var > 0 else 0.0
 
     if result.max_drawdown > 0 and result.cagr != 0:
         result.calmar_ratio = result.cagr / result.max_drawdown
+
+    # Timeline: first entry, then each trade's exit (entry if still open)
+    times = np.where(trades.exit_ns != _MISSING_NS, trades.exit_ns, trades.entry_ns)
+    if np.all(trades.entry_ns != _MISSING_NS):
+        timeline = np.concatenate(([first_entry], times))
+        result.max_drawdown_duration_days = (
+            _max_drawdown_duration_ns(pnl, result.starting_balance, timeline) / _NS_PER_DAY
+        )
+
+        start = int(np.min(trades.entry_ns))
+        span = int(np.max(times)) - start
+        held = has_times & (trades.exit_ns >= trades.entry_ns)
+        if span > 0 and held.any():
+            result.time_in_market = (
+                _union_length_ns(trades.entry_ns[held], trades.exit_ns[held]) / span
+            )
+
+        hours = (times // _NS_PER_HOUR_INT) % 24
+        result.pnl_by_hour = tuple(float(x) for x in np.bincount(hours, weights=pnl, minlength=24))
+
+
+def _compute_excursions(
+    result: ValidationResult,
+    positions: _PositionArrays,
+    bars: _BarArrays | None,
+) -> None:
+    """Average maximum adverse/favorable excursion over closed positions.
+
+    Each position's price path is the high/low of its instrument's bars
+    (one bar type) that close after the open and no later than the close;
+    a bar closing at the open instant holds only pre-entry prices. Excursions are
+    fractions of the entry price; positions without bars are skipped.
+    """
+    if bars is None or not bars.by_instrument:
+        return
+
+    mae = np.full(len(positions), np.nan)
+    mfe = np.full(len(positions), np.nan)
+    ids = np.asarray(positions.instrument_ids, dtype=object)
+    for instrument_id, series in bars.by_instrument.items():
+        sel = np.flatnonzero(ids == instrument_id)
+        if sel.size == 0:
+            continue
+        max_high, min_low, has_bars = _range_extrema(
+            series.ts, series.high, series.low, positions.ts_opened[sel], positions.ts_closed[sel]
+        )
+        entry = positions.entry_px[sel]
+        up = (max_high - entry) / entry
+        down = (entry - min_low) / entry
+        is_long = positions.is_long[sel]
+        valid = has_bars & (entry > 0)
+        mae[sel] = np.where(valid, np.maximum(np.where(is_long, down, up), 0.0), np.nan)
+        mfe[sel] = np.where(valid, np.maximum(np.where(is_long, up, down), 0.0), np.nan)
+
+    if np.any(~np.isnan(mae)):
+        result.avg_mae = float(np.nanmean(mae))
+        result.avg_mfe = float(np.nanmean(mfe))
+
+
+def _range_extrema(
+    ts: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    start_ns: np.ndarray,
+    end_ns: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Max high and min low of bars with ``start < ts <= end``, per range.
+
+    ``reduceat`` over interleaved ``[lo0, hi0, lo1, hi1, ...]`` reduces
+    each ``[lo, hi)`` slice at the even positions; the odd positions span
+    the gaps between ranges and are discarded. A sentinel element keeps
+    ``hi == len(ts)`` a valid index.
+
+    Returns:
+        ``(max_high, min_low, has_bars)``; extrema of empty ranges are
+        meaningless and masked out by ``has_bars``.
+    """
+    lo = np.searchsorted(ts, start_ns, side="right")
+    hi = np.searchsorted(ts, end_ns, side="right")
+    bounds = np.empty(2 * lo.size, dtype=np.intp)
+    bounds[0::2] = lo
+    bounds[1::2] = hi
+    max_high = np.maximum.reduceat(np.append(high, -np.inf), bounds)[0::2]
+    min_low = np.minimum.reduceat(np.append(low, np.inf), bounds)[0::2]
+    return max_high, min_low, hi > lo
+
+
+def _longest_run(mask: np.ndarray) -> int:
+    """Length of the longest run of True values."""
+    if not mask.any():
+        return 0
+    edges = np.diff(np.concatenate(([0], mask.astype(np.int8), [0])))
+    return int(np.max(np.flatnonzero(edges == -1) - np.flatnonzero(edges == 1)))
+
+
+def _max_drawdown_duration_ns(
+    net_pnl: np.ndarray,
+    starting_balance: float,
+    timeline: np.ndarray,
+) -> int:
+    """Longest time from an equity peak until the curve regains it.
+
+    ``timeline`` holds the time of the starting balance followed by each
+    trade's exit. A drawdown still open at the last trade lasts until it.
+    """
+    if starting_balance <= 0:
+        return 0
+    equity, peak = _equity_curve(net_pnl, starting_balance)
+    at_peak = equity >= peak
+    peak_idx = np.maximum.accumulate(np.where(at_peak, np.arange(equity.size), 0))
+    # A drawdown ends at the first point back at the peak; measure it from
+    # the peak held by the previous point
+    since_peak = timeline.copy()
+    since_peak[1:] -= timeline[peak_idx[:-1]]
+    since_peak[0] = 0
+    ends = ~at_peak
+    ends[1:] |= ~at_peak[:-1]
+    return max(int(np.max(np.where(ends, since_peak, 0))), 0)
+
+
+def _union_length_ns(start_ns: np.ndarray, end_ns: np.ndarray) -> int:
+    """Total length covered by a set of ``[start, end]`` intervals."""
+    order = np.argsort(start_ns, kind="stable")
+    starts = start_ns[order]
+    ends = np.maximum.accumulate(end_ns[order])
+    # An interval opens a new block when it starts after every earlier end
+    new_block = np.concatenate(([True], starts[1:] > ends[:-1]))
+    block_start = starts[new_block]
+    block_end = np.maximum.reduceat(ends, np.flatnonzero(new_block))
+    return int(np.sum(block_end - block_start))
@@ -3,6 +3,7 @@
 Provides:
 - VolumeSlippageFillModel: FillModel subclass that passes prob_slippage to NT
 - SlippageEstimator: Standalone SPEC-formula slippage calculator for post-fill analytics
+- trailing_market_stats: The volume/volatility inputs of the impact term
 - ScreeningFillModelConfig / create_screening_fill_model: Simple fill model for screening
 """
 
@@ -12,6 +13,7 @@ import math
 import random
 from dataclasses import dataclass
 
+import numpy as np
 from nautilus_trader.backtest.models import FillModel
 from nautilus_trader.common.config import NautilusConfig
 
@@ -34,6 +36,10 @@ class VolumeSlippageFillModelConfig(NautilusConfig, frozen=True):
         prob_slippage: Probability that market orders experience slippage.
             Default 0.0 in validation to avoid double-counting with
             post-fill SPEC slippage estimation.
+        impact_exponent: Participation exponent of the impact term.
+            Default 0.5 (SPEC square-root law).
+        base_slippage: Constant slippage fraction added to every fill.
+            Default 0.0; calibrated models fit it from recorded fills.
     """
 
     impact_coefficient: float = 0.1
@@ -41,6 +47,8 @@ class VolumeSlippageFillModelConfig(NautilusConfig, frozen=True):
     prob_best_price_fill: float = 1.0
     max_adverse_ticks: int = 1
     prob_slippage: float = 0.0
+    impact_exponent: float = 0.5
+    base_slippage: float = 0.0
 
 
 class VolumeSlippageFillModel(FillModel):  # type: ignore[misc]
@@ -198,6 +206,10 @@ class SlippageEstimator:
     Formula (SPEC Section 7):
         slippage = spread/2 + k * volatility * sqrt(order_size / avg_volume)
 
+    Calibrated models (see :mod:`vibe_quant.validation.calibration`)
+    generalize this to ``spread/2 + base + k * volatility *
+    (order_size / avg_volume) ** exponent``.
+
     This is used by ValidationRunner post-fill to compute realistic slippage
     costs for each trade. It is NOT integrated into NT's matching engine
     (which only supports 1-tick slippage).
@@ -210,19 +222,38 @@ class SlippageEstimator:
         )
     """
 
-    def __init__(self, impact_coefficient: float = 0.1) -> None:
+    def __init__(
+        self,
+        impact_coefficient: float = 0.1,
+        impact_exponent: float = 0.5,
+        base_slippage: float = 0.0,
+    ) -> None:
         """Initialize SlippageEstimator.
 
         Args:
             impact_coefficient: Market impact coefficient k.
+            impact_exponent: Participation exponent (0.5 = square root).
+            base_slippage: Constant slippage fraction added to every fill.
         """
         self._k = impact_coefficient
+        self._exponent = impact_exponent
+        self._base = base_slippage
 
     @property
     def impact_coefficient(self) -> float:
         """Get market impact coefficient."""
         return self._k
 
+    @property
+    def impact_exponent(self) -> float:
+        """Get participation exponent of the impact term."""
+        return self._exponent
+
+    @property
+    def base_slippage(self) -> float:
+        """Get constant slippage fraction."""
+        return self._base
+
     def calculate(
         self,
         order_size: float,
@@ -245,14 +276,19 @@ class SlippageEstimator:
         Returns:
             Slippage factor as a decimal (e.g., 0.001 for 0.1% slippage).
         """
-        half_spread = spread * 0.5
+        half_spread = spread * 0.5 + self._base
 
         # Fast path: no volume data or no volatility -> spread-only slippage
         if avg_volume <= 0 or volatility == 0.0:
             return half_spread
 
         # SPEC formula: spread/2 + k * volatility * sqrt(order_size / avg_volume)
-        market_impact = self._k * volatility * math.sqrt(abs(order_size) / avg_volume)
+        participation = abs(order_size) / avg_volume
+        if self._exponent == 0.5:
+            scaled = math.sqrt(participation)
+        else:
+            scaled = participation**self._exponent
+        market_impact = self._k * volatility * scaled
         return half_spread + market_impact
 
     def estimate_cost(
@@ -278,6 +314,107 @@ class SlippageEstimator:
         factor = self.calculate(order_size, avg_volume, volatility, spread)
         return factor * entry_price * abs(order_size)
 
+    def estimate_costs(
+        self,
+        entry_prices: np.ndarray,
+        order_sizes: np.ndarray,
+        avg_volume: float | np.ndarray,
+        volatility: float | np.ndarray = 0.0,
+        spread: float = 0.0,
+    ) -> np.ndarray:
+        """Vectorized :meth:`estimate_cost` over arrays of trades.
+
+        Args:
+            entry_prices: Trade entry prices.
+            order_sizes: Order quantities.
+            avg_volume: Average bar volume, scalar or per trade.
+            volatility: Current volatility estimate, scalar or per trade.
+            spread: Current bid-ask spread as fraction of price.
+
+        Returns:
+            Estimated slippage cost per trade in quote currency.
+        """
+        sizes = np.abs(np.asarray(order_sizes, dtype=np.float64))
+        factor = np.full(sizes.shape, spread * 0.5 + self._base)
+        volumes = np.broadcast_to(np.asarray(avg_volume, dtype=np.float64), sizes.shape)
+        sigmas = np.broadcast_to(np.asarray(volatility, dtype=np.float64), sizes.shape)
+        # Same fast path as calculate(): spread-only without volume or volatility
+        active = (volumes > 0) & (sigmas != 0.0)
+        if np.any(active):
+            participation = np.zeros(sizes.shape)
+            np.divide(sizes, volumes, out=participation, where=active)
+            if self._exponent == 0.5:
+                scaled = np.sqrt(participation)
+            else:
+                scaled = participation**self._exponent
+            factor += np.where(active, self._k * sigmas * scaled, 0.0)
+        return factor * np.asarray(entry_prices, dtype=np.float64) * sizes
+
+
+# Trailing bars of one bar series that the impact term's average volume and
+# volatility are measured over. Paper nodes record them at order submission
+# and validation recomputes them at each trade entry, so an impact
+# coefficient calibrated from paper fills is applied on the same scale.
+MARKET_CONTEXT_BARS = 50
+
+
+def trailing_market_stats(
+    volume: np.ndarray,
+    close: np.ndarray,
+    ends: np.ndarray,
+    window: int = MARKET_CONTEXT_BARS,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Average bar volume and per-bar volatility over trailing bar windows.
+
+    For each end index the window is bars ``[end - window, end)`` of one
+    oldest-first bar series. Average volume is the mean of the window's
+    positive volumes. Volatility is the ``ddof=1`` standard deviation of
+    log returns between consecutive positive closes in the window (per-bar,
+    not annualized).
+
+    Args:
+        volume: Bar volumes, oldest first.
+        close: Bar closes, oldest first.
+        ends: Exclusive window ends, e.g. the number of bars closed before
+            each order.
+        window: Bars per window.
+
+    Returns:
+        ``(avg_volume, volatility)`` arrays shaped like ``ends``. Entries are
+        NaN where a window has no positive volume, fewer than two returns or
+        no price movement.
+    """
+    volume = np.asarray(volume, dtype=np.float64)
+    close = np.asarray(close, dtype=np.float64)
+    ends = np.clip(np.asarray(ends, dtype=np.intp), 0, len(volume))
+    starts = np.maximum(ends - window, 0)
+
+    positive = volume > 0
+    vol_sum = np.concatenate(([0.0], np.cumsum(np.where(positive, volume, 0.0))))
+    vol_count = np.concatenate(([0], np.cumsum(positive)))
+    n_volumes = vol_count[ends] - vol_count[starts]
+    avg_volume = np.full(ends.shape, np.nan)
+    np.divide(vol_sum[ends] - vol_sum[starts], n_volumes, out=avg_volume, where=n_volumes > 0)
+
+    # Return i is bar i-1 -> bar i, so window [s, e) holds returns s+1 .. e-1
+    returns = np.zeros(len(close))
+    has_return = np.zeros(len(close), dtype=bool)
+    if len(close) > 1:
+        has_return[1:] = (close[1:] > 0) & (close[:-1] > 0)
+        returns[has_return] = np.log(close[1:][has_return[1:]] / close[:-1][has_return[1:]])
+    r_sum = np.concatenate(([0.0], np.cumsum(returns)))
+    r_sq = np.concatenate(([0.0], np.cumsum(returns * returns)))
+    r_count = np.concatenate(([0], np.cumsum(has_return)))
+    first = np.minimum(starts + 1, ends)
+    n = r_count[ends] - r_count[first]
+    s1 = r_sum[ends] - r_sum[first]
+    s2 = r_sq[ends] - r_sq[first]
+    var = np.full(ends.shape, np.nan)
+    np.divide(s2 - s1 * s1 / np.maximum(n, 1), n - 1, out=var, where=n >= 2)
+    volatility = np.full(ends.shape, np.nan)
+    np.sqrt(var, out=volatility, where=var > 0)
+    return avg_volume, volatility
+
 
 @dataclass(frozen=True)
 class ScreeningFillModelConfig:
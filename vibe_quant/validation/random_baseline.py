@@ -1,33 +1,40 @@
-"""Random short entry baseline for 1m strategy validation.
+"""Random entry baseline for 1m strategy validation.
 
-Null hypothesis test: enter SHORT randomly on 1m bars with the same
-SL/TP as champion strategies, measure Sharpe/DD/PF.  If random entry
+Null hypothesis test: enter SHORT (or LONG) randomly on 1m bars with the
+same SL/TP as champion strategies, measure Sharpe/DD/PF.  If random entry
 with a given SL/TP produces Sharpe ≥ 2, the "alpha" is just SL/TP
-geometry + systematic BTC downward drift — not indicator skill.
+geometry + systematic BTC drift — not indicator skill.
+
+The Monte Carlo runs on bars held as NumPy arrays (:class:`OHLCArrays`).
+SL/TP outcomes depend only on the entry bar, so the first-passage exit of
+every possible entry is computed once, vectorized, and all simulations
+then chain non-overlapping random entries through that exit table.
 
 Usage (CLI):
     python -m vibe_quant.validation.random_baseline \
         --sl-pct 0.59 --tp-pct 10.55 \
         --start 2026-01-10 --end 2026-03-10 \
-        --target-trades 50 --monte-carlo 1000
+        --target-trades 50 --monte-carlo 1000 [--direction long] \
+        [--strategy-sharpe 2.4]
 
 Usage (Python):
     from vibe_quant.validation.random_baseline import (
-        load_ohlc, run_random_short_baseline, BaselineConfig
+        load_ohlc_arrays, run_random_baseline, BaselineConfig
     )
     cfg = BaselineConfig(sl_pct=0.59, tp_pct=10.55, target_trades=50)
-    bars = load_ohlc("BTCUSDT", "1m", "2026-01-10", "2026-03-10")
-    result = run_random_short_baseline(bars, cfg, n_simulations=1000)
-    print(result.summary())
+    bars = load_ohlc_arrays("BTCUSDT", "1m", "2026-01-10", "2026-03-10")
+    result = run_random_baseline(bars, cfg, n_simulations=1000)
+    print(result.summary(strategy_sharpe=2.4))
 """
 
 from __future__ import annotations
 
 import logging
 import sqlite3
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import UTC
 from pathlib import Path
+from typing import Literal
 
 import numpy as np
 
@@ -36,6 +43,7 @@ logger = logging.getLogger(__name__)
 # Taker fee per side (Binance perp default)
 DEFAULT_TAKER_FEE = 0.0005  # 0.05%
 DEFAULT_ARCHIVE_PATH = Path("data/archive/raw_data.db")
+Direction = Literal["short", "long"]
 
 
 # ---------------------------------------------------------------------------
@@ -54,25 +62,38 @@ class OHLCBar:
     close: float
 
 
-def load_ohlc(
+@dataclass(frozen=True, slots=True)
+class OHLCArrays:
+    """OHLC bars as column arrays (one element per bar)."""
+
+    ts: np.ndarray  # int64 open_time in ms
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.close)
+
+    @classmethod
+    def from_bars(cls, bars: list[OHLCBar]) -> OHLCArrays:
+        """Convert a list of OHLCBar into column arrays."""
+        return cls(
+            ts=np.array([b.ts for b in bars], dtype=np.int64),
+            open=np.array([b.open for b in bars], dtype=np.float64),
+            high=np.array([b.high for b in bars], dtype=np.float64),
+            low=np.array([b.low for b in bars], dtype=np.float64),
+            close=np.array([b.close for b in bars], dtype=np.float64),
+        )
+
+
+def _query_ohlc(
     symbol: str,
     interval: str,
     start_date: str,
     end_date: str,
-    archive_path: Path = DEFAULT_ARCHIVE_PATH,
-) -> list[OHLCBar]:
-    """Load OHLC bars from SQLite archive.
-
-    Args:
-        symbol: e.g. "BTCUSDT"
-        interval: e.g. "1m"
-        start_date: ISO date string, inclusive
-        end_date: ISO date string, exclusive
-        archive_path: Path to raw_data.db
-
-    Returns:
-        List of OHLCBar sorted by timestamp.
-    """
+    archive_path: Path,
+) -> list[tuple[int, float, float, float, float]]:
     from datetime import datetime
 
     start_ms = int(
@@ -101,10 +122,58 @@ def load_ohlc(
         ).fetchall()
     finally:
         conn.close()
+    logger.info("Loaded %d %s %s bars (%s to %s)", len(rows), symbol, interval, start_date, end_date)
+    return rows
 
-    bars = [OHLCBar(ts=r[0], open=r[1], high=r[2], low=r[3], close=r[4]) for r in rows]
-    logger.info("Loaded %d %s %s bars (%s to %s)", len(bars), symbol, interval, start_date, end_date)
-    return bars
+
+def load_ohlc(
+    symbol: str,
+    interval: str,
+    start_date: str,
+    end_date: str,
+    archive_path: Path = DEFAULT_ARCHIVE_PATH,
+) -> list[OHLCBar]:
+    """Load OHLC bars from SQLite archive.
+
+    Args:
+        symbol: e.g. "BTCUSDT"
+        interval: e.g. "1m"
+        start_date: ISO date string, inclusive
+        end_date: ISO date string, exclusive
+        archive_path: Path to raw_data.db
+
+    Returns:
+        List of OHLCBar sorted by timestamp.
+    """
+    rows = _query_ohlc(symbol, interval, start_date, end_date, archive_path)
+    return [OHLCBar(ts=r[0], open=r[1], high=r[2], low=r[3], close=r[4]) for r in rows]
+
+
+def load_ohlc_arrays(
+    symbol: str,
+    interval: str,
+    start_date: str,
+    end_date: str,
+    archive_path: Path = DEFAULT_ARCHIVE_PATH,
+) -> OHLCArrays:
+    """Load OHLC bars from SQLite archive as column arrays.
+
+    Same arguments as :func:`load_ohlc`, without building a Python object
+    per bar.
+    """
+    rows = _query_ohlc(symbol, interval, start_date, end_date, archive_path)
+    data = np.array(rows, dtype=np.float64).reshape(-1, 5)
+    return OHLCArrays(
+        ts=data[:, 0].astype(np.int64),
+        open=data[:, 1].copy(),
+        high=data[:, 2].copy(),
+        low=data[:, 3].copy(),
+        close=data[:, 4].copy(),
+    )
+
+
+def _as_arrays(bars: list[OHLCBar] | OHLCArrays) -> OHLCArrays:
+    return bars if isinstance(bars, OHLCArrays) else OHLCArrays.from_bars(bars)
 
 
 # ---------------------------------------------------------------------------
@@ -122,6 +191,12 @@ class BaselineConfig:
     taker_fee: float = DEFAULT_TAKER_FEE
     initial_capital: float = 100_000.0
     position_size_pct: float = 1.0  # % of capital per trade (notional, not margin)
+    direction: Direction = "short"
+
+    def __post_init__(self) -> None:
+        if self.direction not in ("short", "long"):
+            msg = f"direction must be 'short' or 'long', got {self.direction!r}"
+            raise ValueError(msg)
 
 
 # ---------------------------------------------------------------------------
@@ -148,28 +223,38 @@ def _simulate_single_run(
     sl_pct: float,
     tp_pct: float,
     taker_fee: float,
+    direction: Direction = "short",
 ) -> list[TradeResult]:
-    """Simulate SHORT trades at given entry bar indices.
+    """Simulate trades at given entry bar indices, one bar at a time.
+
+    Reference implementation for :func:`_first_passage_exits`.
 
     For each entry:
-    - Enter SHORT at the entry bar's close price
-    - Walk forward bar-by-bar checking HIGH (SL) and LOW (TP)
-    - SL hit if bar HIGH >= entry * (1 + sl_pct/100)
-    - TP hit if bar LOW <= entry * (1 - tp_pct/100)
+    - Enter at the entry bar's close price
+    - Walk forward bar-by-bar checking the adverse and favourable extremes
+    - SHORT: SL hit if bar HIGH >= entry * (1 + sl_pct/100),
+      TP hit if bar LOW <= entry * (1 - tp_pct/100)
+    - LONG: SL hit if bar LOW <= entry * (1 - sl_pct/100),
+      TP hit if bar HIGH >= entry * (1 + tp_pct/100)
     - If both hit in same bar: assume SL hit first (conservative)
     - If neither hit by end of data: exit at last bar close
     """
     trades: list[TradeResult] = []
     n_bars = len(bars)
     current_exit = 0  # Ensure non-overlapping trades
+    is_short = direction == "short"
 
     for entry_idx in entry_indices:
         if entry_idx < current_exit or entry_idx >= n_bars - 1:
             continue
 
         entry_price = bars[entry_idx].close
-        sl_price = entry_price * (1.0 + sl_pct / 100.0)
-        tp_price = entry_price * (1.0 - tp_pct / 100.0)
+        if is_short:
+            sl_price = entry_price * (1.0 + sl_pct / 100.0)
+            tp_price = entry_price * (1.0 - tp_pct / 100.0)
+        else:
+            sl_price = entry_price * (1.0 - sl_pct / 100.0)
+            tp_price = entry_price * (1.0 + tp_pct / 100.0)
 
         hit_tp = False
         hit_sl = False
@@ -178,14 +263,13 @@ def _simulate_single_run(
 
         for j in range(entry_idx + 1, n_bars):
             bar = bars[j]
-            # Check SL first (conservative for shorts: price goes UP)
-            if bar.high >= sl_price:
+            # Check SL first (conservative)
+            if (bar.high >= sl_price) if is_short else (bar.low <= sl_price):
                 exit_price = sl_price
                 exit_idx = j
                 hit_sl = True
                 break
-            # Check TP (price goes DOWN)
-            if bar.low <= tp_price:
+            if (bar.low <= tp_price) if is_short else (bar.high >= tp_price):
                 exit_price = tp_price
                 exit_idx = j
                 hit_tp = True
@@ -193,6 +277,8 @@ def _simulate_single_run(
 
         # PnL: short position → profit when price drops
         raw_pnl_pct = (entry_price - exit_price) / entry_price * 100.0
+        if not is_short:
+            raw_pnl_pct = -raw_pnl_pct
         # Fees: entry + exit (taker both sides)
         fee_pct = taker_fee * 100.0 * 2.0
         net_pnl_pct = raw_pnl_pct - fee_pct
@@ -213,6 +299,124 @@ def _simulate_single_run(
     return trades
 
 
+# ---------------------------------------------------------------------------
+# Vectorized simulation
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True, slots=True)
+class ExitTable:
+    """First-passage outcome for an entry at every bar ``0 .. n_bars-2``."""
+
+    exit_idx: np.ndarray  # int64
+    exit_price: np.ndarray
+    hit_sl: np.ndarray  # bool
+    hit_tp: np.ndarray  # bool
+    pnl_pct: np.ndarray  # After fees
+
+
+def _first_crossing(series: np.ndarray, start: np.ndarray, thresholds: np.ndarray) -> np.ndarray:
+    """First index ``j >= start`` with ``series[j] >= threshold``, per query.
+
+    Builds running maxima over dyadic blocks (``level[k][i]`` is the max
+    of ``series[i : i + 2**k]``) and binary-lifts each query past every
+    block whose max stays below its threshold.  Returns ``len(series)``
+    where the threshold is never reached.
+    """
+    n = len(series)
+    levels = [series]
+    while (1 << len(levels)) <= n:
+        half = 1 << (len(levels) - 1)
+        prev = levels[-1]
+        levels.append(np.maximum(prev[:-half], prev[half:]))
+
+    pos = start.copy()
+    for k in range(len(levels) - 1, -1, -1):
+        level = levels[k]
+        fits = pos < len(level)
+        below = level[np.minimum(pos, len(level) - 1)] < thresholds
+        pos += (fits & below).astype(np.int64) << k
+    return pos
+
+
+def _first_passage_exits(
+    bars: OHLCArrays,
+    sl_pct: float,
+    tp_pct: float,
+    taker_fee: float,
+    direction: Direction = "short",
+) -> ExitTable:
+    """Exit of a trade entered at each bar's close, for all bars at once.
+
+    Both barriers are rewritten as "series >= threshold" (the short TP
+    and long SL negate the lows) and located with :func:`_first_crossing`.
+    Matches :func:`_simulate_single_run` exactly, including SL-first on
+    ties.
+    """
+    n_bars = len(bars)
+    close = bars.close
+    entry = close[:-1]
+    starts = np.arange(1, n_bars)
+    if direction == "short":
+        sl_price = entry * (1.0 + sl_pct / 100.0)
+        tp_price = entry * (1.0 - tp_pct / 100.0)
+        sl_at = _first_crossing(bars.high, starts, sl_price)
+        tp_at = _first_crossing(-bars.low, starts, -tp_price)
+    else:
+        sl_price = entry * (1.0 - sl_pct / 100.0)
+        tp_price = entry * (1.0 + tp_pct / 100.0)
+        sl_at = _first_crossing(-bars.low, starts, -sl_price)
+        tp_at = _first_crossing(bars.high, starts, tp_price)
+
+    hit_sl = (sl_at < n_bars) & (sl_at <= tp_at)
+    hit_tp = (tp_at < n_bars) & ~hit_sl
+    exit_idx = np.where(hit_sl, sl_at, np.where(hit_tp, tp_at, n_bars - 1))
+    exit_price = np.where(hit_sl, sl_price, np.where(hit_tp, tp_price, close[-1]))
+    raw_pnl_pct = (entry - exit_price) / entry * 100.0
+    if direction == "long":
+        raw_pnl_pct = -raw_pnl_pct
+    pnl_pct = raw_pnl_pct - taker_fee * 100.0 * 2.0
+    return ExitTable(exit_idx, exit_price, hit_sl, hit_tp, pnl_pct)
+
+
+def _random_entries(
+    exit_idx: np.ndarray,
+    entry_prob: float,
+    n_simulations: int,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """Non-overlapping random trade entries for all simulations at once.
+
+    Every bar is an entry candidate with probability ``entry_prob``; a
+    candidate inside an open trade is skipped.  Since candidates are
+    independent per bar, the gap from one bar to the next candidate is
+    geometric, so each step draws one gap per simulation instead of a
+    uniform per bar.
+
+    Args:
+        exit_idx: Exit bar of an entry at each bar ``0 .. n_bars-2``.
+        entry_prob: Per-bar entry candidate probability.
+        n_simulations: Number of simulations (rows).
+        rng: Random generator.
+
+    Returns:
+        (n_simulations, max_trades) entry bar indices, padded with -1.
+    """
+    last_entry = len(exit_idx) - 1  # No entry on the last bar
+    if entry_prob <= 0.0 or last_entry < 0:
+        return np.empty((n_simulations, 0), dtype=np.int64)
+
+    pos = rng.geometric(entry_prob, n_simulations) - 1
+    columns: list[np.ndarray] = []
+    while (active := pos <= last_entry).any():
+        columns.append(np.where(active, pos, -1))
+        after_exit = exit_idx[np.minimum(pos, last_entry)]
+        pos = np.where(active, after_exit + rng.geometric(entry_prob, n_simulations), pos)
+    if not columns:
+        return np.empty((n_simulations, 0), dtype=np.int64)
+    return np.stack(columns, axis=1)
+
+
 # ---------------------------------------------------------------------------
 # Metrics computation
 # ---------------------------------------------------------------------------
@@ -234,7 +438,12 @@ class SimulationMetrics:
 
 def _compute_metrics(trades: list[TradeResult], taker_fee: float) -> SimulationMetrics:
     """Compute performance metrics from a list of trades."""
-    if not trades:
+    return _metrics_from_pnls(np.array([t.pnl_pct for t in trades]), taker_fee)
+
+
+def _metrics_from_pnls(pnls: np.ndarray, taker_fee: float) -> SimulationMetrics:
+    """Compute performance metrics from per-trade net PnL percentages."""
+    if pnls.size == 0:
         return SimulationMetrics(
             sharpe=0.0,
             sortino=0.0,
@@ -246,7 +455,6 @@ def _compute_metrics(trades: list[TradeResult], taker_fee: float) -> SimulationM
             total_fees_pct=0.0,
         )
 
-    pnls = np.array([t.pnl_pct for t in trades])
     n = len(pnls)
 
     # Basic stats
@@ -287,7 +495,7 @@ def _compute_metrics(trades: list[TradeResult], taker_fee: float) -> SimulationM
         sharpe=float(sharpe),
         sortino=float(sortino),
         max_drawdown=max_dd,
-        total_return=total_return,
+        total_return=float(total_return),
         profit_factor=profit_factor,
         win_rate=win_rate,
         total_trades=n,
@@ -327,10 +535,28 @@ class BaselineResult:
     pct_sharpe_above_2: float
     pct_sharpe_above_3: float
 
-    def summary(self) -> str:
-        """Human-readable summary."""
+    def percentile_of(self, strategy_sharpe: float) -> float:
+        """Percentile rank (0-100) of a strategy Sharpe among random runs.
+
+        Ties count half, so a strategy equal to every simulation sits at 50.
+        """
+        sharpes = np.array([m.sharpe for m in self.metrics])
+        if sharpes.size == 0:
+            return float("nan")
+        below = np.mean(sharpes < strategy_sharpe)
+        ties = np.mean(sharpes == strategy_sharpe)
+        return float((below + 0.5 * ties) * 100.0)
+
+    def summary(self, strategy_sharpe: float | None = None) -> str:
+        """Human-readable summary.
+
+        Args:
+            strategy_sharpe: Optional Sharpe of the strategy under test;
+                adds its percentile among the random simulations.
+        """
         lines = [
-            f"=== Random Short Baseline ({self.n_simulations} simulations) ===",
+            f"=== Random {self.config.direction.title()} Baseline "
+            f"({self.n_simulations} simulations) ===",
             f"Config: SL={self.config.sl_pct}% TP={self.config.tp_pct}% "
             f"target_trades={self.config.target_trades}",
             f"Data: {self.n_bars} bars",
@@ -349,6 +575,14 @@ class BaselineResult:
             f"  >= 3.0: {self.pct_sharpe_above_3 * 100:.1f}% of simulations",
             "",
         ]
+        if strategy_sharpe is not None:
+            lines.extend(
+                [
+                    f"Strategy Sharpe {strategy_sharpe:.2f} is at the "
+                    f"{self.percentile_of(strategy_sharpe):.1f}th percentile of random entries",
+                    "",
+                ]
+            )
 
         # Verdict
         if self.pct_sharpe_above_2 > 0.10:
@@ -365,29 +599,33 @@ class BaselineResult:
         else:
             lines.append(
                 "VERDICT: Random entries rarely achieve high Sharpe. "
-                "Indicator-based entry timing provides genuine alpha beyond the short bias."
+                f"Indicator-based entry timing provides genuine alpha beyond the "
+                f"{self.config.direction} bias."
             )
         return "\n".join(lines)
 
 
-def run_random_short_baseline(
-    bars: list[OHLCBar],
+def run_random_baseline(
+    bars: list[OHLCBar] | OHLCArrays,
     config: BaselineConfig,
     n_simulations: int = 1000,
     seed: int | None = 42,
 ) -> BaselineResult:
-    """Run Monte Carlo random short baseline.
+    """Run Monte Carlo random entry baseline in ``config.direction``.
 
     For each simulation:
     1. Randomly select ~target_trades bar indices as entry points
-    2. Simulate SHORT trades with given SL/TP
+    2. Simulate non-overlapping trades with given SL/TP
     3. Compute Sharpe/DD/PF/return
 
-    Aggregate across all simulations.
+    Aggregate across all simulations.  Exits are precomputed once per
+    entry bar and all simulations advance trade by trade together; the
+    trades have the same distribution as the bar-by-bar reference
+    (:func:`_simulate_single_run` over a per-bar Bernoulli entry mask).
 
     Args:
-        bars: OHLC data loaded via load_ohlc()
-        config: SL/TP and trade parameters
+        bars: OHLC data from load_ohlc_arrays() (or load_ohlc())
+        config: SL/TP, direction and trade parameters
         n_simulations: Number of Monte Carlo runs
         seed: Random seed for reproducibility (None = random)
 
@@ -395,7 +633,8 @@ def run_random_short_baseline(
         BaselineResult with aggregated statistics
     """
     rng = np.random.default_rng(seed)
-    n_bars = len(bars)
+    arrays = _as_arrays(bars)
+    n_bars = len(arrays)
 
     if n_bars < 100:
         msg = f"Need at least 100 bars, got {n_bars}"
@@ -406,21 +645,17 @@ def run_random_short_baseline(
     # reduce the actual count
     entry_prob = min(0.5, config.target_trades * 1.5 / n_bars)
 
-    all_metrics: list[SimulationMetrics] = []
-
-    for i in range(n_simulations):
-        # Random entry indices
-        mask = rng.random(n_bars) < entry_prob
-        entry_indices = np.where(mask)[0]
-
-        trades = _simulate_single_run(
-            bars, entry_indices, config.sl_pct, config.tp_pct, config.taker_fee
-        )
-        metrics = _compute_metrics(trades, config.taker_fee)
-        all_metrics.append(metrics)
-
-        if (i + 1) % 200 == 0:
-            logger.info("Completed %d / %d simulations", i + 1, n_simulations)
+    table = _first_passage_exits(
+        arrays,
+        config.sl_pct,
+        config.tp_pct,
+        config.taker_fee,
+        config.direction,
+    )
+    entries = _random_entries(table.exit_idx, entry_prob, n_simulations, rng)
+    all_metrics = [
+        _metrics_from_pnls(table.pnl_pct[row[row >= 0]], config.taker_fee) for row in entries
+    ]
 
     # Aggregate
     sharpes = np.array([m.sharpe for m in all_metrics])
@@ -454,6 +689,19 @@ def run_random_short_baseline(
     )
 
 
+def run_random_short_baseline(
+    bars: list[OHLCBar] | OHLCArrays,
+    config: BaselineConfig,
+    n_simulations: int = 1000,
+    seed: int | None = 42,
+) -> BaselineResult:
+    """Run the random entry baseline with SHORT entries.
+
+    See :func:`run_random_baseline`.
+    """
+    return run_random_baseline(bars, replace(config, direction="short"), n_simulations, seed)
+
+
 # ---------------------------------------------------------------------------
 # Multi-config runner: test multiple champion SL/TP combos
 # ---------------------------------------------------------------------------
@@ -471,7 +719,7 @@ CHAMPION_CONFIGS = {
 
 
 def run_all_champions(
-    bars: list[OHLCBar],
+    bars: list[OHLCBar] | OHLCArrays,
     n_simulations: int = 1000,
     seed: int | None = 42,
 ) -> dict[str, BaselineResult]:
@@ -479,10 +727,11 @@ def run_all_champions(
 
     Returns dict mapping champion name to BaselineResult.
     """
+    arrays = _as_arrays(bars)
     results: dict[str, BaselineResult] = {}
     for name, config in CHAMPION_CONFIGS.items():
         logger.info("Running baseline for %s ...", name)
-        results[name] = run_random_short_baseline(bars, config, n_simulations, seed)
+        results[name] = run_random_baseline(arrays, config, n_simulations, seed)
     return results
 
 
@@ -525,7 +774,7 @@ def main() -> None:
     import argparse
 
     parser = argparse.ArgumentParser(
-        description="Random short entry baseline for 1m strategy validation"
+        description="Random entry baseline for 1m strategy validation"
     )
     parser.add_argument("--sl-pct", type=float, help="Stop loss %% (e.g. 0.59)")
     parser.add_argument("--tp-pct", type=float, help="Take profit %% (e.g. 10.55)")
@@ -536,6 +785,13 @@ def main() -> None:
     parser.add_argument("--interval", type=str, default="1m", help="Bar interval")
     parser.add_argument("--monte-carlo", type=int, default=1000, help="Number of simulations")
     parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    parser.add_argument(
+        "--direction", choices=["short", "long"], default="short", help="Trade direction"
+    )
+    parser.add_argument(
+        "--strategy-sharpe", type=float, default=None,
+        help="Report this strategy Sharpe's percentile among random entries",
+    )
     parser.add_argument("--archive", type=str, default=str(DEFAULT_ARCHIVE_PATH), help="Archive DB path")
     parser.add_argument(
         "--all-champions", action="store_true",
@@ -545,7 +801,7 @@ def main() -> None:
 
     logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
 
-    bars = load_ohlc(args.symbol, args.interval, args.start, args.end, Path(args.archive))
+    bars = load_ohlc_arrays(args.symbol, args.interval, args.start, args.end, Path(args.archive))
     print(f"Loaded {len(bars)} bars\n")
 
     if args.all_champions:
@@ -560,9 +816,10 @@ def main() -> None:
             sl_pct=args.sl_pct,
             tp_pct=args.tp_pct,
             target_trades=args.target_trades,
+            direction=args.direction,
         )
-        result = run_random_short_baseline(bars, config, args.monte_carlo, args.seed)
-        print(result.summary())
+        result = run_random_baseline(bars, config, args.monte_carlo, args.seed)
+        print(result.summary(strategy_sharpe=args.strategy_sharpe))
 
 
 if __name__ == "__main__":
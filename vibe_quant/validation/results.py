@@ -98,6 +98,10 @@ class ValidationResult(PerformanceMetrics):
     avg_win: float = 0.0
     avg_loss: float = 0.0
     total_slippage: float = 0.0
+    time_in_market: float = 0.0
+    avg_mae: float = 0.0
+    avg_mfe: float = 0.0
+    pnl_by_hour: tuple[float, ...] = ()
     trades: list[TradeRecord] = field(default_factory=list)
 
     starting_balance: float = 1000.0
@@ -128,6 +132,9 @@ class ValidationResult(PerformanceMetrics):
             "total_fees": self.total_fees,
             "total_funding": self.total_funding,
             "total_slippage": self.total_slippage,
+            "time_in_market": self.time_in_market,
+            "avg_mae": self.avg_mae,
+            "avg_mfe": self.avg_mfe,
             "skewness": self.skewness,
             "kurtosis": self.kurtosis,
             "execution_time_seconds": self.execution_time_seconds,
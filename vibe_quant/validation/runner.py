@@ -8,17 +8,26 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 import time
 from dataclasses import dataclass
-from datetime import date, datetime as dt, timedelta
+from datetime import UTC, date, datetime as dt, timedelta
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Literal
 
 from vibe_quant.db.state_manager import StateManager
 from vibe_quant.dsl.compiler import StrategyCompiler
 from vibe_quant.dsl.parser import validate_strategy_dict
 from vibe_quant.logging.events import EventType, create_event
 from vibe_quant.logging.writer import EventWriter
+from vibe_quant.validation.calibration import CalibratedExecutionModel
+from vibe_quant.validation.detail_store import (
+    OPEN_END,
+    DetailBarStore,
+    Window,
+    bar_duration_ns,
+    merge_windows,
+)
 from vibe_quant.validation.latency import LatencyPreset
 from vibe_quant.validation.results import TradeRecord, ValidationResult
 from vibe_quant.validation.venue import (
@@ -28,13 +37,23 @@ from vibe_quant.validation.venue import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
     from nautilus_trader.backtest.engine import BacktestEngine
+    from nautilus_trader.backtest.node import BacktestNode
     from nautilus_trader.backtest.results import BacktestResult
+    from nautilus_trader.config import ImportableStrategyConfig
+    from nautilus_trader.core.data import Data
+    from nautilus_trader.model.data import Bar
 
     from vibe_quant.dsl.schema import StrategyDSL
 
 logger = logging.getLogger(__name__)
 
+# How detail (sub-bar) data reaches the matching engine: "stream" feeds
+# the whole detail series, "on_demand" only windows with working orders.
+DetailMode = Literal["stream", "on_demand"]
+
 
 class ValidationRunnerError(Exception):
     """Error during validation run."""
@@ -42,6 +61,22 @@ class ValidationRunnerError(Exception):
     pass
 
 
+class ValidationBatchError(ValidationRunnerError):
+    """Some runs of a batch failed; the others completed.
+
+    Attributes:
+        results: ValidationResult of each completed run, by run ID.
+        errors: Error message of each failed run, by run ID.
+    """
+
+    def __init__(
+        self, message: str, results: dict[int, ValidationResult], errors: dict[int, str]
+    ) -> None:
+        super().__init__(message)
+        self.results = results
+        self.errors = errors
+
+
 @dataclass(frozen=True)
 class WalkForwardWindow:
     """Single walk-forward train/test window."""
@@ -52,6 +87,180 @@ class WalkForwardWindow:
     test_end: str
 
 
+@dataclass(frozen=True)
+class _ValidationJob:
+    """A validation run resolved from the database, ready to backtest."""
+
+    run_id: int
+    strategy_name: str
+    dsl: StrategyDSL
+    venue_config: VenueConfig
+    run_config: dict[str, object]
+    detail_timeframe: str | None
+
+
+def _pool_size(max_workers: int | None, num_jobs: int) -> int:
+    """Resolve a ``max_workers`` setting (None/1 = sequential, 0 = auto)."""
+    if max_workers is None:
+        return 1
+    workers = max_workers if max_workers > 0 else (os.cpu_count() or 4)
+    return max(1, min(workers, num_jobs))
+
+
+def _iso_to_ns(value: str) -> int:
+    """ISO date/datetime string (naive = UTC) to epoch nanoseconds."""
+    parsed = dt.fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=UTC)
+    return int(parsed.timestamp()) * 1_000_000_000 + parsed.microsecond * 1_000
+
+
+def _run_walk_forward_window(
+    db_path: Path | None,
+    logs_path: Path,
+    backtest_kwargs: dict[str, Any],
+) -> ValidationResult:
+    """Process-pool entry point: backtest one walk-forward test window."""
+    runner = ValidationRunner(db_path=db_path, logs_path=logs_path)
+    try:
+        return runner._run_backtest(  # noqa: SLF001
+            **backtest_kwargs,
+            writer=None,
+            ensure_instruments=False,
+        )
+    finally:
+        runner.close()
+
+
+def _shard_groups(groups: list[list[_ValidationJob]], n_shards: int) -> list[list[_ValidationJob]]:
+    """Split groups into about ``n_shards`` contiguous shards.
+
+    Each group gets shards in proportion to its size (at least one, at
+    most one per item), so one large group does not leave workers idle.
+    """
+    counts = [1] * len(groups)
+    while sum(counts) < n_shards:
+        splittable = [i for i, group in enumerate(groups) if counts[i] < len(group)]
+        if not splittable:
+            break
+        i = max(splittable, key=lambda k: len(groups[k]) / counts[k])
+        counts[i] += 1
+    shards: list[list[_ValidationJob]] = []
+    for group, count in zip(groups, counts, strict=True):
+        size, extra = divmod(len(group), count)
+        start = 0
+        for k in range(count):
+            end = start + size + (1 if k < extra else 0)
+            shards.append(group[start:end])
+            start = end
+    return shards
+
+
+def _run_validation_group(
+    db_path: Path | None,
+    logs_path: Path,
+    jobs: list[_ValidationJob],
+    detail_mode: DetailMode,
+) -> list[tuple[int, ValidationResult | str]]:
+    """Process-pool entry point: backtest runs that share one data set."""
+    runner = ValidationRunner(db_path=db_path, logs_path=logs_path)
+    try:
+        return runner._run_group(jobs, detail_mode)  # noqa: SLF001
+    finally:
+        runner.close()
+
+
+class _BacktestSession:
+    """A built BacktestEngine whose data is reused across strategy runs.
+
+    Venue, instruments and bar feeds are set up once by
+    :meth:`ValidationRunner._open_session`. Each :meth:`run` resets the
+    engine, swaps in the given strategies (and any on-demand detail bars)
+    and runs it again, so strategies validated on the same data share one
+    parquet read and one engine build.
+    """
+
+    def __init__(
+        self,
+        *,
+        node: BacktestNode,
+        engine: BacktestEngine,
+        run_config_id: str,
+        base_data: list[list[Data]],
+        detail_stores: list[DetailBarStore],
+        start: str,
+        end: str,
+        catalog_path: Path,
+    ) -> None:
+        self._node = node
+        self.engine = engine
+        self._run_config_id = run_config_id
+        self._base_data = base_data
+        self.detail_stores = detail_stores
+        self._start = start
+        self._end = end
+        self._catalog_path = catalog_path
+        self._runs = 0
+        self._has_detail = False
+        self._load(None)
+
+    def _load(self, detail_bars: list[Bar] | None) -> None:
+        """Replace the engine's data stream with the base feeds plus detail bars."""
+        engine = self.engine
+        engine.clear_data()
+        # Strategy bars first, so the stable sort breaks ts_init ties the
+        # same way as a streamed detail feed
+        for data in self._base_data:
+            engine.add_data(data, sort=False)
+        if detail_bars:
+            engine.add_data(detail_bars, sort=False)
+        engine.sort_data()
+        self._has_detail = bool(detail_bars)
+
+    def run(
+        self,
+        strategy_configs: list[ImportableStrategyConfig],
+        detail_bars: list[Bar] | None = None,
+    ) -> BacktestResult:
+        """Run the given strategies from a clean engine state.
+
+        Args:
+            strategy_configs: Strategies to add for this run.
+            detail_bars: Extra detail bars for this run only.
+
+        Returns:
+            The engine's BacktestResult (the engine keeps its cache for
+            report extraction until the next run).
+        """
+        from nautilus_trader.trading.config import StrategyFactory
+
+        engine = self.engine
+        if self._runs:
+            engine.reset()
+            engine.clear_strategies()
+        if detail_bars or self._has_detail:
+            self._load(detail_bars)
+        engine.add_strategies([StrategyFactory.create(config) for config in strategy_configs])
+        self._runs += 1
+        engine.run(start=self._start, end=self._end, run_config_id=self._run_config_id)
+        result: BacktestResult = engine.get_result()
+        return result
+
+    def close(self) -> None:
+        """Dispose of the engine and clean up NT's catalog side effects."""
+        import contextlib
+
+        # Reset before dispose to avoid InvalidStateTrigger('RUNNING -> DISPOSE')
+        with contextlib.suppress(Exception):
+            self.engine.reset()
+        self._node.dispose()  # type: ignore[no-untyped-call]
+
+        # NT writes corrupt epoch-timestamp instrument parquet on dispose()
+        from vibe_quant.data.catalog import cleanup_epoch_parquet
+
+        cleanup_epoch_parquet(self._catalog_path)
+
+
 class ValidationRunner:
     """Runner for validation backtests with full-fidelity execution.
 
@@ -75,6 +284,7 @@ class ValidationRunner:
             db_path: Path to state database. Uses default if None.
             logs_path: Path for event log files.
         """
+        self._db_path = db_path
         self._state = StateManager(db_path)
         self._logs_path = Path(logs_path)
         self._compiler = StrategyCompiler()
@@ -88,6 +298,8 @@ class ValidationRunner:
         run_id: int,
         latency_preset: LatencyPreset | str | None = None,
         detail_timeframe: str | None = None,
+        detail_mode: DetailMode = "stream",
+        execution_model: str | None = None,
     ) -> ValidationResult:
         """Run validation backtest for a given run_id.
 
@@ -100,6 +312,13 @@ class ValidationRunner:
                 engine can fill orders at sub-bar resolution. This enables
                 LatencyModel for 1m strategies (normally skipped because
                 bar data has no sub-bar timestamps).
+            detail_mode: "stream" (default) feeds the whole detail series;
+                "on_demand" first runs on strategy bars alone and then feeds
+                detail bars only while orders are working. It pays off
+                when orders work for a small part of the run.
+            execution_model: Name of a calibrated execution model (see
+                :mod:`vibe_quant.validation.calibration`) whose fitted
+                slippage and latency replace the static defaults.
 
         Returns:
             ValidationResult with metrics and trades.
@@ -108,8 +327,191 @@ class ValidationRunner:
             ValidationRunnerError: If run fails.
         """
         start_time = time.monotonic()
+        job = self._prepare_job(run_id, latency_preset, detail_timeframe, execution_model)
+
+        # Update run status to running
+        self._state.update_backtest_run_status(run_id, "running")
+
+        try:
+            # Create event writer
+            with EventWriter(run_id=str(run_id), base_path=self._logs_path) as writer:
+                self._write_start_event(writer, run_id, job.strategy_name, job.venue_config)
+
+                result = self._run_backtest(
+                    run_id=run_id,
+                    strategy_name=job.strategy_name,
+                    dsl=job.dsl,
+                    venue_config=job.venue_config,
+                    run_config=job.run_config,
+                    writer=writer,
+                    detail_timeframe=job.detail_timeframe,
+                    detail_mode=detail_mode,
+                )
+
+                self._write_completion_event(writer, run_id, job.strategy_name, result)
 
-        # Load run config from database
+            result.execution_time_seconds = time.monotonic() - start_time
+            self._finish_run(run_id, result)
+            return result
+        except Exception as exc:
+            error_msg = f"{type(exc).__name__}: {exc}"
+            self._fail_run(run_id, error_msg)
+            raise ValidationRunnerError(error_msg) from exc
+
+    def run_batch(
+        self,
+        run_ids: Sequence[int],
+        *,
+        latency_preset: LatencyPreset | str | None = None,
+        detail_timeframe: str | None = None,
+        detail_mode: DetailMode = "stream",
+        max_workers: int | None = None,
+        execution_model: str | None = None,
+    ) -> list[ValidationResult]:
+        """Validate several runs, loading each shared data set once.
+
+        Runs are grouped by everything that determines the engine's data
+        and venue: symbols, bar timeframes, date range, detail timeframe,
+        latency and fill model. Each group builds one engine and reads its
+        bars once; its strategies then run one after another on that
+        engine (see :class:`_BacktestSession`). With ``max_workers`` groups
+        run on a process pool, and groups larger than their share of the
+        workers are split so every worker stays busy.
+
+        A failing run is marked failed and does not stop the others. If a
+        worker process dies, every run of its shard that had not reported
+        is marked failed. Completed runs are persisted as they finish.
+
+        Args:
+            run_ids: Validation run IDs from the database.
+            latency_preset: Override latency preset for every run.
+            detail_timeframe: Sub-bar timeframe override (see :meth:`run`).
+            detail_mode: How detail bars are fed (see :meth:`run`).
+            max_workers: Worker processes. None or 1 = sequential,
+                0 = auto (cpu_count).
+            execution_model: Calibrated execution model for every run
+                (see :meth:`run`).
+
+        Returns:
+            ValidationResult per run, in ``run_ids`` order.
+
+        Raises:
+            ValidationRunnerError: If a run cannot be prepared.
+            ValidationBatchError: After all runs finished, if any of them
+                failed. It carries the completed runs' results.
+        """
+        model = self._load_execution_model(execution_model)
+        jobs = [
+            self._prepare_job(run_id, latency_preset, detail_timeframe, model)
+            for run_id in run_ids
+        ]
+        groups: dict[tuple[object, ...], list[_ValidationJob]] = {}
+        for job in jobs:
+            groups.setdefault(self._data_key(job), []).append(job)
+
+        pool_size = _pool_size(max_workers, len(jobs))
+        shards = _shard_groups(list(groups.values()), pool_size)
+        logger.info(
+            "Validating %d runs in %d data groups (%d shards, %d workers)",
+            len(jobs),
+            len(groups),
+            len(shards),
+            min(pool_size, len(shards)),
+        )
+
+        for job in jobs:
+            self._state.update_backtest_run_status(job.run_id, "running")
+
+        by_id = {job.run_id: job for job in jobs}
+        results: dict[int, ValidationResult] = {}
+        errors: dict[int, str] = {}
+
+        def _record(run_id: int, outcome: ValidationResult | str) -> None:
+            if isinstance(outcome, str):
+                errors[run_id] = outcome
+                self._fail_run(run_id, outcome)
+                return
+            job = by_id[run_id]
+            try:
+                with EventWriter(run_id=str(run_id), base_path=self._logs_path) as writer:
+                    self._write_start_event(writer, run_id, job.strategy_name, job.venue_config)
+                    for trade in outcome.trades:
+                        self._write_trade_events(writer, run_id, job.strategy_name, trade)
+                    self._write_completion_event(writer, run_id, job.strategy_name, outcome)
+                self._finish_run(run_id, outcome)
+            except Exception as exc:
+                logger.exception("Failed to persist validation run %d", run_id)
+                _record(run_id, f"{type(exc).__name__}: {exc}")
+                return
+            results[run_id] = outcome
+
+        def _record_crash(shard: list[_ValidationJob], exc: BaseException) -> None:
+            logger.error("Validation worker failed: %s", exc, exc_info=exc)
+            for job in shard:
+                if job.run_id not in results and job.run_id not in errors:
+                    _record(job.run_id, f"worker failed: {type(exc).__name__}: {exc}")
+
+        if min(pool_size, len(shards)) > 1:
+            from concurrent.futures import ProcessPoolExecutor, as_completed
+
+            self._ensure_instruments(
+                sorted({s for job in jobs for s in self._parse_symbols(job.run_config)})
+            )
+            pool = ProcessPoolExecutor(max_workers=min(pool_size, len(shards)))
+            try:
+                futures = {
+                    pool.submit(
+                        _run_validation_group,
+                        self._db_path,
+                        self._logs_path,
+                        shard,
+                        detail_mode,
+                    ): shard
+                    for shard in shards
+                }
+                for future in as_completed(futures):
+                    try:
+                        outcomes = future.result()
+                    except Exception as exc:
+                        # A dead worker (BrokenProcessPool) fails every
+                        # shard still pending on the pool
+                        _record_crash(futures[future], exc)
+                        continue
+                    for run_id, outcome in outcomes:
+                        _record(run_id, outcome)
+            finally:
+                pool.shutdown(wait=True, cancel_futures=True)
+        else:
+            for shard in shards:
+                try:
+                    outcomes = self._run_group(shard, detail_mode)
+                except Exception as exc:
+                    _record_crash(shard, exc)
+                    continue
+                for run_id, outcome in outcomes:
+                    _record(run_id, outcome)
+
+        if errors:
+            details = "; ".join(f"run {rid}: {msg}" for rid, msg in sorted(errors.items()))
+            msg = f"{len(errors)} of {len(jobs)} validation runs failed: {details}"
+            raise ValidationBatchError(msg, results=results, errors=errors)
+        return [results[run_id] for run_id in run_ids]
+
+    def _prepare_job(
+        self,
+        run_id: int,
+        latency_preset: LatencyPreset | str | None,
+        detail_timeframe: str | None,
+        execution_model: CalibratedExecutionModel | str | None = None,
+    ) -> _ValidationJob:
+        """Load a run and its strategy and resolve detail data and venue.
+
+        Raises:
+            ValidationRunnerError: If the run, strategy or execution model
+                is missing or the DSL does not validate.
+        """
+        if not isinstance(execution_model, CalibratedExecutionModel):
+            execution_model = self._load_execution_model(execution_model)
         run_config = self._load_run_config(run_id)
         strategy_id_raw = run_config["strategy_id"]
         if not isinstance(strategy_id_raw, int):
@@ -144,45 +546,117 @@ class ValidationRunner:
             effective_latency,
             timeframe=dsl.timeframe,
             has_detail_data=effective_detail is not None,
+            execution_model=execution_model,
+        )
+        return _ValidationJob(
+            run_id=run_id,
+            strategy_name=strategy_name,
+            dsl=dsl,
+            venue_config=venue_config,
+            run_config=run_config,
+            detail_timeframe=effective_detail,
         )
 
-        # Update run status to running
-        self._state.update_backtest_run_status(run_id, "running")
-
-        try:
-            # Create event writer
-            with EventWriter(run_id=str(run_id), base_path=self._logs_path) as writer:
-                self._write_start_event(writer, run_id, strategy_name, venue_config)
+    def _load_execution_model(self, name: str | None) -> CalibratedExecutionModel | None:
+        """Load a stored calibrated execution model by name.
 
-                result = self._run_backtest(
-                    run_id=run_id,
-                    strategy_name=strategy_name,
-                    dsl=dsl,
-                    venue_config=venue_config,
-                    run_config=run_config,
-                    writer=writer,
-                    detail_timeframe=effective_detail,
-                )
-
-                self._write_completion_event(writer, run_id, strategy_name, result)
+        Raises:
+            ValidationRunnerError: If no model with that name is stored.
+        """
+        if name is None:
+            return None
+        row = self._state.get_execution_model(name)
+        if row is None:
+            msg = f"Execution model {name!r} not found"
+            raise ValidationRunnerError(msg)
+        return CalibratedExecutionModel.from_dict(row["model"])
+
+    def _data_key(self, job: _ValidationJob) -> tuple[object, ...]:
+        """Everything that determines a run's engine data and venue."""
+        return (
+            tuple(self._parse_symbols(job.run_config)),
+            tuple(sorted(self._strategy_timeframes(job.dsl))),
+            str(job.run_config.get("start_date", "2024-01-01")),
+            str(job.run_config.get("end_date", "2024-12-31")),
+            job.detail_timeframe,
+            repr(job.venue_config),
+        )
 
-            result.execution_time_seconds = time.monotonic() - start_time
-            self._store_results(run_id, result)
+    def _run_group(
+        self,
+        jobs: list[_ValidationJob],
+        detail_mode: DetailMode,
+    ) -> list[tuple[int, ValidationResult | str]]:
+        """Backtest runs sharing one data set on a single engine.
 
-            if result.total_trades == 0:
-                error_msg = "Validation produced 0 trades — likely missing/empty data"
-                logger.error("Run %d: %s", run_id, error_msg)
-                self._state.update_backtest_run_status(run_id, "failed", error_message=error_msg)
-            else:
-                self._state.update_backtest_run_status(run_id, "completed")
-            return result
-        except Exception as exc:
-            error_msg = f"{type(exc).__name__}: {exc}"
-            try:
-                self._state.update_backtest_run_status(run_id, "failed", error_message=error_msg)
-            except Exception:
-                logger.exception("Failed to update run %d status to failed", run_id)
-            raise ValidationRunnerError(error_msg) from exc
+        Returns:
+            ``(run_id, result)`` per job, or ``(run_id, error message)`` for
+            runs that failed. A failed run rebuilds the engine for the next.
+        """
+        first = jobs[0]
+        symbols = self._parse_symbols(first.run_config)
+        session: _BacktestSession | None = None
+        outcomes: list[tuple[int, ValidationResult | str]] = []
+        try:
+            for job in jobs:
+                start_time = time.monotonic()
+                try:
+                    strategy_configs = self._build_strategy_configs(
+                        job.dsl,
+                        job.run_config,
+                        symbols,
+                        has_detail_data=job.detail_timeframe is not None,
+                    )
+                    if session is None:
+                        session = self._open_session(
+                            run_id=job.run_id,
+                            symbols=symbols,
+                            timeframes=self._strategy_timeframes(job.dsl),
+                            start_date=str(job.run_config.get("start_date", "2024-01-01")),
+                            end_date=str(job.run_config.get("end_date", "2024-12-31")),
+                            venue_config=job.venue_config,
+                            detail_timeframe=job.detail_timeframe,
+                            detail_mode=detail_mode,
+                        )
+                    result = self._run_in_session(
+                        session,
+                        run_id=job.run_id,
+                        strategy_name=job.strategy_name,
+                        dsl=job.dsl,
+                        venue_config=job.venue_config,
+                        strategy_configs=strategy_configs,
+                    )
+                except Exception as exc:
+                    logger.exception("Validation run %d failed", job.run_id)
+                    outcomes.append((job.run_id, f"{type(exc).__name__}: {exc}"))
+                    if session is not None:
+                        session.close()
+                        session = None
+                    continue
+                result.execution_time_seconds = time.monotonic() - start_time
+                outcomes.append((job.run_id, result))
+        finally:
+            if session is not None:
+                session.close()
+        return outcomes
+
+    def _finish_run(self, run_id: int, result: ValidationResult) -> None:
+        """Store a finished run's results and mark it completed (or failed on 0 trades)."""
+        self._store_results(run_id, result)
+
+        if result.total_trades == 0:
+            error_msg = "Validation produced 0 trades — likely missing/empty data"
+            logger.error("Run %d: %s", run_id, error_msg)
+            self._state.update_backtest_run_status(run_id, "failed", error_message=error_msg)
+        else:
+            self._state.update_backtest_run_status(run_id, "completed")
+
+    def _fail_run(self, run_id: int, error_msg: str) -> None:
+        """Mark a run failed, logging (not raising) if the update itself fails."""
+        try:
+            self._state.update_backtest_run_status(run_id, "failed", error_message=error_msg)
+        except Exception:
+            logger.exception("Failed to update run %d status to failed", run_id)
 
     def run_walk_forward(
         self,
@@ -193,12 +667,16 @@ class ValidationRunner:
         step_days: int | None = None,
         latency_preset: LatencyPreset | str | None = None,
         detail_timeframe: str | None = None,
+        detail_mode: DetailMode = "stream",
+        max_workers: int | None = None,
     ) -> list[ValidationResult]:
         """Run walk-forward validation over multiple rolling windows.
 
         Windows are constructed over the run's configured [start_date, end_date]
         range using a rolling train window followed by an out-of-sample test
-        window. Each test window is backtested independently.
+        window. Each test window is backtested independently, so with
+        ``max_workers`` they run on a process pool. Results, events and the
+        aggregate are always produced in window order.
 
         Args:
             run_id: Backtest run ID from database.
@@ -207,6 +685,9 @@ class ValidationRunner:
             step_days: Step size between windows. Defaults to test_days.
             latency_preset: Optional latency override.
             detail_timeframe: Sub-bar timeframe for fill resolution (e.g., '5s').
+            detail_mode: How detail bars are fed (see :meth:`run`).
+            max_workers: Worker processes for window backtests. None or 1 =
+                sequential, 0 = auto (cpu_count).
 
         Returns:
             List of ValidationResult objects, one per test window.
@@ -289,21 +770,24 @@ class ValidationRunner:
                     )
                 )
 
-                for index, window in enumerate(windows, start=1):
+                window_configs: list[dict[str, object]] = []
+                for window in windows:
                     window_run_config = dict(run_config)
                     window_run_config["start_date"] = window.test_start
                     window_run_config["end_date"] = window.test_end
-
-                    window_result = self._run_backtest(
-                        run_id=run_id,
-                        strategy_name=strategy_name,
-                        dsl=dsl,
-                        venue_config=venue_config,
-                        run_config=window_run_config,
-                        writer=writer,
-                        detail_timeframe=effective_detail,
-                    )
-                    window_results.append(window_result)
+                    window_configs.append(window_run_config)
+
+                backtest_kwargs: dict[str, Any] = {
+                    "run_id": run_id,
+                    "strategy_name": strategy_name,
+                    "dsl": dsl,
+                    "venue_config": venue_config,
+                    "detail_timeframe": effective_detail,
+                    "detail_mode": detail_mode,
+                }
+
+                def _log_window(index: int, window_result: ValidationResult) -> None:
+                    window = windows[index]
                     writer.write(
                         create_event(
                             event_type=EventType.LIFECYCLE,
@@ -311,7 +795,7 @@ class ValidationRunner:
                             strategy_name=strategy_name,
                             data={
                                 "event": "WALK_FORWARD_WINDOW_COMPLETE",
-                                "window_index": index,
+                                "window_index": index + 1,
                                 "window_count": len(windows),
                                 "train_start": window.train_start,
                                 "train_end": window.train_end,
@@ -325,6 +809,25 @@ class ValidationRunner:
                         )
                     )
 
+                pool_size = _pool_size(max_workers, len(windows))
+                if pool_size > 1:
+                    # Workers skip event logging; replay it here in window order
+                    self._ensure_instruments(self._parse_symbols(run_config))
+                    window_results = self._run_windows_parallel(
+                        backtest_kwargs, window_configs, pool_size
+                    )
+                    for index, window_result in enumerate(window_results):
+                        for trade in window_result.trades:
+                            self._write_trade_events(writer, run_id, strategy_name, trade)
+                        _log_window(index, window_result)
+                else:
+                    for index, window_run_config in enumerate(window_configs):
+                        window_result = self._run_backtest(
+                            **backtest_kwargs, run_config=window_run_config, writer=writer
+                        )
+                        window_results.append(window_result)
+                        _log_window(index, window_result)
+
                 aggregate = self._aggregate_walk_forward_results(
                     run_id=run_id,
                     strategy_name=strategy_name,
@@ -362,6 +865,34 @@ class ValidationRunner:
             msg = f"Invalid {field_name}: {value}"
             raise ValidationRunnerError(msg) from exc
 
+    def _run_windows_parallel(
+        self,
+        backtest_kwargs: dict[str, Any],
+        window_configs: list[dict[str, object]],
+        pool_size: int,
+    ) -> list[ValidationResult]:
+        """Backtest walk-forward windows on a process pool, in window order.
+
+        Workers build their own runner (DB connection, compiler) and skip
+        event logging and catalog instrument writes; the parent does both.
+        """
+        from concurrent.futures import ProcessPoolExecutor
+
+        pool = ProcessPoolExecutor(max_workers=pool_size)
+        try:
+            futures = [
+                pool.submit(
+                    _run_walk_forward_window,
+                    self._db_path,
+                    self._logs_path,
+                    {**backtest_kwargs, "run_config": cfg},
+                )
+                for cfg in window_configs
+            ]
+            return [f.result() for f in futures]
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
     @staticmethod
     def _build_walk_forward_windows(
         *,
@@ -553,6 +1084,7 @@ class ValidationRunner:
         timeframe: str = "4h",
         *,
         has_detail_data: bool = False,
+        execution_model: CalibratedExecutionModel | None = None,
     ) -> VenueConfig:
         """Create venue configuration for validation.
 
@@ -569,6 +1101,7 @@ class ValidationRunner:
             latency_preset: Latency preset to use.
             timeframe: Strategy primary timeframe.
             has_detail_data: Whether sub-bar detail data is loaded.
+            execution_model: Calibrated slippage/latency model, if any.
 
         Returns:
             Configured VenueConfig.
@@ -590,88 +1123,40 @@ class ValidationRunner:
             return create_venue_config_for_validation(
                 starting_balance_usdt=int(balance),
                 latency_preset=None,
+                execution_model=execution_model,
             )
 
         return create_venue_config_for_validation(
             starting_balance_usdt=int(balance),
             latency_preset=latency_preset or LatencyPreset.CLOUD,
+            execution_model=execution_model,
         )
 
-    def _run_backtest(
+    @staticmethod
+    def _strategy_timeframes(dsl: StrategyDSL) -> set[str]:
+        """Every bar timeframe the strategy subscribes to."""
+        timeframes = {dsl.timeframe}
+        timeframes.update(dsl.additional_timeframes)
+        for ind_config in dsl.indicators.values():
+            if ind_config.timeframe:
+                timeframes.add(ind_config.timeframe)
+        return timeframes
+
+    def _build_strategy_configs(
         self,
-        run_id: int,
-        strategy_name: str,
         dsl: StrategyDSL,
-        venue_config: VenueConfig,
         run_config: dict[str, object],
-        writer: EventWriter,
-        detail_timeframe: str | None = None,
-    ) -> ValidationResult:
-        """Run NautilusTrader backtest with full-fidelity execution.
-
-        Compiles the strategy DSL to a NautilusTrader Strategy, loads market
-        data from the ParquetDataCatalog, configures the venue with latency
-        and slippage models, and runs a BacktestNode.
-
-        When detail_timeframe is provided (e.g., '5s'), loads sub-bar data
-        alongside strategy bars. NT processes all data chronologically, so
-        the matching engine can fill orders at the next detail bar instead
-        of the next strategy bar. This enables realistic latency simulation
-        on 1m strategies (e.g., 60ms latency fills at next 5s bar = ~5s
-        delay instead of 60s).
-
-        Args:
-            run_id: Run ID.
-            strategy_name: Strategy name.
-            dsl: Validated strategy DSL.
-            venue_config: Venue configuration.
-            run_config: Run configuration from database.
-            writer: Event writer for logging.
-            detail_timeframe: Sub-bar timeframe for fill resolution (e.g., '5s').
-
-        Returns:
-            ValidationResult with real metrics and trades.
+        symbols: list[str],
+        *,
+        has_detail_data: bool,
+    ) -> list[ImportableStrategyConfig]:
+        """Compile the strategy and build one importable config per symbol.
 
         Raises:
-            ValidationRunnerError: If backtest setup or execution fails.
+            ValidationRunnerError: If the compiled module lacks the
+                expected strategy/config classes.
         """
-        from nautilus_trader.backtest.node import BacktestNode
-        from nautilus_trader.config import (
-            BacktestDataConfig,
-            BacktestEngineConfig,
-            BacktestRunConfig,
-            ImportableStrategyConfig,
-        )
-
-        from vibe_quant.data.catalog import (
-            DEFAULT_CATALOG_PATH,
-            INSTRUMENT_CONFIGS,
-            INTERVAL_TO_AGGREGATION,
-            CatalogManager,
-            create_instrument,
-        )
-
-        # Parse symbols from run config
-        symbols = self._parse_symbols(run_config)
-
-        # Parse date range
-        start_date = str(run_config.get("start_date", "2024-01-01"))
-        end_date = str(run_config.get("end_date", "2024-12-31"))
-
-        # Collect all timeframes needed by the strategy
-        all_timeframes = {dsl.timeframe}
-        all_timeframes.update(dsl.additional_timeframes)
-        for ind_config in dsl.indicators.values():
-            if ind_config.timeframe:
-                all_timeframes.add(ind_config.timeframe)
-
-        # Ensure instruments exist in catalog
-        catalog_path = DEFAULT_CATALOG_PATH
-        catalog_mgr = CatalogManager(catalog_path)
-        for symbol in symbols:
-            if symbol in INSTRUMENT_CONFIGS:
-                instrument = create_instrument(symbol)
-                catalog_mgr.write_instrument(instrument)
+        from nautilus_trader.config import ImportableStrategyConfig
 
         # Compile strategy to an importable module (registers in sys.modules)
         module = self._compiler.compile_to_module(dsl)
@@ -691,35 +1176,81 @@ class ValidationRunner:
         strategy_params = self._augment_strategy_params_for_validation(
             self._build_strategy_params(run_config),
             timeframe=dsl.timeframe,
-            has_detail_data=detail_timeframe is not None,
+            has_detail_data=has_detail_data,
         )
 
-        # Build strategy configs (one per symbol)
-        strategy_configs: list[ImportableStrategyConfig] = []
-        for symbol in symbols:
-            instrument_id = f"{symbol}-PERP.BINANCE"
-            config_dict = {"instrument_id": instrument_id, **strategy_params}
-            strategy_configs.append(
-                ImportableStrategyConfig(
-                    strategy_path=f"{module_path}:{strategy_cls_name}",
-                    config_path=f"{module_path}:{config_cls_name}",
-                    config=config_dict,
-                )
+        return [
+            ImportableStrategyConfig(
+                strategy_path=f"{module_path}:{strategy_cls_name}",
+                config_path=f"{module_path}:{config_cls_name}",
+                config={"instrument_id": f"{symbol}-PERP.BINANCE", **strategy_params},
             )
+            for symbol in symbols
+        ]
+
+    def _open_session(
+        self,
+        *,
+        run_id: int,
+        symbols: list[str],
+        timeframes: set[str],
+        start_date: str,
+        end_date: str,
+        venue_config: VenueConfig,
+        detail_timeframe: str | None,
+        detail_mode: DetailMode,
+    ) -> _BacktestSession:
+        """Build an engine for one data set and load its bars.
+
+        Args:
+            run_id: Run ID (for logging).
+            symbols: Symbols to load.
+            timeframes: Strategy bar timeframes to load per symbol.
+            start_date: Start of the backtest window.
+            end_date: End of the backtest window.
+            venue_config: Venue configuration.
+            detail_timeframe: Sub-bar timeframe for fill resolution.
+            detail_mode: How detail bars reach the engine (see :meth:`run`).
+
+        Returns:
+            A session ready to run strategies.
+
+        Raises:
+            ValidationRunnerError: If no data configuration can be built or
+                the engine cannot be created.
+        """
+        from nautilus_trader.backtest.node import BacktestNode
+        from nautilus_trader.config import (
+            BacktestDataConfig,
+            BacktestEngineConfig,
+            BacktestRunConfig,
+        )
+        from nautilus_trader.model.data import Bar
+
+        from vibe_quant.data.catalog import (
+            DEFAULT_CATALOG_PATH,
+            INTERVAL_TO_AGGREGATION,
+            get_bar_type,
+        )
+
+        catalog_path = DEFAULT_CATALOG_PATH
 
         # Build data configs (one per symbol per timeframe)
         data_configs: list[BacktestDataConfig] = []
+        detail_stores: list[DetailBarStore] = []
         for symbol in symbols:
             instrument_id = f"{symbol}-PERP.BINANCE"
-            for tf in sorted(all_timeframes):
+            for tf in sorted(timeframes):
                 if tf not in INTERVAL_TO_AGGREGATION:
                     logger.warning("Unknown timeframe %s, skipping", tf)
                     continue
                 step, agg = INTERVAL_TO_AGGREGATION[tf]
+                # data_cls must be the class: NT only applies bar_spec when
+                # ``data_cls is Bar``, otherwise every bar type is loaded
                 data_configs.append(
                     BacktestDataConfig(
                         catalog_path=str(catalog_path.resolve()),
-                        data_cls="nautilus_trader.model.data:Bar",
+                        data_cls=Bar,
                         instrument_id=instrument_id,
                         bar_spec=f"{step}-{agg.name}-LAST",
                         start_time=start_date,
@@ -728,13 +1259,27 @@ class ValidationRunner:
                 )
 
             # Add detail (sub-bar) data for fill resolution if requested
-            if detail_timeframe and detail_timeframe not in all_timeframes:
-                if detail_timeframe in INTERVAL_TO_AGGREGATION:
+            if detail_timeframe and detail_timeframe not in timeframes:
+                if detail_timeframe in INTERVAL_TO_AGGREGATION and detail_mode == "on_demand":
+                    detail_dir = (
+                        catalog_path / "data" / "bar" / str(get_bar_type(symbol, detail_timeframe))
+                    )
+                    try:
+                        detail_stores.append(
+                            DetailBarStore(detail_dir, _iso_to_ns(start_date), _iso_to_ns(end_date))
+                        )
+                    except ValueError:
+                        logger.warning(
+                            "No %s detail bars for %s, skipping sub-bar data",
+                            detail_timeframe,
+                            symbol,
+                        )
+                elif detail_timeframe in INTERVAL_TO_AGGREGATION:
                     detail_step, detail_agg = INTERVAL_TO_AGGREGATION[detail_timeframe]
                     data_configs.append(
                         BacktestDataConfig(
                             catalog_path=str(catalog_path.resolve()),
-                            data_cls="nautilus_trader.model.data:Bar",
+                            data_cls=Bar,
                             instrument_id=instrument_id,
                             bar_spec=f"{detail_step}-{detail_agg.name}-LAST",
                             start_time=start_date,
@@ -756,20 +1301,12 @@ class ValidationRunner:
             msg = "No valid data configurations could be built"
             raise ValidationRunnerError(msg)
 
-        # Convert our VenueConfig to NautilusTrader BacktestVenueConfig
-        bt_venue_config = create_backtest_venue_config(venue_config)
-
-        # Create engine config
-        engine_config = BacktestEngineConfig(
-            strategies=strategy_configs,
-            run_analysis=True,
-        )
-
-        # Create run config -- dispose_on_completion=False so we can
-        # access engine.trader for positions report after run completes.
+        # Strategies are added per run by the session, so the engine config
+        # carries none. dispose_on_completion=False keeps engine.trader
+        # available for the positions report after each run.
         bt_run_config = BacktestRunConfig(
-            engine=engine_config,
-            venues=[bt_venue_config],
+            engine=BacktestEngineConfig(run_analysis=True),
+            venues=[create_backtest_venue_config(venue_config)],
             data=data_configs,
             start=start_date,
             end=end_date,
@@ -777,59 +1314,258 @@ class ValidationRunner:
         )
 
         detail_info = f", detail={detail_timeframe}" if detail_timeframe else ""
+        if detail_stores:
+            detail_info += " (on demand)"
         logger.info(
             "Starting NautilusTrader backtest for run %d: %d symbols, %d timeframes%s, %s to %s",
             run_id,
             len(symbols),
-            len(all_timeframes),
+            len(timeframes),
             detail_info,
             start_date,
             end_date,
         )
 
-        # Execute the backtest
         node = BacktestNode(configs=[bt_run_config])
         try:
             # Build engines, then register portfolio statistics before running
             node.build()
             self._register_statistics(node)
-            node.run()
-
             engine = node.get_engine(bt_run_config.id)
             if engine is None:
                 raise ValidationRunnerError(
                     f"Backtest engine not found for run config {bt_run_config.id}"
                 )
-            bt_result = engine.get_result()
+            base_data: list[list[Data]] = []
+            for data_config in data_configs:
+                loaded = node.load_data_config(data_config, start_date, end_date)
+                if loaded.data:
+                    base_data.append(loaded.data)
+        except BaseException:
+            node.dispose()  # type: ignore[no-untyped-call]
+            raise
+        return _BacktestSession(
+            node=node,
+            engine=engine,
+            run_config_id=bt_run_config.id,
+            base_data=base_data,
+            detail_stores=detail_stores,
+            start=start_date,
+            end=end_date,
+            catalog_path=catalog_path,
+        )
 
-            # Extract metrics and trades from the engine
+    def _run_in_session(
+        self,
+        session: _BacktestSession,
+        *,
+        run_id: int,
+        strategy_name: str,
+        dsl: StrategyDSL,
+        venue_config: VenueConfig,
+        strategy_configs: list[ImportableStrategyConfig],
+    ) -> ValidationResult:
+        """Run one strategy on an open session and extract its results."""
+
+        def execute(detail_bars: list[Bar] | None) -> tuple[ValidationResult, list[Window]]:
+            bt_result = session.run(strategy_configs, detail_bars)
             result = self._extract_results(
                 run_id=run_id,
                 strategy_name=strategy_name,
                 bt_result=bt_result,
-                engine=engine,
+                engine=session.engine,
+                venue_config=venue_config,
+                timeframe=dsl.timeframe,
+            )
+            return result, self._order_intervals(session.engine)
+
+        if session.detail_stores:
+            return self._run_with_on_demand_detail(
+                execute, session.detail_stores, bar_duration_ns(dsl.timeframe), run_id
+            )
+        result, _ = execute(None)
+        return result
+
+    def _run_backtest(
+        self,
+        run_id: int,
+        strategy_name: str,
+        dsl: StrategyDSL,
+        venue_config: VenueConfig,
+        run_config: dict[str, object],
+        writer: EventWriter | None,
+        detail_timeframe: str | None = None,
+        ensure_instruments: bool = True,
+        detail_mode: DetailMode = "stream",
+    ) -> ValidationResult:
+        """Run NautilusTrader backtest with full-fidelity execution.
+
+        Compiles the strategy DSL to a NautilusTrader Strategy, loads market
+        data from the ParquetDataCatalog, configures the venue with latency
+        and slippage models, and runs a BacktestEngine.
+
+        When detail_timeframe is provided (e.g., '5s'), loads sub-bar data
+        alongside strategy bars. NT processes all data chronologically, so
+        the matching engine can fill orders at the next detail bar instead
+        of the next strategy bar. This enables realistic latency simulation
+        on 1m strategies (e.g., 60ms latency fills at next 5s bar = ~5s
+        delay instead of 60s).
+
+        Args:
+            run_id: Run ID.
+            strategy_name: Strategy name.
+            dsl: Validated strategy DSL.
+            venue_config: Venue configuration.
+            run_config: Run configuration from database.
+            writer: Event writer for trade events. None skips them (the
+                caller logs ``result.trades`` itself).
+            detail_timeframe: Sub-bar timeframe for fill resolution (e.g., '5s').
+            ensure_instruments: Write instrument definitions to the catalog
+                first. Parallel workers skip this; the parent does it once.
+            detail_mode: "stream" adds the detail series as a data feed.
+                "on_demand" reads it into a :class:`DetailBarStore` and
+                adds only windows where orders are working (see
+                :meth:`_run_with_on_demand_detail`).
+
+        Returns:
+            ValidationResult with real metrics and trades.
+
+        Raises:
+            ValidationRunnerError: If backtest setup or execution fails.
+        """
+        symbols = self._parse_symbols(run_config)
+        if ensure_instruments:
+            self._ensure_instruments(symbols)
+
+        strategy_configs = self._build_strategy_configs(
+            dsl, run_config, symbols, has_detail_data=detail_timeframe is not None
+        )
+        session = self._open_session(
+            run_id=run_id,
+            symbols=symbols,
+            timeframes=self._strategy_timeframes(dsl),
+            start_date=str(run_config.get("start_date", "2024-01-01")),
+            end_date=str(run_config.get("end_date", "2024-12-31")),
+            venue_config=venue_config,
+            detail_timeframe=detail_timeframe,
+            detail_mode=detail_mode,
+        )
+        try:
+            result = self._run_in_session(
+                session,
+                run_id=run_id,
+                strategy_name=strategy_name,
+                dsl=dsl,
                 venue_config=venue_config,
+                strategy_configs=strategy_configs,
             )
+        finally:
+            session.close()
 
-            # Log trade events
+        # Log trade events
+        if writer is not None:
             for trade in result.trades:
                 self._write_trade_events(writer, run_id, strategy_name, trade)
 
-            return result
-        finally:
-            # Reset engines before dispose to avoid
-            # InvalidStateTrigger('RUNNING -> DISPOSE')
-            import contextlib
+        return result
 
-            for eng in node.get_engines():
-                with contextlib.suppress(Exception):
-                    eng.reset()
-            node.dispose()  # type: ignore[no-untyped-call]
+    # Primary-bar passes before on-demand detail falls back to the full feed
+    _MAX_DETAIL_PASSES = 4
+    # Share of detail bars inside order windows above which another
+    # windowed pass cannot beat feeding every detail bar once
+    _MAX_DETAIL_COVERAGE = 0.5
 
-            # NT writes corrupt epoch-timestamp instrument parquet on dispose()
-            from vibe_quant.data.catalog import cleanup_epoch_parquet
+    @classmethod
+    def _run_with_on_demand_detail(
+        cls,
+        execute: Callable[[list[Bar] | None], tuple[ValidationResult, list[Window]]],
+        detail_stores: list[DetailBarStore],
+        pad_ns: int,
+        run_id: int,
+    ) -> ValidationResult:
+        """Backtest with detail bars only where orders are working.
+
+        The first pass runs on strategy bars alone to find when orders are
+        working. Each later pass adds detail bars for those intervals
+        (padded by one strategy bar) and re-runs; sub-bar fills can move
+        later orders, so passes repeat until the orders' padded intervals
+        are all inside the loaded windows. At that point every bar with a
+        working order saw the same detail data as a full detail feed. If
+        that does not happen within ``_MAX_DETAIL_PASSES``, or the windows
+        already hold more than ``_MAX_DETAIL_COVERAGE`` of the detail bars,
+        the next pass loads every detail bar and is the last one.
 
-            cleanup_epoch_parquet(catalog_path)
+        Args:
+            execute: Runs one backtest with the given extra detail bars and
+                returns its result and the orders' working intervals.
+            detail_stores: One detail store per symbol.
+            pad_ns: Strategy bar length in nanoseconds.
+            run_id: Run ID (for logging).
+
+        Returns:
+            ValidationResult of the final pass.
+        """
+        windows: list[Window] = []
+        result, intervals = execute(None)
+        for n_pass in range(2, cls._MAX_DETAIL_PASSES + 1):
+            needed = merge_windows([*windows, *merge_windows(intervals, pad_ns)])
+            if needed == windows:
+                break
+            windows = needed
+            total = sum(len(store) for store in detail_stores)
+            covered = sum(store.count(windows) for store in detail_stores)
+            full_feed = total > 0 and covered / total > cls._MAX_DETAIL_COVERAGE
+            if full_feed:
+                logger.info(
+                    "Run %d: orders work over %.0f%% of detail bars, loading all of them",
+                    run_id,
+                    100.0 * covered / total,
+                )
+            elif n_pass == cls._MAX_DETAIL_PASSES:
+                logger.warning(
+                    "Run %d: order windows did not settle after %d passes, loading all detail bars",
+                    run_id,
+                    n_pass - 1,
+                )
+                full_feed = True
+            if full_feed:
+                windows = [(0, OPEN_END)]
+            detail_bars = [bar for store in detail_stores for bar in store.bars(windows)]
+            logger.info(
+                "Run %d pass %d: %d of %d detail bars in %d order windows",
+                run_id,
+                n_pass,
+                len(detail_bars),
+                total,
+                len(windows),
+            )
+            result, intervals = execute(detail_bars)
+            if full_feed:
+                break
+        return result
+
+    @staticmethod
+    def _order_intervals(engine: BacktestEngine) -> list[Window]:
+        """Working interval of every order; orders still open run to the end."""
+        return [
+            (order.ts_init, OPEN_END if order.is_open else order.ts_last)
+            for order in engine.cache.orders()
+        ]
+
+    @staticmethod
+    def _ensure_instruments(symbols: list[str]) -> None:
+        """Write instrument definitions for known symbols to the catalog."""
+        from vibe_quant.data.catalog import (
+            DEFAULT_CATALOG_PATH,
+            INSTRUMENT_CONFIGS,
+            CatalogManager,
+            create_instrument,
+        )
+
+        catalog_mgr = CatalogManager(DEFAULT_CATALOG_PATH)
+        for symbol in symbols:
+            if symbol in INSTRUMENT_CONFIGS:
+                catalog_mgr.write_instrument(create_instrument(symbol))
 
     def _register_statistics(self, node: object) -> None:
         """Register portfolio statistics on the engine's analyzer.
@@ -1046,6 +1782,7 @@ class ValidationRunner:
         bt_result: BacktestResult,
         engine: BacktestEngine,
         venue_config: VenueConfig,
+        timeframe: str | None = None,
     ) -> ValidationResult:
         """Extract ValidationResult from NautilusTrader backtest output.
 
@@ -1058,13 +1795,17 @@ class ValidationRunner:
             bt_result: NautilusTrader BacktestResult.
             engine: BacktestEngine after run for report generation.
             venue_config: Venue config for leverage info.
+            timeframe: Strategy timeframe (selects the bar series used
+                for excursions).
 
         Returns:
             Populated ValidationResult.
         """
         from vibe_quant.validation.extraction import extract_results
 
-        return extract_results(run_id, strategy_name, bt_result, engine, venue_config)
+        return extract_results(
+            run_id, strategy_name, bt_result, engine, venue_config, timeframe=timeframe
+        )
 
     def _write_start_event(
         self,
@@ -1085,6 +1826,7 @@ class ValidationRunner:
                 if venue_config.latency_preset
                 else None,
                 "starting_balance": venue_config.starting_balance_usdt,
+                "execution_model": venue_config.execution_model,
             },
         )
         writer.write(event)
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from decimal import Decimal
+from typing import TYPE_CHECKING
 
 from nautilus_trader.backtest.config import (
     ImportableFeeModelConfig,
@@ -26,6 +27,9 @@ from vibe_quant.validation.latency import (
     get_latency_model,
 )
 
+if TYPE_CHECKING:
+    from vibe_quant.validation.calibration import CalibratedExecutionModel
+
 # Default Binance fee rates (percentage)
 # Note: Binance has VIP tiers; these are default non-VIP rates
 BINANCE_MAKER_FEE = Decimal("0.0002")  # 0.02%
@@ -47,6 +51,8 @@ class VenueConfig:
         fill_config: Fill model configuration.
         maker_fee: Maker fee rate as decimal.
         taker_fee: Taker fee rate as decimal.
+        execution_model: Name of the calibrated execution model the
+            latency and slippage come from, or None for static defaults.
     """
 
     name: str = "BINANCE"
@@ -67,6 +73,8 @@ class VenueConfig:
     maker_fee: Decimal = BINANCE_MAKER_FEE
     taker_fee: Decimal = BINANCE_TAKER_FEE
 
+    execution_model: str | None = None
+
 
 def create_venue_config_for_screening(
     starting_balance_usdt: int = 1_000,
@@ -108,6 +116,7 @@ def create_venue_config_for_validation(
     leverages: dict[str, Decimal] | None = None,
     latency_preset: LatencyPreset | str | None = LatencyPreset.CLOUD,
     impact_coefficient: float = 0.1,
+    execution_model: CalibratedExecutionModel | None = None,
 ) -> VenueConfig:
     """Create VenueConfig optimized for validation mode.
 
@@ -127,6 +136,9 @@ def create_venue_config_for_validation(
         leverages: Per-instrument leverage overrides.
         latency_preset: Latency preset for execution delays. None = no latency.
         impact_coefficient: Market impact coefficient for slippage.
+        execution_model: Calibrated model fitted from recorded fills. Its
+            slippage curve replaces ``impact_coefficient`` and, when latency
+            is enabled, its fitted latency replaces the preset's.
 
     Returns:
         VenueConfig for validation.
@@ -144,12 +156,23 @@ def create_venue_config_for_validation(
         prob_best_price_fill = 1.0
         max_adverse_ticks = 1
 
+    impact_exponent = 0.5
+    base_slippage = 0.0
+    latency_config: LatencyModelConfig | None = None
+    if execution_model is not None:
+        impact_coefficient = execution_model.slippage.impact_coefficient
+        impact_exponent = execution_model.slippage.impact_exponent
+        base_slippage = execution_model.slippage.base_slippage
+        if latency_preset is not None:
+            latency_config = execution_model.latency.to_latency_values().to_config()
+
     return VenueConfig(
         name="BINANCE",
         starting_balance_usdt=starting_balance_usdt,
         default_leverage=default_leverage,
         leverages=leverages or {},
         latency_preset=latency_preset,
+        latency_config=latency_config,
         use_volume_slippage=True,
         fill_config=VolumeSlippageFillModelConfig(
             impact_coefficient=impact_coefficient,
@@ -157,7 +180,10 @@ def create_venue_config_for_validation(
             prob_best_price_fill=prob_best_price_fill,
             max_adverse_ticks=max_adverse_ticks,
             prob_slippage=0.0,
+            impact_exponent=impact_exponent,
+            base_slippage=base_slippage,
         ),
+        execution_model=execution_model.name if execution_model is not None else None,
     )
 
 
@@ -239,6 +265,8 @@ def _create_importable_fill_model_config(
                 "prob_best_price_fill": fill_cfg.prob_best_price_fill,
                 "max_adverse_ticks": fill_cfg.max_adverse_ticks,
                 "prob_slippage": fill_cfg.prob_slippage,
+                "impact_exponent": fill_cfg.impact_exponent,
+                "base_slippage": fill_cfg.base_slippage,
             },
         )
     else: